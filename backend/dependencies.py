@@ -2,13 +2,20 @@
 
 import logging
 import os
-from typing import Optional
+from contextlib import suppress
+from typing import AsyncIterator, Optional
 
 logger = logging.getLogger(__name__)
 
-from fastapi import Cookie, Depends, HTTPException
+from fastapi import Cookie, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt, JWTError
 
+from backend.jobs import JobManager, get_job_manager
+from backend.parsed_store import ParsedResultStore, get_parsed_result_store
+from backend.response_cache import ResponseCache, get_shared_response_cache
+
+from modules.db_connection import UnitOfWork, bind_unit_of_work
 from modules.repositories.customer import CustomerRepository
 from modules.repositories.daily_info import DailyInfoRepository
 from modules.repositories.weekly_status import WeeklyStatusRepository
@@ -28,6 +35,41 @@ if _SECRET_KEY == _DEFAULT_JWT_KEY:
     logger.warning("JWT_SECRET_KEY가 기본값입니다. 운영 환경에서는 반드시 변경하세요.")
 
 
+def without_unit_of_work(endpoint):
+    """요청 범위 작업 단위를 쓰지 않는 엔드포인트 표시 (@router.* 아래에 붙인다).
+
+    외부 AI 호출이나 대량 저장처럼 오래 걸리는 요청용. 작업 단위를 쓰면 응답할 때까지 풀 연결 1개와
+    트랜잭션(잠금)을 쥐고 있게 되므로, 이런 엔드포인트의 쿼리는 호출마다 연결을 빌리고 바로 커밋·반납한다.
+    """
+    endpoint.__db_unit_of_work__ = False
+    return endpoint
+
+
+async def db_unit_of_work(request: Request) -> AsyncIterator[Optional[UnitOfWork]]:
+    """요청 범위 DB 작업 단위 (앱 전역 의존성).
+
+    요청 안의 모든 저장소 호출이 연결 1개를 빌려 쓰고, 응답 전에 한 번 커밋한다.
+    예외(HTTPException 포함)로 끝나면 롤백한다. 비동기 의존성이어야 컨텍스트 변수가
+    이후의 동기 의존성/엔드포인트(스레드 풀)로 전달된다.
+    @without_unit_of_work 엔드포인트는 작업 단위 없이 실행한다 (None).
+    """
+    if not getattr(request.scope.get("endpoint"), "__db_unit_of_work__", True):
+        yield None
+        return
+    uow = UnitOfWork()
+    bind_unit_of_work(uow)
+    try:
+        yield uow
+    except Exception:
+        with suppress(Exception):
+            await run_in_threadpool(uow.rollback)
+        raise
+    else:
+        await run_in_threadpool(uow.commit)
+    finally:
+        await run_in_threadpool(uow.close)
+
+
 def get_customer_repo() -> CustomerRepository:
     return CustomerRepository()
 
@@ -52,6 +94,18 @@ def get_user_repo() -> UserRepository:
     return UserRepository()
 
 
+def get_parsed_store() -> ParsedResultStore:
+    return get_parsed_result_store()
+
+
+def get_jobs() -> JobManager:
+    return get_job_manager()
+
+
+def get_response_cache() -> ResponseCache:
+    return get_shared_response_cache()
+
+
 def get_evaluation_service() -> EvaluationService:
     return EvaluationService()
 
@@ -71,6 +125,16 @@ def get_current_user(access_token: Optional[str] = Cookie(None)) -> dict:
         raise HTTPException(status_code=401, detail="인증이 필요합니다.")
 
 
+def get_optional_user(access_token: Optional[str] = Cookie(None)) -> Optional[dict]:
+    """로그인했으면 JWT 내용, 아니면 None (다른 인증 수단도 받는 엔드포인트용)."""
+    if not access_token:
+        return None
+    try:
+        return get_current_user(access_token)
+    except HTTPException:
+        return None
+
+
 def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     """ADMIN 역할만 허용. 그 외 403 반환."""
     if str(current_user.get("role", "")).upper() != "ADMIN":
@@ -1,7 +1,14 @@
-"""PII 암호화/복호화 및 마스킹 유틸리티 (AES-128 Fernet)."""
+"""PII 암호화/복호화, 블라인드 인덱스 및 마스킹 유틸리티 (AES-128 Fernet, HMAC-SHA256)."""
 
+import base64
+import hashlib
+import hmac
 import os
-from typing import Optional
+import threading
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -17,11 +24,23 @@ def _load_fernet() -> Fernet:
     return Fernet(key.encode() if isinstance(key, str) else key)
 
 
+# 복호화 결과 LRU 캐시 크기 (프로세스 메모리에만 보관, 디스크 기록 없음). 0이면 미사용.
+DECRYPT_CACHE_SIZE = int(os.getenv("PII_DECRYPT_CACHE_SIZE", "20000"))
+
+
 class EncryptionService:
-    """Fernet 대칭 암호화 서비스."""
+    """Fernet 대칭 암호화 서비스.
 
-    def __init__(self):
+    공용 인스턴스는 get_encryption_service() 로 얻는다 (복호화 캐시 포함).
+    직접 생성한 인스턴스는 cache_size 를 주지 않으면 캐시 없이 동작한다.
+    """
+
+    def __init__(self, cache_size: int = 0):
+        self.key = os.getenv("ENCRYPTION_KEY")
         self._fernet = _load_fernet()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def encrypt(self, text: str) -> str:
         """평문 문자열을 암호화하여 base64 토큰으로 반환."""
@@ -29,16 +48,35 @@ class EncryptionService:
 
     def decrypt(self, token: str) -> str:
         """암호화 토큰을 복호화하여 평문 문자열로 반환."""
-        return self._fernet.decrypt(token.encode()).decode()
+        cached = self._cache_get(token)
+        if cached is not None:
+            return cached
+        plain = self._fernet.decrypt(token.encode()).decode()
+        self._cache_put(token, plain)
+        return plain
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """바이너리 데이터 암호화 (디스크 캐시 payload 등)."""
+        return self._fernet.encrypt(data)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """encrypt_bytes로 만든 토큰 복호화. 키가 다르면 InvalidToken."""
+        return self._fernet.decrypt(token)
 
     def safe_decrypt(self, value: str) -> str:
         """복호화 시도 후 실패하면 원본 값 그대로 반환 (마이그레이션 과도기용)."""
         if not value:
             return value
+        cached = self._cache_get(value)
+        if cached is not None:
+            return cached
         try:
-            return self._fernet.decrypt(value.encode()).decode()
+            plain = self._fernet.decrypt(value.encode()).decode()
         except (InvalidToken, Exception):
-            return value
+            plain = value
+        # 평문(미암호화) 값도 기록해 같은 값에 대한 복호화 재시도를 막음
+        self._cache_put(value, plain)
+        return plain
 
     def encrypt_optional(self, value: Optional[str]) -> Optional[str]:
         if value is None:
@@ -50,6 +88,144 @@ class EncryptionService:
             return None
         return self.safe_decrypt(value)
 
+    def decrypt_many(self, values: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """여러 값을 한 번에 복호화 (safe_decrypt 규칙, None 유지, 중복 값은 1회만 복호화)."""
+        values = list(values)
+        plain: Dict[str, str] = {}
+        for value in values:
+            if value is not None and value not in plain:
+                plain[value] = self.safe_decrypt(str(value))
+        return [None if value is None else plain[value] for value in values]
+
+    def decrypt_columns(self, rows: Sequence[Optional[Dict]], columns: Sequence[str]) -> List[Optional[Dict]]:
+        """행 목록의 지정 컬럼을 일괄 복호화한 복사본 반환 (None 행/값 유지)."""
+        cells = [
+            (i, col)
+            for i, row in enumerate(rows) if row is not None
+            for col in columns if row.get(col) is not None
+        ]
+        decrypted = self.decrypt_many(str(rows[i][col]) for i, col in cells)
+        result = [dict(row) if row is not None else None for row in rows]
+        for (i, col), plain in zip(cells, decrypted):
+            result[i][col] = plain
+        return result
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_get(self, token: str) -> Optional[str]:
+        if not self.cache_size:
+            return None
+        with self._cache_lock:
+            plain = self._cache.get(token)
+            if plain is not None:
+                self._cache.move_to_end(token)
+            return plain
+
+    def _cache_put(self, token: str, plain: str) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache[token] = plain
+            self._cache.move_to_end(token)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+_service: Optional[EncryptionService] = None
+_service_lock = threading.Lock()
+
+
+def get_encryption_service() -> EncryptionService:
+    """프로세스 공용 EncryptionService (복호화 LRU 캐시 포함).
+
+    ENCRYPTION_KEY 가 바뀌면(키 교체) 새 인스턴스로 교체되어 이전 캐시는 버려진다.
+    """
+    global _service
+    key = os.getenv("ENCRYPTION_KEY")
+    service = _service
+    if service is not None and service.key == key:
+        return service
+    with _service_lock:
+        if _service is None or _service.key != key:
+            _service = EncryptionService(cache_size=DECRYPT_CACHE_SIZE)
+        return _service
+
+
+def reset_encryption_service() -> None:
+    """공용 인스턴스와 복호화 캐시 폐기 (키 교체·마이그레이션 후 명시적 무효화)."""
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.clear_cache()
+        _service = None
+
+
+# ── 블라인드 인덱스 (암호화 컬럼 검색용) ─────────────────────────────────────
+#
+# Fernet 암호문은 매번 달라 WHERE 조건으로 찾을 수 없으므로, 정규화한 평문의
+# 키 기반 HMAC 값을 별도 컬럼/토큰 테이블에 저장해 동등 비교로 조회한다.
+# 인덱스 일치 후에는 항상 복호화한 값으로 다시 확인한다 (잘린 해시 충돌 대비).
+
+BLIND_INDEX_HEX_LEN = 32        # 128bit
+SEARCH_TOKEN_NGRAM = 2          # 검색 토큰 n-gram 길이 (더 긴 검색어는 앞 n글자로 조회 후 재확인)
+
+
+def _load_blind_index_key() -> bytes:
+    """BLIND_INDEX_KEY가 있으면 사용, 없으면 ENCRYPTION_KEY에서 용도 분리 파생."""
+    return _derive_blind_index_key(os.getenv("BLIND_INDEX_KEY"), os.getenv("ENCRYPTION_KEY"))
+
+
+@lru_cache(maxsize=4)
+def _derive_blind_index_key(key: Optional[str], fernet_key: Optional[str]) -> bytes:
+    if key:
+        return base64.urlsafe_b64decode(key.encode())
+    if not fernet_key:
+        _load_fernet()  # 동일한 안내 메시지로 RuntimeError
+    return hmac.new(fernet_key.encode(), b"arisa-blind-index-v1", hashlib.sha256).digest()
+
+
+def normalize_pii(value) -> str:
+    """인덱스용 정규화: NFKC, 소문자, 공백 제거."""
+    text = unicodedata.normalize("NFKC", str(value)).lower()
+    return "".join(text.split())
+
+
+def blind_index(value, field: str) -> Optional[str]:
+    """field별로 구분된 HMAC 블라인드 인덱스. 값이 비어 있으면 None."""
+    if value is None:
+        return None
+    normalized = normalize_pii(value)
+    if not normalized:
+        return None
+    digest = hmac.new(
+        _load_blind_index_key(), f"{field}\x1f{normalized}".encode(), hashlib.sha256
+    ).hexdigest()
+    return digest[:BLIND_INDEX_HEX_LEN]
+
+
+def search_tokens(value, field: str) -> Set[str]:
+    """부분 문자열 검색용 토큰 (정규화 값의 n-gram 블라인드 인덱스, 값 길이에 비례).
+
+    n글자보다 짧은 값은 토큰이 없다 (짧은 검색어는 토큰 없이 조회 후 재확인).
+    """
+    if value is None:
+        return set()
+    normalized = normalize_pii(value)
+    return {
+        blind_index(normalized[start:start + SEARCH_TOKEN_NGRAM], field)
+        for start in range(len(normalized) - SEARCH_TOKEN_NGRAM + 1)
+    }
+
+
+def keyword_token(keyword, field: str) -> Optional[str]:
+    """검색어 → 조회용 토큰 (앞 n-gram 하나, 결과는 호출측에서 재확인). n글자 미만이면 None."""
+    normalized = normalize_pii(keyword or "")
+    if len(normalized) < SEARCH_TOKEN_NGRAM:
+        return None
+    return blind_index(normalized[:SEARCH_TOKEN_NGRAM], field)
+
 
 # ── 마스킹 함수 (ADMIN 외 역할에 적용) ────────────────────────────────────────
 
@@ -0,0 +1,333 @@
+"""백그라운드 작업 큐 (PDF 파싱, DB 저장, AI 일괄 평가).
+
+- 외부 브로커 없이 프로세스 내 스레드 풀에서 실행 (동시 실행 수 제한)
+- 작업 상태/진행률/결과는 호스트 로컬 SQLite에 기록 → 어느 uvicorn 워커에서도 조회 가능
+- 사용자별 동시 작업(대기+실행) 수 제한
+- 취소는 협조적: 작업 함수가 진행률을 보고할 때 취소 요청을 확인
+- 결과(JSON)는 수급자명 등 PII를 포함할 수 있어 Fernet 암호화 후 저장
+- 실행 프로세스가 사라졌거나 오래 갱신이 없는 미완료 작업은 실패 처리 (서버 재시작 등)
+
+환경변수:
+    JOB_WORKERS          작업 실행 스레드 수 (기본: 2)
+    JOB_MAX_PER_USER     사용자별 동시 작업 수 (기본: 2)
+    JOB_TTL_HOURS        완료된 작업 보관 시간 (기본: 24)
+    JOB_STALE_MINUTES    다른 프로세스의 작업을 중단으로 간주하는 무응답 시간 (기본: 30)
+    JOB_STORE_DIR        SQLite 파일 디렉토리 (기본: <tmp>/arisa_store)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.encryption import EncryptionService
+from modules.utils.sqlite_utils import (
+    init_sqlite,
+    local_store_path,
+    sqlite_connect,
+    sqlite_transaction,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_PER_USER = int(os.getenv("JOB_MAX_PER_USER", "2"))
+JOB_TTL_SECONDS = int(float(os.getenv("JOB_TTL_HOURS", "24")) * 3600)
+JOB_STALE_SECONDS = int(float(os.getenv("JOB_STALE_MINUTES", "30")) * 60)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+
+class JobLimitExceeded(Exception):
+    """사용자별 동시 작업 수 초과."""
+
+
+class JobCancelled(Exception):
+    """작업 실행 중 취소 요청 감지."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id           TEXT PRIMARY KEY,
+    kind             TEXT NOT NULL,
+    owner            TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    progress_current INTEGER NOT NULL DEFAULT 0,
+    progress_total   INTEGER,
+    message          TEXT,
+    result           BLOB,
+    error            TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    runner           TEXT NOT NULL,
+    pid              INTEGER NOT NULL,
+    created_at       REAL NOT NULL,
+    updated_at       REAL NOT NULL,
+    started_at       REAL,
+    finished_at      REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_owner_status ON jobs (owner, status);
+CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at);
+"""
+
+_PUBLIC_COLUMNS = (
+    "job_id, kind, owner, status, progress_current, progress_total, message, "
+    "result, error, cancel_requested, created_at, started_at, finished_at"
+)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+class JobContext:
+    """작업 함수에 전달되는 진행률 보고/취소 확인 핸들."""
+
+    def __init__(self, manager: "JobManager", job_id: str):
+        self._manager = manager
+        self.job_id = job_id
+
+    def progress(self, current: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        """진행률 기록. 취소가 요청됐으면 JobCancelled 발생."""
+        self._manager._update_progress(self.job_id, current, total, message)
+        self.check_cancelled()
+
+    def check_cancelled(self) -> None:
+        if self._manager._cancel_requested(self.job_id):
+            raise JobCancelled()
+
+
+JobFunc = Callable[..., Any]
+
+
+class JobManager:
+    """SQLite 상태 저장 + 스레드 풀 실행 작업 관리자."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_workers: int = JOB_WORKERS,
+        max_per_user: int = JOB_MAX_PER_USER,
+        ttl_seconds: int = JOB_TTL_SECONDS,
+        stale_seconds: int = JOB_STALE_SECONDS,
+    ):
+        self.path = Path(path) if path else local_store_path("jobs.sqlite3", env_dir="JOB_STORE_DIR")
+        self.max_per_user = max_per_user
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        # 이 인스턴스가 실행하는 작업 표시 (PID 재사용과 구분)
+        self.runner = uuid.uuid4().hex
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="arisa-job")
+        self._enc = None
+        init_sqlite(self.path, _SCHEMA)
+        with sqlite_transaction(self.path) as conn:
+            self._fail_orphaned_jobs(conn, time.time())
+
+    def _get_enc(self) -> EncryptionService:
+        if self._enc is None:
+            self._enc = EncryptionService()
+        return self._enc
+
+    # ── 제출/조회/취소 ────────────────────────────────────────────────────
+
+    def submit(self, kind: str, owner: str, func: JobFunc, *args, total: Optional[int] = None) -> str:
+        """작업 등록 후 job_id 반환. func(ctx, *args)의 반환값(JSON 직렬화 가능)이 결과.
+
+        Raises:
+            JobLimitExceeded: owner의 대기/실행 중 작업이 max_per_user 이상
+        """
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            self._purge(conn, now)
+            self._fail_orphaned_jobs(conn, now)
+            active = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE owner = ? AND status IN (?, ?)",
+                (owner, *ACTIVE_STATUSES),
+            ).fetchone()[0]
+            if active >= self.max_per_user:
+                raise JobLimitExceeded(
+                    f"동시에 실행할 수 있는 작업은 최대 {self.max_per_user}개입니다."
+                )
+            conn.execute(
+                """
+                INSERT INTO jobs (job_id, kind, owner, status, progress_total,
+                                  runner, pid, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, kind, owner, STATUS_QUEUED, total, self.runner, os.getpid(), now, now),
+            )
+        self._executor.submit(self._run, job_id, func, args)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with sqlite_connect(self.path) as conn:
+            conn.row_factory = _dict_row
+            row = conn.execute(
+                f"SELECT {_PUBLIC_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_public(row) if row else None
+
+    def list_jobs(self, owner: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (결과 본문 제외). owner가 None이면 전체."""
+        where, params = ("WHERE owner = ?", (owner,)) if owner is not None else ("", ())
+        with sqlite_connect(self.path) as conn:
+            conn.row_factory = _dict_row
+            rows = conn.execute(
+                f"SELECT {_PUBLIC_COLUMNS} FROM jobs {where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        jobs = []
+        for row in rows:
+            row["result"] = None
+            jobs.append(self._to_public(row))
+        return jobs
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """대기 중 작업은 즉시 취소, 실행 중 작업은 취소 요청만 기록. 없는 작업이면 None."""
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            row = conn.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            if row[0] == STATUS_QUEUED:
+                conn.execute(
+                    """
+                    UPDATE jobs SET status = ?, cancel_requested = 1, finished_at = ?, updated_at = ?
+                    WHERE job_id = ?
+                    """,
+                    (STATUS_CANCELLED, now, now, job_id),
+                )
+            elif row[0] == STATUS_RUNNING:
+                conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE job_id = ?", (job_id,))
+        return self.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ── 실행 ──────────────────────────────────────────────────────────────
+
+    def _run(self, job_id: str, func: JobFunc, args: tuple) -> None:
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            updated = conn.execute(
+                """
+                UPDATE jobs SET status = ?, started_at = ?, updated_at = ?
+                WHERE job_id = ? AND status = ?
+                """,
+                (STATUS_RUNNING, now, now, job_id, STATUS_QUEUED),
+            ).rowcount
+        if not updated:
+            return  # 대기 중 취소됨
+
+        try:
+            result = func(JobContext(self, job_id), *args)
+        except JobCancelled:
+            self._finish(job_id, STATUS_CANCELLED)
+        except Exception as e:
+            logger.error("작업 실패 (job_id=%s): %s", job_id, e)
+            self._finish(job_id, STATUS_FAILED, error=str(e))
+        else:
+            self._finish(job_id, STATUS_SUCCEEDED, result=result)
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        blob = None
+        if result is not None:
+            raw = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+            blob = self._get_enc().encrypt_bytes(raw)
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, updated_at = ?
+                WHERE job_id = ?
+                """,
+                (status, blob, error, now, now, job_id),
+            )
+
+    def _update_progress(self, job_id: str, current: int, total: Optional[int], message: Optional[str]) -> None:
+        with sqlite_transaction(self.path) as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET progress_current = ?,
+                                progress_total = COALESCE(?, progress_total),
+                                message = COALESCE(?, message),
+                                updated_at = ?
+                WHERE job_id = ?
+                """,
+                (current, total, message, time.time(), job_id),
+            )
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with sqlite_connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    # ── 정리 ──────────────────────────────────────────────────────────────
+
+    def _purge(self, conn, now: float) -> None:
+        conn.execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+            (now - self.ttl_seconds,),
+        )
+
+    def _fail_orphaned_jobs(self, conn, now: float) -> None:
+        """다른 실행자의 미완료 작업 중 프로세스가 없거나 오래 갱신이 없는 작업을 실패 처리."""
+        rows = conn.execute(
+            "SELECT job_id, pid, updated_at FROM jobs WHERE status IN (?, ?) AND runner != ?",
+            (*ACTIVE_STATUSES, self.runner),
+        ).fetchall()
+        for job_id, pid, updated_at in rows:
+            if _pid_alive(pid) and updated_at >= now - self.stale_seconds:
+                continue
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?, updated_at = ? WHERE job_id = ?",
+                (STATUS_FAILED, "서버 재시작으로 작업이 중단되었습니다.", now, now, job_id),
+            )
+
+    def _to_public(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        blob = row.pop("result")
+        row["result"] = json.loads(self._get_enc().decrypt_bytes(blob)) if blob else None
+        row["cancel_requested"] = bool(row["cancel_requested"])
+        return row
+
+
+def _dict_row(cursor, row) -> Dict[str, Any]:
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """프로세스 공용 작업 관리자."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
+
+
+def shutdown_job_manager() -> None:
+    """앱 종료 시 대기 작업 취소 (실행 중 작업은 다음 기동 시 실패 처리됨)."""
+    with _manager_lock:
+        if _manager is not None:
+            _manager.shutdown(wait=False)
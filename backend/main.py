@@ -17,13 +17,16 @@ from dotenv import load_dotenv
 
 load_dotenv(ROOT_DIR / ".env")
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+from backend.dependencies import db_unit_of_work
+from backend.request_metrics import RequestMetricsMiddleware
 from backend.routers import (
     customers,
     employees,
@@ -35,7 +38,10 @@ from backend.routers import (
     dashboard,
     auth,
     feedback_reports,
+    jobs,
+    metrics,
 )
+from modules.db_pool import PoolTimeout
 
 
 limiter = Limiter(key_func=get_remote_address)
@@ -52,9 +58,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("DB 연결 풀 초기화 실패 (첫 요청 시 재시도): %s", e)
 
+    # METRICS_DIR 가 있으면 워커별 지표 스냅샷을 주기적으로 기록 (워커 간 합산용)
+    from modules.metrics import REGISTRY
+
+    REGISTRY.start_dumping()
+
     yield
 
     # 정리 작업
+    from backend.jobs import shutdown_job_manager
+
+    shutdown_job_manager()
+
+    from modules.db_connection import release_pool
+
+    release_pool()
     logger.info("앱 종료")
 
 
@@ -63,11 +81,27 @@ app = FastAPI(
     description="요양 시설 기록 관리 REST API",
     version="2.0.0",
     lifespan=lifespan,
+    # 요청 1건의 DB 호출은 연결 1개·트랜잭션 1개를 공유 (modules.db_connection.UnitOfWork)
+    dependencies=[Depends(db_unit_of_work)],
 )
 
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+@app.exception_handler(PoolTimeout)
+async def _db_pool_timeout_handler(request: Request, exc: PoolTimeout):
+    # 연결 풀이 가득 찬 채 DB_POOL_TIMEOUT 이 지남 → 잠시 후 재시도하도록 503
+    logger.warning("DB 연결 풀 대기 시간 초과: %s %s", request.method, request.url.path)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "서버가 혼잡합니다. 잠시 후 다시 시도해 주세요."},
+        headers={"Retry-After": "1"},
+    )
+
+# 라우트별 처리 시간 지표 (/api/metrics)
+app.add_middleware(RequestMetricsMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -93,6 +127,8 @@ app.include_router(employee_evaluations.router, prefix="/api", tags=["직원 평
 app.include_router(upload.router, prefix="/api", tags=["파일 업로드"])
 app.include_router(dashboard.router, prefix="/api", tags=["대시보드"])
 app.include_router(feedback_reports.router, prefix="/api", tags=["피드백 리포트"])
+app.include_router(jobs.router, prefix="/api", tags=["백그라운드 작업"])
+app.include_router(metrics.router, prefix="/api", tags=["운영 지표"])
 
 
 @app.get("/api/health")
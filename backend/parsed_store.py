@@ -0,0 +1,419 @@
+"""업로드 파싱 결과 저장소 (업로드 → 미리보기/DB 저장 사이 보관).
+
+- `uvicorn --workers N` 환경에서 어느 워커가 요청을 받아도 같은 결과를 조회
+- TTL 만료 + 전체 바이트 상한 (초과 시 오래된 업로드부터 제거)
+- 레코드는 배치 단위로 컬럼형 인코딩 → zlib 압축 → Fernet 암호화 (PII 보호)
+- 스트리밍 파싱은 append 로 수급자 그룹마다 바로 기록하고 finish 로 공개 (그 전에는 get 이 None)
+- 백엔드 교체 가능
+    - sqlite (기본): 호스트 로컬 SQLite 파일, 워커 간 공유
+    - memory: 단일 프로세스 전용 (개발/테스트)
+
+환경변수:
+    PARSED_STORE_BACKEND   sqlite | memory (기본: sqlite)
+    PARSED_STORE_DIR       SQLite 파일 디렉토리 (기본: <tmp>/arisa_store)
+    PARSED_STORE_TTL_HOURS 보관 시간 (기본: 2)
+    PARSED_STORE_MAX_MB    전체 용량 상한 (기본: 512)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.encryption import EncryptionService
+from modules.utils.memory_utils import chunked_process
+from modules.utils.sqlite_utils import (
+    init_sqlite,
+    local_store_path,
+    sqlite_connect,
+    sqlite_transaction,
+)
+
+logger = logging.getLogger(__name__)
+
+PARSED_STORE_BACKEND = os.getenv("PARSED_STORE_BACKEND", "sqlite")
+PARSED_STORE_TTL_SECONDS = int(float(os.getenv("PARSED_STORE_TTL_HOURS", "2")) * 3600)
+PARSED_STORE_MAX_BYTES = int(os.getenv("PARSED_STORE_MAX_MB", "512")) * 1024 * 1024
+BATCH_RECORDS = 500
+
+
+# ─── 컬럼형 배치 인코딩 ─────────────────────────────────────────────────────
+
+
+def encode_batch(records: List[dict]) -> bytes:
+    """레코드 목록을 컬럼형 JSON으로 인코딩 후 압축.
+
+    - 컬럼별 값 배열로 저장 (키 이름 반복 제거)
+    - 고유값이 절반 이하인 컬럼은 사전 인코딩 (수급자명, 상태값 등)
+    - 일부 레코드에 없는 키는 missing 인덱스로 보존
+    """
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    encoded: Dict[str, Any] = {}
+    for col in columns:
+        missing = [i for i, r in enumerate(records) if col not in r]
+        values = [r.get(col) for r in records]
+        column: Dict[str, Any] = {}
+        try:
+            uniques = list(dict.fromkeys(values))
+        except TypeError:
+            uniques = None
+        if uniques is not None and len(uniques) <= len(values) // 2:
+            lookup = {v: i for i, v in enumerate(uniques)}
+            column["dict"] = uniques
+            column["idx"] = [lookup[v] for v in values]
+        else:
+            column["values"] = values
+        if missing:
+            column["missing"] = missing
+        encoded[col] = column
+
+    payload = {"n": len(records), "columns": columns, "data": encoded}
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+    return zlib.compress(raw.encode("utf-8"), 6)
+
+
+def decode_batch(blob: bytes) -> List[dict]:
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+    n = payload["n"]
+    records: List[dict] = [{} for _ in range(n)]
+    for col in payload["columns"]:
+        column = payload["data"][col]
+        if "dict" in column:
+            uniques = column["dict"]
+            values = [uniques[i] for i in column["idx"]]
+        else:
+            values = column["values"]
+        missing = set(column.get("missing", ()))
+        for i, value in enumerate(values):
+            if i not in missing:
+                records[i][col] = value
+    return records
+
+
+# ─── 저장소 인터페이스 ──────────────────────────────────────────────────────
+
+
+class ParsedResultStore(ABC):
+    """파싱 결과 저장소 공통 로직 (배치 인코딩/암호화). 백엔드는 bytes 배치만 다룸."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = PARSED_STORE_TTL_SECONDS,
+        max_bytes: int = PARSED_STORE_MAX_BYTES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._enc = None
+
+    def _get_enc(self) -> EncryptionService:
+        if self._enc is None:
+            self._enc = EncryptionService()
+        return self._enc
+
+    def _encode(self, records: List[dict]) -> List[bytes]:
+        enc = self._get_enc()
+        return [
+            enc.encrypt_bytes(encode_batch(chunk))
+            for chunk in chunked_process(records, BATCH_RECORDS)
+        ]
+
+    def put(self, file_id: str, records: List[dict]) -> None:
+        self._put_batches(file_id, self._encode(records), len(records))
+
+    def append(self, file_id: str, records: List[dict]) -> None:
+        """레코드를 작성 중인 업로드 뒤에 추가 (없으면 생성). finish 전까지 get 에 보이지 않음."""
+        if records:
+            self._append_batches(file_id, self._encode(records), len(records))
+
+    def finish(self, file_id: str, total: int) -> bool:
+        """append 로 작성한 업로드를 조회 가능하게 공개 (파싱 실패 시에는 대신 delete).
+
+        작성 중 만료·용량 초과로 밀려나 저장된 건수가 total 과 다르면 지우고 False.
+        """
+        if self._finish(file_id, total):
+            return True
+        self.delete(file_id)
+        return False
+
+    def get(self, file_id: str) -> Optional[List[dict]]:
+        """저장된 레코드 반환. 없거나 만료됐으면 None."""
+        batches = self._get_batches(file_id)
+        if batches is None:
+            return None
+        enc = self._get_enc()
+        records: List[dict] = []
+        for blob in batches:
+            records.extend(decode_batch(enc.decrypt_bytes(blob)))
+        return records
+
+    @abstractmethod
+    def _put_batches(self, file_id: str, batches: List[bytes], total: int) -> None: ...
+
+    @abstractmethod
+    def _append_batches(self, file_id: str, batches: List[bytes], count: int) -> None: ...
+
+    @abstractmethod
+    def _finish(self, file_id: str, total: int) -> bool: ...
+
+    @abstractmethod
+    def _get_batches(self, file_id: str) -> Optional[List[bytes]]: ...
+
+    @abstractmethod
+    def delete(self, file_id: str) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class InMemoryParsedStore(ParsedResultStore):
+    """프로세스 메모리 저장소 (단일 워커/테스트용)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        # file_id → (batches, total, size_bytes, created_at)
+        self._items: Dict[str, tuple] = {}
+        self._pending: set = set()
+
+    def _purge(self, now: float) -> None:
+        expired = [
+            fid for fid, (_, _, _, created) in self._items.items()
+            if created + self.ttl_seconds < now
+        ]
+        for fid in expired:
+            del self._items[fid]
+            self._pending.discard(fid)
+        total = sum(item[2] for item in self._items.values())
+        for fid in sorted(self._items, key=lambda f: self._items[f][3]):
+            if total <= self.max_bytes or len(self._items) <= 1:
+                break
+            total -= self._items.pop(fid)[2]
+            self._pending.discard(fid)
+
+    def _put_batches(self, file_id, batches, total):
+        now = time.time()
+        with self._lock:
+            self._items[file_id] = (batches, total, sum(len(b) for b in batches), now)
+            self._pending.discard(file_id)
+            self._purge(now)
+
+    def _append_batches(self, file_id, batches, count):
+        now = time.time()
+        with self._lock:
+            if file_id in self._items and file_id in self._pending:
+                old, total, size, created = self._items[file_id]
+            else:
+                old, total, size, created = [], 0, 0, now
+                self._pending.add(file_id)
+            self._items[file_id] = (
+                old + batches, total + count, size + sum(len(b) for b in batches), created
+            )
+            self._purge(now)
+
+    def _finish(self, file_id, total):
+        with self._lock:
+            item = self._items.get(file_id)
+            if file_id not in self._pending or item is None or item[1] != total:
+                return False
+            self._pending.discard(file_id)
+            return True
+
+    def _get_batches(self, file_id):
+        with self._lock:
+            self._purge(time.time())
+            if file_id in self._pending:
+                return None
+            item = self._items.get(file_id)
+            return list(item[0]) if item else None
+
+    def delete(self, file_id):
+        with self._lock:
+            self._items.pop(file_id, None)
+            self._pending.discard(file_id)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "backend": "memory",
+                "uploads": len(self._items),
+                "size_bytes": sum(item[2] for item in self._items.values()),
+            }
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_results (
+    file_id    TEXT PRIMARY KEY,
+    total      INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parsed_results_created ON parsed_results (created_at);
+CREATE TABLE IF NOT EXISTS parsed_batches (
+    file_id  TEXT NOT NULL,
+    batch_no INTEGER NOT NULL,
+    payload  BLOB NOT NULL,
+    PRIMARY KEY (file_id, batch_no)
+);
+-- append 로 작성 중인 업로드 (finish 전까지 조회 제외)
+CREATE TABLE IF NOT EXISTS parsed_pending (
+    file_id TEXT PRIMARY KEY
+);
+"""
+
+
+class SqliteParsedStore(ParsedResultStore):
+    """호스트 로컬 SQLite 파일 저장소 (여러 uvicorn 워커가 공유)."""
+
+    def __init__(self, path: Optional[Path] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.path = Path(path) if path else local_store_path(
+            "parsed_results.sqlite3", env_dir="PARSED_STORE_DIR"
+        )
+        init_sqlite(self.path, _SQLITE_SCHEMA)
+
+    @staticmethod
+    def _delete(conn, file_id: str) -> None:
+        conn.execute("DELETE FROM parsed_batches WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM parsed_results WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM parsed_pending WHERE file_id = ?", (file_id,))
+
+    def _purge(self, conn, now: float, keep: Optional[str] = None) -> None:
+        for (fid,) in conn.execute(
+            "SELECT file_id FROM parsed_results WHERE expires_at < ?", (now,)
+        ).fetchall():
+            self._delete(conn, fid)
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM parsed_results"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for fid, size in conn.execute(
+            "SELECT file_id, size_bytes FROM parsed_results ORDER BY created_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            if fid == keep:
+                continue
+            self._delete(conn, fid)
+            total -= size
+
+    def _put_batches(self, file_id, batches, total):
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            self._delete(conn, file_id)
+            conn.execute(
+                """
+                INSERT INTO parsed_results (file_id, total, size_bytes, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (file_id, total, sum(len(b) for b in batches), now, now + self.ttl_seconds),
+            )
+            conn.executemany(
+                "INSERT INTO parsed_batches (file_id, batch_no, payload) VALUES (?, ?, ?)",
+                [(file_id, i, blob) for i, blob in enumerate(batches)],
+            )
+            self._purge(conn, now, keep=file_id)
+
+    def _append_batches(self, file_id, batches, count):
+        now = time.time()
+        size = sum(len(b) for b in batches)
+        with sqlite_transaction(self.path) as conn:
+            pending = conn.execute(
+                "SELECT 1 FROM parsed_pending WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            if pending is None:
+                self._delete(conn, file_id)
+                conn.execute("INSERT INTO parsed_pending (file_id) VALUES (?)", (file_id,))
+                conn.execute(
+                    """
+                    INSERT INTO parsed_results (file_id, total, size_bytes, created_at, expires_at)
+                    VALUES (?, 0, 0, ?, ?)
+                    """,
+                    (file_id, now, now + self.ttl_seconds),
+                )
+            first = conn.execute(
+                "SELECT COALESCE(MAX(batch_no) + 1, 0) FROM parsed_batches WHERE file_id = ?",
+                (file_id,),
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE parsed_results SET total = total + ?, size_bytes = size_bytes + ? WHERE file_id = ?",
+                (count, size, file_id),
+            )
+            conn.executemany(
+                "INSERT INTO parsed_batches (file_id, batch_no, payload) VALUES (?, ?, ?)",
+                [(file_id, first + i, blob) for i, blob in enumerate(batches)],
+            )
+            self._purge(conn, now, keep=file_id)
+
+    def _finish(self, file_id, total):
+        with sqlite_transaction(self.path) as conn:
+            row = conn.execute(
+                "SELECT total FROM parsed_results WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            pending = conn.execute(
+                "SELECT 1 FROM parsed_pending WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            if row is None or pending is None or row[0] != total:
+                return False
+            conn.execute("DELETE FROM parsed_pending WHERE file_id = ?", (file_id,))
+            return True
+
+    def _get_batches(self, file_id):
+        with sqlite_connect(self.path) as conn:
+            row = conn.execute(
+                """
+                SELECT expires_at FROM parsed_results
+                WHERE file_id = ? AND file_id NOT IN (SELECT file_id FROM parsed_pending)
+                """,
+                (file_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] < time.time():
+                self.delete(file_id)
+                return None
+            return [
+                blob for (blob,) in conn.execute(
+                    "SELECT payload FROM parsed_batches WHERE file_id = ? ORDER BY batch_no",
+                    (file_id,),
+                )
+            ]
+
+    def delete(self, file_id):
+        with sqlite_transaction(self.path) as conn:
+            self._delete(conn, file_id)
+
+    def stats(self):
+        with sqlite_connect(self.path) as conn:
+            uploads, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM parsed_results"
+            ).fetchone()
+        return {"backend": "sqlite", "path": str(self.path), "uploads": uploads, "size_bytes": size}
+
+
+_STORE_BACKENDS = {
+    "sqlite": SqliteParsedStore,
+    "memory": InMemoryParsedStore,
+}
+
+_store: Optional[ParsedResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_parsed_result_store() -> ParsedResultStore:
+    """프로세스 공용 저장소 (PARSED_STORE_BACKEND로 선택)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            backend = _STORE_BACKENDS.get(PARSED_STORE_BACKEND)
+            if backend is None:
+                raise RuntimeError(f"알 수 없는 PARSED_STORE_BACKEND: {PARSED_STORE_BACKEND}")
+            _store = backend()
+        return _store
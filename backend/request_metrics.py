@@ -0,0 +1,46 @@
+"""라우트별 요청 처리 시간 지표 (ASGI 미들웨어)
+
+경로 대신 라우트 템플릿(/api/daily-records/{record_id})을 레이블로 써서 지표 수가 늘지 않게 한다.
+라우트가 없는 요청(404, 정적 파일)은 route="unmatched" 로 묶는다.
+StreamingResponse 는 본문 전송이 끝날 때까지를 잰다.
+"""
+
+import time
+
+from modules.metrics import REGISTRY
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "arisa_http_request_duration_seconds", "API 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route", "status"],
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """요청마다 (메서드, 라우트 템플릿, 상태 코드) 별 처리 시간을 관측."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            REQUEST_SECONDS.observe(time.perf_counter() - started, method=method, route=path, status=status)
@@ -0,0 +1,417 @@
+"""GET 응답 캐시 (대시보드/주간 분석 엔드포인트).
+
+- 키: 경로 + 정렬된 쿼리 파라미터 + 호출자 역할 (역할에 따라 마스킹 여부가 다름)
+- TTL 만료 + 테이블 태그별 세대(generation) 번호로 명시적 무효화
+    쓰기 후 invalidate("ai_evaluations") → 해당 태그 세대 증가 → 이전 세대 항목은 더 이상 조회되지 않음
+    (무효화 전에 시작한 계산이 늦게 저장해도 옛 세대 키에 들어가므로 재사용되지 않음)
+- single-flight: 같은 키를 동시에 여러 번 계산하지 않음
+    - 프로세스 내: 키별 잠금 (스트라이프)
+    - 워커 간 (sqlite): 임대(lease) 행을 잡은 워커만 계산, 나머지는 결과가 저장될 때까지 대기
+- 응답 본문(복호화된 이름 포함 가능)은 압축 후 Fernet 암호화하여 저장
+- 백엔드 교체 가능
+    - sqlite (기본): 호스트 로컬 SQLite 파일, 워커 간 공유
+    - memory: 단일 프로세스 전용 (개발/테스트)
+    - off: 캐시 사용 안 함
+
+환경변수:
+    RESPONSE_CACHE_BACKEND      sqlite | memory | off (기본: sqlite)
+    RESPONSE_CACHE_DIR          SQLite 파일 디렉토리 (기본: <tmp>/arisa_store)
+    RESPONSE_CACHE_TTL_SECONDS  보관 시간 (기본: 300)
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Depends, Request
+from fastapi.encoders import jsonable_encoder
+
+from backend.encryption import get_encryption_service
+from modules.db_connection import current_unit_of_work
+from modules.utils.sqlite_utils import (
+    init_sqlite,
+    local_store_path,
+    sqlite_connect,
+    sqlite_transaction,
+)
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "sqlite")
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+LEASE_SECONDS = 30         # 다른 워커의 계산을 기다리는 최대 시간
+LEASE_POLL_SECONDS = 0.05
+_LOCK_STRIPES = 64
+
+# 무효화 태그 (원본 테이블 이름)
+TAG_AI_EVALUATIONS = "ai_evaluations"
+TAG_EMPLOYEE_EVALUATIONS = "employee_evaluations"
+TAG_DAILY_INFOS = "daily_infos"
+TAG_CUSTOMERS = "customers"
+TAG_USERS = "users"
+
+DASHBOARD_TAGS = (TAG_AI_EVALUATIONS, TAG_EMPLOYEE_EVALUATIONS, TAG_DAILY_INFOS, TAG_CUSTOMERS, TAG_USERS)
+WEEKLY_ANALYSIS_TAGS = (TAG_DAILY_INFOS, TAG_CUSTOMERS)
+
+_MISS = object()
+
+
+def _encode(value: Any) -> bytes:
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return get_encryption_service().encrypt_bytes(zlib.compress(raw.encode("utf-8"), 6))
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(get_encryption_service().decrypt_bytes(blob)).decode("utf-8"))
+
+
+def cache_key(path: str, params: Iterable[Tuple[str, str]], role: str) -> str:
+    """경로 + 정렬된 쿼리 파라미터 + 역할 → 세대 번호를 붙이기 전의 기본 키."""
+    return json.dumps([path, sorted(params), str(role or "").upper()], ensure_ascii=False)
+
+
+class ResponseCache(ABC):
+    """응답 캐시 공통 로직 (세대 키 계산, single-flight, 인코딩). 백엔드는 bytes 항목만 다룸."""
+
+    def __init__(self, ttl_seconds: int = RESPONSE_CACHE_TTL_SECONDS, lease_seconds: float = LEASE_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: str, tags: Iterable[str], compute: Callable[[], Any]) -> Any:
+        """캐시된 응답 반환. 없으면 compute() 결과를 JSON 호환 형태로 저장 후 반환."""
+        tags = sorted(set(tags))
+        generations = self._generations(tags)
+        entry_key = hashlib.sha256(
+            json.dumps([key, [generations.get(t, 0) for t in tags]]).encode("utf-8")
+        ).hexdigest()
+
+        value = self._load(entry_key)
+        if value is not _MISS:
+            self.hits += 1
+            return value
+
+        with self._locks[int(entry_key[:8], 16) % _LOCK_STRIPES]:
+            value = self._load(entry_key)
+            if value is not _MISS:
+                self.hits += 1
+                return value
+
+            deadline = time.monotonic() + self.lease_seconds
+            while not self._acquire_lease(entry_key):
+                # 다른 워커가 계산 중 → 결과 대기 (임대가 풀리지 않으면 직접 계산)
+                time.sleep(LEASE_POLL_SECONDS)
+                value = self._load(entry_key)
+                if value is not _MISS:
+                    self.hits += 1
+                    return value
+                if time.monotonic() >= deadline:
+                    break
+
+            try:
+                # 대기 중 다른 워커가 저장하고 임대를 반납했을 수 있음
+                value = self._load(entry_key)
+                if value is not _MISS:
+                    self.hits += 1
+                    return value
+                self.misses += 1
+                value = jsonable_encoder(compute())
+                self._put(entry_key, _encode(value), time.time() + self.ttl_seconds)
+                return value
+            finally:
+                self._release_lease(entry_key)
+
+    def _load(self, entry_key: str) -> Any:
+        blob = self._get(entry_key)
+        if blob is None:
+            return _MISS
+        try:
+            return _decode(blob)
+        except Exception as e:
+            # 키 변경 등으로 복호화 불가 → 미스로 처리 (다음 저장 시 덮어씀)
+            logger.warning("응답 캐시 항목 복호화 실패: %s", e)
+            return _MISS
+
+    def invalidate(self, *tags: str) -> None:
+        """태그 세대 증가. 해당 태그에 의존하는 기존 항목은 모두 무효.
+
+        요청 작업 단위(db_unit_of_work)가 열려 있으면 커밋 뒤로 미룬다. 커밋 전에 올리면 그 사이의
+        GET 이 커밋 전 데이터를 새 세대로 저장해 TTL 동안 남는다. 롤백되면 무효화하지 않는다.
+        """
+        uow = current_unit_of_work()
+        if uow is None:
+            self._invalidate(*tags)
+        else:
+            uow.after_commit(lambda: self._invalidate(*tags))
+
+    @abstractmethod
+    def _invalidate(self, *tags: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def _generations(self, tags: Iterable[str]) -> Dict[str, int]: ...
+
+    @abstractmethod
+    def _get(self, entry_key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def _put(self, entry_key: str, blob: bytes, expires_at: float) -> None: ...
+
+    def _acquire_lease(self, entry_key: str) -> bool:
+        return True
+
+    def _release_lease(self, entry_key: str) -> None:
+        pass
+
+
+class NullResponseCache(ResponseCache):
+    """캐시 비활성화 (RESPONSE_CACHE_BACKEND=off). 매번 계산."""
+
+    def get_or_compute(self, key, tags, compute):
+        self.misses += 1
+        return jsonable_encoder(compute())
+
+    def _invalidate(self, *tags):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        return {"backend": "off", "entries": 0, "hits": self.hits, "misses": self.misses}
+
+    def _generations(self, tags):
+        return {}
+
+    def _get(self, entry_key):
+        return None
+
+    def _put(self, entry_key, blob, expires_at):
+        pass
+
+
+class InMemoryResponseCache(ResponseCache):
+    """프로세스 메모리 캐시 (단일 워커/테스트용)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._items: Dict[str, Tuple[bytes, float]] = {}
+        self._gens: Dict[str, int] = {}
+
+    def _invalidate(self, *tags):
+        with self._lock:
+            for tag in tags:
+                self._gens[tag] = self._gens.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"backend": "memory", "entries": len(self._items), "hits": self.hits, "misses": self.misses}
+
+    def _generations(self, tags):
+        with self._lock:
+            return {tag: self._gens.get(tag, 0) for tag in tags}
+
+    def _get(self, entry_key):
+        now = time.time()
+        with self._lock:
+            item = self._items.get(entry_key)
+            if item is None:
+                return None
+            if item[1] < now:
+                del self._items[entry_key]
+                return None
+            return item[0]
+
+    def _put(self, entry_key, blob, expires_at):
+        now = time.time()
+        with self._lock:
+            for key in [k for k, (_, exp) in self._items.items() if exp < now]:
+                del self._items[key]
+            self._items[entry_key] = (blob, expires_at)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    entry_key  TEXT PRIMARY KEY,
+    payload    BLOB NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_response_cache_expires ON response_cache (expires_at);
+CREATE TABLE IF NOT EXISTS response_cache_generations (
+    tag        TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS response_cache_leases (
+    entry_key  TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SqliteResponseCache(ResponseCache):
+    """호스트 로컬 SQLite 파일 캐시 (여러 uvicorn 워커가 공유)."""
+
+    def __init__(self, path: Optional[Path] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.path = Path(path) if path else local_store_path(
+            "response_cache.sqlite3", env_dir="RESPONSE_CACHE_DIR"
+        )
+        init_sqlite(self.path, _SQLITE_SCHEMA)
+
+    def _invalidate(self, *tags):
+        if not tags:
+            return
+        with sqlite_transaction(self.path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO response_cache_generations (tag, generation) VALUES (?, 1)
+                ON CONFLICT(tag) DO UPDATE SET generation = generation + 1
+                """,
+                [(tag,) for tag in tags],
+            )
+
+    def clear(self):
+        with sqlite_transaction(self.path) as conn:
+            conn.execute("DELETE FROM response_cache")
+            conn.execute("DELETE FROM response_cache_leases")
+
+    def stats(self):
+        with sqlite_connect(self.path) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "path": str(self.path),
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _generations(self, tags):
+        tags = list(tags)
+        if not tags:
+            return {}
+        with sqlite_connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT tag, generation FROM response_cache_generations "
+                f"WHERE tag IN ({', '.join(['?'] * len(tags))})",
+                tags,
+            ).fetchall()
+        return dict(rows)
+
+    def _get(self, entry_key):
+        with sqlite_connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT payload FROM response_cache WHERE entry_key = ? AND expires_at >= ?",
+                (entry_key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _put(self, entry_key, blob, expires_at):
+        with sqlite_transaction(self.path) as conn:
+            conn.execute("DELETE FROM response_cache WHERE expires_at < ?", (time.time(),))
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache (entry_key, payload, expires_at) VALUES (?, ?, ?)",
+                (entry_key, blob, expires_at),
+            )
+
+    def _acquire_lease(self, entry_key):
+        now = time.time()
+        with sqlite_transaction(self.path) as conn:
+            # 만료된 임대(계산 중 죽은 워커 등)는 새로 잡을 수 있음
+            cur = conn.execute(
+                """
+                INSERT INTO response_cache_leases (entry_key, expires_at) VALUES (?, ?)
+                ON CONFLICT(entry_key) DO UPDATE SET expires_at = excluded.expires_at
+                WHERE response_cache_leases.expires_at < ?
+                """,
+                (entry_key, now + self.lease_seconds, now),
+            )
+            return cur.rowcount == 1
+
+    def _release_lease(self, entry_key):
+        with sqlite_transaction(self.path) as conn:
+            conn.execute("DELETE FROM response_cache_leases WHERE entry_key = ?", (entry_key,))
+
+
+_CACHE_BACKENDS = {
+    "sqlite": SqliteResponseCache,
+    "memory": InMemoryResponseCache,
+    "off": NullResponseCache,
+}
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_shared_response_cache() -> ResponseCache:
+    """프로세스 공용 응답 캐시 (RESPONSE_CACHE_BACKEND로 선택)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            backend = _CACHE_BACKENDS.get(RESPONSE_CACHE_BACKEND)
+            if backend is None:
+                raise RuntimeError(f"알 수 없는 RESPONSE_CACHE_BACKEND: {RESPONSE_CACHE_BACKEND}")
+            _cache = backend()
+        return _cache
+
+
+def cached_response(*tags: str):
+    """동기 GET 라우트 응답을 캐시하는 데코레이터.
+
+    라우트 시그니처에 Request, 현재 사용자, 캐시 의존성을 덧붙여 FastAPI가 주입하게 한다.
+    키는 cache_key(경로, 쿼리 파라미터, 역할), 무효화는 tags 기준.
+
+        @router.get("/dashboard/summary")
+        @cached_response(*DASHBOARD_TAGS)
+        def get_summary(...): ...
+    """
+    from backend.dependencies import get_current_user, get_response_cache
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        extra = [
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter(
+                "_cache_user", inspect.Parameter.KEYWORD_ONLY,
+                annotation=dict, default=Depends(get_current_user),
+            ),
+            inspect.Parameter(
+                "_cache", inspect.Parameter.KEYWORD_ONLY,
+                annotation=ResponseCache, default=Depends(get_response_cache),
+            ),
+        ]
+
+        @functools.wraps(func)
+        def wrapper(*args, _cache_request: Request, _cache_user: dict, _cache: ResponseCache, **kwargs):
+            key = cache_key(
+                _cache_request.url.path,
+                _cache_request.query_params.multi_items(),
+                _cache_user.get("role", ""),
+            )
+            return _cache.get_or_compute(key, tags, lambda: func(*args, **kwargs))
+
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *extra])
+        return wrapper
+
+    return decorator
@@ -1,11 +1,31 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 
-from backend.dependencies import get_ai_evaluation_repo, get_evaluation_service, get_current_user, require_admin
-from backend.schemas.ai_evaluations import AiEvaluationResponse, AiEvaluateRequest
+from backend.dependencies import (
+    get_ai_evaluation_repo,
+    get_current_user,
+    get_evaluation_service,
+    get_jobs,
+    get_response_cache,
+    require_admin,
+    without_unit_of_work,
+)
+from backend.jobs import JobContext, JobManager
+from backend.response_cache import TAG_AI_EVALUATIONS, ResponseCache
+from backend.routers.jobs import submit_job
+from backend.schemas.ai_evaluations import (
+    AiBulkEvaluateRequest,
+    AiEvaluateRequest,
+    AiEvaluationResponse,
+    AiRangeEvaluateRequest,
+)
 from modules.repositories.ai_evaluation import AiEvaluationRepository
 from modules.services.daily_report_service import EvaluationService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
 
@@ -18,9 +38,11 @@ def get_ai_evaluations(
 
 
 @router.post("/ai-evaluations/evaluate")
+@without_unit_of_work
 def evaluate_record(
     body: AiEvaluateRequest,
     service: EvaluationService = Depends(get_evaluation_service),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     """특이사항 AI 평가 실행"""
@@ -30,16 +52,12 @@ def evaluate_record(
         note_text=body.note_text,
         note_writer_user_id=body.writer_user_id,
     )
+    cache.invalidate(TAG_AI_EVALUATIONS)
     return result
 
 
-@router.post("/ai-evaluations/evaluate-record/{record_id}")
-def evaluate_full_record(
-    record_id: int,
-    service: EvaluationService = Depends(get_evaluation_service),
-    _: dict = Depends(require_admin),
-):
-    """특정 record의 신체/인지 특이사항 전체 AI 평가"""
+def _fetch_record_for_evaluation(record_id: int) -> Optional[dict]:
+    """AI 평가 입력용 record + 특이사항 조회."""
     from modules.db_connection import db_query
     query = """
         SELECT di.*, c.name as customer_name,
@@ -55,16 +73,124 @@ def evaluate_full_record(
     """
     with db_query() as cursor:
         cursor.execute(query, (record_id,))
-        record = cursor.fetchone()
+        return cursor.fetchone()
+
+
+def _evaluate_and_save(
+    ctx: JobContext, records: List[dict], service: EvaluationService, cache: ResponseCache,
+    failed: Optional[List[int]] = None, use_cache: bool = True,
+) -> dict:
+    """기록들을 공급자 한도 안에서 동시 평가하고 끝나는 대로 저장. 건별 실패는 기록하고 계속 진행."""
+    evaluated: List[int] = []
+    failed = list(failed or [])
+    total = len(records) + len(failed)
+
+    def on_result(record: dict, ai_result: Optional[dict]) -> None:
+        record_id = record["record_id"]
+        try:
+            if ai_result:
+                service.save_special_note_evaluation(record_id, ai_result)
+                evaluated.append(record_id)
+            else:
+                failed.append(record_id)
+        except Exception as e:
+            logger.error("AI 평가 저장 실패 (record_id=%s): %s", record_id, e)
+            failed.append(record_id)
+        ctx.progress(len(evaluated) + len(failed), total)
+
+    try:
+        ctx.progress(len(failed), total)
+        service.evaluate_special_notes_concurrently(records, on_result=on_result, use_cache=use_cache)
+    finally:
+        # 취소로 중단돼도 이미 저장된 평가는 반영
+        if evaluated:
+            cache.invalidate(TAG_AI_EVALUATIONS)
+    return {"evaluated": sorted(evaluated), "failed": sorted(failed)}
+
+
+def _evaluate_records_job(
+    ctx: JobContext, record_ids: List[int], service: EvaluationService, cache: ResponseCache,
+    use_cache: bool = True,
+) -> dict:
+    """record 목록 AI 일괄 평가 작업."""
+    records: List[dict] = []
+    missing: List[int] = []
+    for record_id in record_ids:
+        try:
+            record = _fetch_record_for_evaluation(record_id)
+        except Exception as e:
+            logger.error("AI 평가 대상 조회 실패 (record_id=%s): %s", record_id, e)
+            record = None
+        if record:
+            records.append(record)
+        else:
+            missing.append(record_id)
+    return _evaluate_and_save(ctx, records, service, cache, failed=missing, use_cache=use_cache)
+
+
+def _evaluate_range_job(
+    ctx: JobContext, body: AiRangeEvaluateRequest, service: EvaluationService, cache: ResponseCache
+) -> dict:
+    """기간 내 특이사항 AI 일괄 평가 작업."""
+    records = service.get_records_for_evaluation(
+        body.start_date, body.end_date, body.customer_ids, only_unevaluated=body.skip_evaluated
+    )
+    return _evaluate_and_save(ctx, records, service, cache, use_cache=body.use_cache)
+
 
+@router.post("/ai-evaluations/evaluate-record/{record_id}")
+@without_unit_of_work
+def evaluate_full_record(
+    record_id: int,
+    use_cache: bool = Query(True, description="False 면 같은 프롬프트의 캐시된 AI 응답을 쓰지 않고 다시 평가"),
+    service: EvaluationService = Depends(get_evaluation_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    _: dict = Depends(require_admin),
+):
+    """특정 record의 신체/인지 특이사항 전체 AI 평가"""
+    record = _fetch_record_for_evaluation(record_id)
     if not record:
         raise HTTPException(status_code=404, detail="기록을 찾을 수 없습니다.")
 
-    ai_result = service.evaluate_special_note_with_ai(record)
+    ai_result = service.evaluate_special_note_with_ai(record, use_cache=use_cache)
     if not ai_result:
         raise HTTPException(status_code=500, detail="AI 평가에 실패했습니다.")
 
     # DB 저장
     service.save_special_note_evaluation(record_id, ai_result)
+    cache.invalidate(TAG_AI_EVALUATIONS)
 
     return ai_result
+
+
+@router.post("/ai-evaluations/evaluate-records/job", status_code=202)
+def evaluate_records_job(
+    body: AiBulkEvaluateRequest,
+    service: EvaluationService = Depends(get_evaluation_service),
+    jobs: JobManager = Depends(get_jobs),
+    cache: ResponseCache = Depends(get_response_cache),
+    current_user: dict = Depends(require_admin),
+):
+    """여러 record의 특이사항 AI 평가를 백그라운드 작업으로 등록"""
+    record_ids = list(dict.fromkeys(body.record_ids))
+    return submit_job(
+        jobs, "ai_evaluation", current_user, _evaluate_records_job,
+        record_ids, service, cache, body.use_cache, total=len(record_ids),
+    )
+
+
+@router.post("/ai-evaluations/evaluate-range/job", status_code=202)
+def evaluate_range_job(
+    body: AiRangeEvaluateRequest,
+    service: EvaluationService = Depends(get_evaluation_service),
+    jobs: JobManager = Depends(get_jobs),
+    cache: ResponseCache = Depends(get_response_cache),
+    current_user: dict = Depends(require_admin),
+):
+    """기간(선택: 수급자) 내 특이사항 AI 평가를 백그라운드 작업으로 등록.
+
+    호출은 공급자별 RPM/TPM 한도와 적응형 동시성 안에서 병렬로 진행된다.
+    """
+    if body.end_date < body.start_date:
+        raise HTTPException(status_code=400, detail="종료일이 시작일보다 빠릅니다.")
+    return submit_job(jobs, "ai_evaluation", current_user, _evaluate_range_job, body, service, cache)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 
-from backend.dependencies import get_customer_repo, get_current_user, require_admin
+from backend.dependencies import get_customer_repo, get_current_user, get_response_cache, require_admin
 from backend.encryption import apply_customer_mask, is_admin
+from backend.response_cache import TAG_CUSTOMERS, ResponseCache
 from backend.schemas.customers import CustomerCreate, CustomerUpdate, CustomerResponse
 from modules.repositories.customer import CustomerRepository
 from modules.repositories.audit import AuditRepository
@@ -64,6 +65,7 @@ def create_customer(
     request: Request,
     body: CustomerCreate,
     repo: CustomerRepository = Depends(get_customer_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     customer_id = repo.create_customer(
@@ -74,6 +76,7 @@ def create_customer(
         benefit_start_date=body.benefit_start_date,
         grade=body.grade,
     )
+    cache.invalidate(TAG_CUSTOMERS)
     customer = repo.get_customer(customer_id)
     _audit_repo().log(
         user_id=current_user["user_id"],
@@ -91,6 +94,7 @@ def update_customer(
     customer_id: int,
     body: CustomerUpdate,
     repo: CustomerRepository = Depends(get_customer_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     repo.update_customer(
@@ -102,6 +106,7 @@ def update_customer(
         benefit_start_date=body.benefit_start_date,
         grade=body.grade,
     )
+    cache.invalidate(TAG_CUSTOMERS)
     customer = repo.get_customer(customer_id)
     if not customer:
         raise HTTPException(status_code=404, detail="수급자를 찾을 수 없습니다.")
@@ -120,11 +125,13 @@ def delete_customer(
     request: Request,
     customer_id: int,
     repo: CustomerRepository = Depends(get_customer_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     affected = repo.delete_customer(customer_id)
     if not affected:
         raise HTTPException(status_code=404, detail="수급자를 찾을 수 없습니다.")
+    cache.invalidate(TAG_CUSTOMERS)
     _audit_repo().log(
         user_id=current_user["user_id"],
         action="DELETE",
@@ -1,9 +1,19 @@
+import csv
+import io
+import json
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Dict, Iterable, Iterator, List, Literal, Optional
 from datetime import date
 
-from backend.dependencies import get_daily_info_repo, get_current_user, require_admin
+from backend.dependencies import get_daily_info_repo, get_current_user, get_response_cache, require_admin
 from backend.encryption import apply_customer_mask, is_admin
+from backend.response_cache import (
+    TAG_AI_EVALUATIONS,
+    TAG_DAILY_INFOS,
+    TAG_EMPLOYEE_EVALUATIONS,
+    ResponseCache,
+)
 from backend.schemas.daily_records import DailyRecordSummary, CustomerWithRecords
 from modules.repositories.daily_info import DailyInfoRepository
 
@@ -39,6 +49,64 @@ def get_customers_with_records(
     return rows
 
 
+def _csv_chunks(batches: Iterable[List[Dict]]) -> Iterator[bytes]:
+    """배치마다 CSV 조각 하나 (첫 배치 앞에 BOM + 헤더, Excel 한글 호환)."""
+    columns = None
+    for rows in batches:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if columns is None:
+            columns = list(rows[0].keys())
+            buffer.write("\ufeff")
+            writer.writerow(columns)
+        writer.writerows([row.get(column) for column in columns] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunks(batches: Iterable[List[Dict]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows).encode("utf-8")
+
+
+_EXPORT_FORMATS = {
+    "csv": (_csv_chunks, "text/csv; charset=utf-8"),
+    "ndjson": (_ndjson_chunks, "application/x-ndjson"),
+}
+
+
+@router.get("/daily-records/export")
+def export_daily_records(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    repo: DailyInfoRepository = Depends(get_daily_info_repo),
+    _: dict = Depends(require_admin),
+):
+    """기간 내 전체 일일 기록(수급자 정보 + 하위 테이블)을 CSV/NDJSON 으로 스트리밍.
+
+    DB 에서 배치 단위로 읽어 바로 내보내므로 기간이 길어도 메모리는 배치 크기만큼만 쓴다.
+    첫 배치는 응답 전에 읽어 DB 오류를 상태 코드로 돌려준다. 기록이 없으면 빈 본문.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date는 start_date 이후여야 합니다.")
+    batches = repo.iter_records_by_date_range(start_date, end_date)
+    first = next(batches, None)
+
+    def body() -> Iterator[List[Dict]]:
+        if first is None:
+            return
+        yield first
+        yield from batches
+
+    chunks, media_type = _EXPORT_FORMATS[export_format]
+    filename = f"daily_records_{start_date}_{end_date}.{export_format}"
+    return StreamingResponse(
+        chunks(body()),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/daily-records/{record_id}", response_model=DailyRecordSummary)
 def get_daily_record(
     record_id: int,
@@ -76,6 +144,9 @@ def get_daily_record(
 def delete_daily_record(
     record_id: int,
     repo: DailyInfoRepository = Depends(get_daily_info_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     repo.delete_daily_record(record_id)
+    # 평가 행은 기록 삭제 시 함께 삭제됨
+    cache.invalidate(TAG_DAILY_INFOS, TAG_AI_EVALUATIONS, TAG_EMPLOYEE_EVALUATIONS)
@@ -5,12 +5,25 @@ from typing import Optional
 from datetime import date, timedelta
 
 from backend.dependencies import get_current_user
-from backend.encryption import EncryptionService, mask_name, is_admin
+from backend.encryption import get_encryption_service, mask_name, is_admin
+from backend.response_cache import DASHBOARD_TAGS, cached_response
+from modules.repositories.dashboard_rollup import AI_GRADE_TABLE, EMP_EVAL_TABLE
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
+# AI 평가/직원 평가 지표는 일별 집계 테이블(modules/repositories/dashboard_rollup.py)에서 읽는다.
+# 조회 비용은 원본 행 수가 아니라 기간 일수에 비례.
+# 모든 조회는 응답 캐시(backend/response_cache.py)를 거치며, 원본 쓰기 라우트가 태그로 무효화한다.
+
+
+def _date_range_where(start_date, end_date, column: str = "date"):
+    if start_date and end_date:
+        return f"WHERE {column} BETWEEN %s AND %s", [start_date, end_date]
+    return "", []
+
 
 @router.get("/dashboard/summary")
+@cached_response(*DASHBOARD_TAGS)
 def get_summary(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -34,33 +47,21 @@ def get_summary(
             cursor.execute("SELECT COUNT(*) as cnt FROM daily_infos")
         total_records = cursor.fetchone()["cnt"]
 
-        if start_date and end_date:
-            cursor.execute(
-                """
-                SELECT AVG(CASE grade_code
-                    WHEN '우수' THEN 3
-                    WHEN '평균' THEN 2
-                    WHEN '개선' THEN 1
-                    ELSE NULL
-                END) as avg_score
-                FROM ai_evaluations ae
-                JOIN daily_infos di ON ae.record_id = di.record_id
-                WHERE di.date BETWEEN %s AND %s
-                """,
-                (start_date, end_date),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT AVG(CASE grade_code
+        where, params = _date_range_where(start_date, end_date)
+        cursor.execute(
+            f"""
+            SELECT SUM(cnt * CASE grade_code
                     WHEN '우수' THEN 3
                     WHEN '평균' THEN 2
                     WHEN '개선' THEN 1
-                    ELSE NULL
-                END) as avg_score
-                FROM ai_evaluations
-                """
-            )
+                    ELSE 0
+                END)
+                / SUM(CASE WHEN grade_code IN ('우수', '평균', '개선') THEN cnt END) as avg_score
+            FROM {AI_GRADE_TABLE}
+            {where}
+            """,
+            params,
+        )
         avg_row = cursor.fetchone()
         avg_score = round(avg_row["avg_score"], 2) if avg_row and avg_row["avg_score"] else None
 
@@ -73,6 +74,7 @@ def get_summary(
 
 
 @router.get("/dashboard/evaluation-trend")
+@cached_response(*DASHBOARD_TAGS)
 def get_evaluation_trend(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -80,23 +82,17 @@ def get_evaluation_trend(
     """날짜별 평가 등급 추이"""
     from modules.db_connection import db_query
 
-    params = []
-    where = ""
-    if start_date and end_date:
-        where = "WHERE di.date BETWEEN %s AND %s"
-        params = [start_date, end_date]
-
+    where, params = _date_range_where(start_date, end_date)
     query = f"""
         SELECT
-            di.date as eval_date,
-            SUM(CASE ae.grade_code WHEN '우수' THEN 1 ELSE 0 END) as excellent,
-            SUM(CASE ae.grade_code WHEN '평균' THEN 1 ELSE 0 END) as average,
-            SUM(CASE ae.grade_code WHEN '개선' THEN 1 ELSE 0 END) as improvement
-        FROM ai_evaluations ae
-        JOIN daily_infos di ON ae.record_id = di.record_id
+            date as eval_date,
+            SUM(CASE grade_code WHEN '우수' THEN cnt ELSE 0 END) as excellent,
+            SUM(CASE grade_code WHEN '평균' THEN cnt ELSE 0 END) as average,
+            SUM(CASE grade_code WHEN '개선' THEN cnt ELSE 0 END) as improvement
+        FROM {AI_GRADE_TABLE}
         {where}
-        GROUP BY di.date
-        ORDER BY di.date
+        GROUP BY date
+        ORDER BY date
     """
     with db_query() as cursor:
         cursor.execute(query, params)
@@ -114,6 +110,7 @@ def get_evaluation_trend(
 
 
 @router.get("/dashboard/employee-rankings")
+@cached_response(*DASHBOARD_TAGS)
 def get_employee_rankings(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -122,45 +119,52 @@ def get_employee_rankings(
     """직원별 기록 및 평가 랭킹"""
     from modules.db_connection import db_query
 
-    enc = EncryptionService()
+    enc = get_encryption_service()
     admin = is_admin(current_user)
 
-    # 1단계: 재직 중 직원 조회 및 이름 복호화
-    with db_query() as cursor:
-        cursor.execute("SELECT user_id, name FROM users WHERE work_status = '재직'")
-        users = cursor.fetchall()
-
     date_params: list = []
     date_filter = ""
     if start_date and end_date:
-        date_filter = "AND di.date BETWEEN %s AND %s"
+        date_filter = "WHERE di.date BETWEEN %s AND %s"
         date_params = [start_date, end_date]
 
-    result = []
-    for u in users:
-        uid = u["user_id"]
-        decrypted_name = enc.safe_decrypt(u["name"])
-
-        # 2단계: 복호화된 이름으로 writer_name(평문) 매칭
-        params = [decrypted_name, decrypted_name] + date_params
-        query = f"""
-            SELECT
-                COUNT(DISTINCT di.record_id) as total_records,
-                SUM(CASE ae.grade_code WHEN '우수' THEN 1 ELSE 0 END) as excellent_count,
-                SUM(CASE ae.grade_code WHEN '평균' THEN 1 ELSE 0 END) as average_count,
-                SUM(CASE ae.grade_code WHEN '개선' THEN 1 ELSE 0 END) as improvement_count
-            FROM daily_infos di
-            LEFT JOIN ai_evaluations ae ON ae.record_id = di.record_id
-            WHERE di.record_id IN (
-                SELECT dp.record_id FROM daily_physicals dp WHERE dp.writer_name = %s
-                UNION
-                SELECT dc.record_id FROM daily_cognitives dc WHERE dc.writer_name = %s
-            ) {date_filter}
-        """
-        with db_query() as cursor:
-            cursor.execute(query, params)
-            row = cursor.fetchone()
+    with db_query() as cursor:
+        # 1단계: 재직 중 직원 조회 및 이름 복호화
+        cursor.execute("SELECT user_id, name FROM users WHERE work_status = '재직'")
+        users = cursor.fetchall()
+        names = enc.decrypt_many(u["name"] for u in users)
+        writer_names = list(dict.fromkeys(n for n in names if n))
+
+        # 2단계: 작성자(writer_name, 평문)별 통계를 한 번의 GROUP BY 로 집계
+        # (작성자, 기록) 쌍을 UNION 으로 중복 제거 → 기록 수는 작성자별 DISTINCT 와 동일
+        stats = {}
+        if writer_names:
+            placeholders = ", ".join(["%s"] * len(writer_names))
+            query = f"""
+                SELECT
+                    w.writer_name,
+                    COUNT(DISTINCT di.record_id) as total_records,
+                    SUM(CASE ae.grade_code WHEN '우수' THEN 1 ELSE 0 END) as excellent_count,
+                    SUM(CASE ae.grade_code WHEN '평균' THEN 1 ELSE 0 END) as average_count,
+                    SUM(CASE ae.grade_code WHEN '개선' THEN 1 ELSE 0 END) as improvement_count
+                FROM (
+                    SELECT dp.record_id, dp.writer_name FROM daily_physicals dp
+                    WHERE dp.writer_name IN ({placeholders})
+                    UNION
+                    SELECT dc.record_id, dc.writer_name FROM daily_cognitives dc
+                    WHERE dc.writer_name IN ({placeholders})
+                ) w
+                JOIN daily_infos di ON di.record_id = w.record_id
+                LEFT JOIN ai_evaluations ae ON ae.record_id = di.record_id
+                {date_filter}
+                GROUP BY w.writer_name
+            """
+            cursor.execute(query, writer_names + writer_names + date_params)
+            stats = {row["writer_name"]: row for row in cursor.fetchall()}
 
+    result = []
+    for u, decrypted_name in zip(users, names):
+        row = stats.get(decrypted_name)
         exc = (row["excellent_count"] or 0) if row else 0
         avg = (row["average_count"] or 0) if row else 0
         imp = (row["improvement_count"] or 0) if row else 0
@@ -170,7 +174,7 @@ def get_employee_rankings(
 
         display_name = decrypted_name if admin else mask_name(decrypted_name)
         result.append({
-            "user_id": uid,
+            "user_id": u["user_id"],
             "name": display_name,
             "total_records": total_r,
             "excellent_count": exc,
@@ -184,6 +188,7 @@ def get_employee_rankings(
 
 
 @router.get("/dashboard/ai-grade-dist")
+@cached_response(*DASHBOARD_TAGS)
 def get_ai_grade_dist(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -191,27 +196,22 @@ def get_ai_grade_dist(
     """AI 평가 등급 분포"""
     from modules.db_connection import db_query
 
-    params = []
-    where = ""
-    if start_date and end_date:
-        where = "WHERE di.date BETWEEN %s AND %s"
-        params = [start_date, end_date]
-
+    where, params = _date_range_where(start_date, end_date)
     query = f"""
-        SELECT ae.grade_code as grade, COUNT(*) as count
-        FROM ai_evaluations ae
-        JOIN daily_infos di ON ae.record_id = di.record_id
+        SELECT NULLIF(grade_code, '') as grade, SUM(cnt) as count
+        FROM {AI_GRADE_TABLE}
         {where}
-        GROUP BY ae.grade_code
+        GROUP BY grade_code
     """
     with db_query() as cursor:
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
-    return [{"grade": r["grade"], "count": r["count"]} for r in rows]
+    return [{"grade": r["grade"], "count": int(r["count"])} for r in rows]
 
 
 @router.get("/dashboard/employee/{user_id}/details")
+@cached_response(*DASHBOARD_TAGS)
 def get_employee_details(
     user_id: int,
     start_date: Optional[date] = Query(None),
@@ -221,7 +221,7 @@ def get_employee_details(
     """직원별 상세 기록 및 평가"""
     from modules.db_connection import db_query
 
-    enc = EncryptionService()
+    enc = get_encryption_service()
     admin = is_admin(current_user)
 
     with db_query() as cursor:
@@ -263,13 +263,10 @@ def get_employee_details(
         records = cursor.fetchall()
 
     # 복호화 + 마스킹
-    processed_records = []
-    for r in records:
-        row = dict(r)
-        if row.get("customer_name"):
-            plain = enc.safe_decrypt(row["customer_name"])
-            row["customer_name"] = plain if admin else mask_name(plain)
-        processed_records.append(row)
+    processed_records = enc.decrypt_columns(records, ("customer_name",))
+    for row in processed_records:
+        if row.get("customer_name") and not admin:
+            row["customer_name"] = mask_name(row["customer_name"])
 
     display_name = decrypted_name if admin else mask_name(decrypted_name)
     return {
@@ -283,6 +280,7 @@ def get_employee_details(
 
 
 @router.get("/dashboard/emp-eval-trend")
+@cached_response(*DASHBOARD_TAGS)
 def get_emp_eval_trend(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -290,24 +288,19 @@ def get_emp_eval_trend(
     """직원 평가 유형별 일별 추이 (누락/내용부족/오타/문법/오류)"""
     from modules.db_connection import db_query
 
-    params = []
-    where = ""
-    if start_date and end_date:
-        where = "WHERE ee.evaluation_date BETWEEN %s AND %s"
-        params = [start_date, end_date]
-
+    where, params = _date_range_where(start_date, end_date)
     query = f"""
         SELECT
-            ee.evaluation_date as eval_date,
-            SUM(CASE ee.evaluation_type WHEN '누락' THEN 1 ELSE 0 END) as cnt_누락,
-            SUM(CASE ee.evaluation_type WHEN '내용부족' THEN 1 ELSE 0 END) as cnt_내용부족,
-            SUM(CASE ee.evaluation_type WHEN '오타' THEN 1 ELSE 0 END) as cnt_오타,
-            SUM(CASE ee.evaluation_type WHEN '문법' THEN 1 ELSE 0 END) as cnt_문법,
-            SUM(CASE ee.evaluation_type WHEN '오류' THEN 1 ELSE 0 END) as cnt_오류
-        FROM employee_evaluations ee
+            date as eval_date,
+            SUM(CASE evaluation_type WHEN '누락' THEN cnt ELSE 0 END) as cnt_누락,
+            SUM(CASE evaluation_type WHEN '내용부족' THEN cnt ELSE 0 END) as cnt_내용부족,
+            SUM(CASE evaluation_type WHEN '오타' THEN cnt ELSE 0 END) as cnt_오타,
+            SUM(CASE evaluation_type WHEN '문법' THEN cnt ELSE 0 END) as cnt_문법,
+            SUM(CASE evaluation_type WHEN '오류' THEN cnt ELSE 0 END) as cnt_오류
+        FROM {EMP_EVAL_TABLE}
         {where}
-        GROUP BY ee.evaluation_date
-        ORDER BY ee.evaluation_date
+        GROUP BY date
+        ORDER BY date
     """
     with db_query() as cursor:
         cursor.execute(query, params)
@@ -327,6 +320,7 @@ def get_emp_eval_trend(
 
 
 @router.get("/dashboard/emp-eval-category")
+@cached_response(*DASHBOARD_TAGS)
 def get_emp_eval_category(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -334,15 +328,10 @@ def get_emp_eval_category(
     """직원 평가 카테고리별 건수"""
     from modules.db_connection import db_query
 
-    params = []
-    where = ""
-    if start_date and end_date:
-        where = "WHERE evaluation_date BETWEEN %s AND %s"
-        params = [start_date, end_date]
-
+    where, params = _date_range_where(start_date, end_date)
     query = f"""
-        SELECT category, COUNT(*) as count
-        FROM employee_evaluations
+        SELECT NULLIF(category, '') as category, SUM(cnt) as count
+        FROM {EMP_EVAL_TABLE}
         {where}
         GROUP BY category
         ORDER BY count DESC
@@ -351,10 +340,11 @@ def get_emp_eval_category(
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
-    return [{"category": r["category"], "count": r["count"]} for r in rows]
+    return [{"category": r["category"], "count": int(r["count"])} for r in rows]
 
 
 @router.get("/dashboard/emp-eval-rankings")
+@cached_response(*DASHBOARD_TAGS)
 def get_emp_eval_rankings(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -389,10 +379,10 @@ def get_emp_eval_rankings(
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
-    enc = EncryptionService()
+    enc = get_encryption_service()
     admin = is_admin(current_user)
     result = []
-    for r in rows:
+    for r, plain in zip(rows, enc.decrypt_many(r["name"] for r in rows)):
         types = {
             "누락": r["cnt_누락"] or 0,
             "내용부족": r["cnt_내용부족"] or 0,
@@ -401,7 +391,6 @@ def get_emp_eval_rankings(
             "오류": r["cnt_오류"] or 0,
         }
         main_type = max(types, key=lambda k: types[k]) if any(types.values()) else "-"
-        plain = enc.safe_decrypt(r["name"])
         result.append({
             "user_id": r["user_id"],
             "name": plain if admin else mask_name(plain),
@@ -412,6 +401,7 @@ def get_emp_eval_rankings(
 
 
 @router.get("/dashboard/employee/{user_id}/emp-eval-history")
+@cached_response(*DASHBOARD_TAGS)
 def get_employee_eval_history(
     user_id: int,
     start_date: Optional[date] = Query(None),
@@ -428,7 +418,7 @@ def get_employee_eval_history(
     if not user:
         raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
 
-    enc = EncryptionService()
+    enc = get_encryption_service()
     admin = is_admin(current_user)
     decrypted_name = enc.safe_decrypt(user["name"])
 
@@ -475,6 +465,7 @@ def get_employee_eval_history(
 
 
 @router.get("/dashboard/period-comparison")
+@cached_response(*DASHBOARD_TAGS)
 def get_period_comparison(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -496,14 +487,14 @@ def get_period_comparison(
 
     def _fetch_period(cursor, sd, ed):
         cursor.execute(
-            "SELECT evaluation_type, COUNT(*) as cnt "
-            "FROM employee_evaluations "
-            "WHERE evaluation_date BETWEEN %s AND %s "
+            "SELECT NULLIF(evaluation_type, '') as evaluation_type, SUM(cnt) as cnt "
+            f"FROM {EMP_EVAL_TABLE} "
+            "WHERE date BETWEEN %s AND %s "
             "GROUP BY evaluation_type",
             (sd, ed),
         )
         rows = cursor.fetchall()
-        by_type = {r["evaluation_type"]: r["cnt"] for r in rows}
+        by_type = {r["evaluation_type"]: int(r["cnt"]) for r in rows}
         total = sum(by_type.values())
         return {"start": str(sd), "end": str(ed), "total": total, "by_type": by_type}
 
@@ -523,6 +514,7 @@ def get_period_comparison(
 
 
 @router.get("/dashboard/kpi-summary")
+@cached_response(*DASHBOARD_TAGS)
 def get_kpi_summary(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -530,65 +522,57 @@ def get_kpi_summary(
     """KPI 카드에 필요한 지표 + 이전 기간 대비 delta."""
     from modules.db_connection import db_query
 
-    def _fetch_kpi(cursor, sd, ed):
-        if sd and ed:
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM employee_evaluations "
-                "WHERE evaluation_date BETWEEN %s AND %s",
-                (sd, ed),
-            )
-        else:
-            cursor.execute("SELECT COUNT(*) as total FROM employee_evaluations")
-        total = cursor.fetchone()["total"]
-
-        if sd and ed:
-            cursor.execute(
-                "SELECT COUNT(*) as cnt FROM ("
-                "  SELECT target_user_id FROM employee_evaluations "
-                "  WHERE evaluation_date BETWEEN %s AND %s "
-                "  GROUP BY target_user_id HAVING COUNT(*) >= 5"
-                ") sub",
-                (sd, ed),
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) as cnt FROM ("
-                "  SELECT target_user_id FROM employee_evaluations "
-                "  GROUP BY target_user_id HAVING COUNT(*) >= 5"
-                ") sub"
-            )
-        high_risk = cursor.fetchone()["cnt"]
-
-        if sd and ed:
-            cursor.execute(
-                "SELECT COUNT(DISTINCT target_user_id) as emp_cnt "
-                "FROM employee_evaluations "
-                "WHERE evaluation_date BETWEEN %s AND %s",
-                (sd, ed),
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(DISTINCT target_user_id) as emp_cnt "
-                "FROM employee_evaluations"
-            )
-        emp_cnt = cursor.fetchone()["emp_cnt"]
-        avg = round(total / emp_cnt, 1) if emp_cnt > 0 else None
-
-        return total, avg, high_risk
+    # 직원별 합계를 현재/이전 기간으로 나눠 한 번에 집계 (집계 테이블 1회 조회)
+    prev_start = prev_end = None
+    if start_date and end_date:
+        period_length = (end_date - start_date).days
+        prev_end = start_date - timedelta(days=1)
+        prev_start = prev_end - timedelta(days=period_length)
+        per_user = f"""
+            SELECT target_user_id,
+                   SUM(CASE WHEN date BETWEEN %s AND %s THEN cnt ELSE 0 END) as curr,
+                   SUM(CASE WHEN date BETWEEN %s AND %s THEN cnt ELSE 0 END) as prev
+            FROM {EMP_EVAL_TABLE}
+            WHERE date BETWEEN %s AND %s
+            GROUP BY target_user_id
+        """
+        params = [start_date, end_date, prev_start, prev_end, prev_start, end_date]
+    else:
+        per_user = f"""
+            SELECT target_user_id, SUM(cnt) as curr, 0 as prev
+            FROM {EMP_EVAL_TABLE}
+            GROUP BY target_user_id
+        """
+        params = []
 
     with db_query() as cursor:
         cursor.execute("SELECT COUNT(*) as cnt FROM users WHERE work_status = '재직'")
         total_employees = cursor.fetchone()["cnt"]
 
-        curr_total, curr_avg, curr_high = _fetch_kpi(cursor, start_date, end_date)
+        cursor.execute(
+            f"""
+            SELECT
+                COALESCE(SUM(curr), 0) as curr_total,
+                COALESCE(SUM(curr > 0), 0) as curr_emp_cnt,
+                COALESCE(SUM(curr >= 5), 0) as curr_high_risk,
+                COALESCE(SUM(prev), 0) as prev_total,
+                COALESCE(SUM(prev > 0), 0) as prev_emp_cnt,
+                COALESCE(SUM(prev >= 5), 0) as prev_high_risk
+            FROM ({per_user}) per_user
+            """,
+            params,
+        )
+        kpi = {k: int(v or 0) for k, v in cursor.fetchone().items()}
 
-        # 이전 기간 계산
-        prev_total, prev_avg, prev_high = 0, None, 0
-        if start_date and end_date:
-            period_length = (end_date - start_date).days
-            prev_end = start_date - timedelta(days=1)
-            prev_start = prev_end - timedelta(days=period_length)
-            prev_total, prev_avg, prev_high = _fetch_kpi(cursor, prev_start, prev_end)
+    def _avg(total, emp_cnt):
+        return round(total / emp_cnt, 1) if emp_cnt > 0 else None
+
+    curr_total, curr_high = kpi["curr_total"], kpi["curr_high_risk"]
+    curr_avg = _avg(curr_total, kpi["curr_emp_cnt"])
+    prev_total, prev_avg, prev_high = 0, None, 0
+    if prev_start is not None:
+        prev_total, prev_high = kpi["prev_total"], kpi["prev_high_risk"]
+        prev_avg = _avg(prev_total, kpi["prev_emp_cnt"])
 
     def _delta(curr, prev):
         if prev is None or prev == 0:
@@ -609,6 +593,7 @@ def get_kpi_summary(
 
 
 @router.get("/dashboard/employee/{user_id}/monthly-trend")
+@cached_response(*DASHBOARD_TAGS)
 def get_employee_monthly_trend(
     user_id: int,
     months: int = Query(6, ge=1, le=24),
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 
-from backend.dependencies import get_employee_evaluation_repo, get_current_user, require_admin
+from backend.dependencies import get_employee_evaluation_repo, get_current_user, get_response_cache, require_admin
+from backend.response_cache import TAG_EMPLOYEE_EVALUATIONS, ResponseCache
 from backend.schemas.employee_evaluations import (
     EmployeeEvaluationCreate,
     EmployeeEvaluationUpdate,
@@ -33,6 +34,7 @@ def get_employee_evaluations(
 def create_employee_evaluation(
     body: EmployeeEvaluationCreate,
     repo: EmployeeEvaluationRepository = Depends(get_employee_evaluation_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     # 기존 평가 확인
@@ -54,6 +56,7 @@ def create_employee_evaluation(
                 score=body.score,
                 comment=body.comment,
             )
+            cache.invalidate(TAG_EMPLOYEE_EVALUATIONS)
             return repo.get_evaluations_by_record(body.record_id)[0]
 
     emp_eval_id = repo.save_evaluation(
@@ -67,6 +70,7 @@ def create_employee_evaluation(
         score=body.score,
         comment=body.comment,
     )
+    cache.invalidate(TAG_EMPLOYEE_EVALUATIONS)
 
     result = repo.get_evaluation_by_id(emp_eval_id)
     if result:
@@ -80,6 +84,7 @@ def update_employee_evaluation(
     emp_eval_id: int,
     body: EmployeeEvaluationUpdate,
     repo: EmployeeEvaluationRepository = Depends(get_employee_evaluation_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     affected = repo.update_evaluation(
@@ -94,6 +99,7 @@ def update_employee_evaluation(
     )
     if not affected:
         raise HTTPException(status_code=404, detail="평가를 찾을 수 없습니다.")
+    cache.invalidate(TAG_EMPLOYEE_EVALUATIONS)
     return {"message": "업데이트 완료"}
 
 
@@ -101,8 +107,10 @@ def update_employee_evaluation(
 def delete_employee_evaluation(
     emp_eval_id: int,
     repo: EmployeeEvaluationRepository = Depends(get_employee_evaluation_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     affected = repo.delete_evaluation(emp_eval_id)
     if not affected:
         raise HTTPException(status_code=404, detail="평가를 찾을 수 없습니다.")
+    cache.invalidate(TAG_EMPLOYEE_EVALUATIONS)
@@ -3,8 +3,9 @@ from typing import List, Optional
 
 from passlib.context import CryptContext
 
-from backend.dependencies import get_user_repo, get_current_user, require_admin
+from backend.dependencies import get_user_repo, get_current_user, get_response_cache, require_admin
 from backend.encryption import apply_employee_mask, is_admin
+from backend.response_cache import TAG_USERS, ResponseCache
 from backend.schemas.employees import EmployeeCreate, EmployeeUpdate, EmployeeResponse
 from modules.repositories.user import UserRepository
 from modules.repositories.audit import AuditRepository
@@ -67,6 +68,7 @@ def create_employee(
     request: Request,
     body: EmployeeCreate,
     repo: UserRepository = Depends(get_user_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     hashed_password = _pwd_context.hash(body.password)
@@ -83,6 +85,7 @@ def create_employee(
         license_name=body.license_name,
         license_date=body.license_date,
     )
+    cache.invalidate(TAG_USERS)
     employee = repo.get_user(user_id)
     _audit_repo().log(
         user_id=current_user["user_id"],
@@ -100,6 +103,7 @@ def update_employee(
     user_id: int,
     body: EmployeeUpdate,
     repo: UserRepository = Depends(get_user_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     repo.update_user(
@@ -114,6 +118,7 @@ def update_employee(
         license_name=body.license_name,
         license_date=body.license_date,
     )
+    cache.invalidate(TAG_USERS)
     employee = repo.get_user(user_id)
     if not employee:
         raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
@@ -132,12 +137,14 @@ def soft_delete_employee(
     request: Request,
     user_id: int,
     repo: UserRepository = Depends(get_user_repo),
+    cache: ResponseCache = Depends(get_response_cache),
     current_user: dict = Depends(require_admin),
 ):
     """퇴사 처리 (soft delete)"""
     affected = repo.soft_delete_user(user_id)
     if not affected:
         raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
+    cache.invalidate(TAG_USERS)
     _audit_repo().log(
         user_id=current_user["user_id"],
         action="DELETE",
@@ -3,8 +3,8 @@
 import calendar
 from fastapi import APIRouter, Depends, HTTPException
 
-from backend.dependencies import require_admin, get_feedback_service
-from backend.encryption import EncryptionService
+from backend.dependencies import require_admin, get_feedback_service, without_unit_of_work
+from backend.encryption import get_encryption_service
 from backend.schemas.feedback_reports import (
     FeedbackReportCreate,
     FeedbackReportResponse,
@@ -20,6 +20,7 @@ router = APIRouter(dependencies=[Depends(require_admin)])
     "/dashboard/employee/{user_id}/feedback-report",
     response_model=FeedbackReportResponse,
 )
+@without_unit_of_work
 def create_feedback_report(
     user_id: int,
     body: FeedbackReportCreate,
@@ -32,7 +33,7 @@ def create_feedback_report(
     if not user:
         raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다.")
 
-    enc = EncryptionService()
+    enc = get_encryption_service()
     employee_name = enc.safe_decrypt(user["name"])
 
     try:
@@ -62,6 +63,7 @@ def create_feedback_report(
             target_month=body.target_month,
             admin_note=body.admin_note,
             evaluations=[dict(r) for r in evaluations],
+            use_cache=body.use_cache,
         )
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
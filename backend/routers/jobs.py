@@ -0,0 +1,73 @@
+"""백그라운드 작업 조회/취소 라우터"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from backend.dependencies import get_current_user, get_jobs
+from backend.jobs import JobFunc, JobLimitExceeded, JobManager
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+def job_owner(current_user: dict) -> str:
+    return str(current_user.get("user_id"))
+
+
+def _is_admin(current_user: dict) -> bool:
+    return str(current_user.get("role", "")).upper() == "ADMIN"
+
+
+def submit_job(
+    jobs: JobManager,
+    kind: str,
+    current_user: dict,
+    func: JobFunc,
+    *args,
+    total: Optional[int] = None,
+) -> dict:
+    """작업 등록. 사용자별 동시 작업 수 초과 시 429."""
+    try:
+        job_id = jobs.submit(kind, job_owner(current_user), func, *args, total=total)
+    except JobLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return {"job_id": job_id, "kind": kind, "status": "queued"}
+
+
+def _get_own_job(jobs: JobManager, job_id: str, current_user: dict) -> dict:
+    job = jobs.get(job_id)
+    # 다른 사용자의 작업은 존재 여부도 노출하지 않음 (ADMIN 제외)
+    if job is None or (job["owner"] != job_owner(current_user) and not _is_admin(current_user)):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/jobs")
+def list_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    jobs: JobManager = Depends(get_jobs),
+    current_user: dict = Depends(get_current_user),
+):
+    """내 최근 작업 목록 (결과 본문 제외)."""
+    return jobs.list_jobs(owner=job_owner(current_user), limit=limit)
+
+
+@router.get("/jobs/{job_id}")
+def get_job(
+    job_id: str,
+    jobs: JobManager = Depends(get_jobs),
+    current_user: dict = Depends(get_current_user),
+):
+    """작업 상태/진행률 조회. 완료 시 result 포함."""
+    return _get_own_job(jobs, job_id, current_user)
+
+
+@router.post("/jobs/{job_id}/cancel")
+def cancel_job(
+    job_id: str,
+    jobs: JobManager = Depends(get_jobs),
+    current_user: dict = Depends(get_current_user),
+):
+    """작업 취소. 실행 중 작업은 다음 진행률 보고 시점에 중단."""
+    _get_own_job(jobs, job_id, current_user)
+    return jobs.cancel(job_id)
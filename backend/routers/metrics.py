@@ -0,0 +1,63 @@
+"""운영 지표 라우터
+
+- /metrics: Prometheus 텍스트 형식. ADMIN 쿠키 또는 METRICS_TOKEN 베어러 토큰 (스크레이퍼용)
+- /metrics/db-pool, /metrics/db-queries: JSON (ADMIN)
+"""
+
+import hmac
+import os
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from backend.dependencies import get_optional_user, require_admin
+from modules.db_connection import get_pool_stats
+from modules.db_metrics import get_statement_stats
+from modules.metrics import REGISTRY
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def require_metrics_access(
+    authorization: Optional[str] = Header(None),
+    current_user: Optional[dict] = Depends(get_optional_user),
+) -> None:
+    """METRICS_TOKEN 과 같은 Bearer 토큰이면 통과, 아니면 ADMIN 로그인 필요."""
+    token = os.getenv("METRICS_TOKEN", "")
+    if token and authorization:
+        scheme, _, value = authorization.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(value.strip(), token):
+            return
+    if current_user is None:
+        raise HTTPException(status_code=401, detail="인증이 필요합니다.")
+    require_admin(current_user)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_access)])
+def get_prometheus_metrics():
+    """DB 쿼리·풀, 라우트별 처리 시간, AI 호출, PDF 파싱 단계 지표 (Prometheus 텍스트 형식).
+
+    METRICS_DIR 가 있으면 모든 워커의 값을 합산한다.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/metrics/db-pool", dependencies=[Depends(require_admin)])
+def get_db_pool_metrics():
+    """이 워커 프로세스의 DB 연결 풀 통계. 풀이 아직 만들어지지 않았으면 pool 은 null.
+
+    워커마다 풀이 따로 있으므로 pid 로 구분한다.
+    """
+    return {"pid": os.getpid(), "pool": get_pool_stats()}
+
+
+@router.get("/metrics/db-queries", dependencies=[Depends(require_admin)])
+def get_db_query_metrics(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal["seconds_total", "calls", "seconds_max", "rows"] = "seconds_total",
+):
+    """이 워커의 SQL 지문별 호출 수/시간/행 수 상위 목록. /metrics 의 fingerprint 레이블을 SQL 로 풀 때 쓴다."""
+    return {"pid": os.getpid(), "statements": get_statement_stats(limit, order_by)}
@@ -9,23 +9,37 @@ import tempfile
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 logger = logging.getLogger(__name__)
 
-from backend.dependencies import get_current_user, get_daily_info_repo, require_admin
+from backend.dependencies import (
+    get_current_user,
+    get_daily_info_repo,
+    get_jobs,
+    get_parsed_store,
+    get_response_cache,
+    require_admin,
+    without_unit_of_work,
+)
+from backend.jobs import JobContext, JobManager
+from backend.parsed_store import ParsedResultStore
+from backend.response_cache import TAG_CUSTOMERS, TAG_DAILY_INFOS, ResponseCache
+from backend.routers.jobs import submit_job
 from modules.repositories.daily_info import DailyInfoRepository
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
-# 메모리 임시 저장소 (파싱된 결과)
-_parsed_cache: Dict[str, List[dict]] = {}
-
 # 청크 임시 저장 디렉토리
 CHUNK_DIR = Path(tempfile.gettempdir()) / "arisa_chunks"
 CHUNK_TTL_HOURS = 2
+# 세션 디렉토리 내 조립 대상 파일 / 청크 완료 맵 (청크당 1바이트)
+SESSION_FILE = "upload.pdf"
+CHUNK_MAP_FILE = "chunks.map"
 
 
 # ─── 헬퍼 ───────────────────────────────────────────────────────────────────
@@ -50,6 +64,46 @@ def _write_meta(upload_id: str, meta: dict) -> None:
     )
 
 
+def _read_done_chunks(upload_id: str) -> List[int]:
+    """완료 맵에서 수신 완료된 청크 인덱스 목록 반환."""
+    chunk_map = (_get_session_dir(upload_id) / CHUNK_MAP_FILE).read_bytes()
+    return [i for i, done in enumerate(chunk_map) if done]
+
+
+def _expected_chunk_length(meta: dict, index: int) -> int:
+    offset = index * meta["chunk_size"]
+    return min(meta["chunk_size"], meta["total_size"] - offset)
+
+
+def _write_chunk(upload_id: str, meta: dict, index: int, data: bytes) -> None:
+    """청크를 세션 파일의 바이트 오프셋에 직접 쓰고 완료 맵에 표시.
+
+    완료 맵은 청크당 1바이트라 동시 업로드에서도 읽기-수정-쓰기 경합이 없음.
+    데이터를 먼저 쓰고 맵을 나중에 표시하므로 중단돼도 미완료로 남을 뿐.
+    """
+    session_dir = _get_session_dir(upload_id)
+    with open(session_dir / SESSION_FILE, "r+b") as f:
+        f.seek(index * meta["chunk_size"])
+        f.write(data)
+    with open(session_dir / CHUNK_MAP_FILE, "r+b") as f:
+        f.seek(index)
+        f.write(b"\x01")
+
+
+def _assembled_path(upload_id: str, meta: dict) -> Path:
+    """누락 청크 검증 후 조립 완료된 세션 파일 경로 반환 (복사 없음)."""
+    total_chunks = meta["total_chunks"]
+    done_chunks = _read_done_chunks(upload_id)
+
+    if len(done_chunks) != total_chunks:
+        missing = sorted(set(range(total_chunks)) - set(done_chunks))
+        raise HTTPException(
+            status_code=400,
+            detail=f"누락된 청크: {missing[:10]}{'...' if len(missing) > 10 else ''}",
+        )
+    return _get_session_dir(upload_id) / SESSION_FILE
+
+
 def _cleanup_expired_sessions() -> None:
     """CHUNK_TTL_HOURS 초과된 청크 세션 자동 삭제."""
     if not CHUNK_DIR.exists():
@@ -72,25 +126,151 @@ def _cleanup_expired_sessions() -> None:
             shutil.rmtree(session_dir, ignore_errors=True)
 
 
+_STORE_EVICTED_DETAIL = "파싱 결과 저장 공간이 부족해 결과가 만료되었습니다. 다시 업로드하세요."
+
+
+def _ndjson_line(payload: dict) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _stream_parse(
+    pdf_source, file_id: str, filename: str, store: ParsedResultStore
+) -> Iterator[bytes]:
+    """수급자 단위 파싱 결과를 NDJSON 라인으로 순차 전송.
+
+    라인 종류:
+      - {"type": "group", "customer_name", "records"}: 수급자 한 명의 레코드
+      - {"type": "done", "file_id", "filename", "total_records", "customer_names"}
+      - {"type": "error", "detail"}: 파싱 실패 (스트림 종료)
+    """
+    from modules.parse_cache import get_parse_cache
+    from modules.pdf_parser import CareRecordParser
+
+    # 그룹마다 저장소에 바로 추가하고 done 직전에 공개 (전체 레코드를 메모리에 모으지 않음)
+    total_records = 0
+    customer_names: List[str] = []
+    try:
+        for group_records in CareRecordParser(pdf_source, cache=get_parse_cache()).iter_parse():
+            customer_name = group_records[0].get("customer_name", "")
+            if customer_name not in customer_names:
+                customer_names.append(customer_name)
+            store.append(file_id, group_records)
+            total_records += len(group_records)
+            yield _ndjson_line(
+                {"type": "group", "customer_name": customer_name, "records": group_records}
+            )
+    except Exception as e:
+        logger.error("PDF 스트리밍 파싱 실패 (file_id=%s): %s", file_id, e)
+        store.delete(file_id)
+        yield _ndjson_line({"type": "error", "detail": f"PDF 파싱 실패: {e}"})
+        return
+    except BaseException:
+        # 클라이언트 연결 종료(GeneratorExit) 등: 작성 중이던 결과를 남기지 않음
+        store.delete(file_id)
+        raise
+
+    if not total_records:
+        yield _ndjson_line({"type": "error", "detail": "파싱된 데이터가 없습니다."})
+        return
+
+    if not store.finish(file_id, total_records):
+        yield _ndjson_line({"type": "error", "detail": _STORE_EVICTED_DETAIL})
+        return
+    yield _ndjson_line(
+        {
+            "type": "done",
+            "file_id": file_id,
+            "filename": filename,
+            "total_records": total_records,
+            "customer_names": customer_names,
+        }
+    )
+
+
+def _parse_job(
+    ctx: JobContext,
+    pdf_path: str,
+    file_id: str,
+    filename: str,
+    store: ParsedResultStore,
+    session_dir: Path,
+) -> dict:
+    """백그라운드 파싱 작업. 수급자 단위로 진행률을 보고하고 끝나면 세션 디렉토리 정리."""
+    from modules.parse_cache import get_parse_cache
+    from modules.pdf_parser import CareRecordParser
+
+    published = False
+    try:
+        total_records = 0
+        customer_names: List[str] = []
+        for group_records in CareRecordParser(pdf_path, cache=get_parse_cache()).iter_parse():
+            customer_name = group_records[0].get("customer_name", "")
+            if customer_name not in customer_names:
+                customer_names.append(customer_name)
+            store.append(file_id, group_records)
+            total_records += len(group_records)
+            ctx.progress(len(customer_names), message=f"{total_records}건 파싱")
+
+        if not total_records:
+            raise ValueError("파싱된 데이터가 없습니다.")
+
+        published = store.finish(file_id, total_records)
+        if not published:
+            raise RuntimeError(_STORE_EVICTED_DETAIL)
+        return {
+            "file_id": file_id,
+            "filename": filename,
+            "total_records": total_records,
+            "customer_names": customer_names,
+        }
+    finally:
+        if not published:
+            store.delete(file_id)
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+
+def _save_job(
+    ctx: JobContext,
+    file_id: str,
+    records: List[dict],
+    repo: DailyInfoRepository,
+    store: ParsedResultStore,
+    cache: ResponseCache,
+) -> dict:
+    """백그라운드 DB 저장 작업. 배치 커밋마다 진행률 보고."""
+    try:
+        saved_count = repo.save_parsed_data(
+            records,
+            progress=lambda done, total: ctx.progress(done, total, f"{done}/{total}건 저장"),
+        )
+    finally:
+        # 배치 단위 커밋이므로 중간 실패/취소에도 이미 저장된 분량 반영
+        cache.invalidate(TAG_DAILY_INFOS, TAG_CUSTOMERS)
+    store.delete(file_id)
+    return {"saved_count": saved_count, "message": f"{saved_count}건 저장 완료"}
+
+
 # ─── 기존 단일 업로드 엔드포인트 ────────────────────────────────────────────
 
 
 @router.post("/upload")
 async def upload_pdf(
     file: UploadFile = File(...),
+    store: ParsedResultStore = Depends(get_parsed_store),
     _: dict = Depends(require_admin),
 ):
-    """PDF 파싱 → 메모리 보관. file_id 반환."""
+    """PDF 파싱 → 파싱 결과 저장소 보관. file_id 반환."""
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
 
+    from modules.parse_cache import get_parse_cache
     from modules.pdf_parser import CareRecordParser
 
     try:
         contents = await file.read()
         pdf_bytes = io.BytesIO(contents)
 
-        parser = CareRecordParser(pdf_bytes)
+        parser = CareRecordParser(pdf_bytes, cache=get_parse_cache())
         records = await asyncio.to_thread(parser.parse)
     except Exception as e:
         raise HTTPException(status_code=422, detail=f"PDF 파싱 실패: {e}")
@@ -99,7 +279,7 @@ async def upload_pdf(
         raise HTTPException(status_code=422, detail="파싱된 데이터가 없습니다.")
 
     file_id = str(uuid.uuid4())
-    _parsed_cache[file_id] = records
+    await asyncio.to_thread(store.put, file_id, records)
 
     customer_names = list({r.get("customer_name", "") for r in records})
     return {
@@ -111,14 +291,96 @@ async def upload_pdf(
     }
 
 
+@router.post("/upload/stream")
+async def upload_pdf_stream(
+    file: UploadFile = File(...),
+    store: ParsedResultStore = Depends(get_parsed_store),
+    _: dict = Depends(require_admin),
+):
+    """PDF 파싱 결과를 수급자 단위 NDJSON으로 스트리밍. 마지막 라인에 file_id 반환."""
+    if not file.filename or not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
+
+    contents = await file.read()
+    return StreamingResponse(
+        _stream_parse(io.BytesIO(contents), str(uuid.uuid4()), file.filename, store),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/upload/jobs", status_code=202)
+async def upload_pdf_job(
+    file: UploadFile = File(...),
+    store: ParsedResultStore = Depends(get_parsed_store),
+    jobs: JobManager = Depends(get_jobs),
+    current_user: dict = Depends(require_admin),
+):
+    """PDF를 임시 파일로 받아 백그라운드 파싱 작업 등록. job_id로 진행률 조회."""
+    if not file.filename or not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
+
+    _cleanup_expired_sessions()
+    file_id = str(uuid.uuid4())
+    session_dir = _get_session_dir(file_id)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    _write_meta(
+        file_id,
+        {
+            "upload_id": file_id,
+            "filename": file.filename,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    pdf_path = session_dir / SESSION_FILE
+
+    def _spool() -> None:
+        with open(pdf_path, "wb") as f:
+            shutil.copyfileobj(file.file, f)
+
+    await asyncio.to_thread(_spool)
+
+    try:
+        return submit_job(
+            jobs, "parse", current_user, _parse_job,
+            str(pdf_path), file_id, file.filename, store, session_dir,
+        )
+    except HTTPException:
+        shutil.rmtree(session_dir, ignore_errors=True)
+        raise
+
+
+@router.post("/upload/{file_id}/save/job", status_code=202)
+def save_parsed_data_job(
+    file_id: str,
+    repo: DailyInfoRepository = Depends(get_daily_info_repo),
+    store: ParsedResultStore = Depends(get_parsed_store),
+    jobs: JobManager = Depends(get_jobs),
+    cache: ResponseCache = Depends(get_response_cache),
+    current_user: dict = Depends(require_admin),
+):
+    """파싱된 데이터의 DB 저장을 백그라운드 작업으로 등록."""
+    records = store.get(file_id)
+    if not records:
+        raise HTTPException(
+            status_code=404, detail="파싱 데이터를 찾을 수 없습니다. 다시 업로드하세요."
+        )
+    return submit_job(
+        jobs, "save", current_user, _save_job,
+        file_id, records, repo, store, cache, total=len(records),
+    )
+
+
 @router.post("/upload/{file_id}/save")
+@without_unit_of_work
 def save_parsed_data(
     file_id: str,
     repo: DailyInfoRepository = Depends(get_daily_info_repo),
+    store: ParsedResultStore = Depends(get_parsed_store),
+    cache: ResponseCache = Depends(get_response_cache),
     _: dict = Depends(require_admin),
 ):
     """파싱된 데이터를 DB에 저장"""
-    records = _parsed_cache.get(file_id)
+    records = store.get(file_id)
     if not records:
         raise HTTPException(
             status_code=404, detail="파싱 데이터를 찾을 수 없습니다. 다시 업로드하세요."
@@ -129,16 +391,21 @@ def save_parsed_data(
     except Exception as e:
         logger.error("DB 저장 실패 (file_id=%s): %s", file_id, e)
         raise HTTPException(status_code=500, detail="DB 저장 중 오류가 발생했습니다.")
+    finally:
+        cache.invalidate(TAG_DAILY_INFOS, TAG_CUSTOMERS)
 
-    del _parsed_cache[file_id]
+    store.delete(file_id)
 
     return {"saved_count": saved_count, "message": f"{saved_count}건 저장 완료"}
 
 
 @router.get("/upload/{file_id}/preview")
-def get_parsed_preview(file_id: str):
+def get_parsed_preview(
+    file_id: str,
+    store: ParsedResultStore = Depends(get_parsed_store),
+):
     """파싱된 데이터 미리보기"""
-    records = _parsed_cache.get(file_id)
+    records = store.get(file_id)
     if not records:
         raise HTTPException(status_code=404, detail="파싱 데이터를 찾을 수 없습니다.")
     return {"file_id": file_id, "records": records, "total": len(records)}
@@ -152,29 +419,48 @@ async def init_chunked_upload(
     filename: str,
     total_size: int,
     total_chunks: int,
+    chunk_size: Optional[int] = None,
     _: dict = Depends(require_admin),
 ):
-    """청크 업로드 세션 초기화. upload_id 반환."""
+    """청크 업로드 세션 초기화. upload_id 반환.
+
+    total_size 크기의 세션 파일을 미리 만들어 두고 각 청크는 index * chunk_size
+    위치에 직접 기록. chunk_size 미지정 시 total_size / total_chunks 올림값 사용.
+    """
     _cleanup_expired_sessions()
 
     if not filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
 
+    if total_size <= 0 or total_chunks <= 0:
+        raise HTTPException(status_code=400, detail="잘못된 파일 크기 또는 청크 수입니다.")
+    if chunk_size is None:
+        chunk_size = -(-total_size // total_chunks)
+    if chunk_size <= 0 or -(-total_size // chunk_size) != total_chunks:
+        raise HTTPException(
+            status_code=400, detail="chunk_size와 total_chunks가 파일 크기와 맞지 않습니다."
+        )
+
     upload_id = str(uuid.uuid4())
     session_dir = _get_session_dir(upload_id)
     session_dir.mkdir(parents=True, exist_ok=True)
 
+    # 희소 파일로 미리 할당 (디스크 블록은 실제로 쓴 청크만 사용)
+    with open(session_dir / SESSION_FILE, "wb") as f:
+        f.truncate(total_size)
+    (session_dir / CHUNK_MAP_FILE).write_bytes(bytes(total_chunks))
+
     meta = {
         "upload_id": upload_id,
         "filename": filename,
         "total_size": total_size,
         "total_chunks": total_chunks,
+        "chunk_size": chunk_size,
         "created_at": datetime.now(timezone.utc).isoformat(),
-        "done_chunks": [],
     }
     _write_meta(upload_id, meta)
 
-    return {"upload_id": upload_id, "total_chunks": total_chunks}
+    return {"upload_id": upload_id, "total_chunks": total_chunks, "chunk_size": chunk_size}
 
 
 @router.put("/upload/chunk/{upload_id}")
@@ -184,23 +470,24 @@ async def upload_chunk(
     chunk: UploadFile = File(...),
     _: dict = Depends(require_admin),
 ):
-    """청크 하나를 업로드. 이미 완료된 청크는 덮어쓰기 허용 (재시도 안전)."""
+    """청크 하나를 세션 파일의 해당 위치에 기록. 이미 완료된 청크는 덮어쓰기 허용 (재시도 안전)."""
     meta = _read_meta(upload_id)
 
     if index < 0 or index >= meta["total_chunks"]:
         raise HTTPException(status_code=400, detail=f"잘못된 청크 인덱스: {index}")
 
-    chunk_path = _get_session_dir(upload_id) / f"chunk_{index:06d}.bin"
     data = await chunk.read()
-    chunk_path.write_bytes(data)
-
-    if index not in meta["done_chunks"]:
-        meta["done_chunks"].append(index)
-    _write_meta(upload_id, meta)
+    expected = _expected_chunk_length(meta, index)
+    if len(data) != expected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"청크 크기 불일치: index={index}, 예상 {expected}B, 수신 {len(data)}B",
+        )
+    _write_chunk(upload_id, meta, index, data)
 
     return {
         "upload_id": upload_id,
-        "done_chunks": meta["done_chunks"],
+        "done_chunks": _read_done_chunks(upload_id),
         "total_chunks": meta["total_chunks"],
     }
 
@@ -211,7 +498,7 @@ async def get_chunk_status(upload_id: str):
     meta = _read_meta(upload_id)
     return {
         "upload_id": upload_id,
-        "done_chunks": meta["done_chunks"],
+        "done_chunks": _read_done_chunks(upload_id),
         "total_chunks": meta["total_chunks"],
         "filename": meta["filename"],
     }
@@ -220,47 +507,31 @@ async def get_chunk_status(upload_id: str):
 @router.post("/upload/chunk/{upload_id}/complete")
 async def complete_chunked_upload(
     upload_id: str,
+    store: ParsedResultStore = Depends(get_parsed_store),
     _: dict = Depends(require_admin),
 ):
-    """모든 청크를 합쳐 PDF 파싱. 기존 /upload 응답과 동일한 구조 반환."""
+    """조립된 세션 파일을 경로로 열어 PDF 파싱. 기존 /upload 응답과 동일한 구조 반환."""
     meta = _read_meta(upload_id)
-
-    total_chunks = meta["total_chunks"]
-    done_chunks = sorted(meta["done_chunks"])
-
-    if len(done_chunks) != total_chunks or done_chunks != list(range(total_chunks)):
-        missing = sorted(set(range(total_chunks)) - set(done_chunks))
-        raise HTTPException(
-            status_code=400,
-            detail=f"누락된 청크: {missing[:10]}{'...' if len(missing) > 10 else ''}",
-        )
-
-    # 청크 합치기
+    pdf_path = _assembled_path(upload_id, meta)
     session_dir = _get_session_dir(upload_id)
-    pdf_buffer = io.BytesIO()
-    for i in range(total_chunks):
-        chunk_path = session_dir / f"chunk_{i:06d}.bin"
-        if not chunk_path.exists():
-            raise HTTPException(status_code=400, detail=f"청크 파일 없음: {i}")
-        pdf_buffer.write(chunk_path.read_bytes())
-    pdf_buffer.seek(0)
 
+    from modules.parse_cache import get_parse_cache
     from modules.pdf_parser import CareRecordParser
 
     try:
-        parser = CareRecordParser(pdf_buffer)
+        parser = CareRecordParser(str(pdf_path), cache=get_parse_cache())
         records = await asyncio.to_thread(parser.parse)
     except Exception as e:
         raise HTTPException(status_code=422, detail=f"PDF 파싱 실패: {e}")
     finally:
-        # 파싱 성공·실패 무관하게 임시 청크 정리
+        # 파싱 성공·실패 무관하게 세션 디렉토리 정리
         shutil.rmtree(session_dir, ignore_errors=True)
 
     if not records:
         raise HTTPException(status_code=422, detail="파싱된 데이터가 없습니다.")
 
-    # 기존 캐시에 동일 upload_id로 저장 (save 엔드포인트 재사용)
-    _parsed_cache[upload_id] = records
+    # 동일 upload_id로 저장 (save 엔드포인트 재사용)
+    await asyncio.to_thread(store.put, upload_id, records)
 
     customer_names = list({r.get("customer_name", "") for r in records})
     return {
@@ -270,3 +541,37 @@ async def complete_chunked_upload(
         "customer_names": customer_names,
         "records": records,
     }
+
+
+@router.post("/upload/chunk/{upload_id}/complete/stream")
+async def complete_chunked_upload_stream(
+    upload_id: str,
+    store: ParsedResultStore = Depends(get_parsed_store),
+    _: dict = Depends(require_admin),
+):
+    """조립된 세션 파일을 수급자 단위 NDJSON으로 스트리밍 파싱. /upload/stream과 동일한 라인 형식."""
+    meta = _read_meta(upload_id)
+    pdf_path = _assembled_path(upload_id, meta)
+
+    # 세션 파일은 스트림 전송이 끝난 뒤 정리 (중단 시 TTL 정리에 맡김)
+    return StreamingResponse(
+        _stream_parse(str(pdf_path), upload_id, meta["filename"], store),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(shutil.rmtree, _get_session_dir(upload_id), ignore_errors=True),
+    )
+
+
+@router.post("/upload/chunk/{upload_id}/complete/job", status_code=202)
+def complete_chunked_upload_job(
+    upload_id: str,
+    store: ParsedResultStore = Depends(get_parsed_store),
+    jobs: JobManager = Depends(get_jobs),
+    current_user: dict = Depends(require_admin),
+):
+    """조립된 세션 파일의 파싱을 백그라운드 작업으로 등록. 결과 file_id는 upload_id와 동일."""
+    meta = _read_meta(upload_id)
+    pdf_path = _assembled_path(upload_id, meta)
+    return submit_job(
+        jobs, "parse", current_user, _parse_job,
+        str(pdf_path), upload_id, meta["filename"], store, _get_session_dir(upload_id),
+    )
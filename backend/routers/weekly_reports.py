@@ -2,17 +2,26 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import date
 
-from backend.dependencies import get_weekly_status_repo, get_report_service, get_current_user, require_admin
+from backend.dependencies import (
+    get_current_user,
+    get_report_service,
+    get_weekly_status_repo,
+    require_admin,
+    without_unit_of_work,
+)
+from backend.response_cache import WEEKLY_ANALYSIS_TAGS, cached_response
 from backend.schemas.weekly_reports import (
     WeeklyReportResponse,
     WeeklyReportGenerateRequest,
     WeeklyReportGenerateResponse,
     WeeklyAnalysisResponse,
+    WeeklyAnalysisBulkItem,
+    WeeklyAnalysisBulkResponse,
     WeeklyReportSaveRequest,
 )
 from modules.repositories.weekly_status import WeeklyStatusRepository
 from modules.services.weekly_report_service import ReportService
-from modules.weekly_data_analyzer import compute_weekly_status
+from modules.weekly_data_analyzer import compute_weekly_status, compute_weekly_status_bulk
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
@@ -47,6 +56,7 @@ def list_weekly_reports(
 
 
 @router.get("/weekly-reports/analysis", response_model=WeeklyAnalysisResponse)
+@cached_response(*WEEKLY_ANALYSIS_TAGS)
 def get_weekly_analysis(
     customer_id: int = Query(...),
     start_date: date = Query(...),
@@ -63,11 +73,35 @@ def get_weekly_analysis(
         customer_name=customer["name"],
         week_start_str=str(start_date),
         customer_id=customer_id,
-        use_cache=False,
+        use_cache=True,
     )
 
+    return WeeklyAnalysisResponse(**_analysis_fields(analysis_result))
+
+
+@router.get("/weekly-reports/analysis/bulk", response_model=WeeklyAnalysisBulkResponse)
+@cached_response(*WEEKLY_ANALYSIS_TAGS)
+def get_weekly_analysis_bulk(
+    start_date: date = Query(...),
+    customer_ids: Optional[List[int]] = Query(None),
+):
+    """여러 수급자의 전주/이번주 변화량 분석을 한 번에 조회 (customer_ids 생략 시 기록 있는 전원)"""
+    results = compute_weekly_status_bulk(customer_ids, start_date, use_cache=True)
+    items = []
+    for customer_id, analysis_result in results.items():
+        error = analysis_result.get("error") if isinstance(analysis_result, dict) else None
+        items.append(WeeklyAnalysisBulkItem(
+            customer_id=customer_id,
+            error=error,
+            **({} if error else _analysis_fields(analysis_result)),
+        ))
+    return WeeklyAnalysisBulkResponse(start_date=start_date, items=items)
+
+
+def _analysis_fields(analysis_result) -> dict:
+    """compute_weekly_status 결과 → WeeklyAnalysisResponse 필드"""
     if not isinstance(analysis_result, dict):
-        return WeeklyAnalysisResponse()
+        return {}
 
     trend = analysis_result.get("trend", {})
     weekly_table = trend.get("weekly_table", []) if isinstance(trend, dict) else []
@@ -84,7 +118,7 @@ def get_weekly_analysis(
     prev_prog_entries = trend.get("prev_prog_entries", []) if isinstance(trend, dict) else []
     curr_prog_entries = trend.get("curr_prog_entries", []) if isinstance(trend, dict) else []
 
-    return WeeklyAnalysisResponse(
+    return dict(
         weekly_table=weekly_table,
         scores=scores,
         prev_range=prev_range,
@@ -95,6 +129,7 @@ def get_weekly_analysis(
 
 
 @router.post("/weekly-reports/generate", response_model=WeeklyReportGenerateResponse)
+@without_unit_of_work
 def generate_weekly_report(
     body: WeeklyReportGenerateRequest,
     report_service: ReportService = Depends(get_report_service),
@@ -113,7 +148,7 @@ def generate_weekly_report(
         customer_name=customer["name"],
         week_start_str=str(body.start_date),
         customer_id=body.customer_id,
-        use_cache=False,
+        use_cache=True,
     )
 
     # trend.ai_payload 추출 (서비스가 기대하는 구조)
@@ -131,6 +166,7 @@ def generate_weekly_report(
         customer_name=customer["name"],
         date_range=(body.start_date, body.end_date),
         analysis_payload=ai_payload,
+        use_cache=body.use_cache,
     )
 
     if isinstance(result, dict) and "error" in result:
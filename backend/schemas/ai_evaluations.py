@@ -1,6 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date, datetime
 
 
 class AiEvaluationResponse(BaseModel):
@@ -24,3 +24,18 @@ class AiEvaluateRequest(BaseModel):
     category: str
     note_text: str
     writer_user_id: int = 0
+
+
+class AiBulkEvaluateRequest(BaseModel):
+    record_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    # False 면 같은 프롬프트의 캐시된 AI 응답을 쓰지 않고 다시 평가
+    use_cache: bool = True
+
+
+class AiRangeEvaluateRequest(BaseModel):
+    start_date: date
+    end_date: date
+    customer_ids: Optional[List[int]] = Field(None, max_length=1000)
+    # True 면 신체/인지 평가가 모두 저장된 기록은 건너뜀
+    skip_evaluated: bool = True
+    use_cache: bool = True
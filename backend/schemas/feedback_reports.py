@@ -7,6 +7,8 @@ from typing import Optional, Any
 class FeedbackReportCreate(BaseModel):
     target_month: str
     admin_note: Optional[str] = None
+    # False 면 같은 입력의 캐시된 AI 응답을 쓰지 않고 다시 생성
+    use_cache: bool = True
 
 
 class FeedbackReportMonthItem(BaseModel):
@@ -14,6 +14,8 @@ class WeeklyReportGenerateRequest(BaseModel):
     customer_id: int
     start_date: date
     end_date: date
+    # False 면 같은 입력의 캐시된 AI 응답을 쓰지 않고 다시 생성
+    use_cache: bool = True
 
 
 class WeeklyReportGenerateResponse(BaseModel):
@@ -31,6 +33,16 @@ class WeeklyAnalysisResponse(BaseModel):
     curr_prog_entries: List[Dict[str, str]] = []
 
 
+class WeeklyAnalysisBulkItem(WeeklyAnalysisResponse):
+    customer_id: int
+    error: Optional[str] = None
+
+
+class WeeklyAnalysisBulkResponse(BaseModel):
+    start_date: date
+    items: List[WeeklyAnalysisBulkItem] = []
+
+
 class WeeklyReportSaveRequest(BaseModel):
     customer_id: int
     start_date: date
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+/dashboard/employee-rankings 집계 벤치마크 (직원별 N+1 쿼리 vs GROUP BY 1회).
+
+실제 DB 대신 execute 마다 왕복 지연(--rtt-ms)을 주는 가짜 커서로 두 구현을 실행해
+쿼리 수와 소요 시간을 비교한다. 결과 값이 서로 같은지도 확인한다.
+
+  - per_user : 기존 방식. 직원마다 새 연결 + UNION 서브쿼리 집계 1회
+  - grouped  : 현재 구현 (backend.routers.dashboard.get_employee_rankings)
+
+사용법:
+  python benchmarks/bench_employee_rankings.py                  # 직원 200명, RTT 1ms
+  python benchmarks/bench_employee_rankings.py --employees 500 --rtt-ms 2 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+os.environ.setdefault("ENCRYPTION_KEY", "iW496e8pcXRPsReQUHwKotJO_EivwvokoLdwm_6YkZQ=")
+
+from backend.encryption import get_encryption_service
+from backend.routers.dashboard import get_employee_rankings
+
+ADMIN = {"user_id": 1, "role": "ADMIN"}
+
+
+class _FakeDb:
+    """execute 마다 rtt 만큼 대기하고, 쿼리 종류에 맞는 합성 결과를 돌려주는 커서."""
+
+    def __init__(self, employees: int, rtt: float):
+        enc = get_encryption_service()
+        self.rtt = rtt
+        self.queries = 0
+        self.users = [
+            {"user_id": i, "name": enc.encrypt(f"직원{i:04d}")} for i in range(1, employees + 1)
+        ]
+        # 직원 i: 기록 i % 40 건, 우수/평균/개선 분포를 조금씩 다르게
+        self.stats = {
+            f"직원{i:04d}": {
+                "total_records": i % 40,
+                "excellent_count": i % 7,
+                "average_count": i % 5,
+                "improvement_count": i % 3,
+            }
+            for i in range(1, employees + 1)
+        }
+        self._result = None
+
+    def execute(self, query, params=None):
+        time.sleep(self.rtt)
+        self.queries += 1
+        if "FROM users" in query:
+            self._result = self.users
+        elif "GROUP BY w.writer_name" in query:
+            self._result = [
+                dict(self.stats[name], writer_name=name)
+                for name in dict.fromkeys(params)
+                if name in self.stats
+            ]
+        else:
+            self._result = [self.stats.get(params[0])]
+
+    def fetchall(self):
+        return self._result
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    @contextmanager
+    def connection(self):
+        time.sleep(self.rtt)  # 풀에서 연결 획득 + 세션 리셋
+        yield self
+
+
+def _per_user(db: _FakeDb):
+    """기존 구현 재현: 직원마다 연결 1개 + 집계 쿼리 1회."""
+    enc = get_encryption_service()
+    with db.connection() as cursor:
+        cursor.execute("SELECT user_id, name FROM users WHERE work_status = '재직'")
+        users = cursor.fetchall()
+    result = []
+    for u in users:
+        name = enc.safe_decrypt(u["name"])
+        with db.connection() as cursor:
+            cursor.execute("SELECT ... WHERE dp.writer_name = %s", [name, name])
+            row = cursor.fetchone()
+        exc = (row["excellent_count"] or 0) if row else 0
+        avg = (row["average_count"] or 0) if row else 0
+        imp = (row["improvement_count"] or 0) if row else 0
+        total_grade = exc + avg + imp
+        score = ((exc * 3 + avg * 2 + imp) / total_grade) if total_grade > 0 else 0.0
+        result.append({
+            "user_id": u["user_id"],
+            "name": name,
+            "total_records": (row["total_records"] or 0) if row else 0,
+            "excellent_count": exc,
+            "average_count": avg,
+            "improvement_count": imp,
+            "score": round(score, 2),
+        })
+    result.sort(key=lambda x: (-x["excellent_count"], -x["total_records"]))
+    return result
+
+
+def _grouped(db: _FakeDb):
+    with patch("modules.db_connection.db_query", db.connection):
+        return get_employee_rankings(start_date=None, end_date=None, current_user=ADMIN)
+
+
+STRATEGIES = {"per_user": _per_user, "grouped": _grouped}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직원 랭킹 집계 벤치마크")
+    parser.add_argument("--employees", type=int, default=200, help="재직 직원 수")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="쿼리/연결당 왕복 지연 (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    print(f"{'strategy':<10} {'queries':>8} {'median(s)':>10} {'min(s)':>8}")
+    expected = None
+    for name, func in STRATEGIES.items():
+        timings = []
+        for _ in range(args.repeat):
+            db = _FakeDb(args.employees, args.rtt_ms / 1000)
+            started = time.perf_counter()
+            result = func(db)
+            timings.append(time.perf_counter() - started)
+        if expected is None:
+            expected = result
+        elif result != expected:
+            print(f"[ERROR] {name} 결과가 기존 구현과 다릅니다.", file=sys.stderr)
+            sys.exit(1)
+        print(f"{name:<10} {db.queries:>8} {statistics.median(timings):>10.3f} {min(timings):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
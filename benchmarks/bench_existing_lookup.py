@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+기존 레코드 조회 전략 벤치마크 (save_parsed_data 2단계).
+
+별도 스크래치 테이블(bench_lookup_daily_infos)에 (customer_id, date) 행을 적재한 뒤
+같은 키 목록을 전략별로 조회해 소요 시간을 비교한다. 운영 테이블은 건드리지 않는다.
+
+  - or_chain   : 기존 방식. 100쌍씩 (customer_id=%s AND date=%s) OR ... , 청크마다 새 연결
+  - range      : 수급자 묶음별 customer_id IN (...) AND date BETWEEN min AND max, 연결 1개
+  - temp_table : 임시 테이블에 키 적재 후 조인, 연결 1개
+
+사용법:
+  python benchmarks/bench_existing_lookup.py                       # 1k/10k/100k 쌍
+  python benchmarks/bench_existing_lookup.py --sizes 1000,5000 --repeat 5
+  python benchmarks/bench_existing_lookup.py --strategies range,temp_table --keep-table
+
+DB 접속 정보는 .env (DB_HOST 등)에서 읽는다.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+# 프로젝트 루트의 .env 자동 로드
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from modules.db_connection import db_query, db_transaction
+from modules.repositories.daily_info import lookup_record_ids
+
+BENCH_TABLE = "bench_lookup_daily_infos"
+DAYS_PER_CUSTOMER = 30  # 한 달치 기록
+MISS_RATIO = 0.1        # 조회 키 중 존재하지 않는 비율
+SEED_INSERT_ROWS = 1000
+
+
+def _make_keys(size: int):
+    """size 쌍의 (customer_id, 'YYYY-MM-DD') 키. 수급자당 한 달치."""
+    start = date(2025, 11, 1)
+    return [
+        (i // DAYS_PER_CUSTOMER + 1, str(start + timedelta(days=i % DAYS_PER_CUSTOMER)))
+        for i in range(size)
+    ]
+
+
+def _seed(keys) -> None:
+    with db_transaction() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        cursor.execute(
+            f"""
+            CREATE TABLE {BENCH_TABLE} (
+                record_id   INT AUTO_INCREMENT PRIMARY KEY,
+                customer_id INT NOT NULL,
+                date        DATE NOT NULL,
+                UNIQUE KEY uq_customer_date (customer_id, date)
+            ) ENGINE=InnoDB
+            """
+        )
+        for i in range(0, len(keys), SEED_INSERT_ROWS):
+            chunk = keys[i:i + SEED_INSERT_ROWS]
+            cursor.execute(
+                f"INSERT INTO {BENCH_TABLE} (customer_id, date) VALUES "
+                + ", ".join(["(%s, %s)"] * len(chunk)),
+                [value for key in chunk for value in key],
+            )
+
+
+def _drop() -> None:
+    with db_transaction() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+
+
+def _lookup_or_chain(keys):
+    """기존 구현 재현: 100쌍 OR 체인, 청크마다 db_query() 새 연결."""
+    found = {}
+    for i in range(0, len(keys), 100):
+        chunk = keys[i:i + 100]
+        with db_query() as cursor:
+            conditions = " OR ".join(["(customer_id=%s AND date=%s)"] * len(chunk))
+            cursor.execute(
+                f"SELECT record_id, customer_id, date FROM {BENCH_TABLE} WHERE {conditions}",
+                [value for key in chunk for value in key],
+            )
+            for row in cursor.fetchall():
+                found[(row["customer_id"], str(row["date"]))] = row["record_id"]
+    return found
+
+
+def _lookup_with(strategy):
+    def _run(keys):
+        with db_query() as cursor:
+            return lookup_record_ids(cursor, keys, strategy=strategy, table=BENCH_TABLE)
+    return _run
+
+
+STRATEGIES = {
+    "or_chain": _lookup_or_chain,
+    "range": _lookup_with("range"),
+    "temp_table": _lookup_with("temp_table"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 레코드 조회 전략 벤치마크")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="조회 키 수 목록 (쉼표 구분)")
+    parser.add_argument("--strategies", default="or_chain,range,temp_table", help="비교할 전략 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="전략별 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--keep-table", action="store_true", help="종료 후 스크래치 테이블 유지")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    strategies = [s.strip() for s in args.strategies.split(",")]
+    unknown = [s for s in strategies if s not in STRATEGIES]
+    if unknown:
+        print(f"[ERROR] 알 수 없는 전략: {unknown}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'pairs':>8}  {'strategy':<11} {'median(s)':>10} {'min(s)':>8}  found")
+    try:
+        for size in sizes:
+            seeded = _make_keys(size)
+            # 존재하지 않는 키를 일부 섞어 실제 업로드(신규+기존 혼재)와 비슷하게 구성
+            missing = int(size * MISS_RATIO)
+            keys = seeded[missing:] + _make_keys(size + missing)[size:]
+            _seed(seeded)
+            expected = None
+            for name in strategies:
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    found = STRATEGIES[name](keys)
+                    timings.append(time.perf_counter() - started)
+                if expected is None:
+                    expected = found
+                elif found != expected:
+                    print(f"[ERROR] {name} 결과가 다른 전략과 다릅니다.", file=sys.stderr)
+                    sys.exit(1)
+                print(
+                    f"{size:>8}  {name:<11} {statistics.median(timings):>10.3f} "
+                    f"{min(timings):>8.3f}  {len(found)}"
+                )
+    finally:
+        if not args.keep_table:
+            _drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+"""
+주간 추이 분석(analyze_weekly_trend) 벤치마크 (행 단위 apply/iterrows vs 벡터화).
+
+합성 기록(수급자 N명 × M주, 하루 1건)을 만들어 수급자·주마다 2주 구간을 분석하고
+구현별 소요 시간을 비교한다. 결과가 기존 구현과 같은지도 확인한다. DB 는 쓰지 않는다.
+
+  - rowwise    : 기존 방식. df.apply(_derive, axis=1) + iterrows 로 행마다 텍스트 파싱
+  - vectorized : 현재 구현 (modules.weekly_data_analyzer.analyze_weekly_trend), 호출마다 2주치
+  - batched    : 주마다 전체 수급자의 2주치를 한 프레임으로 특징 추출 후
+                 (수급자, 주 구간) groupby 로 나눠 집계 (compute_weekly_status_bulk 경로)
+
+사용법:
+  python benchmarks/bench_weekly_trend.py                        # 수급자 20명 × 12주
+  python benchmarks/bench_weekly_trend.py --customers 60 --weeks 26 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from itertools import islice
+from unittest.mock import patch
+
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from modules import weekly_data_analyzer as analyzer
+
+START = date(2025, 1, 6)  # 월요일
+MEALS = [
+    None, "일반식 전량", "일반식 1/2이상", "죽식 1/2 이하", "다짐식 정량, 일반식 완식",
+    "경관식", "거부", "다진식 전량/죽식 절반", "특식 잘 드심", "일반식 1/2이하 / 죽식",
+]
+TOILETS = [None, "소변 3회 대변 1회", "기저귀 교환 2회", "배변 1회/배뇨 4회", "소변 5회", "3회"]
+SERVICE = ["9시간", "8시간 30분", "결석", "미이용", "일정없음"]
+NOTES = [
+    None, "상태 양호", "통증 호소하여 휴식, 주의 필요", "보행 안정적으로 유지",
+    "식사 거부 후 호전", "불안 증가, 야간 악화", "프로그램 활발히 참여",
+]
+PROGRAMS = [None, "미니골프 활동 참여", "노래교실", "인지 퍼즐 맞추기"]
+
+
+def make_records(customers: int, weeks: int, seed: int = 0):
+    """수급자별 일일 기록 (customer_id → rows). _fetch_two_week_records 반환 형식과 같다."""
+    rnd = random.Random(seed)
+    records = {}
+    for customer_id in range(1, customers + 1):
+        rows = []
+        for i in range((weeks + 1) * 7):
+            rows.append({
+                "date": START - timedelta(days=7) + timedelta(days=i),
+                "total_service_time": rnd.choice(SERVICE),
+                "physical_note": rnd.choice(NOTES),
+                "cognitive_note": rnd.choice(NOTES),
+                "nursing_note": rnd.choice(NOTES),
+                "functional_note": rnd.choice(NOTES),
+                "meal_breakfast": rnd.choice(MEALS),
+                "meal_lunch": rnd.choice(MEALS),
+                "meal_dinner": rnd.choice(MEALS),
+                "toilet_care": rnd.choice(TOILETS),
+                "bath_time": None,
+                "bp_temp": "120/80 36.5",
+                "prog_therapy": rnd.choice([None, "완료"]),
+                "prog_enhance_detail": rnd.choice(PROGRAMS),
+            })
+        records[customer_id] = rows
+    return records
+
+
+def _windows(rows, weeks: int):
+    """주마다 (2주 기록, 지난주 범위, 이번주 범위)"""
+    for w in range(weeks):
+        curr_start = START + timedelta(days=7 * w)
+        prev_range = (curr_start - timedelta(days=7), curr_start - timedelta(days=1))
+        curr_range = (curr_start, curr_start + timedelta(days=6))
+        window = [r for r in rows if prev_range[0] <= r["date"] <= curr_range[1]]
+        yield window, prev_range, curr_range
+
+
+# ─── 기존 구현 재현 (행 단위) ───────────────────────────────────────────
+
+def _legacy_meal_type_amounts(text):
+    totals = {key: 0.0 for key in analyzer.MEAL_TYPE_KEYWORDS}
+    if not text:
+        return totals
+    for segment in [seg.strip() for seg in re.split(r"[\/,]", text) if seg.strip()]:
+        ratio = 0.5
+        for keyword, value in analyzer.MEAL_PORTION_MAP.items():
+            if keyword in segment:
+                ratio = value
+                break
+        for type_label, keywords in analyzer.MEAL_TYPE_KEYWORDS.items():
+            if any(keyword in segment for keyword in keywords):
+                totals[type_label] += ratio
+    return totals
+
+
+def _legacy_derive(row):
+    meals = [row.get(field) for field in analyzer.MEAL_FIELDS]
+    meal_detail = [
+        f"{analyzer._detect_meal_type(m) or '미확인'} ({analyzer._meal_amount_label(m)})"
+        for m in meals if m
+    ]
+    return pd.Series({
+        "meal_detail": " / ".join(meal_detail),
+        "toilet_detail": analyzer._parse_toilet_breakdown(row.get("toilet_care")),
+    })
+
+
+def _legacy_week(source_df, highlight):
+    notes = []
+    for row in source_df.itertuples(index=False):
+        parts = [
+            f"{analyzer.NOTE_LABELS[key]}: {getattr(row, field)}"
+            for key, (field, _) in analyzer.CATEGORIES.items() if getattr(row, field)
+        ]
+        if not parts:
+            continue
+        line = f"[{row.date.strftime('%m-%d')}] " + " / ".join(parts)
+        if highlight:
+            for kw in analyzer.HIGHLIGHT_KEYWORDS:
+                if kw in line:
+                    line = line.replace(kw, f"<span style='background-color:#fff3cd;'>{kw}</span>")
+        notes.append(line)
+
+    details = [d for d in source_df.sort_values("date")["meal_detail"] if d]
+    toilet = {key: 0.0 for key in analyzer.TOILET_KEYS}
+    for detail in source_df["toilet_detail"]:
+        for key in toilet:
+            toilet[key] += detail.get(key, 0.0)
+    meals = {key: 0.0 for key in analyzer.MEAL_TYPE_KEYWORDS}
+    entries = {key: [] for key in analyzer.CATEGORIES}
+    prog_entries = []
+    attendance = 0
+    for _, row in source_df.iterrows():
+        for field in analyzer.MEAL_FIELDS:
+            for meal_type, value in _legacy_meal_type_amounts(row.get(field)).items():
+                meals[meal_type] += value
+        for key, (field, _) in analyzer.CATEGORIES.items():
+            if row.get(field):
+                entries[key].append(f"[{row['date'].strftime('%m-%d')}] {row[field]}")
+        service = row.get("total_service_time")
+        if service and str(service).strip() not in analyzer.ABSENCE_STATUSES:
+            attendance += 1
+        detail = row.get("prog_enhance_detail")
+        if detail and str(detail).strip():
+            prog_entries.append({"date": row["date"].strftime("%m-%d"), "detail": str(detail).strip()})
+
+    return {
+        "notes": notes,
+        "meal_detail": " / ".join(details) if details else "-",
+        "toilet_detail": (
+            f"대변{int(toilet['stool'])}회/소변{int(toilet['urine'])}회 "
+            f"(기저귀교환{int(toilet['diaper'])}회)" if any(toilet.values()) else "-"
+        ),
+        "entries": entries,
+        "attendance": attendance,
+        "meals": meals,
+        "toilet": toilet,
+        "prog_entries": prog_entries,
+    }
+
+
+def _rowwise_one(rows, prev_range, curr_range, customer_id):
+    df = pd.DataFrame(rows)
+    df["date"] = pd.to_datetime(df["date"]).dt.date
+    df = pd.concat([df, df.apply(_legacy_derive, axis=1)], axis=1)
+    last = _legacy_week(df[(df["date"] >= prev_range[0]) & (df["date"] <= prev_range[1])], False)
+    this = _legacy_week(df[(df["date"] >= curr_range[0]) & (df["date"] <= curr_range[1])], True)
+    return analyzer._build_trend_result(last, this, None)
+
+
+def _per_window(analyze):
+    def run(records, weeks):
+        return [
+            analyze(window, prev_range, curr_range, customer_id)
+            for customer_id, rows in records.items()
+            for window, prev_range, curr_range in _windows(rows, weeks)
+        ]
+    return run
+
+
+def _batched(records, weeks):
+    by_week = []
+    for w in range(weeks):
+        windows = {cid: next(islice(_windows(rows, weeks), w, None)) for cid, rows in records.items()}
+        _, prev_range, curr_range = next(iter(windows.values()))
+        by_week.append(analyzer._analyze_weekly_trends(
+            {cid: window for cid, (window, _, _) in windows.items()}, prev_range, curr_range, {}
+        ))
+    return [week[cid] for cid in records for week in by_week]
+
+
+STRATEGIES = {
+    "rowwise": _per_window(_rowwise_one),
+    "vectorized": _per_window(analyzer.analyze_weekly_trend),
+    "batched": _batched,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주간 추이 분석 벤치마크")
+    parser.add_argument("--customers", type=int, default=20, help="수급자 수")
+    parser.add_argument("--weeks", type=int, default=12, help="분석할 주 수 (수급자마다)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    records = make_records(args.customers, args.weeks)
+    calls = args.customers * args.weeks
+    print(f"records={sum(len(r) for r in records.values())} analyses={calls}")
+    print(f"{'strategy':<11} {'median(s)':>10} {'min(s)':>8} {'ms/call':>8}")
+    expected = None
+    with patch.object(analyzer, "WeeklyStatusRepository") as repo:
+        repo.return_value.load_weekly_status.return_value = None
+        for name, func in STRATEGIES.items():
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                results = func(records, args.weeks)
+                timings.append(time.perf_counter() - started)
+            if expected is None:
+                expected = results
+            elif results != expected:
+                print(f"[ERROR] {name} 결과가 기존 구현과 다릅니다.", file=sys.stderr)
+                sys.exit(1)
+            median = statistics.median(timings)
+            print(f"{name:<11} {median:>10.3f} {min(timings):>8.3f} {median / calls * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+"""
+재현 가능한 벤치마크 모음 (합성 기록지 PDF + 합성 DB).
+
+규모(수급자 × 일수)별로 같은 시드의 합성 데이터를 만들어 주요 경로의 소요 시간을 잰다.
+결과는 JSON 으로 남기고, 이전 결과(--baseline)와 중앙값을 비교해 회귀를 잡는다.
+
+DB 없이 항상 도는 시나리오:
+  - pdf.parse            : 합성 기록지 PDF → CareRecordParser.parse() (기록 수 확인)
+  - weekly_status        : 수급자별 compute_weekly_status (2주치 조회/전주 보고서는 메모리 데이터로 대체)
+  - pii.decrypt_rows     : 기록 행마다 붙는 수급자 PII 일괄 복호화 (캐시 비운 상태)
+  - pii.blind_index      : 수급자 이름/인정번호 블라인드 인덱스 계산
+
+--mysql-db 를 주면 추가로 도는 시나리오 (앱 스키마가 있는 버리는 DB 만 지정할 것):
+  - db.save_parsed_data.first / .resave : 기록 저장 (첫 저장 1회, 이후 같은 기록 재저장)
+  - db.weekly_status     : compute_weekly_status(use_cache=False)
+  - db.customer_lookup   : 수급자 이름 조회 (블라인드 인덱스 + 복호화 확인)
+  - db.records_by_range  : 기간 내 전체 기록 조회 (JOIN + 복호화)
+  - db.dashboard.*       : 대시보드 집계 (응답 캐시 우회)
+
+사용법:
+  python benchmarks/run_suite.py                                   # small, medium
+  python benchmarks/run_suite.py --scales small,medium,large --repeat 5 --output bench.json
+  python benchmarks/run_suite.py --baseline bench.json --max-regression 0.2
+  python benchmarks/run_suite.py --mysql-db arisa_bench --output bench-db.json
+
+--baseline 비교에서 중앙값이 (1 + max-regression) 배를 넘는 시나리오가 있으면 종료 코드 1.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from unittest.mock import patch
+
+# 프로젝트 루트의 .env 자동 로드 (DB 접속 정보; DB_NAME 은 --mysql-db 로만 정함)
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+os.environ.setdefault("ENCRYPTION_KEY", "iW496e8pcXRPsReQUHwKotJO_EivwvokoLdwm_6YkZQ=")
+
+# 프로젝트 루트와 benchmarks 를 sys.path에 추가
+_here = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.dirname(_here)
+for _path in (_root, _here):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from synthetic import START, group_by_customer, make_records, render_care_record_pdf
+
+# 이름: (수급자 수, 일수)
+SCALES = {
+    "small": (5, 14),
+    "medium": (20, 28),
+    "large": (60, 28),
+}
+DEFAULT_SCALES = "small,medium"
+
+
+class Skip(Exception):
+    """이 환경에서 돌릴 수 없는 시나리오."""
+
+
+def _measure(fn: Callable, repeat: int, setup: Optional[Callable] = None, warmup: bool = True) -> Dict:
+    """fn 을 repeat 번 재서 요약. setup 은 매 실행 전에 부르며 시간에 넣지 않는다."""
+    if warmup:
+        if setup:
+            setup()
+        fn()
+    timings = []
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "runs": len(timings),
+        "result": result,
+    }
+
+
+# ─── DB 없이 도는 시나리오 ─────────────────────────────────────────────
+
+def bench_pdf_parse(data, repeat, args):
+    from modules.pdf_parser import CareRecordParser
+
+    expected = len(data["records"])
+
+    def run():
+        parsed = CareRecordParser(io.BytesIO(data["pdf"]), workers=args.parse_workers).parse()
+        if len(parsed) != expected:
+            raise AssertionError(f"파싱 기록 수 {len(parsed)} != {expected}")
+        return len(parsed)
+
+    stats = _measure(run, repeat, warmup=False)
+    stats["pdf_bytes"] = len(data["pdf"])
+    return stats
+
+
+def _analysis_rows(records) -> List[Dict]:
+    from modules.weekly_data_analyzer import _to_analysis_row
+
+    return [
+        _to_analysis_row(dict(r, date=date.fromisoformat(r["date"])))
+        for r in records if r["total_service_time"] != "결석"
+    ]
+
+
+def _week_starts(days: int) -> List[date]:
+    """전주가 있는 주 시작일 (둘째 주부터)."""
+    return [START + timedelta(days=d) for d in range(7, days - 6, 7)]
+
+
+def bench_weekly_status(data, repeat, args):
+    from modules import weekly_data_analyzer as analyzer
+
+    rows_by_name = {name: _analysis_rows(rs) for name, rs in group_by_customer(data["records"]).items()}
+    weeks = _week_starts(data["days"])
+    if not weeks:
+        raise Skip("2주 미만 데이터")
+
+    def fetch(name, start_date):
+        prev_range = (start_date - timedelta(days=7), start_date - timedelta(days=1))
+        curr_range = (start_date, start_date + timedelta(days=6))
+        rows = [r for r in rows_by_name.get(name, []) if prev_range[0] <= r["date"] <= curr_range[1]]
+        return rows, prev_range, curr_range
+
+    def run():
+        count = 0
+        for name in rows_by_name:
+            for week in weeks:
+                result = analyzer.compute_weekly_status(name, week.isoformat(), None)
+                if "error" in result:
+                    raise AssertionError(result["error"])
+                count += 1
+        return count
+
+    with patch.object(analyzer, "_fetch_two_week_records", side_effect=fetch), \
+            patch.object(analyzer, "WeeklyStatusRepository") as repo:
+        repo.return_value.load_weekly_status.return_value = None
+        return _measure(run, repeat)
+
+
+def bench_pii_decrypt_rows(data, repeat, args):
+    from backend.encryption import get_encryption_service
+    from modules.repositories.daily_info import _dec_customer_rows
+
+    enc = get_encryption_service()
+    encrypted = {}
+    for name, rs in group_by_customer(data["records"]).items():
+        first = rs[0]
+        encrypted[name] = {
+            "name": enc.encrypt(name),
+            "birth_date": enc.encrypt(first["customer_birth_date"]),
+            "recognition_no": enc.encrypt(first["customer_recognition_no"]),
+        }
+    # 기록 조회 결과처럼 기록마다 수급자 컬럼이 붙은 행
+    template = [encrypted[r["customer_name"]] for r in data["records"]]
+
+    def run():
+        rows = _dec_customer_rows([dict(row) for row in template])
+        return len(rows)
+
+    return _measure(run, repeat, setup=enc.clear_cache)
+
+
+def bench_pii_blind_index(data, repeat, args):
+    from modules.repositories.customer import customer_index_values
+
+    customers = [rs[0] for rs in group_by_customer(data["records"]).values()]
+
+    def run():
+        for c in customers:
+            customer_index_values(c["customer_name"], c["customer_recognition_no"])
+        return len(customers)
+
+    return _measure(run, repeat)
+
+
+OFFLINE_SCENARIOS = {
+    "pdf.parse": bench_pdf_parse,
+    "weekly_status": bench_weekly_status,
+    "pii.decrypt_rows": bench_pii_decrypt_rows,
+    "pii.blind_index": bench_pii_blind_index,
+}
+
+
+# ─── MySQL 시나리오 ───────────────────────────────────────────────────
+
+def _db_customers(data) -> Dict[str, int]:
+    from modules.repositories import CustomerRepository
+
+    repo = CustomerRepository()
+    ids = {}
+    for name in group_by_customer(data["records"]):
+        customer = repo.find_by_name(name)
+        if not customer:
+            raise AssertionError(f"저장된 수급자 없음: {name}")
+        ids[name] = customer["customer_id"]
+    return ids
+
+
+def bench_db_save(data, repeat, args):
+    from seed_db import seed
+
+    first = seed(data["records"])
+    stats = _measure(lambda: seed(data["records"]), repeat, warmup=False)
+    return {
+        "db.save_parsed_data.first": {"median_s": first, "min_s": first, "max_s": first, "runs": 1},
+        "db.save_parsed_data.resave": stats,
+    }
+
+
+def bench_db_weekly_status(data, repeat, args):
+    from modules.weekly_data_analyzer import compute_weekly_status
+
+    customers = _db_customers(data)
+    weeks = _week_starts(data["days"])
+    if not weeks:
+        raise Skip("2주 미만 데이터")
+
+    def run():
+        for name, customer_id in customers.items():
+            for week in weeks:
+                result = compute_weekly_status(name, week.isoformat(), customer_id, use_cache=False)
+                if "error" in result:
+                    raise AssertionError(result["error"])
+        return len(customers) * len(weeks)
+
+    return _measure(run, repeat)
+
+
+def bench_db_customer_lookup(data, repeat, args):
+    from backend.encryption import get_encryption_service
+    from modules.repositories import CustomerRepository
+
+    names = list(group_by_customer(data["records"]))
+    repo = CustomerRepository()
+
+    def run():
+        return sum(1 for name in names if repo.find_by_name(name))
+
+    return _measure(run, repeat, setup=get_encryption_service().clear_cache)
+
+
+def _date_range(data):
+    return START, START + timedelta(days=data["days"] - 1)
+
+
+def bench_db_records_by_range(data, repeat, args):
+    from backend.encryption import get_encryption_service
+    from modules.repositories.daily_info import DailyInfoRepository
+
+    start, end = _date_range(data)
+    repo = DailyInfoRepository()
+
+    def run():
+        rows = repo.get_all_records_by_date_range(start, end)
+        if len(rows) < len(data["records"]):
+            raise AssertionError(f"조회 기록 수 {len(rows)} < {len(data['records'])}")
+        return len(rows)
+
+    return _measure(run, repeat, setup=get_encryption_service().clear_cache)
+
+
+def bench_db_dashboard(data, repeat, args):
+    from backend.routers import dashboard
+
+    start, end = _date_range(data)
+    admin = {"user_id": 0, "role": "ADMIN"}
+    # @cached_response 래퍼를 벗겨 응답 캐시 없이 잰다
+    calls = {
+        "db.dashboard.summary": lambda: dashboard.get_summary.__wrapped__(start, end),
+        "db.dashboard.kpi_summary": lambda: dashboard.get_kpi_summary.__wrapped__(start, end),
+        "db.dashboard.employee_rankings": lambda: dashboard.get_employee_rankings.__wrapped__(start, end, admin),
+        "db.dashboard.ai_grade_dist": lambda: dashboard.get_ai_grade_dist.__wrapped__(start, end),
+    }
+    return {name: _measure(fn, repeat) for name, fn in calls.items()}
+
+
+# 저장이 먼저 돌아야 나머지가 데이터를 본다
+DB_SCENARIOS = {
+    "db.save_parsed_data": bench_db_save,
+    "db.weekly_status": bench_db_weekly_status,
+    "db.customer_lookup": bench_db_customer_lookup,
+    "db.records_by_range": bench_db_records_by_range,
+    "db.dashboard": bench_db_dashboard,
+}
+
+
+# ─── 실행/결과 ────────────────────────────────────────────────────────
+
+def _environment(args) -> Dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_root, capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "parse_workers": args.parse_workers,
+        "mysql": bool(args.mysql_db),
+    }
+
+
+def _run_scenario(results, name, fn, data, args):
+    entry = {"scale": data["scale"], "customers": data["customers"], "days": data["days"],
+             "records": len(data["records"])}
+    try:
+        stats = fn(data, args.repeat, args)
+    except Skip as e:
+        results.append(dict(entry, scenario=name, status="skipped", reason=str(e)))
+        print(f"  {name:<34} skipped ({e})")
+        return
+    # 여러 하위 시나리오를 돌려주는 함수는 {이름: 통계}
+    named = stats if "median_s" not in stats else {name: stats}
+    for sub_name, sub in named.items():
+        sub = {k: v for k, v in sub.items() if k != "result"}
+        results.append(dict(entry, scenario=sub_name, status="ok", **sub))
+        print(f"  {sub_name:<34} median {sub['median_s'] * 1000:10.1f}ms  min {sub['min_s'] * 1000:10.1f}ms")
+
+
+def run_suite(args) -> Dict:
+    results: List[Dict] = []
+    for scale in args.scales:
+        customers, days = SCALES[scale]
+        records = make_records(customers, days, seed=args.seed, prefix=f"벤{scale[0].upper()}")
+        data = {"scale": scale, "customers": customers, "days": days, "records": records,
+                "pdf": render_care_record_pdf(records)}
+        print(f"\n[{scale}] 수급자 {customers}명 × {days}일 = 기록 {len(records)}건, "
+              f"PDF {len(data['pdf']) / 1024:.0f} KB")
+        for name, fn in OFFLINE_SCENARIOS.items():
+            _run_scenario(results, name, fn, data, args)
+        for name in DB_SCENARIOS:
+            if args.mysql_db:
+                _run_scenario(results, name, DB_SCENARIOS[name], data, args)
+            else:
+                results.append({"scale": scale, "scenario": name, "status": "skipped",
+                                "reason": "--mysql-db 미지정"})
+    return {"environment": _environment(args), "results": results}
+
+
+def compare(current: Dict, baseline: Dict, max_regression: float) -> List[Dict]:
+    """(시나리오, 규모)별 중앙값 비율. ratio > 1 + max_regression 이면 regression."""
+    base = {
+        (r["scenario"], r["scale"]): r["median_s"]
+        for r in baseline.get("results", []) if r.get("status") == "ok"
+    }
+    rows = []
+    for r in current["results"]:
+        key = (r["scenario"], r["scale"])
+        if r.get("status") != "ok" or key not in base or not base[key]:
+            continue
+        ratio = r["median_s"] / base[key]
+        rows.append({
+            "scenario": r["scenario"], "scale": r["scale"],
+            "baseline_s": base[key], "current_s": r["median_s"],
+            "ratio": ratio, "regression": ratio > 1 + max_regression,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 데이터 벤치마크 모음")
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help=f"쉼표 구분 규모 ({', '.join(f'{k}={c}x{d}' for k, (c, d) in SCALES.items())})")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--parse-workers", type=int, default=1,
+                        help="PDF 파싱 프로세스 수 (기본 1: 단일 프로세스, 머신 차이를 줄임)")
+    parser.add_argument("--mysql-db", default=None,
+                        help="DB 시나리오용 DB 이름 (앱 스키마가 있는 버리는 DB, 합성 기록이 저장됨)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="허용 느려짐 비율 (0.2 = 중앙값 20%% 초과 시 실패)")
+    args = parser.parse_args()
+
+    args.scales = [s.strip() for s in args.scales.split(",") if s.strip()]
+    unknown = [s for s in args.scales if s not in SCALES]
+    if unknown:
+        parser.error(f"알 수 없는 규모: {', '.join(unknown)}")
+    if args.mysql_db:
+        from seed_db import use_database
+        use_database(args.mysql_db)
+
+    report = run_suite(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[INFO] 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.max_regression)
+        print(f"\n기준 결과 비교 ({args.baseline}, 커밋 {baseline.get('environment', {}).get('git_commit')})")
+        for row in rows:
+            flag = "  <-- 회귀" if row["regression"] else ""
+            print(f"  {row['scenario']:<34} {row['scale']:<7} "
+                  f"{row['baseline_s'] * 1000:10.1f}ms -> {row['current_s'] * 1000:10.1f}ms  "
+                  f"x{row['ratio']:.2f}{flag}")
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+합성 기록 DB 적재 (벤치마크용 버리는 DB 에만).
+
+benchmarks/synthetic.py 의 수급자 N명 × M일 기록을 save_parsed_data 로 저장한다.
+PDF 업로드 저장과 같은 경로(수급자 자동 생성, 암호화, 블라인드 인덱스)를 탄다.
+수급자 이름은 '벤' 으로 시작하므로 운영 데이터와 구분된다.
+
+운영 DB 에 섞이지 않도록 --db-name 을 반드시 지정해야 하며 .env 의 DB_NAME 은 쓰지 않는다.
+스키마는 앱 스키마가 이미 만들어진 DB 여야 한다.
+
+사용법:
+  python benchmarks/seed_db.py --db-name arisa_bench --customers 20 --days 28
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트의 .env 자동 로드 (접속 정보만 사용)
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트와 benchmarks 를 sys.path에 추가
+_here = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.dirname(_here)
+for _path in (_root, _here):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from synthetic import make_records, public_record
+
+
+def use_database(db_name: str) -> None:
+    """이후 만들어지는 연결이 db_name 을 쓰도록 설정 (modules.db_connection import 전에 호출)."""
+    if not db_name:
+        raise ValueError("벤치마크 DB 이름이 필요합니다.")
+    if "modules.db_connection" in sys.modules and os.environ.get("DB_NAME") != db_name:
+        raise RuntimeError("DB 연결 모듈이 이미 로드되어 DB 를 바꿀 수 없습니다.")
+    os.environ["DB_NAME"] = db_name
+
+
+def seed(records) -> float:
+    """records 를 저장하고 걸린 시간(초)을 돌려준다."""
+    from modules.repositories.daily_info import DailyInfoRepository
+
+    started = time.perf_counter()
+    DailyInfoRepository().save_parsed_data([public_record(r) for r in records])
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 기록 DB 적재 (버리는 DB 전용)")
+    parser.add_argument("--db-name", required=True, help="적재할 DB 이름 (.env 의 DB_NAME 무시)")
+    parser.add_argument("--customers", type=int, default=20, help="수급자 수")
+    parser.add_argument("--days", type=int, default=28, help="수급자별 기록 일수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    use_database(args.db_name)
+    records = make_records(args.customers, args.days, seed=args.seed)
+    elapsed = seed(records)
+    print(f"[INFO] {args.db_name}: 기록 {len(records)}건 저장 ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
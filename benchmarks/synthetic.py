@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+"""
+합성 장기요양급여제공기록지 데이터 (벤치마크/수동 점검용).
+
+수급자 N명 × M일 기록을 만들고, CareRecordParser 가 읽을 수 있는 PDF 로 그린다.
+- 수급자마다 첫 페이지에 양식 제목/수급자 정보, 주(7일)마다 가로형 기록 표 1쪽
+- 특이사항 일부는 "별지 참조" 로 두고 내용은 별지 페이지(날짜/내용 표)에 적는다
+- 외부 PDF 라이브러리 없이 직접 쓴다. 글꼴은 내장하지 않고 ToUnicode 만 넣으므로
+  화면 표시는 뷰어 대체 글꼴에 맡기고, 텍스트 추출(pdfplumber)은 정확하다
+
+make_records() 결과는 파서 출력과 같은 키를 쓰므로 파싱 결과 검증에 그대로 쓸 수 있다.
+
+사용법:
+  python benchmarks/synthetic.py --customers 5 --days 14 --output /tmp/sample.pdf
+"""
+
+import argparse
+import math
+import os
+import random
+import re
+import sys
+import zlib
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+START = date(2025, 3, 3)  # 월요일. 연도가 바뀌지 않도록 MAX_DAYS 로 제한
+MAX_DAYS = 280
+DAYS_PER_PAGE = 7
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서지영현수진우준희은경숙자순옥말분례"
+WRITERS = ["김요양", "이복지", "박간호", "최재활", "정돌봄"]
+MEALS = ["일반식 전량", "일반식 1/2이상", "죽식 1/2 이하", "다짐식 정량", "거부"]
+TOILETS = ["소변 3회 대변 1회", "기저귀 교환 2회", "배변 1회/배뇨 4회", "소변 5회"]
+PROGRAMS = ["노래교실", "미니골프 활동", "인지 퍼즐 맞추기", "색칠하기", "실내 산책"]
+# 별지 페이지의 섹션 판별(키워드 검색)을 흐리지 않도록 섹션 이름은 쓰지 않는다
+NOTES = [
+    "컨디션 양호하여 일과를 잘 따라하심",
+    "오후에 피곤해하셔서 휴식을 취하심",
+    "보행 시 균형 잡기 어려워 보조함",
+    "식사량 평소와 비슷하고 수분 섭취 양호함",
+    "가족 면회 후 기분 좋아지심",
+    "어지러움 호소하여 안정 취하도록 도움",
+    "통증 호소하여 관찰함, 주의 필요",
+    "프로그램에 활발히 참여하심",
+]
+LONG_NOTE = (
+    "오전 프로그램 중 어지러움을 호소하셔서 활동을 멈추고 안정을 취하도록 함. "
+    "점심 이후 증상 호전되어 오후 일과에 참여하셨으며 귀가 시 보호자에게 상황을 전달함."
+)
+PLACEHOLDER = "별지 참조"
+CATEGORY_FIELDS = {
+    "phy": "physical_note",
+    "cog": "cognitive_note",
+    "nur": "nursing_note",
+    "func": "functional_note",
+}
+CATEGORY_TITLES = {
+    "phy": "신체활동지원",
+    "cog": "인지관리",
+    "nur": "건강 및 간호관리",
+    "func": "기능회복훈련",
+}
+CHECK = "■"
+
+
+def make_customers(count: int, seed: int = 0, prefix: str = "벤") -> List[Dict]:
+    """수급자 정보 (이름은 벤치마크 데이터임을 알 수 있게 prefix 로 시작, 겹치지 않음)."""
+    rnd = random.Random(seed)
+    customers = []
+    for i in range(count):
+        name = f"{prefix}{SURNAMES[i % len(SURNAMES)]}{GIVEN[(i // len(SURNAMES)) % len(GIVEN)]}{i:03d}"
+        customers.append({
+            "customer_name": name,
+            "customer_birth_date": f"19{rnd.randint(30, 55)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            "customer_grade": f"{rnd.randint(1, 5)}등급",
+            "customer_recognition_no": f"L{rnd.randint(10**9, 10**10 - 1)}",
+        })
+    return customers
+
+
+def make_records(customers: int, days: int, seed: int = 0, appendix_ratio: float = 0.15,
+                 absence_ratio: float = 0.05, prefix: str = "벤") -> List[Dict]:
+    """수급자 customers 명 × days 일 기록 (CareRecordParser.parse() 결과와 같은 키).
+
+    appendix_ratio 만큼의 특이사항은 별지로 보내고, 기록에는 별지 내용을 넣는다 (파싱 후 병합 결과와 같음).
+    prefix 를 바꾸면 같은 DB 에 규모별 수급자를 따로 적재할 수 있다.
+    """
+    if not 0 < days <= MAX_DAYS:
+        raise ValueError(f"days 는 1~{MAX_DAYS} 이어야 합니다.")
+    rnd = random.Random(seed)
+    records = []
+    for customer in make_customers(customers, seed, prefix):
+        for offset in range(days):
+            day = START + timedelta(days=offset)
+            record = dict(customer, date=day.isoformat(), facility_name="보은사랑주간보호",
+                          facility_code="12345678901")
+            if rnd.random() < absence_ratio:
+                record.update(_absent_record())
+                records.append(record)
+                continue
+            record.update({
+                "start_time": "09:00", "end_time": "17:00", "total_service_time": "480분",
+                "transport_service": "제공", "transport_vehicles": "12가3456",
+                "hygiene_care": "완료", "bath_time": rnd.choice(["없음", "14:00"]),
+                "meal_breakfast": rnd.choice(MEALS), "meal_lunch": rnd.choice(MEALS),
+                "meal_dinner": rnd.choice(MEALS), "toilet_care": rnd.choice(TOILETS),
+                "mobility_care": rnd.choice(["완료", "미실시"]),
+                "cog_support": "완료", "comm_support": rnd.choice(["완료", "미실시"]),
+                "bp_temp": f"{rnd.randint(105, 140)}/{rnd.randint(65, 90)} 36.{rnd.randint(2, 8)}",
+                "health_manage": "완료", "nursing_manage": rnd.choice(["완료", "미실시"]),
+                "emergency": "미실시",
+                "prog_basic": "완료", "prog_activity": rnd.choice(["완료", "미실시"]),
+                "prog_cognitive": rnd.choice(["완료", "미실시"]), "prog_therapy": "미실시",
+                "prog_enhance_detail": rnd.choice(PROGRAMS),
+            })
+            record["bath_method"] = "샤워" if record["bath_time"] != "없음" else ""
+            for category, field in CATEGORY_FIELDS.items():
+                record[f"writer_{category}"] = rnd.choice(WRITERS)
+                if rnd.random() < appendix_ratio:
+                    record[field] = LONG_NOTE
+                    record.setdefault("_appendix", []).append(category)
+                else:
+                    record[field] = rnd.choice(NOTES)
+            records.append(record)
+    return records
+
+
+def _absent_record() -> Dict:
+    return {
+        "start_time": "", "end_time": "", "total_service_time": "결석",
+        "transport_service": "미제공", "transport_vehicles": "",
+        "hygiene_care": "미실시", "bath_time": "없음", "bath_method": "",
+        "meal_breakfast": "", "meal_lunch": "", "meal_dinner": "", "toilet_care": "",
+        "mobility_care": "미실시", "cog_support": "미실시", "comm_support": "미실시",
+        "bp_temp": "", "health_manage": "미실시", "nursing_manage": "미실시", "emergency": "미실시",
+        "prog_basic": "미실시", "prog_activity": "미실시", "prog_cognitive": "미실시",
+        "prog_therapy": "미실시", "prog_enhance_detail": "",
+        "physical_note": "", "cognitive_note": "", "nursing_note": "", "functional_note": "",
+        "writer_phy": "", "writer_cog": "", "writer_nur": "", "writer_func": "",
+    }
+
+
+def group_by_customer(records: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        groups.setdefault(record["customer_name"], []).append(record)
+    return groups
+
+
+def public_record(record: Dict) -> Dict:
+    """생성용 내부 키(_appendix) 를 뺀 사본 (save_parsed_data 입력용)."""
+    return {k: v for k, v in record.items() if not k.startswith("_")}
+
+
+# ─── 기록지 표 구성 ───────────────────────────────────────────────────
+
+def _status(value: str) -> str:
+    return CHECK if value == "완료" else ""
+
+
+def _note_cell(record: Dict, category: str) -> str:
+    if category in record.get("_appendix", ()):
+        return PLACEHOLDER
+    return record[CATEGORY_FIELDS[category]]
+
+
+# (섹션, 항목, 셀 값 함수, 줄 수). 항목 이름은 파서의 행 판별 키워드를 따른다
+ROWS: List[Tuple[str, str, object, int]] = [
+    ("", "년월/일", lambda r: f"{int(r['date'][5:7])}/{r['date'][8:10]}", 1),
+    ("", "시작시간~종료시간", lambda r: f"{r['start_time']}~{r['end_time']}" if r["start_time"] else "", 1),
+    ("", "총시간", lambda r: r["total_service_time"], 1),
+    ("", "이동서비스", lambda r: f"{CHECK}제공 {r['transport_vehicles']}" if r["transport_vehicles"] else "", 1),
+    ("신체활동지원", "세면·구강청결", lambda r: _status(r["hygiene_care"]), 1),
+    ("", "목욕 소요시간", lambda r: r["bath_time"] if r["bath_time"] != "없음" else "-", 1),
+    ("", "목욕 방법", lambda r: r["bath_method"] or "-", 1),
+    ("", "식사 아침", lambda r: r["meal_breakfast"], 1),
+    ("", "식사 점심", lambda r: r["meal_lunch"], 1),
+    ("", "식사 저녁", lambda r: r["meal_dinner"], 1),
+    ("", "화장실 이용", lambda r: r["toilet_care"], 2),
+    ("", "이동도움", lambda r: _status(r["mobility_care"]), 1),
+    ("", "특이사항", lambda r: _note_cell(r, "phy"), 4),
+    ("", "작성자", lambda r: r["writer_phy"], 1),
+    ("인지관리", "인지관리지원", lambda r: _status(r["cog_support"]), 1),
+    ("", "의사소통도움", lambda r: _status(r["comm_support"]), 1),
+    ("", "특이사항", lambda r: _note_cell(r, "cog"), 4),
+    ("", "작성자", lambda r: r["writer_cog"], 1),
+    ("건강 및 간호관리", "혈압/체온", lambda r: r["bp_temp"], 1),
+    ("", "건강관리", lambda r: _status(r["health_manage"]), 1),
+    ("", "간호관리", lambda r: _status(r["nursing_manage"]), 1),
+    ("", "응급서비스", lambda r: _status(r["emergency"]), 1),
+    ("", "특이사항", lambda r: _note_cell(r, "nur"), 4),
+    ("", "작성자", lambda r: r["writer_nur"], 1),
+    ("기능회복훈련", "기본동작훈련", lambda r: _status(r["prog_basic"]), 1),
+    ("", "인지활동형 프로그램", lambda r: _status(r["prog_activity"]), 1),
+    ("", "인지기능 향상훈련", lambda r: _status(r["prog_cognitive"]), 1),
+    ("", "물리치료", lambda r: _status(r["prog_therapy"]), 1),
+    ("", "신체·인지기능 향상 프로그램", lambda r: r["prog_enhance_detail"], 2),
+    ("", "특이사항", lambda r: _note_cell(r, "func"), 4),
+    ("", "작성자", lambda r: r["writer_func"], 1),
+]
+
+
+# ─── PDF 쓰기 ─────────────────────────────────────────────────────────
+
+PAGE_W, PAGE_H = 842.0, 595.0  # A4 가로
+FONT_SIZE = 6.0
+LINE_H = 7.5
+MARGIN = 14.0
+
+
+def _text_width(text: str, size: float = FONT_SIZE) -> float:
+    return sum(0.5 if ord(ch) < 128 else 1.0 for ch in text) * size
+
+
+def _wrap(text: str, width: float, size: float = FONT_SIZE) -> List[str]:
+    """글자 단위 줄바꿈 (양식의 셀 자동 줄바꿈과 같음)."""
+    lines, line = [], ""
+    for ch in text:
+        if line and _text_width(line + ch, size) > width:
+            lines.append(line)
+            line = ""
+        line += ch
+    if line:
+        lines.append(line)
+    return lines
+
+
+class _Page:
+    def __init__(self):
+        self.ops: List[str] = []
+
+    def text(self, x: float, top: float, text: str, size: float = FONT_SIZE) -> None:
+        """top: 페이지 위에서 글자 윗변까지 거리."""
+        if not text:
+            return
+        y = PAGE_H - top - size * 0.88
+        hexed = "".join(f"{ord(ch):04X}" for ch in text)
+        self.ops.append(f"BT /F1 {size:g} Tf {x:.2f} {y:.2f} Td <{hexed}> Tj ET")
+
+    def line(self, x0: float, top0: float, x1: float, top1: float) -> None:
+        self.ops.append(f"{x0:.2f} {PAGE_H - top0:.2f} m {x1:.2f} {PAGE_H - top1:.2f} l S")
+
+    def grid(self, x0: float, top: float, widths: Sequence[float], heights: Sequence[float]) -> None:
+        xs = [x0]
+        for w in widths:
+            xs.append(xs[-1] + w)
+        tops = [top]
+        for h in heights:
+            tops.append(tops[-1] + h)
+        for t in tops:
+            self.line(xs[0], t, xs[-1], t)
+        for x in xs:
+            self.line(x, tops[0], x, tops[-1])
+
+    def cell_text(self, x: float, top: float, width: float, text: str) -> None:
+        for i, part in enumerate(_wrap(text, width - 3)):
+            self.text(x + 1.5, top + 1.5 + i * LINE_H, part)
+
+
+def _write_pdf(pages: List[_Page]) -> bytes:
+    chars = set()
+    for page in pages:
+        for op in page.ops:
+            m = re.search(r"<([0-9A-F]+)> Tj", op)
+            if m:
+                hexed = m.group(1)
+                chars.update(hexed[i:i + 4] for i in range(0, len(hexed), 4))
+
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    def stream(data: bytes, extra: str = "") -> bytes:
+        data = zlib.compress(data)
+        return f"<< /Length {len(data)} /Filter /FlateDecode {extra}>>\nstream\n".encode() + data + b"\nendstream"
+
+    catalog = add(b"")  # 나중에 채움
+    pages_obj = add(b"")
+    bfchar = []
+    codes = sorted(chars)
+    for i in range(0, len(codes), 100):
+        chunk = codes[i:i + 100]
+        bfchar.append(f"{len(chunk)} beginbfchar\n" + "\n".join(f"<{c}> <{c}>" for c in chunk) + "\nendbfchar")
+    cmap = (
+        "/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+        "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+        "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        + "\n".join(bfchar)
+        + "\nendcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n"
+    )
+    to_unicode = add(stream(cmap.encode()))
+    descriptor = add(
+        b"<< /Type /FontDescriptor /FontName /SyntheticGothic /Flags 4 /FontBBox [0 -120 1000 880] "
+        b"/ItalicAngle 0 /Ascent 880 /Descent -120 /CapHeight 700 /StemV 80 >>"
+    )
+    ascii_widths = " ".join(["500"] * 95)
+    cid_font = add(
+        f"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /SyntheticGothic "
+        f"/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> "
+        f"/FontDescriptor {descriptor} 0 R /DW 1000 /W [32 [{ascii_widths}]] /CIDToGIDMap /Identity >>".encode()
+    )
+    font = add(
+        f"<< /Type /Font /Subtype /Type0 /BaseFont /SyntheticGothic /Encoding /Identity-H "
+        f"/DescendantFonts [{cid_font} 0 R] /ToUnicode {to_unicode} 0 R >>".encode()
+    )
+    kids = []
+    for page in pages:
+        content = add(stream(("0.4 w\n" + "\n".join(page.ops)).encode()))
+        kids.append(add(
+            f"<< /Type /Page /Parent {pages_obj} 0 R /MediaBox [0 0 {PAGE_W:g} {PAGE_H:g}] "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>".encode()
+        ))
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_obj} 0 R >>".encode()
+    objects[pages_obj - 1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>".encode()
+    )
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+# ─── 기록지 배치 ──────────────────────────────────────────────────────
+
+SECTION_W, ITEM_W, SPACER_W = 62.0, 100.0, 6.0
+ROW_PAD = 3.0
+
+
+def _record_pages(customer_records: List[Dict]) -> List[_Page]:
+    first = customer_records[0]
+    pages = []
+    day_w = (PAGE_W - 2 * MARGIN - SECTION_W - ITEM_W - SPACER_W) / DAYS_PER_PAGE
+    for week in range(math.ceil(len(customer_records) / DAYS_PER_PAGE)):
+        days = customer_records[week * DAYS_PER_PAGE:(week + 1) * DAYS_PER_PAGE]
+        page = _Page()
+        top = MARGIN
+        if week == 0:
+            year, month = first["date"][:4], int(first["date"][5:7])
+            page.text(MARGIN, top, f"장기요양급여제공기록지 (주야간보호) {year}년 {month}월", 9)
+            top += 14
+            birth = first["customer_birth_date"].replace("-", ".")
+            page.text(MARGIN, top, (
+                f"수급자명 {first['customer_name']}  생년월일 {birth}  장기요양등급 {first['customer_grade']}  "
+                f"장기요양인정번호 {first['customer_recognition_no']}"
+            ))
+            top += 10
+            page.text(MARGIN, top, (
+                f"장기요양기관명 {first['facility_name']}  장기요양기관기호 {first['facility_code']}"
+            ))
+            top += 14
+        widths = [SECTION_W, ITEM_W, SPACER_W] + [day_w] * len(days)
+        heights = [lines * LINE_H + ROW_PAD for _, _, _, lines in ROWS]
+        page.grid(MARGIN, top, widths, heights)
+        row_top = top
+        for (section, item, value, _), height in zip(ROWS, heights):
+            page.cell_text(MARGIN, row_top, SECTION_W, section)
+            page.cell_text(MARGIN + SECTION_W, row_top, ITEM_W, item)
+            x = MARGIN + SECTION_W + ITEM_W + SPACER_W
+            for record in days:
+                page.cell_text(x, row_top, day_w, value(record))
+                x += day_w
+            row_top += height
+        pages.append(page)
+    return pages
+
+
+def _appendix_pages(customer_records: List[Dict]) -> List[_Page]:
+    entries: Dict[str, List[Tuple[str, str]]] = {}
+    for record in customer_records:
+        for category in record.get("_appendix", ()):
+            entries.setdefault(category, []).append(
+                (record["date"].replace("-", "."), record[CATEGORY_FIELDS[category]])
+            )
+    if not entries:
+        return []
+
+    date_w = 80.0
+    content_w = PAGE_W - 2 * MARGIN - date_w
+    pages: List[_Page] = []
+    page, top = None, 0.0
+
+    def new_page():
+        nonlocal page, top
+        page = _Page()
+        pages.append(page)
+        page.text(MARGIN, MARGIN, f"[별지] 특이사항 상세 - {customer_records[0]['customer_name']}", 9)
+        top = MARGIN + 18
+
+    new_page()
+    for category in CATEGORY_TITLES:
+        rows = entries.get(category)
+        if not rows:
+            continue
+        table_rows = [("날짜", "내용")] + rows
+        while table_rows:
+            if top + 40 > PAGE_H - MARGIN:
+                new_page()
+            page.text(MARGIN, top, CATEGORY_TITLES[category], 8)
+            top += 14
+            placed = []
+            height_sum = 0.0
+            for row in table_rows:
+                height = len(_wrap(row[1], content_w - 3)) * LINE_H + ROW_PAD
+                if top + height_sum + height > PAGE_H - MARGIN:
+                    break
+                placed.append((row, height))
+                height_sum += height
+            page.grid(MARGIN, top, [date_w, content_w], [h for _, h in placed])
+            for (day, content), height in placed:
+                page.cell_text(MARGIN, top, date_w, day)
+                page.cell_text(MARGIN + date_w, top, content_w, content)
+                top += height
+            top += 10
+            table_rows = table_rows[len(placed):]
+    return pages
+
+
+def render_care_record_pdf(records: List[Dict]) -> bytes:
+    """make_records() 결과를 수급자별 기록지 + 별지 PDF 로 그린다."""
+    pages: List[_Page] = []
+    for customer_records in group_by_customer(records).values():
+        pages.extend(_record_pages(customer_records))
+        pages.extend(_appendix_pages(customer_records))
+    return _write_pdf(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 장기요양급여제공기록지 PDF 생성")
+    parser.add_argument("--customers", type=int, default=5, help="수급자 수")
+    parser.add_argument("--days", type=int, default=14, help=f"수급자별 기록 일수 (최대 {MAX_DAYS})")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (같으면 같은 PDF)")
+    parser.add_argument("--output", required=True, help="PDF 저장 경로")
+    args = parser.parse_args()
+
+    records = make_records(args.customers, args.days, seed=args.seed)
+    data = render_care_record_pdf(records)
+    with open(args.output, "wb") as f:
+        f.write(data)
+    print(f"[INFO] {args.output}: 기록 {len(records)}건, {len(data) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
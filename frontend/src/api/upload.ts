@@ -26,10 +26,17 @@ export const uploadApi = {
   /** 청크 업로드 세션 초기화 */
   initChunked: (filename: string, totalSize: number, totalChunks: number) =>
     api
-      .post<{ upload_id: string; total_chunks: number }>(
+      .post<{ upload_id: string; total_chunks: number; chunk_size: number }>(
         "/upload/chunk/init",
         null,
-        { params: { filename, total_size: totalSize, total_chunks: totalChunks } }
+        {
+          params: {
+            filename,
+            total_size: totalSize,
+            total_chunks: totalChunks,
+            chunk_size: CHUNK_SIZE,
+          },
+        }
       )
       .then((r) => r.data),
 
@@ -7,8 +7,13 @@
 - 환경변수 (테스트/CLI용)
 - 의존성 주입 (단위 테스트용)
 - Rate Limit 재시도 로직 (tenacity)
+- 비동기 호출 (achat_completion, 재시도 없음 → 호출측 rate_limit 모듈이 한도/재시도 관리)
+  SDK 비동기 클라이언트는 이벤트 루프에 묶이므로 인스턴스에 캐시하지 않고 async_session() 단위로 만든다
 """
 
+import asyncio
+import contextlib
+import copy
 import os
 import openai
 from typing import Optional, Any, List, Dict
@@ -21,8 +26,15 @@ from tenacity import (
 
 try:
     import google.generativeai as genai
+    from google.generativeai import client as genai_client
 except ModuleNotFoundError:  # pragma: no cover
     genai = None
+    genai_client = None
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ModuleNotFoundError:  # pragma: no cover
+    google_exceptions = None
 
 # AI Client instance for dependency injection (테스트용)
 _ai_client_instance: Optional["BaseAIClient"] = None
@@ -35,18 +47,59 @@ class BaseAIClient:
         """채팅 완성 요청"""
         raise NotImplementedError
 
+    async def achat_completion(self, model: str, messages: list, **kwargs):
+        """비동기 채팅 완성 요청. 기본 구현은 동기 호출을 스레드에서 실행."""
+        return await asyncio.to_thread(self.chat_completion, model, messages, **kwargs)
+
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        """현재 이벤트 루프에서 쓸 비동기 호출용 클라이언트. 블록이 끝나면 연결을 닫는다.
+
+        기본 구현은 루프에 묶인 자원이 없으므로 자기 자신을 돌려준다.
+        """
+        yield self
+
+
+@contextlib.asynccontextmanager
+async def async_session(ai_client):
+    """ai_client.async_session() 과 같지만 BaseAIClient 가 아닌 객체(테스트 더블)는 그대로 쓴다."""
+    if isinstance(ai_client, BaseAIClient):
+        async with ai_client.async_session() as session:
+            yield session
+    else:
+        yield ai_client
+
 
 class OpenAIClient(BaseAIClient):
     """OpenAI 클라이언트 래퍼 클래스"""
 
-    def __init__(self, client: openai.OpenAI):
+    def __init__(self, client: openai.OpenAI, async_client: Optional[openai.AsyncOpenAI] = None):
         self._client = client
+        self._async_client = async_client
 
     @property
     def client(self) -> openai.OpenAI:
         """OpenAI 클라이언트 인스턴스 반환"""
         return self._client
 
+    def _new_async_client(self) -> openai.AsyncOpenAI:
+        """동기 클라이언트와 같은 키/주소의 AsyncOpenAI.
+
+        SDK 내부 재시도(max_retries)는 끈다: 429 를 호출측 한도 관리자가 보고 동시성을 줄여야 한다.
+        """
+        return openai.AsyncOpenAI(api_key=self._client.api_key, base_url=self._client.base_url, max_retries=0)
+
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        """이 이벤트 루프 전용 AsyncOpenAI 를 쓰는 사본 (httpx 연결이 루프에 묶이므로 루프마다 새로 만든다)."""
+        async_client = self._new_async_client()
+        try:
+            session = copy.copy(self)
+            session._async_client = async_client
+            yield session
+        finally:
+            await async_client.close()
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=1, max=60),
@@ -61,6 +114,15 @@ class OpenAIClient(BaseAIClient):
             model=model, messages=messages, **kwargs
         )
 
+    async def achat_completion(self, model: str, messages: list, **kwargs):
+        """비동기 채팅 완성 요청 (재시도 없음). 세션 밖에서 부르면 호출마다 클라이언트를 만들고 닫는다."""
+        if self._async_client is None:
+            async with self.async_session() as session:
+                return await session.achat_completion(model, messages, **kwargs)
+        return await self._async_client.chat.completions.create(
+            model=model, messages=messages, **kwargs
+        )
+
 
 class GeminiClient(BaseAIClient):
     """Google Gemini 클라이언트 래퍼 클래스"""
@@ -74,6 +136,7 @@ class GeminiClient(BaseAIClient):
 
         genai.configure(api_key=api_key)
         self._api_key = api_key
+        self._async_client = None  # async_session() 안에서만 설정 (이벤트 루프 전용 grpc.aio 클라이언트)
 
     def _convert_messages_to_gemini_format(
         self, messages: List[Dict[str, str]]
@@ -111,7 +174,33 @@ class GeminiClient(BaseAIClient):
     )
     def chat_completion(self, model: str, messages: list, **kwargs):
         # Gemini API
+        gemini_model, contents = self._prepare(model, messages, **kwargs)
+        return _GeminiResponse(gemini_model.generate_content(contents))
 
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        """이 이벤트 루프 전용 grpc.aio 클라이언트를 쓰는 사본.
+
+        genai 기본 비동기 클라이언트는 프로세스 공용이고 처음 쓴 루프에 묶이며 genai.configure() 때 교체되므로
+        asyncio.run 마다(작업 스레드마다) 따로 만들어 닫는다.
+        """
+        # 현재 genai 설정(API 키)으로 만들되 공용 클라이언트 목록에는 넣지 않는다
+        async_client = genai_client._client_manager.make_client("generative_async")
+        async with async_client:
+            session = copy.copy(self)
+            session._async_client = async_client
+            yield session
+
+    async def achat_completion(self, model: str, messages: list, **kwargs):
+        """비동기 채팅 완성 요청 (재시도 없음). 세션 밖에서 부르면 호출마다 클라이언트를 만들고 닫는다."""
+        if self._async_client is None:
+            async with self.async_session() as session:
+                return await session.achat_completion(model, messages, **kwargs)
+        gemini_model, contents = self._prepare(model, messages, **kwargs)
+        gemini_model._async_client = self._async_client
+        return _GeminiResponse(await gemini_model.generate_content_async(contents))
+
+    def _prepare(self, model: str, messages: list, **kwargs) -> tuple:
         system_instruction, contents = self._convert_messages_to_gemini_format(messages)
 
         generation_config = {
@@ -124,20 +213,81 @@ class GeminiClient(BaseAIClient):
             system_instruction=system_instruction,
             generation_config=generation_config,
         )
+        return gemini_model, contents
+
+
+class _GeminiUsage:
+    def __init__(self, metadata):
+        self.prompt_tokens = getattr(metadata, "prompt_token_count", None)
+        self.completion_tokens = getattr(metadata, "candidates_token_count", None)
+        self.total_tokens = getattr(metadata, "total_token_count", None)
+
+
+class _GeminiResponse:
+    """Gemini 응답을 OpenAI 응답 형태(choices[0].message.content, usage.total_tokens)로 감싼다."""
+
+    def __init__(self, response):
+        self.choices = [
+            type(
+                "obj",
+                (object,),
+                {"message": type("obj", (object,), {"content": response.text})()},
+            )()
+        ]
+        self.usage = _GeminiUsage(getattr(response, "usage_metadata", None))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """공급자 공통 429 (요청/토큰 한도 초과) 판별"""
+    if isinstance(error, openai.RateLimitError):
+        return True
+    if google_exceptions is not None and isinstance(
+        error, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+    ):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """다시 시도하면 성공할 수 있는 오류 (429, 타임아웃, 연결 오류, 5xx)"""
+    if is_rate_limit_error(error):
+        return True
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)):
+        return True
+    if google_exceptions is not None and isinstance(
+        error,
+        (google_exceptions.ServiceUnavailable, google_exceptions.DeadlineExceeded,
+         google_exceptions.InternalServerError),
+    ):
+        return True
+    return isinstance(error, asyncio.TimeoutError)
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초). 없으면 None."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _usage_value(response, field: str) -> Optional[int]:
+    value = getattr(getattr(response, "usage", None), field, None)
+    return value if isinstance(value, int) else None
+
 
-        response = gemini_model.generate_content(contents)
+def response_total_tokens(response) -> Optional[int]:
+    """응답에 기록된 실제 사용 토큰 수 (입력+출력). 알 수 없으면 None."""
+    return _usage_value(response, "total_tokens")
 
-        class GeminiResponse:
-            def __init__(self, text):
-                self.choices = [
-                    type(
-                        "obj",
-                        (object,),
-                        {"message": type("obj", (object,), {"content": text})()},
-                    )()
-                ]
 
-        return GeminiResponse(response.text)
+def response_token_usage(response) -> tuple:
+    """응답의 (입력 토큰, 출력 토큰). 알 수 없는 값은 None."""
+    return _usage_value(response, "prompt_tokens"), _usage_value(response, "completion_tokens")
 
 
 def set_ai_client(client: Optional[Any]) -> None:
@@ -125,9 +125,29 @@ SYSTEM_PROMPT = """
 """
 
 
-def get_special_note_prompt(record: dict) -> tuple[str, str]:
-    user_prompt = f"""
-<daily_activity_record>
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+<batch_instruction>
+    여러 개의 <daily_activity_record>가 <daily_activity_records> 안에 주어집니다.
+    - 각 기록을 서로 독립적으로, 위 지침을 그대로 적용해 평가·작성하십시오. 다른 기록의 내용을 섞지 마십시오.
+    - 모든 기록에 대해 빠짐없이 결과를 작성하고, 각 결과의 record_id 에는 해당 기록의 record_id 속성값을 그대로 쓰십시오.
+    - 출력은 위 output_format 의 JSON 객체를 기록별로 results 배열에 담은 하나의 JSON 객체입니다.
+    {
+        "results": [
+            {
+                "record_id": "1",
+                "original_physical_evaluation": { ... },
+                "original_cognitive_evaluation": { ... },
+                "physical_candidates": [ ... ],
+                "cognitive_candidates": [ ... ]
+            }
+        ]
+    }
+</batch_instruction>
+"""
+
+
+def _record_xml(record: dict, open_tag: str = "<daily_activity_record>") -> str:
+    return f"""{open_tag}
     <customer_name>{record.get('customer_name', '')}</customer_name>
     <date>{record.get('date', '')}</date>
     
@@ -205,6 +225,20 @@ def get_special_note_prompt(record: dict) -> tuple[str, str]:
         <physical_note>{record.get('physical_note', '')}</physical_note>
         <cognitive_note>{record.get('cognitive_note', '')}</cognitive_note>
     </original_notes>
-</daily_activity_record>
-"""
-    return SYSTEM_PROMPT, user_prompt
+</daily_activity_record>"""
+
+
+def get_special_note_prompt(record: dict) -> tuple[str, str]:
+    return SYSTEM_PROMPT, f"\n{_record_xml(record)}\n"
+
+
+def get_special_note_batch_prompt(records: list) -> tuple[str, str]:
+    """여러 기록을 한 번에 평가하는 프롬프트. 기록마다 record_id 를 1부터 순서대로 붙인다.
+
+    system 프롬프트는 기록과 무관하게 고정이므로 공급자 프롬프트 캐시(앞부분 일치)에 걸린다.
+    """
+    blocks = "\n".join(
+        _record_xml(record, f'<daily_activity_record record_id="{i}">')
+        for i, record in enumerate(records, start=1)
+    )
+    return BATCH_SYSTEM_PROMPT, f"\n<daily_activity_records>\n{blocks}\n</daily_activity_records>\n"
@@ -0,0 +1,427 @@
+"""LLM 응답 디스크 캐시 (프롬프트 내용 주소 기반) + 호출 비용/지연 기록
+
+내용이 바이트 단위로 같은 프롬프트(변경 없는 기록 재업로드, 평가 버튼 반복,
+DB 저장 실패 후 재시도)에 대해 AI 를 다시 호출하지 않기 위한 캐시.
+
+- 키: (공급자, 모델, temperature, system 프롬프트 SHA-256, user 프롬프트 SHA-256)
+- 파싱(parse)까지 성공한 응답만 저장 → 깨진 응답은 다음 실행에서 다시 호출
+- SQLite 단일 파일 → 여러 프로세스(uvicorn 워커, Streamlit, 작업 스레드)가 공유
+- TTL(생성 시각 기준) 만료 + 바이트 합계 상한 초과 시 마지막 접근 시각 기준 LRU 제거
+- 프롬프트/응답에 수급자 PII 가 포함되므로 payload 는 압축 후 Fernet(ENCRYPTION_KEY)으로 암호화
+- 호출마다 (용도, 적중 여부, 지연, 토큰, 비용) 을 llm_calls 에 기록 (TTL 과 같은 기간 보관)
+- AI 호출 시간은 프로세스 지표 arisa_llm_call_duration_seconds 로도 관측 (/api/metrics)
+
+use_cache=False 는 조회만 건너뛰고 새 응답으로 캐시를 갱신한다 (강제 재평가).
+
+환경변수:
+    LLM_CACHE_DIR        SQLite 파일 디렉토리 (기본: <tmp>/arisa_store)
+    LLM_CACHE_MAX_MB     최대 용량 MB (기본: 64, 0이면 캐시/기록 비활성)
+    LLM_CACHE_TTL_DAYS   응답 보관 기간 (기본: 30)
+
+사용법:
+    from modules.clients.llm_cache import cached_completion
+
+    result = cached_completion(
+        get_ai_client("openai"), "openai", "gpt-4o-mini", messages,
+        purpose="feedback", parse=json.loads,
+    )
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from modules.metrics import REGISTRY
+from modules.utils.sqlite_utils import init_sqlite, local_store_path, sqlite_connect
+
+from .ai_client import response_token_usage
+from .rate_limit import ESTIMATED_OUTPUT_TOKENS, ProviderLimiter, RetryBudget, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_MAX_BYTES = int(float(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024)
+LLM_CACHE_TTL_SECONDS = int(float(os.getenv("LLM_CACHE_TTL_DAYS", "30")) * 86400)
+
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "arisa_llm_call_duration_seconds", "AI chat_completion 호출 시간 (한도 대기 제외)",
+    ["provider", "model", "purpose", "outcome"],
+)
+LLM_CACHE_HITS = REGISTRY.counter("arisa_llm_cache_hits_total", "LLM 응답 캐시 적중 수", ["purpose"])
+
+# 100만 토큰당 USD (입력, 출력). 모델명 접두사로 찾고, 없으면 비용 미기록
+MODEL_PRICES_PER_MTOK = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key   TEXT PRIMARY KEY,
+    provider    TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    cost_usd    REAL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache (created_at);
+CREATE TABLE IF NOT EXISTS llm_calls (
+    call_id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    called_at         REAL NOT NULL,
+    purpose           TEXT NOT NULL,
+    provider          TEXT NOT NULL,
+    model             TEXT NOT NULL,
+    cached            INTEGER NOT NULL,
+    latency_ms        REAL NOT NULL,
+    prompt_tokens     INTEGER,
+    completion_tokens INTEGER,
+    cost_usd          REAL,
+    saved_usd         REAL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_called ON llm_calls (called_at);
+"""
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def llm_cache_key(provider: str, model: str, temperature: Optional[float], messages: List[Dict]) -> str:
+    """(공급자, 모델, temperature, system 해시, user 해시) 캐시 키.
+
+    system 이 아닌 메시지는 역할을 붙여 이어 붙인 뒤 해시한다 (대화 이력 포함 프롬프트 대비).
+    """
+    system = "\n".join(str(m.get("content") or "") for m in messages if m.get("role") == "system")
+    user = "\n".join(
+        f"{m.get('role')}:{m.get('content') or ''}" for m in messages if m.get("role") != "system"
+    )
+    parts = [provider, model, "default" if temperature is None else repr(float(temperature)),
+             _sha256(system), _sha256(user)]
+    return _sha256("\x1f".join(parts))
+
+
+def estimate_cost(model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> Optional[float]:
+    """토큰 사용량 → USD. 가격표에 없는 모델이거나 사용량을 모르면 None."""
+    if prompt_tokens is None or completion_tokens is None:
+        return None
+    for prefix, (input_price, output_price) in MODEL_PRICES_PER_MTOK.items():
+        if model.startswith(prefix):
+            return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return None
+
+
+class LLMCache:
+    """SQLite 기반 LLM 응답 캐시 (TTL + 크기 제한 LRU) 와 호출 기록."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = LLM_CACHE_MAX_BYTES,
+                 ttl_seconds: int = LLM_CACHE_TTL_SECONDS):
+        self.path = Path(path) if path else local_store_path("llm_cache.sqlite3", env_dir="LLM_CACHE_DIR")
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._fernet = None
+        init_sqlite(self.path, _SCHEMA)
+
+    def _connect(self):
+        return sqlite_connect(self.path)
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            from backend.encryption import EncryptionService
+
+            self._fernet = EncryptionService()
+        return self._fernet
+
+    def _encode(self, content: str) -> bytes:
+        return self._get_fernet().encrypt_bytes(zlib.compress(content.encode("utf-8"), 6))
+
+    def _decode(self, payload: bytes) -> str:
+        return zlib.decompress(self._get_fernet().decrypt_bytes(payload)).decode("utf-8")
+
+    # ── 조회/저장 ─────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """(응답 본문, 원래 호출 비용). 없거나 만료/복호화 실패 시 None."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, cost_usd, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, cost, created_at = row
+            try:
+                if created_at < now - self.ttl_seconds:
+                    raise LookupError("만료")
+                content = self._decode(payload)
+            except Exception:
+                conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET accessed_at = ?, hits = hits + 1 WHERE cache_key = ?",
+                (now, key),
+            )
+            return content, cost
+
+    def put(self, key: str, provider: str, model: str, content: str, cost_usd: Optional[float] = None) -> None:
+        payload = self._encode(content)
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache
+                    (cache_key, provider, model, payload, size_bytes, cost_usd, created_at, accessed_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, provider, model, payload, len(payload), cost_usd, now, now),
+            )
+            self._evict(conn, now)
+
+    def discard(self, key: str) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+
+    def _evict(self, conn, now: float) -> int:
+        """만료 항목/오래된 호출 기록 삭제 후, 총 크기가 max_bytes 이하가 될 때까지 LRU 삭제."""
+        cutoff = now - self.ttl_seconds
+        removed = conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff,)).rowcount
+        conn.execute("DELETE FROM llm_calls WHERE called_at < ?", (cutoff,))
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return removed
+        rows = conn.execute(
+            "SELECT cache_key, size_bytes FROM llm_cache ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+            total -= size
+            removed += 1
+        return removed
+
+    # ── 호출 기록 ─────────────────────────────────────────────────────────
+
+    def record_call(self, purpose: str, provider: str, model: str, cached: bool, latency_ms: float,
+                    prompt_tokens: Optional[int] = None, completion_tokens: Optional[int] = None,
+                    cost_usd: Optional[float] = None, saved_usd: Optional[float] = None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO llm_calls
+                    (called_at, purpose, provider, model, cached, latency_ms,
+                     prompt_tokens, completion_tokens, cost_usd, saved_usd)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (time.time(), purpose, provider, model, int(cached), latency_ms,
+                 prompt_tokens, completion_tokens, cost_usd, saved_usd),
+            )
+
+    def stats(self, since_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """캐시 항목 요약과 용도별 호출 수/적중 수/비용/평균 지연."""
+        since = time.time() - since_seconds if since_seconds is not None else 0.0
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_cache"
+            ).fetchone()
+            rows = conn.execute(
+                """
+                SELECT purpose, COUNT(*), COALESCE(SUM(cached), 0),
+                       COALESCE(SUM(cost_usd), 0), COALESCE(SUM(saved_usd), 0),
+                       AVG(CASE WHEN cached = 0 THEN latency_ms END)
+                FROM llm_calls WHERE called_at >= ? GROUP BY purpose
+                """,
+                (since,),
+            ).fetchall()
+        by_purpose = {
+            purpose: {
+                "calls": calls,
+                "cached": cached,
+                "cost_usd": round(cost, 6),
+                "saved_usd": round(saved, 6),
+                "avg_latency_ms": round(latency, 1) if latency is not None else None,
+            }
+            for purpose, calls, cached, cost, saved, latency in rows
+        }
+        return {
+            "path": str(self.path),
+            "max_bytes": self.max_bytes,
+            "entries": entries,
+            "size_bytes": size,
+            "by_purpose": by_purpose,
+        }
+
+    def purge(self, older_than_seconds: Optional[float] = None) -> int:
+        """조건에 맞는 응답 삭제 후 삭제 건수 반환. 조건이 없으면 응답/호출 기록 전체 삭제."""
+        with self._lock, self._connect() as conn:
+            if older_than_seconds is not None:
+                return conn.execute(
+                    "DELETE FROM llm_cache WHERE accessed_at < ?", (time.time() - older_than_seconds,)
+                ).rowcount
+            removed = conn.execute("DELETE FROM llm_cache").rowcount
+            conn.execute("DELETE FROM llm_calls")
+        with self._connect() as conn:
+            conn.execute("VACUUM")
+        return removed
+
+
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """프로세스 공용 LLM 캐시. LLM_CACHE_MAX_MB=0 이면 비활성(None)."""
+    global _llm_cache
+    if LLM_CACHE_MAX_BYTES <= 0:
+        return None
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            try:
+                _llm_cache = LLMCache()
+            except Exception as e:
+                # 캐시 디렉토리 생성 실패 등은 AI 호출 자체를 막지 않음
+                logger.warning("LLM 캐시 초기화 실패 (캐시 없이 진행): %s", e)
+                return None
+        return _llm_cache
+
+
+# ─── 호출 래퍼 ──────────────────────────────────────────────────────────
+
+
+def _identity(content: str) -> Any:
+    return content
+
+
+def _lookup(cache: LLMCache, key: str, parse: Callable[[str], Any], purpose: str,
+            provider: str, model: str, started: float) -> Tuple[bool, Any]:
+    """캐시 적중 시 (True, parse 결과). 못 쓰는 항목은 지우고 (False, None)."""
+    try:
+        hit = cache.get(key)
+        if hit is None:
+            return False, None
+        content, cost = hit
+        try:
+            result = parse(content)
+        except Exception:
+            cache.discard(key)
+            return False, None
+        cache.record_call(purpose, provider, model, True,
+                          (time.perf_counter() - started) * 1000, saved_usd=cost)
+        LLM_CACHE_HITS.inc(purpose=purpose)
+        return True, result
+    except Exception as e:
+        logger.warning("LLM 캐시 조회 실패 (AI 호출로 진행): %s", e)
+        return False, None
+
+
+def _store(cache: Optional[LLMCache], key: str, response, parse: Callable[[str], Any], purpose: str,
+           provider: str, model: str, started: float) -> Any:
+    """응답 파싱 → (성공 시) 캐시 저장 + 호출 기록. 파싱 오류는 그대로 올린다."""
+    latency_ms = (time.perf_counter() - started) * 1000
+    content = response.choices[0].message.content
+    prompt_tokens, completion_tokens = response_token_usage(response)
+    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+    if cache is not None:
+        try:
+            cache.record_call(purpose, provider, model, False, latency_ms,
+                              prompt_tokens, completion_tokens, cost)
+        except Exception as e:
+            logger.warning("LLM 호출 기록 실패: %s", e)
+    result = parse(content)
+    if cache is not None and content:
+        try:
+            cache.put(key, provider, model, content, cost)
+        except Exception as e:
+            logger.warning("LLM 캐시 저장 실패: %s", e)
+    return result
+
+
+def lookup_cached(provider: str, model: str, messages: List[Dict], *,
+                  temperature: Optional[float] = None, purpose: str = "default",
+                  parse: Callable[[str], Any] = _identity) -> Tuple[bool, Any]:
+    """AI 를 부르지 않고 캐시만 조회. 적중 시 (True, parse 결과), 아니면 (False, None)."""
+    cache = get_llm_cache()
+    if cache is None:
+        return False, None
+    key = llm_cache_key(provider, model, temperature, messages)
+    return _lookup(cache, key, parse, purpose, provider, model, time.perf_counter())
+
+
+def store_cached(provider: str, model: str, messages: List[Dict], content: str, *,
+                 temperature: Optional[float] = None, cost_usd: Optional[float] = None) -> None:
+    """다른 호출(예: 여러 기록을 묶은 배치 응답)에서 얻은 응답을 messages 의 캐시 키로 저장."""
+    cache = get_llm_cache()
+    if cache is None or not content:
+        return
+    try:
+        cache.put(llm_cache_key(provider, model, temperature, messages), provider, model, content, cost_usd)
+    except Exception as e:
+        logger.warning("LLM 캐시 저장 실패: %s", e)
+
+
+def _call_kwargs(temperature: Optional[float], kwargs: Dict) -> Dict:
+    return {**kwargs, "temperature": temperature} if temperature is not None else kwargs
+
+
+def cached_completion(ai_client, provider: str, model: str, messages: List[Dict], *,
+                      temperature: Optional[float] = None, purpose: str = "default",
+                      parse: Callable[[str], Any] = _identity, use_cache: bool = True, **kwargs) -> Any:
+    """캐시를 거치는 chat_completion. 반환값은 parse(응답 본문).
+
+    parse 가 예외를 던지면 캐시에 저장하지 않고 예외를 그대로 올린다.
+    """
+    cache = get_llm_cache()
+    key = llm_cache_key(provider, model, temperature, messages)
+    started = time.perf_counter()
+    if cache is not None and use_cache:
+        hit, result = _lookup(cache, key, parse, purpose, provider, model, started)
+        if hit:
+            return result
+    started = time.perf_counter()
+    with LLM_CALL_SECONDS.time(provider=provider, model=model, purpose=purpose):
+        response = ai_client.chat_completion(model=model, messages=messages, **_call_kwargs(temperature, kwargs))
+    return _store(cache, key, response, parse, purpose, provider, model, started)
+
+
+async def acached_completion(ai_client, provider: str, model: str, messages: List[Dict], *,
+                             temperature: Optional[float] = None, purpose: str = "default",
+                             parse: Callable[[str], Any] = _identity, use_cache: bool = True,
+                             limiter: Optional[ProviderLimiter] = None,
+                             budget: Optional[RetryBudget] = None,
+                             output_tokens: int = ESTIMATED_OUTPUT_TOKENS, **kwargs) -> Any:
+    """캐시를 거치는 achat_completion. limiter 가 있으면 캐시 미스일 때만 호출 한도를 적용한다.
+
+    output_tokens 는 TPM 예약용 출력 토큰 추정치 (여러 건을 묶은 요청은 건수만큼 키운다).
+    """
+    cache = get_llm_cache()
+    key = llm_cache_key(provider, model, temperature, messages)
+    started = time.perf_counter()
+    if cache is not None and use_cache:
+        hit, result = _lookup(cache, key, parse, purpose, provider, model, started)
+        if hit:
+            return result
+
+    async def call():
+        # 지연은 한도 대기를 빼고 마지막 시도의 API 호출 시간만 잰다
+        nonlocal started
+        started = time.perf_counter()
+        with LLM_CALL_SECONDS.time(provider=provider, model=model, purpose=purpose):
+            return await ai_client.achat_completion(model=model, messages=messages, **_call_kwargs(temperature, kwargs))
+
+    if limiter is not None:
+        response = await limiter.call(call, estimate_tokens(messages, output_tokens), budget)
+    else:
+        response = await call()
+    return _store(cache, key, response, parse, purpose, provider, model, started)
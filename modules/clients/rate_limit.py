@@ -0,0 +1,260 @@
+"""AI 공급자별 호출 한도 관리 (RPM/TPM 토큰 버킷, 적응형 동시성, 재시도 예산).
+
+- 토큰 버킷: 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 공급자별로 공유한다.
+  예약 방식이라 먼저 온 호출이 먼저 나가고, 응답의 실제 사용 토큰으로 예약량을 보정한다.
+- 적응형 동시성(AIMD): 성공할 때마다 동시 호출 한도를 조금씩 늘리고,
+  429 를 받으면 절반으로 줄인 뒤 Retry-After 동안 새 호출을 멈춘다.
+- 재시도 예산: 한 번의 일괄 실행에서 재시도 총량을 (기본값 + 호출 수 × 비율)로 묶어
+  공급자 장애 때 재시도가 폭주하지 않게 한다.
+
+상태는 threading.Lock 으로 보호하고 대기는 asyncio.sleep 으로만 한다.
+이벤트 루프에 묶이지 않으므로 여러 스레드(작업 큐, Streamlit 세션)의 asyncio.run 이 같은 한도를 나눠 쓴다.
+
+환경변수:
+    AI_GEMINI_RPM / AI_GEMINI_TPM   Gemini 분당 요청/토큰 한도 (기본: 60 / 250000, 0이면 제한 없음)
+    AI_OPENAI_RPM / AI_OPENAI_TPM   OpenAI 분당 요청/토큰 한도 (기본: 500 / 200000, 0이면 제한 없음)
+    AI_MAX_CONCURRENCY              공급자별 최대 동시 호출 수 (기본: 16)
+    AI_MAX_ATTEMPTS                 호출 1건의 최대 시도 횟수 (기본: 5)
+    AI_RETRY_BUDGET_RATIO           일괄 실행의 호출 수 대비 재시도 허용 비율 (기본: 0.2)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .ai_client import (
+    is_rate_limit_error,
+    is_retryable_error,
+    response_total_tokens,
+    retry_after_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "16"))
+AI_MAX_ATTEMPTS = int(os.getenv("AI_MAX_ATTEMPTS", "5"))
+AI_RETRY_BUDGET_RATIO = float(os.getenv("AI_RETRY_BUDGET_RATIO", "0.2"))
+
+PROVIDER_LIMITS = {
+    "gemini": (int(os.getenv("AI_GEMINI_RPM", "60")), int(os.getenv("AI_GEMINI_TPM", "250000"))),
+    "openai": (int(os.getenv("AI_OPENAI_RPM", "500")), int(os.getenv("AI_OPENAI_TPM", "200000"))),
+}
+
+# 토큰 수 추정 (한국어 위주 프롬프트 기준 보수적으로), 응답 후 실제 사용량으로 보정
+CHARS_PER_TOKEN = 2
+ESTIMATED_OUTPUT_TOKENS = 2000
+
+RETRY_MIN_BUDGET = 10
+MAX_BACKOFF_SECONDS = 60.0
+CONCURRENCY_POLL_SECONDS = 0.05
+THROTTLE_COOLDOWN_SECONDS = 1.0
+
+
+def estimate_tokens(messages: list, output_tokens: int = ESTIMATED_OUTPUT_TOKENS) -> int:
+    """메시지 길이로 추정한 호출 1건의 토큰 수 (입력 + 출력 여유분)."""
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return chars // CHARS_PER_TOKEN + output_tokens
+
+
+def _backoff(attempt: int) -> float:
+    """지수 백오프 + 지터 (1, 2, 4 ... 최대 60초의 50~100%)."""
+    return min(MAX_BACKOFF_SECONDS, 2.0 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷. 최대 1분치까지 몰아 쓸 수 있다."""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """amount 를 예약하고 쓸 수 있게 될 때까지 기다릴 시간(초)을 반환. 한도 0이면 항상 0.
+
+        잔량이 모자라면 음수로 빌려 두므로 뒤이은 예약은 그만큼 더 기다린다 (선착순).
+        """
+        if self.capacity <= 0:
+            return 0.0
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """예약량 보정 (양수: 되돌려 받기, 음수: 추가 차감)."""
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + delta)
+
+
+class AdaptiveConcurrency:
+    """AIMD 동시 호출 한도. 성공마다 +1/한도, 429 마다 절반 (쿨다운 안의 연속 429 는 한 번만)."""
+
+    def __init__(self, max_limit: int, initial: Optional[int] = None, min_limit: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self._limit = float(min(self.max_limit, initial or 4))
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> Optional[float]:
+        """자리를 잡으면 None, 아니면 다시 시도하기 전 기다릴 시간(초)."""
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return None
+            return CONCURRENCY_POLL_SECONDS
+
+    async def acquire(self) -> None:
+        while True:
+            wait = self.try_acquire()
+            if wait is None:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, success: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if success:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def throttle(self, pause_seconds: float) -> None:
+        """429 수신: 한도를 절반으로 줄이고 pause_seconds 동안 새 호출을 멈춘다."""
+        with self._lock:
+            now = self._clock()
+            if now - self._last_decrease >= THROTTLE_COOLDOWN_SECONDS:
+                self._limit = max(float(self.min_limit), self._limit / 2)
+                self._last_decrease = now
+            self._paused_until = max(self._paused_until, now + pause_seconds)
+
+
+class RetryBudget:
+    """일괄 실행 1회의 재시도 총량. minimum + 호출 수 × ratio 까지 허용."""
+
+    def __init__(self, ratio: float = AI_RETRY_BUDGET_RATIO, minimum: int = RETRY_MIN_BUDGET):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.retries >= self.minimum + self.requests * self.ratio:
+                return False
+            self.retries += 1
+            return True
+
+
+class ProviderLimiter:
+    """공급자 1곳의 RPM/TPM 버킷 + 적응형 동시성. call() 로 감싼 호출만 한도를 따른다."""
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int = AI_MAX_CONCURRENCY,
+                 max_attempts: int = AI_MAX_ATTEMPTS, clock: Callable[[], float] = time.monotonic):
+        self.requests = TokenBucket(rpm, clock)
+        self.tokens = TokenBucket(tpm, clock)
+        self.concurrency = AdaptiveConcurrency(max_concurrency, clock=clock)
+        self.max_attempts = max(1, max_attempts)
+        self._stats_lock = threading.Lock()
+        self._stats = {"calls": 0, "throttled": 0, "retries": 0, "failures": 0}
+
+    def _count(self, kind: str) -> None:
+        with self._stats_lock:
+            self._stats[kind] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """누적 호출/429/재시도/실패 수와 현재 동시성 한도."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["concurrency_limit"] = self.concurrency.limit
+        stats["in_flight"] = self.concurrency.in_flight
+        return stats
+
+    async def _acquire(self, estimated_tokens: int) -> None:
+        wait = max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await self.concurrency.acquire()
+
+    async def call(self, func: Callable[[], Awaitable[T]], estimated_tokens: int,
+                   budget: Optional[RetryBudget] = None) -> T:
+        """func() 를 한도 안에서 실행. 재시도 가능한 오류는 예산이 남아 있는 동안 백오프 후 재시도."""
+        budget = budget or RetryBudget()
+        budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._acquire(estimated_tokens)
+            self._count("calls")
+            try:
+                response = await func()
+            except Exception as e:
+                delay = _backoff(attempt)
+                if is_rate_limit_error(e):
+                    self._count("throttled")
+                    delay = retry_after_seconds(e) or delay
+                    self.concurrency.throttle(delay)
+                self.concurrency.release()
+                if not is_retryable_error(e) or attempt >= self.max_attempts or not budget.try_spend():
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                logger.warning("AI 호출 재시도 %d/%d (%.1f초 후): %s", attempt, self.max_attempts, delay, e)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # 취소(CancelledError) 등은 재시도 없이 자리만 돌려주고 전파 (공용 한도에 자리가 새지 않도록)
+                self.concurrency.release()
+                raise
+            self.concurrency.release(success=True)
+            actual = response_total_tokens(response)
+            if actual is not None:
+                self.tokens.adjust(estimated_tokens - actual)
+            return response
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> ProviderLimiter:
+    """프로세스 공용 공급자별 한도 관리자."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            rpm, tpm = PROVIDER_LIMITS.get(provider, (0, 0))
+            limiter = _limiters[provider] = ProviderLimiter(rpm, tpm)
+        return limiter
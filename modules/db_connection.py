@@ -5,21 +5,40 @@
 - 환경변수 (테스트/CLI용)
 - 의존성 주입 (단위 테스트용)
 - 연결 풀링 (성능 최적화)
+- 작업 단위(unit of work): 요청 1건의 모든 쿼리가 연결 1개와 트랜잭션 1개를 공유
+- 문장별 실행 시간/행 수 계측 (modules.db_metrics.TimedCursor)
 """
 
 import os
 import gc
+import logging
+import threading
 import mysql.connector
-from mysql.connector import pooling
-from contextlib import contextmanager
-from typing import Iterator, Optional, Callable, Dict, Any
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Callable, Dict, Any, Type
+
+from modules.db_metrics import TimedCursor
+from modules.metrics import REGISTRY
+from modules.db_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# 연결 풀 설정 (워커 프로세스마다 적용)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))
+DB_POOL_PING_AFTER = float(os.getenv("DB_POOL_PING_AFTER", "30"))
+
+# iter_query 한 번에 가져오는 행 수
+ITER_QUERY_BATCH_SIZE = 1000
 
 # Connection factory for dependency injection (테스트용)
 _connection_factory: Optional[Callable[[], Any]] = None
 
-# Connection pool (성능 최적화)
-_connection_pool: Optional[pooling.MySQLConnectionPool] = None
+# Connection pool (성능 최적화) — 풀을 만들 때 읽은 설정을 재사용 (대여마다 secrets.toml 재조회 방지)
+_connection_pool: Optional[ConnectionPool] = None
 _pool_config: Optional[Dict[str, Any]] = None
+_pool_lock = threading.Lock()
 
 
 def set_connection_factory(factory: Optional[Callable[[], Any]]) -> None:
@@ -98,53 +117,199 @@ def get_db_config() -> Dict[str, Any]:
     raise RuntimeError("Database configuration not found. Set environment variables or Streamlit secrets.")
 
 
-def _get_connection_pool() -> pooling.MySQLConnectionPool:
-    """연결 풀 가져오기
-    """
+def _get_connection_pool() -> ConnectionPool:
+    """연결 풀 가져오기 (처음 한 번만 설정을 읽어 생성, 설정 변경은 release_pool() 후 반영)"""
     global _connection_pool, _pool_config
-    
-    config = get_db_config()
-    
-    # 설정이 변경되었거나 풀이 없으면 새로 생성
-    if _connection_pool is None or _pool_config != config:
-        if _connection_pool is not None:
-            # 기존 풀 정리
-            try:
-                _connection_pool = None
-                gc.collect()
-            except:
-                pass
-        
-        from modules.utils.memory_utils import DB_POOL_SIZE
-        pool_size = DB_POOL_SIZE
-        
-        _pool_config = config.copy()
-        _connection_pool = pooling.MySQLConnectionPool(
-            pool_name="arisa_pool",
-            pool_size=pool_size,
-            pool_reset_session=True,
-            **config
-        )
-    
-    return _connection_pool
+
+    pool = _connection_pool
+    if pool is not None:
+        return pool
+    with _pool_lock:
+        if _connection_pool is None:
+            from modules.utils.memory_utils import DB_POOL_SIZE
+
+            config = get_db_config()
+            _pool_config = config.copy()
+            _connection_pool = ConnectionPool(
+                lambda: mysql.connector.connect(**config),
+                size=DB_POOL_SIZE,
+                timeout=DB_POOL_TIMEOUT,
+                max_lifetime=DB_POOL_MAX_LIFETIME,
+                ping_after=DB_POOL_PING_AFTER,
+            )
+        return _connection_pool
 
 
 def get_db_connection():
     """데이터베이스 연결 가져오기
-    
+
     설정된 커스텀 팩토리가 있으면 사용하고(테스트용),
     그렇지 않으면 연결 풀에서 연결을 가져옵니다.
+    풀이 가득 차면 DB_POOL_TIMEOUT 초까지 기다리고, 그래도 없으면 PoolTimeout 을 던집니다
+    (풀 밖 직접 연결로 우회하지 않음 → 연결 수는 DB_POOL_SIZE 를 넘지 않음).
     """
     if _connection_factory is not None:
         return _connection_factory()
-    
+    return _get_connection_pool().get_connection()
+
+
+def get_pool_stats() -> Optional[Dict[str, Any]]:
+    """현재 프로세스 연결 풀 통계 (ConnectionPool.stats). 풀이 아직 없으면 None."""
+    pool = _connection_pool
+    return pool.stats() if pool is not None else None
+
+
+# Prometheus 지표로 내보낼 풀 통계 (이름, 타입, 설명)
+_POOL_METRICS = {
+    "size": ("arisa_db_pool_size", "gauge", "연결 풀 최대 크기"),
+    "in_use": ("arisa_db_pool_in_use", "gauge", "사용 중인 연결 수"),
+    "idle": ("arisa_db_pool_idle", "gauge", "유휴 연결 수"),
+    "waiters": ("arisa_db_pool_waiters", "gauge", "연결을 기다리는 스레드 수"),
+    "checkouts": ("arisa_db_pool_checkouts_total", "counter", "연결 대여 수"),
+    "waits": ("arisa_db_pool_waits_total", "counter", "기다린 뒤 대여한 수"),
+    "timeouts": ("arisa_db_pool_timeouts_total", "counter", "대기 시간 초과 수"),
+    "wait_seconds_total": ("arisa_db_pool_wait_seconds_total", "counter", "대여 대기 시간 합계(초)"),
+}
+
+
+def _pool_metric_families():
+    stats = get_pool_stats()
+    if stats is None:
+        return
+    for key, (name, kind, doc) in _POOL_METRICS.items():
+        yield name, kind, doc, [({}, stats[key])]
+
+
+REGISTRY.add_collector(_pool_metric_families)
+
+
+class UnitOfWork:
+    """여러 db_query/db_transaction 이 나눠 쓰는 연결 1개와 트랜잭션 1개.
+
+    - 연결은 첫 쿼리 때 빌린다 (DB 를 쓰지 않는 요청은 체크아웃 없음).
+    - 안쪽 db_transaction 은 커밋하지 않고 SAVEPOINT 로 감싼다. 예외가 나면 그 블록만 되돌린다.
+    - 전체 커밋/롤백과 반납은 작업 단위를 연 쪽에서 한 번만 한다.
+    - after_commit 으로 등록한 함수(캐시 무효화 등)는 커밋이 끝난 뒤에 실행하고, 롤백되면 버린다.
+    - 여러 스레드가 동시에 쓰면 RLock 으로 한 번에 하나씩 실행한다.
+    """
+
+    def __init__(self):
+        self._conn = None
+        self._lock = threading.RLock()
+        self._savepoint_seq = 0
+        self._after_commit: List[Callable[[], None]] = []
+        self.closed = False
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    @property
+    def connection(self):
+        if self._conn is None:
+            self._conn = get_db_connection()
+        return self._conn
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """블록을 SAVEPOINT 로 감싼다. 예외 시 블록 시작 시점으로 되돌리고 예외를 다시 던진다."""
+        with self._lock:
+            self._savepoint_seq += 1
+            name = f"uow_sp_{self._savepoint_seq}"
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(f"SAVEPOINT {name}")
+                try:
+                    yield
+                except BaseException:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                    raise
+                cursor.execute(f"RELEASE SAVEPOINT {name}")
+            finally:
+                cursor.close()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """commit() 성공 뒤 한 번 실행할 함수 등록. 다른 요청이 커밋 전 데이터를 보는 동안 실행되면 안 되는 일용."""
+        with self._lock:
+            self._after_commit.append(callback)
+
+    def commit(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+            callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:  # 커밋은 끝났으므로 후속 작업 실패가 요청을 깨지 않도록
+                logger.error("커밋 후 작업 실패: %s", e)
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._after_commit.clear()
+            if self._conn is not None:
+                self._conn.rollback()
+
+    def close(self) -> None:
+        """연결 반납. 이후의 db_query/db_transaction 은 다시 개별 연결을 쓴다."""
+        with self._lock:
+            self.closed = True
+            self._after_commit.clear()
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                conn.close()
+
+
+_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("db_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """현재 컨텍스트의 열린 작업 단위 (없거나 이미 닫혔으면 None)."""
+    uow = _unit_of_work.get()
+    if uow is None or uow.closed:
+        return None
+    return uow
+
+
+def bind_unit_of_work(uow: UnitOfWork) -> None:
+    """현재 컨텍스트(요청 태스크)에 작업 단위를 연결.
+
+    이후 같은 컨텍스트와 그 복사본(run_in_threadpool, asyncio.to_thread)의 쿼리가 이 연결을 쓴다.
+    해제는 uow.close() 로 한다 (닫힌 작업 단위는 무시됨).
+    """
+    _unit_of_work.set(uow)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """블록 안의 모든 db_query/db_transaction 을 연결 1개, 트랜잭션 1개로 묶는다.
+
+    성공 시 한 번 커밋, 예외 시 롤백 후 예외를 다시 던진다.
+    이미 작업 단위 안이면 새 연결 대신 SAVEPOINT 로 중첩된다.
+
+    Usage:
+        with unit_of_work():
+            repo.save(...)
+            other_repo.update(...)
+    """
+    outer = current_unit_of_work()
+    if outer is not None:
+        with outer.savepoint():
+            yield outer
+        return
+
+    uow = UnitOfWork()
+    token = _unit_of_work.set(uow)
     try:
-        pool = _get_connection_pool()
-        return pool.get_connection()
-    except Exception:
-        # 풀링 실패 시 직접 연결 (폴백)
-        config = get_db_config()
-        return mysql.connector.connect(**config)
+        yield uow
+        uow.commit()
+    except BaseException:
+        with suppress(Exception):
+            uow.rollback()
+        raise
+    finally:
+        _unit_of_work.reset(token)
+        uow.close()
 
 
 @contextmanager
@@ -161,9 +326,23 @@ def db_transaction(dictionary: bool = False) -> Iterator[mysql.connector.cursor.
         with db_transaction() as cursor:
             cursor.execute("INSERT INTO table VALUES (%s)", (value,))
             # 성공 시 자동 커밋, 예외 발생 시 롤백
+
+    작업 단위 안에서는 공유 연결의 SAVEPOINT 로 실행하고 커밋은 작업 단위가 한다.
     """
+    uow = current_unit_of_work()
+    if uow is not None:
+        with uow.lock:
+            cursor = TimedCursor(uow.connection.cursor(dictionary=dictionary, buffered=True))
+            try:
+                with uow.savepoint():
+                    yield cursor
+            finally:
+                cursor.finish()
+                cursor.close()
+        return
+
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=dictionary)
+    cursor = TimedCursor(conn.cursor(dictionary=dictionary))
     try:
         yield cursor
         conn.commit()
@@ -171,6 +350,7 @@ def db_transaction(dictionary: bool = False) -> Iterator[mysql.connector.cursor.
         conn.rollback()
         raise
     finally:
+        cursor.finish()
         cursor.close()
         conn.close()
 
@@ -189,9 +369,22 @@ def db_query(dictionary: bool = True) -> Iterator[mysql.connector.cursor.MySQLCu
         with db_query() as cursor:
             cursor.execute("SELECT * FROM table WHERE id = %s", (id,))
             results = cursor.fetchall()
+
+    작업 단위 안에서는 공유 연결의 buffered 커서를 쓴다 (결과를 다 읽지 않아도 다음 쿼리 가능).
     """
+    uow = current_unit_of_work()
+    if uow is not None:
+        with uow.lock:
+            cursor = TimedCursor(uow.connection.cursor(dictionary=dictionary, buffered=True))
+            try:
+                yield cursor
+            finally:
+                cursor.finish()
+                cursor.close()
+        return
+
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=dictionary, buffered=False)  # 메모리 최적화: unbuffered
+    cursor = TimedCursor(conn.cursor(dictionary=dictionary, buffered=False))  # 메모리 최적화: unbuffered
     try:
         yield cursor
     finally:
@@ -200,13 +393,67 @@ def db_query(dictionary: bool = True) -> Iterator[mysql.connector.cursor.MySQLCu
             cursor.fetchall()
         except:
             pass
+        cursor.finish()
+        cursor.close()
+        conn.close()
+
+
+def iter_query(query: str, params: tuple = None, batch_size: int = ITER_QUERY_BATCH_SIZE,
+               row_type: Optional[Type] = None) -> Iterator[List[Any]]:
+    """결과를 batch_size 행씩 나눠 내보내는 스트리밍 조회 (unbuffered 커서, 메모리 일정)
+
+    Args:
+        query: SELECT 문
+        params: 바인딩 파라미터
+        batch_size: 한 번에 가져올 행 수
+        row_type: NamedTuple 등 튜플 타입을 주면 dict 대신 row_type(*row) 로 내보냄
+            (필드 이름이 있으면 SELECT 컬럼 이름과 같아야 함)
+
+    Yields:
+        행 목록 (dict 또는 row_type)
+
+    작업 단위(unit_of_work) 와 상관없이 항상 별도 연결을 쓴다. 스트리밍 중에는 연결에
+    다른 쿼리를 보낼 수 없고, StreamingResponse 는 요청의 작업 단위가 끝난 뒤에 읽히기 때문이다.
+    중간에 멈추면(제너레이터 close) 남은 행을 batch_size 씩 읽어 버린 뒤 연결을 반납한다.
+
+    Usage:
+        for rows in iter_query("SELECT ... WHERE date BETWEEN %s AND %s", (start, end)):
+            write(rows)
+    """
+    conn = get_db_connection()
+    cursor = TimedCursor(conn.cursor(dictionary=row_type is None, buffered=False))
+    try:
+        cursor.execute(query, params or ())
+        if row_type is not None:
+            fields = getattr(row_type, "_fields", None)
+            if fields is not None and tuple(fields) != tuple(cursor.column_names):
+                raise ValueError(f"{row_type.__name__} 필드 {fields} 가 조회 컬럼 {cursor.column_names} 과 다릅니다.")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [row_type(*row) for row in rows] if row_type is not None else rows
+    finally:
+        # 미소비 결과 정리 (fetchall 대신 나눠 읽어 메모리 일정 유지)
+        try:
+            while cursor.fetchmany(batch_size):
+                pass
+        except Exception:
+            pass
+        cursor.finish()
         cursor.close()
         conn.close()
 
 
 def release_pool():
-    """연결 풀 해제 (메모리 정리용)"""
+    """연결 풀 해제 (메모리 정리용). 유휴 연결은 바로, 사용 중인 연결은 반납될 때 닫는다."""
     global _connection_pool, _pool_config
-    _connection_pool = None
+    with _pool_lock:
+        pool, _connection_pool = _connection_pool, None
+    if pool is not None:
+        try:
+            pool.close()
+        except Exception:
+            pass
     _pool_config = None
     gc.collect()
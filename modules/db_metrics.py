@@ -0,0 +1,193 @@
+"""SQL 문장별 실행 시간/행 수 집계와 느린 쿼리 로그
+
+db_query/db_transaction/iter_query 가 내주는 커서를 TimedCursor 로 감싼다.
+- 문장 지문(fingerprint): 리터럴·파라미터 자리를 ? 로, IN (...) 목록과 여러 행 VALUES 를 하나로 접은 SQL
+- 지문별 호출 수, 누적/최대 시간, 행 수 (pg_stat_statements 와 비슷한 표)
+- 시간은 execute 와 이후 fetch 를 합친 값 (unbuffered 커서는 fetch 때 결과를 받는다)
+- DB_SLOW_QUERY_MS 이상 걸린 문장은 WARNING 으로 남긴다 (0 이하면 끔)
+
+지표 이름: arisa_db_query_duration_seconds{statement}, arisa_db_statement_*_total{fingerprint}
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+# 지문 표 최대 크기 (동적 SQL 이 지문을 무한히 만들지 않도록)
+MAX_STATEMENTS = 2000
+OTHER_FINGERPRINT = "other"
+
+QUERY_SECONDS = REGISTRY.histogram(
+    "arisa_db_query_duration_seconds", "SQL 문장 실행 시간 (execute + fetch)", ["statement"],
+)
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_VALUES_RE = re.compile(r"\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.I)
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> Tuple[str, str]:
+    """(지문 id, 정규화한 SQL). id 는 정규화 SQL 의 sha1 앞 12자리."""
+    sql = _COMMENT_RE.sub(" ", query)
+    sql = _STRING_RE.sub("?", sql)
+    sql = _PARAM_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    sql = _VALUES_RE.sub(r"VALUES \1, ...", sql)
+    sql = _SPACE_RE.sub(" ", sql).strip()
+    return hashlib.sha1(sql.encode("utf-8")).hexdigest()[:12], sql
+
+
+def _statement_kind(sql: str) -> str:
+    word = sql.split(" ", 1)[0].upper() if sql else ""
+    return word if word in {"SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH"} else "OTHER"
+
+
+class _StatementStats:
+    """지문별 누적 통계."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, query: str, seconds: float, rows: int) -> None:
+        fid, sql = fingerprint(query)
+        QUERY_SECONDS.observe(seconds, statement=_statement_kind(sql))
+        with self._lock:
+            entry = self._entries.get(fid)
+            if entry is None:
+                if len(self._entries) >= MAX_STATEMENTS:
+                    fid, sql = OTHER_FINGERPRINT, "(지문 표 가득 참)"
+                    entry = self._entries.get(fid)
+                if entry is None:
+                    entry = self._entries[fid] = {
+                        "fingerprint": fid, "query": sql, "calls": 0,
+                        "seconds_total": 0.0, "seconds_max": 0.0, "rows": 0,
+                    }
+            entry["calls"] += 1
+            entry["seconds_total"] += seconds
+            entry["seconds_max"] = max(entry["seconds_max"], seconds)
+            entry["rows"] += rows
+        if DB_SLOW_QUERY_MS > 0 and seconds * 1000 >= DB_SLOW_QUERY_MS:
+            logger.warning("느린 쿼리 %.0fms rows=%d fingerprint=%s: %s", seconds * 1000, rows, fid, sql[:500])
+
+    def top(self, limit: int = 20, order_by: str = "seconds_total") -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = [dict(e) for e in self._entries.values()]
+        for e in entries:
+            e["seconds_avg"] = round(e["seconds_total"] / e["calls"], 6) if e["calls"] else 0.0
+            e["seconds_total"] = round(e["seconds_total"], 6)
+            e["seconds_max"] = round(e["seconds_max"], 6)
+        entries.sort(key=lambda e: e.get(order_by, 0), reverse=True)
+        return entries[:limit]
+
+    def families(self):
+        with self._lock:
+            entries = [dict(e) for e in self._entries.values()]
+        for name, field, doc in (
+            ("arisa_db_statement_calls_total", "calls", "SQL 지문별 실행 횟수"),
+            ("arisa_db_statement_seconds_total", "seconds_total", "SQL 지문별 누적 실행 시간(초)"),
+            ("arisa_db_statement_rows_total", "rows", "SQL 지문별 반환/변경 행 수"),
+        ):
+            yield name, "counter", doc, [({"fingerprint": e["fingerprint"]}, e[field]) for e in entries]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+STATEMENTS = _StatementStats()
+REGISTRY.add_collector(STATEMENTS.families)
+
+
+def get_statement_stats(limit: int = 20, order_by: str = "seconds_total") -> List[Dict[str, Any]]:
+    """이 워커의 지문별 통계 상위 limit 건 (order_by: seconds_total/calls/seconds_max/rows)."""
+    return STATEMENTS.top(limit, order_by)
+
+
+class TimedCursor:
+    """execute/executemany 와 이어지는 fetch 시간을 재는 커서 래퍼. 나머지 속성은 원래 커서에 위임.
+
+    문장 하나의 측정은 다음 execute 또는 finish() 에서 마무리한다.
+    """
+
+    def __init__(self, cursor: Any):
+        self._cursor = cursor
+        self._query: Optional[str] = None
+        self._seconds = 0.0
+        self._fetched = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _run(self, method, args, kwargs):
+        self.finish()
+        self._query = args[0] if args else kwargs.get("operation")
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._seconds = time.perf_counter() - started
+
+    def execute(self, *args, **kwargs):
+        return self._run(self._cursor.execute, args, kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._run(self._cursor.executemany, args, kwargs)
+
+    def _fetch(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._seconds += time.perf_counter() - started
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        if row is not None:
+            self._fetched += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._fetch(self._cursor.fetchmany, *args)
+        self._fetched += len(rows) if isinstance(rows, list) else 0
+        return rows
+
+    def fetchall(self):
+        rows = self._fetch(self._cursor.fetchall)
+        self._fetched += len(rows) if isinstance(rows, list) else 0
+        return rows
+
+    def finish(self) -> None:
+        """진행 중인 문장 측정을 기록."""
+        query, self._query = self._query, None
+        if not isinstance(query, str):
+            return
+        rows = self._fetched
+        if not rows:
+            rowcount = getattr(self._cursor, "rowcount", None)
+            rows = rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
+        try:
+            STATEMENTS.record(query, self._seconds, rows)
+        except Exception as e:  # 계측 실패가 쿼리를 깨지 않도록
+            logger.debug("쿼리 지표 기록 실패: %s", e)
+        self._seconds = 0.0
+        self._fetched = 0
@@ -0,0 +1,203 @@
+"""MySQL 연결 풀 (크기 제한 + 대기열 + 상태 점검 + 통계)
+
+mysql.connector 의 기본 풀은 비어 있으면 즉시 PoolError 를 던진다. 그래서 예전 get_db_connection 은
+풀 밖에서 직접 연결을 열었고, 몰리는 요청만큼 연결 수가 늘어 MySQL max_connections 에 닿을 수 있었다.
+이 풀은 연결 수를 size 로 묶고, 남는 연결이 없으면 timeout 까지 기다린 뒤 PoolTimeout 을 던진다.
+
+- 연결은 필요할 때 만들고 반납(close)하면 유휴 목록으로 돌아간다
+- 유휴 상태로 ping_after 초가 지난 연결은 빌려주기 전에 ping 으로 점검, 끊겼으면 버리고 새로 만든다
+- 만든 지 max_lifetime 초가 지난 연결은 반납/대여 시점에 닫는다 (서버 wait_timeout, 장애 조치 대비)
+- 반납 시 열린 트랜잭션이 있으면 롤백만 하고 세션 초기화(reset_session) 왕복은 하지 않는다
+- stats(): 사용 중/유휴/대기 수, 누적 대여·대기 시간·타임아웃, 최근 1분 초당 대여 수
+
+풀은 프로세스(uvicorn 워커)마다 하나이므로 DB 연결 총량은 워커 수 × DB_POOL_SIZE 이다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+RATE_WINDOW_SECONDS = 60.0
+
+
+class PoolTimeout(RuntimeError):
+    """timeout 안에 빌릴 수 있는 연결이 없음."""
+
+
+class PooledConnection:
+    """풀에서 빌린 연결. close() 는 연결을 닫지 않고 풀에 반납한다. 나머지는 원래 연결에 위임."""
+
+    def __init__(self, pool: "ConnectionPool", conn: Any, created_at: float):
+        self._pool = pool
+        self._conn = conn
+        self._created_at = created_at
+
+    def __getattr__(self, name: str) -> Any:
+        conn = self.__dict__.get("_conn")
+        if conn is None:
+            raise RuntimeError("이미 풀에 반납된 연결입니다.")
+        return getattr(conn, name)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool._release(conn, self._created_at)
+
+
+class ConnectionPool:
+    """크기가 정해진 연결 풀. connect() 로 연결을 만든다."""
+
+    def __init__(self, connect: Callable[[], Any], size: int, timeout: float = 10.0,
+                 max_lifetime: float = 1800.0, ping_after: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._connect = connect
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self._clock = clock
+        self._cond = threading.Condition()
+        # (연결, 만든 시각, 마지막 반납 시각)
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        self._open = 0
+        self._waiters = 0
+        self._recent: Deque[float] = deque()
+        self._closed = False
+        self._stats = {
+            "checkouts": 0, "waits": 0, "timeouts": 0, "created": 0, "discarded": 0,
+            "wait_seconds_total": 0.0, "wait_seconds_max": 0.0,
+        }
+
+    # ── 대여/반납 ─────────────────────────────────────────────────────────
+
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """연결 대여. 모두 사용 중이면 반납될 때까지 기다리고, timeout 초가 지나면 PoolTimeout."""
+        timeout = self.timeout if timeout is None else timeout
+        started = self._clock()
+        deadline = started + timeout
+        waited = False
+        while True:
+            with self._cond:
+                while not self._idle and self._open >= self.size:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"DB 연결 풀 대기 시간 초과 ({timeout:.1f}초, 크기 {self.size}, 대기 {self._waiters})"
+                        )
+                    waited = True
+                    self._waiters += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiters -= 1
+                if self._idle:
+                    conn, created_at, last_used = self._idle.pop()
+                else:
+                    conn, created_at, last_used = None, None, None
+                    self._open += 1
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    self._forget()
+                    raise
+                created_at = self._clock()
+                with self._cond:
+                    self._stats["created"] += 1
+            elif not self._usable(conn, created_at, last_used):
+                self._discard(conn)
+                continue
+
+            self._record_checkout(started, waited)
+            return PooledConnection(self, conn, created_at)
+
+    def _usable(self, conn: Any, created_at: float, last_used: float) -> bool:
+        now = self._clock()
+        if self.max_lifetime > 0 and now - created_at >= self.max_lifetime:
+            return False
+        if now - last_used < self.ping_after:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _release(self, conn: Any, created_at: float) -> None:
+        try:
+            if getattr(conn, "in_transaction", False):
+                conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        now = self._clock()
+        if self._closed or (self.max_lifetime > 0 and now - created_at >= self.max_lifetime):
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, created_at, now))
+            self._cond.notify()
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._stats["discarded"] += 1
+        self._forget()
+
+    def _forget(self) -> None:
+        """열린 연결 수에서 하나 빼고, 기다리는 쪽이 새로 만들 수 있게 깨운다."""
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    def _record_checkout(self, started: float, waited: bool) -> None:
+        now = self._clock()
+        wait = now - started
+        with self._cond:
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+            self._stats["wait_seconds_total"] += wait
+            self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], wait)
+            self._recent.append(now)
+            self._trim_recent(now)
+
+    def _trim_recent(self, now: float) -> None:
+        while self._recent and self._recent[0] < now - RATE_WINDOW_SECONDS:
+            self._recent.popleft()
+
+    # ── 관리 ─────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 사용 중/유휴/대기 수와 누적 대여 통계."""
+        with self._cond:
+            self._trim_recent(self._clock())
+            stats = dict(self._stats)
+            stats.update(
+                size=self.size,
+                open=self._open,
+                in_use=self._open - len(self._idle),
+                idle=len(self._idle),
+                waiters=self._waiters,
+                checkouts_per_second=round(len(self._recent) / RATE_WINDOW_SECONDS, 3),
+            )
+        checkouts = stats["checkouts"]
+        stats["wait_seconds_avg"] = round(stats["wait_seconds_total"] / checkouts, 6) if checkouts else 0.0
+        stats["wait_seconds_total"] = round(stats["wait_seconds_total"], 6)
+        stats["wait_seconds_max"] = round(stats["wait_seconds_max"], 6)
+        return stats
+
+    def close(self) -> int:
+        """풀 종료. 유휴 연결을 닫고 닫은 수를 반환. 사용 중인 연결은 반납될 때 닫는다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for conn, _, _ in idle:
+            self._discard(conn)
+        return len(idle)
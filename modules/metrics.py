@@ -0,0 +1,334 @@
+"""프로세스 내 지표 수집 (Prometheus 텍스트 형식)
+
+prometheus_client 를 쓰지 않고 필요한 만큼만 직접 구현한다.
+- Counter: 누적 값 (inc)
+- Histogram: 구간별 관측 수 + 합계 (observe, time)
+- 수집기(add_collector): 풀 크기처럼 내보낼 때 읽는 값. (이름, 타입, 설명, [(레이블, 값)]) 목록을 반환
+
+지표는 워커 프로세스마다 따로 쌓인다. METRICS_DIR 가 있으면 각 워커가 METRICS_DUMP_INTERVAL 초마다
+스냅샷을 <METRICS_DIR>/<pid>.json 으로 쓰고, render() 는 살아 있는 다른 워커 스냅샷과 합쳐 내보낸다.
+없으면 요청을 받은 워커 값만 내보낸다.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_DUMP_INTERVAL = float(os.getenv("METRICS_DUMP_INTERVAL", "5"))
+
+# 초 단위 (DB 쿼리 ~ AI 호출까지 한 구간 집합으로)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Labels:
+        if len(labels) != len(self.labelnames) or any(n not in labels for n in self.labelnames):
+            raise ValueError(f"{self.name} 레이블은 {self.labelnames} 이어야 합니다: {sorted(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+
+class Counter(_Metric):
+    """누적 카운터."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def snapshot(self) -> List[list]:
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    """구간(bucket)별 관측 수와 합계. 구간 경계는 초 단위 상한."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → [구간별 관측 수(누적 아님), 합계, 개수]
+        self._values: Dict[Labels, list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[Dict[str, Any]]:
+        """블록 실행 시간을 관측. 레이블에 outcome 이 있으면 예외 여부로 ok/error 를 채운다.
+
+        yield 한 dict 를 고쳐 레이블을 블록 안에서 바꿀 수 있다.
+        """
+        labels = dict(labels)
+        started = time.perf_counter()
+        try:
+            yield labels
+        except BaseException:
+            if "outcome" in self.labelnames:
+                labels["outcome"] = "error"
+            raise
+        else:
+            if "outcome" in self.labelnames:
+                labels.setdefault("outcome", "ok")
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry[2] if entry else 0
+
+    def snapshot(self) -> List[list]:
+        with self._lock:
+            return [[list(key), list(counts), total, count] for key, (counts, total, count) in self._values.items()]
+
+
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+
+
+class Registry:
+    """지표 모음. 같은 이름으로 다시 만들면 기존 지표를 돌려준다 (모듈 재로드 대비)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._dump_thread: Optional[threading.Thread] = None
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} 은 이미 {metric.type} 지표입니다.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def add_collector(self, collector: Collector) -> None:
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    # ── 스냅샷/출력 ──────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, dict]:
+        """JSON 으로 쓸 수 있는 현재 값. {이름: {type, help, labelnames, buckets?, samples}}"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        result: Dict[str, dict] = {}
+        for metric in metrics:
+            entry = {"type": metric.type, "help": metric.documentation,
+                     "labelnames": list(metric.labelnames), "samples": metric.snapshot()}
+            if isinstance(metric, Histogram):
+                entry["buckets"] = list(metric.buckets)
+            result[metric.name] = entry
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.warning("지표 수집기 실패: %s", e)
+                continue
+            for name, kind, documentation, samples in families:
+                labelnames = sorted({k for labels, _ in samples for k in labels})
+                result[name] = {
+                    "type": kind, "help": documentation, "labelnames": labelnames,
+                    "samples": [[[str(labels.get(n, "")) for n in labelnames], value] for labels, value in samples],
+                }
+        return result
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (METRICS_DIR 가 있으면 다른 워커 스냅샷과 합산)."""
+        snapshot = self.snapshot()
+        if METRICS_DIR:
+            self.dump(snapshot)
+            snapshot = merge_snapshots([snapshot, *_read_other_snapshots(METRICS_DIR)])
+        return render_snapshot(snapshot)
+
+    # ── 워커 간 공유 ─────────────────────────────────────────────────────
+
+    def dump(self, snapshot: Optional[Dict[str, dict]] = None) -> None:
+        """이 워커 스냅샷을 METRICS_DIR/<pid>.json 에 원자적으로 기록."""
+        if not METRICS_DIR:
+            return
+        try:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            path = os.path.join(METRICS_DIR, f"{os.getpid()}.json")
+            tmp = f"{path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot() if snapshot is None else snapshot, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("지표 스냅샷 기록 실패: %s", e)
+
+    def start_dumping(self) -> None:
+        """METRICS_DIR 가 있으면 주기적 스냅샷 기록 스레드 시작 (한 번만)."""
+        if not METRICS_DIR or self._dump_thread is not None:
+            return
+
+        def loop():
+            while True:
+                time.sleep(METRICS_DUMP_INTERVAL)
+                self.dump()
+
+        self._dump_thread = threading.Thread(target=loop, name="metrics-dump", daemon=True)
+        self._dump_thread.start()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_other_snapshots(directory: str) -> List[Dict[str, dict]]:
+    """다른 살아 있는 워커의 스냅샷. 종료된 워커 파일은 지운다."""
+    snapshots = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return snapshots
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext != ".json" or not stem.isdigit() or int(stem) == os.getpid():
+            continue
+        path = os.path.join(directory, name)
+        if not _pid_alive(int(stem)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def merge_snapshots(snapshots: List[Dict[str, dict]]) -> Dict[str, dict]:
+    """같은 지표·레이블끼리 더한다 (카운터/게이지는 값, 히스토그램은 구간·합계·개수)."""
+    merged: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        for name, family in snapshot.items():
+            target = merged.get(name)
+            if target is None:
+                merged[name] = target = {**family, "samples": []}
+                target["_index"] = {}
+            if family.get("labelnames") != target.get("labelnames") or family.get("buckets") != target.get("buckets"):
+                continue
+            index = target["_index"]
+            for sample in family["samples"]:
+                key = tuple(sample[0])
+                existing = index.get(key)
+                if existing is None:
+                    copied = [list(sample[0])] + [list(v) if isinstance(v, list) else v for v in sample[1:]]
+                    index[key] = copied
+                    target["samples"].append(copied)
+                elif family["type"] == "histogram":
+                    existing[1] = [a + b for a, b in zip(existing[1], sample[1])]
+                    existing[2] += sample[2]
+                    existing[3] += sample[3]
+                else:
+                    existing[1] += sample[1]
+    for family in merged.values():
+        family.pop("_index", None)
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
+    return str(value)
+
+
+def render_snapshot(snapshot: Dict[str, dict]) -> str:
+    lines: List[str] = []
+    for name in sorted(snapshot):
+        family = snapshot[name]
+        names = family.get("labelnames", [])
+        lines.append(f"# HELP {name} {_escape(family.get('help', ''))}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for sample in family["samples"]:
+            values = sample[0]
+            if family["type"] == "histogram":
+                counts, total, count = sample[1], sample[2], sample[3]
+                cumulative = 0
+                for bound, n in zip([*family["buckets"], math.inf], counts):
+                    cumulative += n
+                    le = "+Inf" if math.isinf(bound) else _number(float(bound))
+                    lines.append(f"{name}_bucket{_labels_text(names, values, ('le', le))} {cumulative}")
+                lines.append(f"{name}_sum{_labels_text(names, values)} {_number(float(total))}")
+                lines.append(f"{name}_count{_labels_text(names, values)} {count}")
+            else:
+                lines.append(f"{name}{_labels_text(names, values)} {_number(sample[1])}")
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
@@ -0,0 +1,230 @@
+"""PDF 파싱 결과 디스크 캐시 (내용 주소 기반)
+
+동일한 PDF를 다시 올리거나 일부 페이지만 고쳐 다시 올릴 때
+CareRecordParser 결과를 재사용하기 위한 캐시.
+
+- 문서 키: PDF 바이트 SHA-256 + 파서 버전 → 전체 레코드
+- 그룹 키: 수급자 페이지 그룹 내용 SHA-256 + 파서 버전 → 그룹 파싱 결과
+  (일부 페이지만 바뀐 재업로드는 바뀐 그룹만 다시 파싱)
+- SQLite 단일 파일에 저장하므로 여러 프로세스(uvicorn 워커, Streamlit)가 공유
+- 바이트 합계 상한을 넘으면 마지막 접근 시각 기준 LRU 제거
+- 수급자 PII가 포함되므로 payload는 압축 후 Fernet(ENCRYPTION_KEY)으로 암호화
+
+사용법:
+    from modules.parse_cache import get_parse_cache
+
+    parser = CareRecordParser(pdf_file, cache=get_parse_cache())
+    records = parser.parse()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from modules.utils.sqlite_utils import init_sqlite, local_store_path, sqlite_connect
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_PATH = local_store_path(
+    "parse_cache.sqlite3", env_dir="PARSE_CACHE_DIR", default_subdir="arisa_parse_cache"
+)
+PARSE_CACHE_MAX_BYTES = int(os.environ.get("PARSE_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+KIND_DOCUMENT = "doc"
+KIND_GROUP = "group"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    cache_key   TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_parse_cache_accessed ON parse_cache (accessed_at);
+"""
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """SQLite 기반 파싱 결과 캐시 (크기 제한 LRU)."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = PARSE_CACHE_MAX_BYTES):
+        self.path = Path(path) if path else PARSE_CACHE_PATH
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._fernet = None
+        init_sqlite(self.path, _SCHEMA)
+
+    # ── 내부 헬퍼 ─────────────────────────────────────────────────────────
+
+    def _connect(self):
+        return sqlite_connect(self.path)
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            from backend.encryption import EncryptionService
+
+            self._fernet = EncryptionService()
+        return self._fernet
+
+    def _encode(self, value: Any) -> bytes:
+        raw = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+        return self._get_fernet().encrypt_bytes(zlib.compress(raw, 6))
+
+    def _decode(self, payload: bytes) -> Any:
+        raw = zlib.decompress(self._get_fernet().decrypt_bytes(payload))
+        return json.loads(raw.decode("utf-8"))
+
+    @staticmethod
+    def make_key(kind: str, content_hash: str, version: str) -> str:
+        return f"{kind}:{version}:{content_hash}"
+
+    # ── 조회/저장 ─────────────────────────────────────────────────────────
+
+    def get(self, kind: str, content_hash: str, version: str) -> Optional[Any]:
+        """캐시 조회. 없거나 복호화 실패(키 교체 등) 시 None."""
+        key = self.make_key(kind, content_hash, version)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM parse_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                value = self._decode(row[0])
+            except Exception:
+                conn.execute("DELETE FROM parse_cache WHERE cache_key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE parse_cache SET accessed_at = ?, hits = hits + 1 WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            return value
+
+    def put(self, kind: str, content_hash: str, version: str, value: Any) -> None:
+        key = self.make_key(kind, content_hash, version)
+        payload = self._encode(value)
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO parse_cache
+                    (cache_key, kind, version, payload, size_bytes, created_at, accessed_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, kind, version, payload, len(payload), now, now),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn) -> int:
+        """총 크기가 max_bytes 이하가 될 때까지 오래 접근하지 않은 항목부터 삭제."""
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM parse_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        rows = conn.execute(
+            "SELECT cache_key, size_bytes FROM parse_cache ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM parse_cache WHERE cache_key = ?", (key,))
+            total -= size
+            removed += 1
+        return removed
+
+    # ── 관리 (CLI) ────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT kind, COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(hits), 0)
+                FROM parse_cache GROUP BY kind
+                """
+            ).fetchall()
+        by_kind = {
+            kind: {"entries": count, "size_bytes": size, "hits": hits}
+            for kind, count, size, hits in rows
+        }
+        return {
+            "path": str(self.path),
+            "max_bytes": self.max_bytes,
+            "entries": sum(v["entries"] for v in by_kind.values()),
+            "size_bytes": sum(v["size_bytes"] for v in by_kind.values()),
+            "by_kind": by_kind,
+        }
+
+    def list_entries(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT cache_key, kind, version, size_bytes, created_at, accessed_at, hits
+                FROM parse_cache ORDER BY accessed_at DESC LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        keys = ("cache_key", "kind", "version", "size_bytes", "created_at", "accessed_at", "hits")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def purge(
+        self,
+        *,
+        older_than_seconds: Optional[float] = None,
+        version: Optional[str] = None,
+        exclude_version: Optional[str] = None,
+    ) -> int:
+        """조건에 맞는 항목 삭제 후 삭제 건수 반환. 조건이 없으면 전체 삭제."""
+        clauses, params = [], []
+        if older_than_seconds is not None:
+            clauses.append("accessed_at < ?")
+            params.append(time.time() - older_than_seconds)
+        if version is not None:
+            clauses.append("version = ?")
+            params.append(version)
+        if exclude_version is not None:
+            clauses.append("version != ?")
+            params.append(exclude_version)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock, self._connect() as conn:
+            cur = conn.execute(f"DELETE FROM parse_cache{where}", params)
+            removed = cur.rowcount
+        if not clauses:
+            with self._connect() as conn:
+                conn.execute("VACUUM")
+        return removed
+
+
+_parse_cache: Optional[ParseCache] = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """프로세스 공용 파싱 캐시. PARSE_CACHE_MAX_MB=0 이면 비활성(None)."""
+    global _parse_cache
+    if PARSE_CACHE_MAX_BYTES <= 0:
+        return None
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            try:
+                _parse_cache = ParseCache()
+            except Exception as e:
+                # 캐시 디렉토리 생성 실패 등은 파싱 자체를 막지 않음
+                logger.warning("파싱 캐시 초기화 실패 (캐시 없이 진행): %s", e)
+                return None
+        return _parse_cache
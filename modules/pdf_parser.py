@@ -2,6 +2,107 @@ import pdfplumber
 import re
 import os
 import gc
+import io
+import hashlib
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# 파싱 규칙이 바뀌면 올려서 기존 파싱 캐시를 무효화
+PARSER_VERSION = "2026.10.1"
+
+# 병렬 파싱 기본 워커 수 (1이면 단일 프로세스). 환경변수로 조정
+PDF_PARSE_WORKERS = int(os.environ.get("PDF_PARSE_WORKERS", "1") or 1)
+
+# 경로 입력 PDF 해시 계산 시 읽기 블록 크기
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# 단계별 소요 시간 (split: 그룹 분리, group: 그룹 파싱(단일 프로세스만), merge: 별지 병합, document: parse() 전체)
+PARSE_STAGE_SECONDS = REGISTRY.histogram(
+    "arisa_parser_stage_duration_seconds", "PDF 파싱 단계별 소요 시간", ["stage"],
+)
+
+# 워커 프로세스별로 한 번만 연 PDF 문서 (병렬 파싱용)
+_worker_pdf = None
+
+
+class PageAnalysisCache:
+    """문서 단위 페이지 분석 결과 캐시
+
+    - 페이지별 텍스트, 단어, search() 결과, find_tables() 결과를 한 번만 계산
+    - 추출 중 발생한 예외도 저장해 두었다가 동일하게 다시 발생시킴
+      (호출부의 기존 예외 처리 규칙을 그대로 유지하기 위함)
+    - 그룹 처리가 끝난 페이지는 evict()로 즉시 해제
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def _entry(self, page):
+        key = id(page)
+        entry = self._entries.get(key)
+        if entry is None:
+            # 페이지 참조를 함께 보관해 id 재사용을 방지
+            entry = {"page": page}
+            self._entries[key] = entry
+        return entry
+
+    def _memo(self, page, key, compute):
+        entry = self._entry(page)
+        if key not in entry:
+            try:
+                entry[key] = (compute(), None)
+            except Exception as e:
+                entry[key] = (None, e)
+        value, error = entry[key]
+        if error is not None:
+            raise error
+        return value
+
+    def text(self, page):
+        return self._memo(page, "text", lambda: page.extract_text() or "")
+
+    def words(self, page):
+        return self._memo(page, "words", lambda: page.extract_words() or [])
+
+    def search(self, page, pattern):
+        return self._memo(page, ("search", pattern), lambda: page.search(pattern) or [])
+
+    def find_tables(self, page, table_settings=None):
+        settings_key = tuple(sorted((table_settings or {}).items()))
+        return self._memo(
+            page,
+            ("find_tables", settings_key),
+            lambda: page.find_tables(table_settings=table_settings) or [],
+        )
+
+    def extract_tables(self, page):
+        return self._memo(page, "extract_tables", lambda: page.extract_tables() or [])
+
+    def geometry(self, page):
+        """테이블 탐지에 쓰이는 선/사각형 좌표 (그룹 내용 해시용)"""
+        def _compute():
+            boxes = sorted(
+                (round(obj["x0"], 1), round(obj["top"], 1), round(obj["x1"], 1), round(obj["bottom"], 1))
+                for obj in list(page.rects) + list(page.lines)
+            )
+            return (round(page.width, 1), round(page.height, 1), tuple(boxes))
+        return self._memo(page, "geometry", _compute)
+
+    def evict(self, pages):
+        for page in pages:
+            self._entries.pop(id(page), None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
 
 class CareRecordParser:
     STATUS_DONE = "완료"
@@ -11,9 +112,17 @@ class CareRecordParser:
     ABSENCE_TOTAL_STATUSES = {"미이용", "결석"}
     CHECKED_SYMBOLS = ("■", "Π", "V", "O", "☑")
     BATH_NOT_AVAILABLE = "없음"
+    MAIN_TABLE_SETTINGS = {
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "lines",
+        "snap_tolerance": 4,
+    }
 
-    def __init__(self, pdf_file):
+    def __init__(self, pdf_file, workers=None, cache=None):
         self.pdf_file = pdf_file
+        self.cache = cache  # modules.parse_cache.ParseCache (None이면 캐시 미사용)
+        # 1 이하이면 단일 프로세스 파싱
+        self.workers = max(1, int(PDF_PARSE_WORKERS if workers is None else workers))
         self.parsed_data = []
         self.appendix_notes = {}
         self._debug = True  # 강제로 디버그 활성화
@@ -21,7 +130,8 @@ class CareRecordParser:
         self._basic_info = {}
         self._personal_info = {}
         self._year = None  # 현재 그룹에서 추출한 연도
-    
+        self._page_cache = PageAnalysisCache()  # 문서 단위 페이지 분석 캐시
+
     def _should_debug(self):
         """강순례 고객에 대해서만 디버그 출력"""
         if not self._debug:
@@ -92,81 +202,265 @@ class CareRecordParser:
         """PDF 파싱
         - 그룹별 즉시 GC 호출 (5그룹마다)
         - 페이지 처리 후 즉시 참조 해제
+        - 페이지 텍스트/테이블은 문서 단위 캐시로 한 번만 추출
+        - workers > 1 이면 페이지 그룹을 프로세스 풀에서 병렬 파싱 (결과 순서 동일)
         """
         final_records = []
         customer_appendix_notes = {}
-        
-        with pdfplumber.open(self.pdf_file) as pdf:
-            pages = pdf.pages
-            page_groups = self._split_page_groups(pages)
-            total_groups = len(page_groups)
+        self._page_cache = PageAnalysisCache()
+        worker_source = self._worker_source() if self.workers > 1 else None
 
-            for group_idx, group_pages in enumerate(page_groups):
-                if not group_pages:
-                    continue
+        document_hash = self._document_hash()
+        if document_hash is not None:
+            cached = self._cache_get("doc", document_hash)
+            if cached is not None:
+                self.parsed_data = cached
+                return self.parsed_data
 
-                # 그룹 단위로 상태 초기화
-                self.parsed_data = []
-                self.appendix_notes = {}
-
-                self._personal_info = self._parse_personal_info(group_pages)
-                self._basic_info = self._parse_basic_info_block(group_pages)
-                self._year = self._extract_year(group_pages)
+        started = time.perf_counter()
+        with pdfplumber.open(self.pdf_file) as pdf:
+            pages = pdf.pages
+            with PARSE_STAGE_SECONDS.time(stage="split"):
+                page_groups = [g for g in self._split_page_groups(pages) if g]
 
-                for page in group_pages:
-                    self._parse_page(page)
+            group_results = self._iter_group_results(pages, page_groups, worker_source)
 
+            for customer_name, records, appendix_notes in group_results:
                 # Store appendix notes at customer level
-                customer_name = self._personal_info.get('customer_name', '')
-                if customer_name:
-                    if customer_name not in customer_appendix_notes:
-                        customer_appendix_notes[customer_name] = {}
-                    
-                    # Merge this group's appendix notes
-                    for date, notes in self.appendix_notes.items():
-                        if date not in customer_appendix_notes[customer_name]:
-                            customer_appendix_notes[customer_name][date] = {}
-                        customer_appendix_notes[customer_name][date].update(notes)
-
-                self._merge_appendix_to_main()
-                final_records.extend(self.parsed_data)
-                
-                # 그룹 처리 후 메모리 해제 (5그룹마다 또는 마지막)
-                self.parsed_data = []
-                self.appendix_notes = {}
-                if (group_idx + 1) % 5 == 0 or group_idx == total_groups - 1:
-                    gc.collect()
+                self._collect_appendix_notes(customer_appendix_notes, customer_name, appendix_notes)
+                final_records.extend(records)
             
             # Final pass: merge all customer appendix notes
-            self._merge_all_customer_appendices(final_records, customer_appendix_notes)
+            with PARSE_STAGE_SECONDS.time(stage="merge"):
+                self._merge_all_customer_appendices(final_records, customer_appendix_notes)
             
             # 최종 메모리 정리
             del customer_appendix_notes
+            self._page_cache.clear()
             gc.collect()
 
+        if document_hash is not None:
+            self._cache_put("doc", document_hash, final_records)
+
+        PARSE_STAGE_SECONDS.observe(time.perf_counter() - started, stage="document")
         self.parsed_data = final_records
         return self.parsed_data
 
+    def iter_parse(self):
+        """수급자 단위로 완성된 레코드 목록을 순차적으로 반환하는 제너레이터
+
+        - 같은 수급자의 연속된 그룹은 모아서 별지 병합까지 끝낸 뒤 반환
+        - 다른 수급자 그룹이 시작되면 이전 수급자 레코드를 즉시 내보냄
+          (전체 파일 파싱을 기다리지 않으며, 메모리는 수급자 단위로만 유지)
+        - 한 수급자의 그룹이 연속으로 배치된 일반적인 PDF에서는 parse()와 결과가 동일
+        """
+        self._page_cache = PageAnalysisCache()
+        worker_source = self._worker_source() if self.workers > 1 else None
+
+        with pdfplumber.open(self.pdf_file) as pdf:
+            pages = pdf.pages
+            with PARSE_STAGE_SECONDS.time(stage="split"):
+                page_groups = [g for g in self._split_page_groups(pages) if g]
+            group_results = self._iter_group_results(pages, page_groups, worker_source)
+
+            pending_name = None
+            pending_records = []
+            pending_notes = {}
+            try:
+                for customer_name, records, appendix_notes in group_results:
+                    if pending_records and customer_name != pending_name:
+                        yield self._finalize_customer_records(pending_records, pending_notes)
+                        pending_records, pending_notes = [], {}
+
+                    pending_name = customer_name
+                    pending_records.extend(records)
+                    self._collect_appendix_notes(pending_notes, customer_name, appendix_notes)
+
+                if pending_records:
+                    yield self._finalize_customer_records(pending_records, pending_notes)
+            finally:
+                group_results.close()
+                self._page_cache.clear()
+                gc.collect()
+
+    def _finalize_customer_records(self, records, customer_appendix_notes):
+        with PARSE_STAGE_SECONDS.time(stage="merge"):
+            self._merge_all_customer_appendices(records, customer_appendix_notes)
+        return records
+
+    def _collect_appendix_notes(self, customer_appendix_notes, customer_name, appendix_notes):
+        """그룹 별지를 {수급자명: {날짜: {카테고리: 내용}}} 구조로 누적"""
+        if not customer_name:
+            return
+        if customer_name not in customer_appendix_notes:
+            customer_appendix_notes[customer_name] = {}
+
+        # Merge this group's appendix notes
+        for date, notes in appendix_notes.items():
+            if date not in customer_appendix_notes[customer_name]:
+                customer_appendix_notes[customer_name][date] = {}
+            customer_appendix_notes[customer_name][date].update(notes)
+
+    def _iter_group_results(self, pages, page_groups, worker_source):
+        if self.cache is not None:
+            return self._iter_group_results_cached(pages, page_groups, worker_source)
+        return self._parse_groups(pages, page_groups, worker_source)
+
+    def _parse_groups(self, pages, page_groups, worker_source):
+        if worker_source is not None and len(page_groups) > 1:
+            return self._parse_groups_parallel(pages, page_groups, worker_source)
+        return self._parse_groups_serial(page_groups)
+
+    def _iter_group_results_cached(self, pages, page_groups, worker_source):
+        """그룹 내용 해시로 캐시를 조회하고, 바뀐 그룹만 다시 파싱"""
+        group_hashes = [self._group_hash(group) for group in page_groups]
+        cached = {}
+        for idx, group_hash in enumerate(group_hashes):
+            hit = self._cache_get("group", group_hash)
+            if hit is not None:
+                customer_name, records, appendix_notes = hit
+                cached[idx] = (customer_name, records, appendix_notes)
+                self._page_cache.evict(page_groups[idx])
+
+        missing = [group for idx, group in enumerate(page_groups) if idx not in cached]
+        fresh = self._parse_groups(pages, missing, worker_source) if missing else iter(())
+        try:
+            for idx, group_hash in enumerate(group_hashes):
+                result = cached.pop(idx, None)
+                if result is None:
+                    result = next(fresh)
+                    self._cache_put("group", group_hash, list(result))
+                yield result
+        finally:
+            if hasattr(fresh, "close"):
+                fresh.close()
+
+    def _document_hash(self):
+        if self.cache is None:
+            return None
+        try:
+            if isinstance(self.pdf_file, (str, os.PathLike)):
+                # 경로 입력은 블록 단위로 해시 (대용량 업로드를 메모리에 올리지 않음)
+                digest = hashlib.sha256()
+                with open(self.pdf_file, "rb") as f:
+                    for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                        digest.update(block)
+                return digest.hexdigest()
+            if hasattr(self.pdf_file, "getbuffer"):
+                return hashlib.sha256(self.pdf_file.getbuffer()).hexdigest()
+            return hashlib.sha256(self._worker_source()).hexdigest()
+        except Exception as e:
+            logger.warning("PDF 해시 계산 실패 (캐시 미사용): %s", e)
+            return None
+
+    def _group_hash(self, group_pages):
+        digest = hashlib.sha256()
+        for page in group_pages:
+            try:
+                digest.update(self._page_text(page).encode("utf-8"))
+                digest.update(repr(self._page_cache.geometry(page)).encode("utf-8"))
+            except Exception:
+                digest.update(b"\0")
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def _cache_get(self, kind, content_hash):
+        try:
+            return self.cache.get(kind, content_hash, PARSER_VERSION)
+        except Exception as e:
+            logger.warning("파싱 캐시 조회 실패: %s", e)
+            return None
+
+    def _cache_put(self, kind, content_hash, value):
+        try:
+            self.cache.put(kind, content_hash, PARSER_VERSION, value)
+        except Exception as e:
+            logger.warning("파싱 캐시 저장 실패: %s", e)
+
+    def _parse_group(self, group_pages):
+        """한 수급자 페이지 그룹을 파싱하여 (수급자명, 레코드, 별지) 반환"""
+        # 그룹 단위로 상태 초기화
+        self.parsed_data = []
+        self.appendix_notes = {}
+
+        self._personal_info = self._parse_personal_info(group_pages)
+        self._basic_info = self._parse_basic_info_block(group_pages)
+        self._year = self._extract_year(group_pages)
+
+        for page in group_pages:
+            self._parse_page(page)
+
+        self._merge_appendix_to_main()
+        result = (
+            self._personal_info.get('customer_name', ''),
+            self.parsed_data,
+            self.appendix_notes,
+        )
+
+        self._page_cache.evict(group_pages)
+        self.parsed_data = []
+        self.appendix_notes = {}
+        return result
+
+    def _parse_groups_serial(self, page_groups):
+        total_groups = len(page_groups)
+        for group_idx, group_pages in enumerate(page_groups):
+            with PARSE_STAGE_SECONDS.time(stage="group"):
+                result = self._parse_group(group_pages)
+            yield result
+
+            # 그룹 처리 후 메모리 해제 (5그룹마다 또는 마지막)
+            if (group_idx + 1) % 5 == 0 or group_idx == total_groups - 1:
+                gc.collect()
+
+    def _parse_groups_parallel(self, pages, page_groups, worker_source):
+        """페이지 그룹을 프로세스 풀에 분배하고 원래 순서대로 결과 반환
+
+        pdfplumber 페이지 객체는 프로세스 간 전달이 불가능하므로
+        각 워커가 PDF를 직접 열고 페이지 인덱스로 그룹을 재구성한다.
+        """
+        page_index = {id(page): idx for idx, page in enumerate(pages)}
+        group_indices = [[page_index[id(page)] for page in group] for group in page_groups]
+
+        # 그룹 분리에 사용한 텍스트는 워커가 다시 추출하므로 즉시 해제
+        self._page_cache.clear()
+
+        max_workers = min(self.workers, len(group_indices))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_parse_worker,
+            initargs=(worker_source,),
+        ) as executor:
+            yield from executor.map(_parse_group_in_worker, group_indices)
+
+    def _worker_source(self):
+        """워커 프로세스에서 PDF를 다시 열 수 있는 형태(경로 또는 bytes)로 변환"""
+        if isinstance(self.pdf_file, (str, os.PathLike)):
+            return self.pdf_file
+        if hasattr(self.pdf_file, "getvalue"):
+            return self.pdf_file.getvalue()
+        position = self.pdf_file.tell()
+        self.pdf_file.seek(0)
+        data = self.pdf_file.read()
+        self.pdf_file.seek(position)
+        return data
+
     def _split_page_groups(self, pages):
         """한 PDF 안에 여러 수급자 기록지가 연속으로 존재하는 경우 그룹을 분리
         
-        메모리 최적화: 페이지 텍스트 추출 후 즉시 해제
+        추출한 페이지 텍스트는 문서 단위 캐시에 남겨 이후 단계에서 재사용
         """
         if not pages:
             return []
 
         groups = []
         current_group = []
-        # 페이지 인덱스 기반 그룹화 (페이지 객체 직접 저장)
-        page_texts_cache = {}  # 페이지 텍스트 캐싱
 
-        for page_idx, page in enumerate(pages):
+        for page in pages:
             try:
-                text = page.extract_text() or ""
-                page_texts_cache[page_idx] = text  # 캐시 저장
+                text = self._page_text(page)
             except Exception:
                 text = ""
-                page_texts_cache[page_idx] = ""
 
             normalized = text.replace(" ", "")
             is_header = (
@@ -206,13 +500,13 @@ class CareRecordParser:
 
         if current_group:
             groups.append(current_group)
-        
-        # 텍스트 캐시 정리
-        del page_texts_cache
 
         # 헤더를 찾지 못한 경우 전체 페이지를 하나의 그룹으로 반환
         return groups or [list(pages)]
 
+    def _page_text(self, page):
+        return self._page_cache.text(page)
+
     def _parse_page(self, page):
         # 1. 페이지 내의 섹션 헤더 위치 찾기 (별지 구분용)
         section_headers = []
@@ -226,7 +520,7 @@ class CareRecordParser:
 
         for key, labels in keywords:
             for label in labels:
-                matches = page.search(label)
+                matches = self._page_cache.search(page, label)
                 if matches:
                     # 가장 마지막에 발견된 해당 키워드의 위치를 사용
                     for match in matches:
@@ -236,11 +530,7 @@ class CareRecordParser:
         section_headers.sort(key=lambda x: x["top"])
 
         # 2. 페이지 내 모든 테이블 찾기
-        tables = page.find_tables(table_settings={
-            "vertical_strategy": "lines",
-            "horizontal_strategy": "lines",
-            "snap_tolerance": 4,
-        })
+        tables = self._page_cache.find_tables(page, self.MAIN_TABLE_SETTINGS)
 
         if not tables:
             return
@@ -702,7 +992,7 @@ class CareRecordParser:
         if not pages:
             return {}
         try:
-            raw_text = pages[0].extract_text() or ""
+            raw_text = self._page_text(pages[0])
         except Exception:
             return {}
 
@@ -735,7 +1025,7 @@ class CareRecordParser:
 
         for page in pages:
             try:
-                text = page.extract_text() or ""
+                text = self._page_text(page)
             except Exception:
                 text = ""
 
@@ -853,7 +1143,7 @@ class CareRecordParser:
         """
         for page in pages:
             try:
-                text = page.extract_text() or ""
+                text = self._page_text(page)
             except Exception:
                 continue
 
@@ -870,7 +1160,7 @@ class CareRecordParser:
         # 테이블 셀에서도 탐색
         for page in pages:
             try:
-                tables = page.extract_tables()
+                tables = self._page_cache.extract_tables(page)
             except Exception:
                 continue
             for table in (tables or []):
@@ -900,3 +1190,25 @@ class CareRecordParser:
         if any(c in clean for c in ["■", "Π", "V", "O", "☑"]):
             return "완료"
         return "미실시"
+
+
+def _init_parse_worker(source):
+    """프로세스 풀 워커 초기화: PDF를 한 번만 열어 재사용"""
+    global _worker_pdf
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    _worker_pdf = pdfplumber.open(source)
+
+
+def _parse_group_in_worker(page_indices):
+    """워커 프로세스에서 페이지 인덱스 목록으로 한 그룹을 파싱"""
+    parser = CareRecordParser(None)
+    pages = [_worker_pdf.pages[i] for i in page_indices]
+    result = parser._parse_group(pages)
+    # 다음 그룹을 위해 페이지 내부 캐시 해제
+    for page in pages:
+        flush = getattr(page, "flush_cache", None)
+        if callable(flush):
+            flush()
+    gc.collect()
+    return result
@@ -1,5 +1,8 @@
-from typing import Dict, Optional
+from functools import partial
+from typing import Dict, List, Optional
 from .base import BaseRepository
+from .dashboard_rollup import refresh_ai_grade_for_records
+from backend.encryption import get_encryption_service
 
 
 class AiEvaluationRepository(BaseRepository):
@@ -42,7 +45,7 @@ class AiEvaluationRepository(BaseRepository):
                 oer_fidelity, specificity_score, grammar_score,
                 grade_code, reason_text, suggestion_text, original_text,
                 record_id, korean_category
-            ))
+            ), after=partial(refresh_ai_grade_for_records, record_ids=[record_id]))
         else:
             # 새 평가 삽입
             insert_query = '''
@@ -58,7 +61,7 @@ class AiEvaluationRepository(BaseRepository):
             self._execute_transaction(insert_query, (
                 record_id, korean_category, oer_fidelity, specificity_score, grammar_score,
                 grade_code, reason_text, suggestion_text, original_text
-            ))
+            ), after=partial(refresh_ai_grade_for_records, record_ids=[record_id]))
     
     def get_evaluation(self, record_id: int, category: str) -> Optional[Dict]:
         """Get AI evaluation for a specific record and category."""
@@ -118,8 +121,44 @@ class AiEvaluationRepository(BaseRepository):
         korean_category = category_map.get(category, category)
         
         query = "DELETE FROM ai_evaluations WHERE record_id = %s AND category = %s"
-        return self._execute_transaction(query, (record_id, korean_category))
+        return self._execute_transaction(
+            query, (record_id, korean_category),
+            after=partial(refresh_ai_grade_for_records, record_ids=[record_id]),
+        )
     
+    def get_records_for_evaluation(self, start_date, end_date,
+                                   customer_ids: Optional[List[int]] = None,
+                                   only_unevaluated: bool = True) -> List[Dict]:
+        """기간 내 신체/인지 특이사항이 있는 기록 (특이사항 AI 평가 입력, 날짜순).
+
+        only_unevaluated 이면 신체·인지 평가가 모두 저장된 기록은 제외한다.
+        """
+        query = """
+            SELECT di.*, c.name AS customer_name,
+                   dp.note AS physical_note, dc.note AS cognitive_note,
+                   dn.note AS nursing_note, dr.note AS functional_note
+            FROM daily_infos di
+            LEFT JOIN customers c ON di.customer_id = c.customer_id
+            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
+            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
+            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
+            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
+            WHERE di.date BETWEEN %s AND %s
+              AND (TRIM(COALESCE(dp.note, '')) <> '' OR TRIM(COALESCE(dc.note, '')) <> '')
+        """
+        params: list = [start_date, end_date]
+        if customer_ids:
+            query += f" AND di.customer_id IN ({', '.join(['%s'] * len(customer_ids))})"
+            params.extend(customer_ids)
+        if only_unevaluated:
+            query += """
+              AND (SELECT COUNT(DISTINCT ae.category) FROM ai_evaluations ae
+                   WHERE ae.record_id = di.record_id AND ae.category IN ('신체', '인지')) < 2
+            """
+        query += " ORDER BY di.date, di.record_id"
+        rows = self._execute_query(query, tuple(params))
+        return get_encryption_service().decrypt_columns(rows, ("customer_name",))
+
     def get_evaluation_stats(self, customer_id: int, start_date=None, end_date=None) -> Dict:
         """Get evaluation statistics for a customer within date range."""
         query = """
@@ -1,5 +1,5 @@
-from typing import Dict, List, Optional, Any
-from modules.db_connection import db_query, db_transaction
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+from modules.db_connection import ITER_QUERY_BATCH_SIZE, db_query, db_transaction, iter_query
 
 
 class BaseRepository:
@@ -20,17 +20,33 @@ class BaseRepository:
             cursor.execute(query, params or ())
             return cursor.fetchone()
     
-    def _execute_transaction(self, query: str, params: tuple = None) -> int:
-        """Execute a write query in a transaction and return affected rows."""
+    def _iter_query(self, query: str, params: tuple = None, batch_size: int = ITER_QUERY_BATCH_SIZE,
+                    row_type: Optional[Type] = None) -> Iterator[List[Any]]:
+        """Stream a read-only query in batches of rows (see db_connection.iter_query)."""
+        return iter_query(query, params, batch_size=batch_size, row_type=row_type)
+
+    def _execute_transaction(self, query: str, params: tuple = None,
+                             after: Optional[Callable[[Any], None]] = None) -> int:
+        """Execute a write query in a transaction and return affected rows.
+
+        after: 같은 트랜잭션에서 이어서 실행할 작업 (cursor 를 받음, 파생 테이블 갱신 등)
+        """
         with db_transaction() as cursor:
             cursor.execute(query, params or ())
-            return cursor.rowcount
+            rowcount = cursor.rowcount
+            if after is not None:
+                after(cursor)
+            return rowcount
     
-    def _execute_transaction_lastrowid(self, query: str, params: tuple = None) -> int:
+    def _execute_transaction_lastrowid(self, query: str, params: tuple = None,
+                                       after: Optional[Callable[[Any], None]] = None) -> int:
         """Execute an insert query in a transaction and return last row ID."""
         with db_transaction() as cursor:
             cursor.execute(query, params or ())
-            return cursor.lastrowid
+            lastrowid = cursor.lastrowid
+            if after is not None:
+                after(cursor)
+            return lastrowid
     
     def _execute_transaction_many(self, query: str, params_list: List[tuple]) -> int:
         """Execute multiple write queries in a transaction."""
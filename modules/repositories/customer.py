@@ -1,37 +1,64 @@
 from typing import List, Optional, Dict
 from .base import BaseRepository
-from backend.encryption import EncryptionService
+from .pii_index import (
+    ENTITY_CUSTOMER,
+    delete_search_tokens,
+    entity_tokens,
+    keyword_condition,
+    replace_search_tokens,
+)
+from backend.encryption import EncryptionService, blind_index, get_encryption_service
+from modules.db_connection import db_transaction
+
+CUSTOMER_PII_COLUMNS = ("name", "birth_date", "recognition_no", "facility_name", "facility_code")
+CUSTOMER_COLUMNS = (
+    "customer_id, name, birth_date, gender, recognition_no, benefit_start_date, grade"
+)
 
 
 def _get_enc() -> EncryptionService:
-    return EncryptionService()
+    return get_encryption_service()
 
 
 def _decrypt_customer(row: Optional[Dict]) -> Optional[Dict]:
     """DB 행의 PII 컬럼을 복호화하여 반환."""
     if row is None:
         return None
-    enc = _get_enc()
-    result = dict(row)
-    for col in ("name", "birth_date", "recognition_no", "facility_name", "facility_code"):
-        if result.get(col) is not None:
-            result[col] = enc.safe_decrypt(str(result[col]))
-    return result
+    return _get_enc().decrypt_columns([row], CUSTOMER_PII_COLUMNS)[0]
+
+
+def _decrypt_customers(rows: List[Dict]) -> List[Dict]:
+    """여러 행의 PII 컬럼을 일괄 복호화."""
+    return _get_enc().decrypt_columns(rows, CUSTOMER_PII_COLUMNS)
+
+
+def customer_index_values(name: Optional[str], recognition_no: Optional[str]) -> Dict:
+    """평문 name/recognition_no → 블라인드 인덱스 컬럼값과 검색 토큰."""
+    return {
+        "name_bidx": blind_index(name, "customer.name"),
+        "recognition_no_bidx": blind_index(recognition_no, "customer.recognition_no"),
+        "tokens": entity_tokens(ENTITY_CUSTOMER, {"name": name, "recognition_no": recognition_no}),
+    }
 
 
 class CustomerRepository(BaseRepository):
     """Repository for customer-related database operations."""
 
     def list_customers(self, keyword: str = None) -> List[Dict]:
-        """List all customers — 암호화 필드는 Python에서 필터링."""
-        query = """
-            SELECT customer_id, name, birth_date, gender, recognition_no,
-                   benefit_start_date, grade
-            FROM customers
-            ORDER BY customer_id DESC
-        """
-        rows = self._execute_query(query)
-        decrypted = [_decrypt_customer(r) for r in rows]
+        """List customers — 키워드는 검색 토큰으로 후보만 조회 후 복호화 값으로 재확인."""
+        query = f"SELECT {CUSTOMER_COLUMNS} FROM customers"
+        params = []
+        if keyword:
+            # 이름은 검색 토큰으로, 인정번호는 블라인드 인덱스 동등 조회로 후보 조회 → 아래에서 재확인
+            clause, params = keyword_condition(
+                ENTITY_CUSTOMER, "customer_id", keyword,
+                extra_sql="recognition_no_bidx = %s",
+                extra_params=[blind_index(keyword, "customer.recognition_no")],
+            )
+            query += f" WHERE {clause}"
+        query += " ORDER BY customer_id DESC"
+        rows = self._execute_query(query, tuple(params))
+        decrypted = _decrypt_customers(rows)
 
         if keyword:
             kw = keyword.lower()
@@ -44,98 +71,109 @@ class CustomerRepository(BaseRepository):
 
     def get_customer(self, customer_id: int) -> Optional[Dict]:
         """Get a single customer by ID."""
-        query = """
-            SELECT customer_id, name, birth_date, gender, recognition_no,
-                   benefit_start_date, grade
-            FROM customers
-            WHERE customer_id = %s
-        """
+        query = f"SELECT {CUSTOMER_COLUMNS} FROM customers WHERE customer_id = %s"
         return _decrypt_customer(self._execute_query_one(query, (customer_id,)))
 
     def create_customer(self, name: str, birth_date, gender: str = None,
                         recognition_no: str = None, benefit_start_date=None,
                         grade: str = None) -> int:
-        """Create a new customer and return the ID."""
+        """Create a new customer and return the ID (블라인드 인덱스/검색 토큰 포함)."""
         enc = _get_enc()
+        index = customer_index_values(str(name), recognition_no)
         query = """
             INSERT INTO customers (name, birth_date, gender, recognition_no,
-                                   benefit_start_date, grade)
-            VALUES (%s, %s, %s, %s, %s, %s)
+                                   benefit_start_date, grade,
+                                   name_bidx, recognition_no_bidx)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
         """
-        return self._execute_transaction_lastrowid(
-            query,
-            (
-                enc.encrypt(str(name)),
-                enc.encrypt_optional(str(birth_date) if birth_date else None),
-                gender,
-                enc.encrypt_optional(recognition_no),
-                benefit_start_date,
-                grade,
-            ),
-        )
+        with db_transaction() as cursor:
+            cursor.execute(
+                query,
+                (
+                    enc.encrypt(str(name)),
+                    enc.encrypt_optional(str(birth_date) if birth_date else None),
+                    gender,
+                    enc.encrypt_optional(recognition_no),
+                    benefit_start_date,
+                    grade,
+                    index["name_bidx"],
+                    index["recognition_no_bidx"],
+                ),
+            )
+            customer_id = cursor.lastrowid
+            replace_search_tokens(cursor, ENTITY_CUSTOMER, customer_id, index["tokens"])
+        return customer_id
 
     def update_customer(self, customer_id: int, name: str, birth_date,
                         gender: str = None, recognition_no: str = None,
                         benefit_start_date=None, grade: str = None) -> int:
         """Update a customer and return the number of affected rows."""
         enc = _get_enc()
+        index = customer_index_values(str(name), recognition_no)
         query = """
             UPDATE customers
             SET name=%s, birth_date=%s, gender=%s, recognition_no=%s,
-                benefit_start_date=%s, grade=%s
+                benefit_start_date=%s, grade=%s,
+                name_bidx=%s, recognition_no_bidx=%s
             WHERE customer_id=%s
         """
-        return self._execute_transaction(
-            query,
-            (
-                enc.encrypt(str(name)),
-                enc.encrypt_optional(str(birth_date) if birth_date else None),
-                gender,
-                enc.encrypt_optional(recognition_no),
-                benefit_start_date,
-                grade,
-                customer_id,
-            ),
-        )
+        with db_transaction() as cursor:
+            cursor.execute(
+                query,
+                (
+                    enc.encrypt(str(name)),
+                    enc.encrypt_optional(str(birth_date) if birth_date else None),
+                    gender,
+                    enc.encrypt_optional(recognition_no),
+                    benefit_start_date,
+                    grade,
+                    index["name_bidx"],
+                    index["recognition_no_bidx"],
+                    customer_id,
+                ),
+            )
+            affected = cursor.rowcount
+            if affected:
+                replace_search_tokens(cursor, ENTITY_CUSTOMER, customer_id, index["tokens"])
+        return affected
 
     def delete_customer(self, customer_id: int) -> int:
         """Delete a customer and return the number of affected rows."""
-        query = "DELETE FROM customers WHERE customer_id=%s"
-        return self._execute_transaction(query, (customer_id,))
-
-    def find_by_name(self, name: str) -> Optional[Dict]:
-        """Find a customer by name — 전체 조회 후 Python 필터링."""
+        with db_transaction() as cursor:
+            cursor.execute("DELETE FROM customers WHERE customer_id=%s", (customer_id,))
+            affected = cursor.rowcount
+            delete_search_tokens(cursor, ENTITY_CUSTOMER, customer_id)
+        return affected
+
+    def _find_candidates(self, column: str, value: str, field: str) -> List[Dict]:
+        """블라인드 인덱스 일치 행 + 백필 전 행만 조회해 복호화."""
         rows = self._execute_query(
-            "SELECT customer_id, name, birth_date, gender, recognition_no, "
-            "benefit_start_date, grade FROM customers ORDER BY customer_id DESC"
+            f"SELECT {CUSTOMER_COLUMNS} FROM customers "
+            f"WHERE {column} = %s OR name_bidx IS NULL ORDER BY customer_id DESC",
+            (blind_index(value, field),),
         )
-        for row in rows:
-            decrypted = _decrypt_customer(row)
+        return _decrypt_customers(rows)
+
+    def find_by_name(self, name: str) -> Optional[Dict]:
+        """Find a customer by name — name_bidx 동등 조회 후 복호화 값으로 확인."""
+        for decrypted in self._find_candidates("name_bidx", name, "customer.name"):
             if decrypted and decrypted.get("name") == name:
                 return decrypted
         return None
 
     def find_by_recognition_no(self, recognition_no: str) -> Optional[Dict]:
-        """Find a customer by recognition number — Python 필터링."""
-        rows = self._execute_query(
-            "SELECT customer_id, name, birth_date, gender, recognition_no, "
-            "benefit_start_date, grade FROM customers ORDER BY customer_id DESC"
-        )
-        for row in rows:
-            decrypted = _decrypt_customer(row)
+        """Find a customer by recognition number — recognition_no_bidx 동등 조회."""
+        for decrypted in self._find_candidates(
+            "recognition_no_bidx", recognition_no, "customer.recognition_no"
+        ):
             if decrypted and decrypted.get("recognition_no") == recognition_no:
                 return decrypted
         return None
 
     def find_by_name_and_birth(self, name: str, birth_date) -> Optional[Dict]:
-        """Find a customer by name and birth date — Python 필터링."""
+        """Find a customer by name and birth date — name_bidx 조회 후 생년월일 확인."""
         birth_str = str(birth_date) if birth_date else None
-        rows = self._execute_query(
-            "SELECT customer_id, name, birth_date, gender, recognition_no, "
-            "benefit_start_date, grade FROM customers ORDER BY customer_id DESC"
-        )
-        for row in rows:
-            decrypted = _decrypt_customer(row)
+        for decrypted in self._find_candidates("name_bidx", name, "customer.name"):
             if (
                 decrypted
                 and decrypted.get("name") == name
@@ -1,18 +1,244 @@
-from typing import List, Dict, Optional, Iterator, Generator
+from functools import partial
+from typing import Callable, List, Dict, Optional, Iterator, Generator
 import gc
-from modules.db_connection import db_transaction, db_query
+import logging
+from modules.db_connection import ITER_QUERY_BATCH_SIZE, db_transaction, db_query
 from .base import BaseRepository
-from backend.encryption import EncryptionService
+from .customer import customer_index_values
+from .dashboard_rollup import refresh_ai_grade_days
+from .pii_index import ENTITY_CUSTOMER, bulk_replace_search_tokens
+from .weekly_analysis_cache import bump_record_versions, bump_versions_for_records
+from backend.encryption import get_encryption_service
+
+logger = logging.getLogger(__name__)
+
+# 대량 저장 시 한 문장에 담을 최대 행 수 / max_allowed_packet 중 사용할 비율
+BULK_MAX_ROWS = 1000
+BULK_PACKET_FILL = 0.5
+_DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024  # 조회 실패 시 (MySQL 5.7 기본값)
+_max_allowed_packet: Optional[int] = None
+
+# daily_infos 갱신 컬럼 (customer_id, date는 UNIQUE 키)
+_DAILY_INFO_COLUMNS = (
+    "start_time", "end_time", "total_service_time", "transport_service", "transport_vehicles",
+)
+
+# 수급자 기록 조회 (기본 정보 + 4개 하위 테이블)
+_CUSTOMER_RECORD_SELECT = """
+    SELECT
+        di.record_id, di.customer_id, di.date,
+        di.start_time, di.end_time, di.total_service_time,
+        di.transport_service, di.transport_vehicles,
+        dp.hygiene_care, dp.bath_time, dp.bath_method,
+        dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
+        dp.toilet_care, dp.mobility_care,
+        dp.note AS physical_note, dp.writer_name AS writer_phy,
+        dc.cog_support, dc.comm_support,
+        dc.note AS cognitive_note, dc.writer_name AS writer_cog,
+        dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
+        dn.note AS nursing_note, dn.writer_name AS writer_nur,
+        dr.prog_basic, dr.prog_activity, dr.prog_cognitive,
+        dr.prog_therapy, dr.prog_enhance_detail,
+        dr.note AS functional_note, dr.writer_name AS writer_func
+    FROM daily_infos di
+    LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
+    LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
+    LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
+    LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
+"""
+
+# 기간 내 전체 기록 조회 (수급자 정보 + 4개 하위 테이블, 수급자 PII 는 암호문)
+_DATE_RANGE_RECORD_SELECT = """
+    SELECT
+        c.customer_id, c.name as customer_name, c.birth_date as customer_birth_date,
+        c.grade as customer_grade, c.recognition_no as customer_recognition_no,
+        di.record_id, di.date, di.start_time, di.end_time,
+        di.total_service_time, di.transport_service, di.transport_vehicles,
+        dp.hygiene_care, dp.bath_time, dp.bath_method,
+        dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
+        dp.toilet_care, dp.mobility_care, dp.note as physical_note, dp.writer_name as writer_phy,
+        dc.cog_support, dc.comm_support, dc.note as cognitive_note, dc.writer_name as writer_cog,
+        dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
+        dn.note as nursing_note, dn.writer_name as writer_nur,
+        dr.prog_basic, dr.prog_activity, dr.prog_cognitive, dr.prog_therapy,
+        dr.prog_enhance_detail, dr.note as functional_note, dr.writer_name as writer_func
+    FROM daily_infos di
+    INNER JOIN customers c ON di.customer_id = c.customer_id
+    LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
+    LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
+    LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
+    LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
+    WHERE di.date BETWEEN %s AND %s
+"""
+
+# 하위 테이블: (테이블명, ((DB 컬럼, 파싱 레코드 키), ...))
+_CHILD_TABLES = (
+    ("daily_physicals", (
+        ("hygiene_care", "hygiene_care"), ("bath_time", "bath_time"),
+        ("bath_method", "bath_method"), ("meal_breakfast", "meal_breakfast"),
+        ("meal_lunch", "meal_lunch"), ("meal_dinner", "meal_dinner"),
+        ("toilet_care", "toilet_care"), ("mobility_care", "mobility_care"),
+        ("note", "physical_note"), ("writer_name", "writer_phy"),
+    )),
+    ("daily_cognitives", (
+        ("cog_support", "cog_support"), ("comm_support", "comm_support"),
+        ("note", "cognitive_note"), ("writer_name", "writer_cog"),
+    )),
+    ("daily_nursings", (
+        ("bp_temp", "bp_temp"), ("health_manage", "health_manage"),
+        ("nursing_manage", "nursing_manage"), ("emergency", "emergency"),
+        ("note", "nursing_note"), ("writer_name", "writer_nur"),
+    )),
+    ("daily_recoveries", (
+        ("prog_basic", "prog_basic"), ("prog_activity", "prog_activity"),
+        ("prog_cognitive", "prog_cognitive"), ("prog_therapy", "prog_therapy"),
+        ("prog_enhance_detail", "prog_enhance_detail"),
+        ("note", "functional_note"), ("writer_name", "writer_func"),
+    )),
+)
+
+
+# 기존 레코드 조회: 이 건수 이상이면 임시 테이블 조인, 미만이면 수급자 묶음별 범위 조회
+EXISTING_LOOKUP_TEMP_TABLE_MIN = 20000
+_RANGE_LOOKUP_CUSTOMERS = 200
+_TEMP_LOOKUP_INSERT_ROWS = 1000
+_TEMP_LOOKUP_TABLE = "tmp_record_lookup"
+
+
+def _record_row_values(row) -> tuple:
+    """딕셔너리/튜플 커서 행에서 (record_id, customer_id, date) 추출."""
+    if isinstance(row, dict):
+        return row["record_id"], row["customer_id"], row["date"]
+    return row[0], row[1], row[2]
+
+
+def _lookup_record_ids_by_range(cursor, keys: List[tuple], table: str = "daily_infos") -> Dict[tuple, int]:
+    """(customer_id, date) 키 → record_id. 수급자 묶음마다 IN + 날짜 BETWEEN 범위 조회 1회.
+
+    (customer_id, date) UNIQUE 인덱스를 범위 스캔으로 사용하고,
+    범위 안의 요청하지 않은 날짜는 Python에서 걸러냄.
+    """
+    wanted = set(keys)
+    dates_by_customer: Dict[int, List[str]] = {}
+    for customer_id, record_date in wanted:
+        dates_by_customer.setdefault(customer_id, []).append(record_date)
+
+    # 날짜 범위가 비슷한 수급자끼리 묶어 과다 조회 최소화
+    customers = sorted(dates_by_customer, key=lambda cid: min(dates_by_customer[cid]))
+    found: Dict[tuple, int] = {}
+    for i in range(0, len(customers), _RANGE_LOOKUP_CUSTOMERS):
+        chunk = customers[i:i + _RANGE_LOOKUP_CUSTOMERS]
+        chunk_dates = [d for cid in chunk for d in dates_by_customer[cid]]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        cursor.execute(
+            f"SELECT record_id, customer_id, date FROM {table} "
+            f"WHERE customer_id IN ({placeholders}) AND date BETWEEN %s AND %s",
+            [*chunk, min(chunk_dates), max(chunk_dates)],
+        )
+        for row in cursor.fetchall():
+            record_id, customer_id, record_date = _record_row_values(row)
+            key = (customer_id, str(record_date))
+            if key in wanted:
+                found[key] = record_id
+    return found
+
+
+def _lookup_record_ids_by_temp_table(cursor, keys: List[tuple], table: str = "daily_infos") -> Dict[tuple, int]:
+    """(customer_id, date) 키 → record_id. 세션 임시 테이블에 키를 적재한 뒤 조인 1회."""
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE IF NOT EXISTS {_TEMP_LOOKUP_TABLE} ("
+        "customer_id INT NOT NULL, date DATE NOT NULL, "
+        "PRIMARY KEY (customer_id, date)) ENGINE=MEMORY"
+    )
+    try:
+        cursor.execute(f"DELETE FROM {_TEMP_LOOKUP_TABLE}")
+        unique_keys = list(dict.fromkeys(keys))
+        for i in range(0, len(unique_keys), _TEMP_LOOKUP_INSERT_ROWS):
+            chunk = unique_keys[i:i + _TEMP_LOOKUP_INSERT_ROWS]
+            cursor.execute(
+                f"INSERT IGNORE INTO {_TEMP_LOOKUP_TABLE} (customer_id, date) VALUES "
+                + ", ".join(["(%s, %s)"] * len(chunk)),
+                [value for key in chunk for value in key],
+            )
+        cursor.execute(
+            f"SELECT t.record_id, t.customer_id, t.date FROM {table} t "
+            f"JOIN {_TEMP_LOOKUP_TABLE} k ON k.customer_id = t.customer_id AND k.date = t.date"
+        )
+        return {
+            (customer_id, str(record_date)): record_id
+            for record_id, customer_id, record_date in map(_record_row_values, cursor.fetchall())
+        }
+    finally:
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {_TEMP_LOOKUP_TABLE}")
+
+
+def lookup_record_ids(
+    cursor, keys: List[tuple], strategy: Optional[str] = None, table: str = "daily_infos"
+) -> Dict[tuple, int]:
+    """(customer_id, 'YYYY-MM-DD') 키 목록의 record_id를 한 연결에서 조회.
+
+    Args:
+        strategy: "range" | "temp_table" | None (None이면 키 수로 자동 선택)
+    """
+    if not keys:
+        return {}
+    if strategy is None:
+        strategy = "temp_table" if len(keys) >= EXISTING_LOOKUP_TEMP_TABLE_MIN else "range"
+    if strategy == "temp_table":
+        try:
+            return _lookup_record_ids_by_temp_table(cursor, keys, table)
+        except Exception as e:
+            # 임시 테이블 권한이 없는 계정 등 → 범위 조회로 대체
+            logger.warning("임시 테이블 조회 실패, 범위 조회로 대체: %s", e)
+    return _lookup_record_ids_by_range(cursor, keys, table)
+
+
+def _get_max_allowed_packet() -> int:
+    """서버 max_allowed_packet (프로세스당 한 번 조회)."""
+    global _max_allowed_packet
+    if _max_allowed_packet is None:
+        try:
+            with db_query(dictionary=False) as cursor:
+                cursor.execute("SELECT @@max_allowed_packet")
+                row = cursor.fetchone()
+            _max_allowed_packet = int(row[0])
+        except Exception:
+            _max_allowed_packet = _DEFAULT_MAX_ALLOWED_PACKET
+    return _max_allowed_packet
+
+
+def _estimate_record_bytes(record: Dict) -> int:
+    """레코드 하나가 SQL 문장에서 차지하는 대략적인 바이트 수 (이스케이프/구분자 여유 포함)."""
+    size = 64
+    for value in record.values():
+        if value is not None:
+            size += len(str(value).encode("utf-8")) * 2 + 4
+    return size
+
+
+def _iter_packet_batches(records: List[Dict], max_bytes: int, max_rows: int = BULK_MAX_ROWS) -> Iterator[List[Dict]]:
+    """예상 문장 크기가 max_bytes, 행 수가 max_rows를 넘지 않도록 레코드를 나눔."""
+    batch: List[Dict] = []
+    batch_bytes = 0
+    for record in records:
+        size = _estimate_record_bytes(record)
+        if batch and (batch_bytes + size > max_bytes or len(batch) >= max_rows):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(record)
+        batch_bytes += size
+    if batch:
+        yield batch
 
 
 def _dec_customer_fields(row: Dict, name_key="name", birth_key="birth_date", recog_key="recognition_no") -> Dict:
     """customer JOIN 결과 행의 PII 필드를 복호화하여 반환 (복사본)."""
-    enc = EncryptionService()
-    result = dict(row)
-    for key in (name_key, birth_key, recog_key):
-        if result.get(key) is not None:
-            result[key] = enc.safe_decrypt(str(result[key]))
-    return result
+    return _dec_customer_rows([row], name_key, birth_key, recog_key)[0]
+
+
+def _dec_customer_rows(rows: List[Dict], name_key="name", birth_key="birth_date", recog_key="recognition_no") -> List[Dict]:
+    """_dec_customer_fields 의 일괄 버전 (decrypt_many 한 번)."""
+    return get_encryption_service().decrypt_columns(rows, (name_key, birth_key, recog_key))
 
 
 class DailyInfoRepository(BaseRepository):
@@ -42,8 +268,15 @@ class DailyInfoRepository(BaseRepository):
         ]
         
         with db_transaction() as cursor:
+            cursor.execute("SELECT date, customer_id FROM daily_infos WHERE record_id=%s", (record_id,))
+            row = cursor.fetchone()
             for query in queries:
                 cursor.execute(query, (record_id,))
+            if row:
+                # 연쇄 삭제된 AI 평가를 대시보드 집계에서도 제외
+                refresh_ai_grade_days(cursor, [row[0]])
+                # 이 날짜를 포함한 주간 분석 캐시 무효화
+                bump_record_versions(cursor, [(row[1], row[0])])
     
     def insert_daily_info(self, customer_id: int, record: Dict) -> int:
         """Insert daily info record and return the record ID."""
@@ -60,7 +293,8 @@ class DailyInfoRepository(BaseRepository):
                 record.get("total_service_time"), 
                 record.get("transport_service"),
                 record.get("transport_vehicles")
-            )
+            ),
+            after=partial(bump_record_versions, keys=[(customer_id, record["date"])]),
         )
     
     def replace_daily_physicals(self, record_id: int, record: Dict) -> None:
@@ -89,6 +323,7 @@ class DailyInfoRepository(BaseRepository):
                 record.get("physical_note"),
                 record.get("writer_phy")
             ))
+            bump_versions_for_records(cursor, [record_id])
     
     def replace_daily_cognitives(self, record_id: int, record: Dict) -> None:
         """Replace daily cognitives record for a record_id."""
@@ -108,6 +343,7 @@ class DailyInfoRepository(BaseRepository):
                 record.get("cognitive_note"),
                 record.get("writer_cog")
             ))
+            bump_versions_for_records(cursor, [record_id])
     
     def replace_daily_nursings(self, record_id: int, record: Dict) -> None:
         """Replace daily nursings record for a record_id."""
@@ -130,6 +366,7 @@ class DailyInfoRepository(BaseRepository):
                 record.get("nursing_note"),
                 record.get("writer_nur")
             ))
+            bump_versions_for_records(cursor, [record_id])
     
     def replace_daily_recoveries(self, record_id: int, record: Dict) -> None:
         """Replace daily recoveries record for a record_id."""
@@ -153,19 +390,28 @@ class DailyInfoRepository(BaseRepository):
                 record.get("functional_note"),
                 record.get("writer_func")
             ))
+            bump_versions_for_records(cursor, [record_id])
     
-    def save_parsed_data(self, records: List[Dict], batch_size: int = None) -> int:
+    def save_parsed_data(
+        self,
+        records: List[Dict],
+        batch_size: int = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
         """Save parsed daily data in batched transactions to avoid packet size limits.
         
         성능 최적화:
         - 고객명 일괄 조회로 N+1 쿼리 방지
         - 기존 레코드 일괄 조회
-        - 청크 단위 메모리 해제
+        - 배치당 daily_infos 다중 행 upsert 1회 + 하위 테이블별 DELETE/INSERT 1회씩
+        - 배치 크기는 max_allowed_packet에 맞춰 자동 결정
         
         Args:
             records: List of parsed records to save
             batch_size: Number of records to process per transaction 
-                       (None이면 기본값 20 사용)
+                       (None이면 max_allowed_packet 기준으로 자동 분할)
+            progress: 배치 커밋마다 (처리 건수, 전체 건수)로 호출되는 콜백.
+                      콜백이 예외를 던지면 중단 (이미 커밋된 배치는 유지)
         
         Returns:
             Total number of records saved
@@ -174,11 +420,14 @@ class DailyInfoRepository(BaseRepository):
             return 0
             
         saved_count = 0
+        processed = 0
         total_records = len(records)
         
         if batch_size is None:
-            from modules.utils.memory_utils import BATCH_SIZE_MEDIUM
-            batch_size = BATCH_SIZE_MEDIUM
+            max_bytes = int(_get_max_allowed_packet() * BULK_PACKET_FILL)
+            batches = _iter_packet_batches(records, max_bytes)
+        else:
+            batches = (records[i:i + batch_size] for i in range(0, total_records, batch_size))
         
         # 1단계: 모든 고객명 수집 및 일괄 조회/생성
         customer_names = list(set(r.get("customer_name") for r in records if r.get("customer_name")))
@@ -187,16 +436,14 @@ class DailyInfoRepository(BaseRepository):
         # 2단계: 기존 레코드 일괄 조회
         existing_records = self._bulk_find_existing_records(customer_map, records)
         
-        # 3단계: 배치 단위로 처리 (메모리 최적화)
-        for i in range(0, total_records, batch_size):
-            batch = records[i:i + batch_size]
+        # 3단계: 배치 단위로 처리
+        for batch in batches:
             saved_count += self._process_batch(
                 batch, customer_map, existing_records
             )
-            
-            # 배치별 메모리 해제
-            if i > 0 and i % (batch_size * 5) == 0:
-                gc.collect()
+            processed += len(batch)
+            if progress is not None:
+                progress(processed, total_records)
         
         # 최종 메모리 정리
         del customer_map, existing_records
@@ -210,165 +457,151 @@ class DailyInfoRepository(BaseRepository):
             return {}
             
         customer_map = {}
+        enc = get_encryption_service()
+        names = set(customer_names)
+        bidx_values = list(dict.fromkeys(customer_index_values(name, None)["name_bidx"] for name in names))
         
         with db_transaction() as cursor:
-            # 기존 고객 일괄 조회
-            placeholders = ', '.join(['%s'] * len(customer_names))
+            # 기존 고객 일괄 조회 - name_bidx 동등 조회 + 백필 전 행 전체 (암호문일 수 있어 복호화 후 비교)
+            placeholders = ', '.join(['%s'] * len(bidx_values))
             cursor.execute(
-                f"SELECT customer_id, name FROM customers WHERE name IN ({placeholders})",
-                customer_names
+                f"SELECT customer_id, name FROM customers "
+                f"WHERE name_bidx IN ({placeholders}) OR name_bidx IS NULL "
+                f"ORDER BY customer_id DESC",
+                bidx_values
             )
             for row in cursor.fetchall():
-                customer_map[row[1]] = row[0]
+                name = enc.safe_decrypt(str(row[1]))
+                if name in names:
+                    customer_map.setdefault(name, row[0])
             
-            # 신규 고객 생성
+            # 신규 고객 생성 (암호화 + 블라인드 인덱스, 검색 토큰은 마지막에 일괄 기록)
+            new_tokens = {}
             for record in records:
                 name = record.get("customer_name")
                 if not name or name in customer_map:
                     continue
-                    
+                
+                recognition_no = record.get("customer_recognition_no")
+                birth_date = record.get("customer_birth_date")
+                index = customer_index_values(name, recognition_no)
                 cursor.execute("""
-                    INSERT INTO customers (name, birth_date, grade, recognition_no)
-                    VALUES (%s, %s, %s, %s)
+                    INSERT INTO customers (name, birth_date, grade, recognition_no,
+                                           name_bidx, recognition_no_bidx)
+                    VALUES (%s, %s, %s, %s, %s, %s)
                 """, (
-                    name,
-                    record.get("customer_birth_date"),
+                    enc.encrypt(str(name)),
+                    enc.encrypt_optional(str(birth_date) if birth_date else None),
                     record.get("customer_grade"),
-                    record.get("customer_recognition_no")
+                    enc.encrypt_optional(recognition_no),
+                    index["name_bidx"],
+                    index["recognition_no_bidx"],
                 ))
                 customer_map[name] = cursor.lastrowid
+                new_tokens[cursor.lastrowid] = index["tokens"]
+            
+            bulk_replace_search_tokens(cursor, ENTITY_CUSTOMER, new_tokens)
         
         return customer_map
     
-    def _bulk_find_existing_records(self, customer_map: Dict[str, int], records: List[Dict]) -> Dict[tuple, int]:
-        """기존 레코드 일괄 조회"""
-        existing = {}
-        
+    def _bulk_find_existing_records(
+        self, customer_map: Dict[str, int], records: List[Dict], strategy: Optional[str] = None
+    ) -> Dict[tuple, int]:
+        """기존 레코드 일괄 조회 - 연결 하나에서 범위 조회 또는 임시 테이블 조인 (lookup_record_ids)"""
         if not customer_map:
-            return existing
-            
-        # (customer_id, date) 쌍 수집
-        lookup_pairs = []
-        for record in records:
-            name = record.get("customer_name")
-            if name in customer_map:
-                lookup_pairs.append((customer_map[name], record["date"]))
-        
-        if not lookup_pairs:
-            return existing
+            return {}
         
-        # 청크 단위로 조회 (SQL IN 절 제한 방지)
-        chunk_size = 100
-        for i in range(0, len(lookup_pairs), chunk_size):
-            chunk = lookup_pairs[i:i + chunk_size]
-            
-            with db_query() as cursor:
-                conditions = " OR ".join(
-                    ["(customer_id=%s AND date=%s)"] * len(chunk)
-                )
-                params = []
-                for cid, dt in chunk:
-                    params.extend([cid, dt])
-                
-                cursor.execute(
-                    f"SELECT record_id, customer_id, date FROM daily_infos WHERE {conditions}",
-                    params
-                )
-                for row in cursor.fetchall():
-                    existing[(row['customer_id'], str(row['date']))] = row['record_id']
+        # (customer_id, date) 쌍 수집
+        lookup_keys = list(dict.fromkeys(
+            (customer_map[record.get("customer_name")], str(record["date"]))
+            for record in records
+            if record.get("customer_name") in customer_map
+        ))
+        if not lookup_keys:
+            return {}
         
-        return existing
+        with db_query() as cursor:
+            return lookup_record_ids(cursor, lookup_keys, strategy=strategy)
     
     def _process_batch(self, batch: List[Dict], customer_map: Dict[str, int], 
                        existing_records: Dict[tuple, int]) -> int:
-        """배치 처리 - 단일 트랜잭션에서 벨크 삽입/업데이트"""
-        saved_count = 0
+        """배치 처리 - 단일 트랜잭션에서 집합 단위 upsert
+        
+        1. daily_infos: 다중 행 INSERT ... ON DUPLICATE KEY UPDATE (record_id 유지)
+        2. 신규 행 record_id 일괄 조회
+        3. 하위 테이블별 DELETE ... IN 1회 + 다중 행 INSERT 1회 (AI 평가는 유지됨)
+        """
+        # (customer_id, date)별 마지막 레코드만 사용 (같은 날짜 중복 시 나중 값 우선)
+        rows: Dict[tuple, Dict] = {}
+        for record in batch:
+            customer_id = customer_map.get(record.get("customer_name"))
+            if not customer_id:
+                continue
+            record["customer_id"] = customer_id
+            rows[(customer_id, str(record["date"]))] = record
+        
+        if not rows:
+            return 0
         
         with db_transaction() as cursor:
-            for record in batch:
-                name = record.get("customer_name")
-                customer_id = customer_map.get(name)
-                if not customer_id:
-                    continue
-                
-                record["customer_id"] = customer_id
-                date_str = str(record["date"])
-                
-                # 기존 레코드 확인
-                existing_id = existing_records.get((customer_id, date_str))
-                
-                if existing_id:
-                    # 기존 레코드 업데이트 (record_id 유지)
-                    cursor.execute("""
-                        UPDATE daily_infos SET
-                            start_time = %s, end_time = %s,
-                            total_service_time = %s, transport_service = %s, transport_vehicles = %s
-                        WHERE record_id = %s
-                    """, (
-                        record.get("start_time"), record.get("end_time"),
-                        record.get("total_service_time"),
-                        record.get("transport_service"),
-                        record.get("transport_vehicles"),
-                        existing_id
-                    ))
-                    record_id = existing_id
-                    
-                    # 하위 레코드들 삭제 후 재삽입 (AI 평가는 유지됨)
-                    cursor.execute("DELETE FROM daily_physicals WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_cognitives WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_nursings WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_recoveries WHERE record_id=%s", (record_id,))
-                else:
-                    # 새 레코드 삽입
-                    cursor.execute("""
-                        INSERT INTO daily_infos (
-                            customer_id, date, start_time, end_time,
-                            total_service_time, transport_service, transport_vehicles
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        customer_id, record["date"],
-                        record.get("start_time"), record.get("end_time"),
-                        record.get("total_service_time"),
-                        record.get("transport_service"),
-                        record.get("transport_vehicles")
-                    ))
-                    record_id = cursor.lastrowid
-                
-                # 하위 레코드들 삽입
-                self._insert_physicals_in_transaction(cursor, record_id, record)
-                self._insert_cognitives_in_transaction(cursor, record_id, record)
-                self._insert_nursings_in_transaction(cursor, record_id, record)
-                self._insert_recoveries_in_transaction(cursor, record_id, record)
-                
-                saved_count += 1
+            self._upsert_daily_infos(cursor, list(rows.values()))
+            # 재업로드된 날짜를 포함한 주간 분석 캐시 무효화
+            bump_record_versions(cursor, rows.keys())
+            
+            record_ids = {key: existing_records[key] for key in rows if key in existing_records}
+            new_keys = [key for key in rows if key not in record_ids]
+            if new_keys:
+                record_ids.update(_lookup_record_ids_by_range(cursor, new_keys))
+                existing_records.update(record_ids)
+            
+            # 하위 레코드 교체 대상 (신규 행은 하위 레코드가 없으므로 삭제 생략)
+            replace_ids = [record_ids[key] for key in rows if key in record_ids and key not in new_keys]
+            children = [(record_ids[key], record) for key, record in rows.items() if key in record_ids]
+            for table, columns in _CHILD_TABLES:
+                if replace_ids:
+                    placeholders = ", ".join(["%s"] * len(replace_ids))
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE record_id IN ({placeholders})", replace_ids
+                    )
+                if children:
+                    self._bulk_insert_children(cursor, table, columns, children)
         
-        return saved_count
+        return len(rows)
+    
+    @staticmethod
+    def _upsert_daily_infos(cursor, records: List[Dict]) -> None:
+        columns = ("customer_id", "date") + _DAILY_INFO_COLUMNS
+        row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        params = []
+        for record in records:
+            params.append(record["customer_id"])
+            params.append(record["date"])
+            params.extend(record.get(col) for col in _DAILY_INFO_COLUMNS)
+        updates = ", ".join(f"{col} = VALUES({col})" for col in _DAILY_INFO_COLUMNS)
+        cursor.execute(
+            f"INSERT INTO daily_infos ({', '.join(columns)}) "
+            f"VALUES {', '.join([row_placeholder] * len(records))} "
+            f"ON DUPLICATE KEY UPDATE {updates}",
+            params,
+        )
+    
+    @staticmethod
+    def _bulk_insert_children(cursor, table: str, columns: tuple, children: List[tuple]) -> None:
+        db_columns = ("record_id",) + tuple(col for col, _ in columns)
+        row_placeholder = "(" + ", ".join(["%s"] * len(db_columns)) + ")"
+        params = []
+        for record_id, record in children:
+            params.append(record_id)
+            params.extend(record.get(key) for _, key in columns)
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(db_columns)}) "
+            f"VALUES {', '.join([row_placeholder] * len(children))}",
+            params,
+        )
     
     def get_customer_records(self, customer_id: int, start_date=None, end_date=None) -> List[Dict]:
         """Get all daily records for a customer within date range."""
-        query = """
-            SELECT
-                di.record_id, di.customer_id, di.date,
-                di.start_time, di.end_time, di.total_service_time,
-                di.transport_service, di.transport_vehicles,
-                dp.hygiene_care, dp.bath_time, dp.bath_method,
-                dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
-                dp.toilet_care, dp.mobility_care,
-                dp.note AS physical_note, dp.writer_name AS writer_phy,
-                dc.cog_support, dc.comm_support,
-                dc.note AS cognitive_note, dc.writer_name AS writer_cog,
-                dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
-                dn.note AS nursing_note, dn.writer_name AS writer_nur,
-                dr.prog_basic, dr.prog_activity, dr.prog_cognitive,
-                dr.prog_therapy, dr.prog_enhance_detail,
-                dr.note AS functional_note, dr.writer_name AS writer_func
-            FROM daily_infos di
-            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-            WHERE di.customer_id = %s
-        """
+        query = _CUSTOMER_RECORD_SELECT + " WHERE di.customer_id = %s"
         params = [customer_id]
         
         if start_date and end_date:
@@ -378,6 +611,26 @@ class DailyInfoRepository(BaseRepository):
         query += " ORDER BY di.date DESC"
         
         return self._execute_query(query, tuple(params))
+
+    def get_records_for_customers(self, customer_ids: List[int], start_date, end_date) -> List[Dict]:
+        """여러 수급자의 기간 내 기록을 한 번에 조회 (수급자별 날짜 내림차순, get_customer_records 와 같은 컬럼)"""
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if not customer_ids:
+            return []
+        query = (
+            _CUSTOMER_RECORD_SELECT
+            + f" WHERE di.customer_id IN ({', '.join(['%s'] * len(customer_ids))})"
+            + " AND di.date BETWEEN %s AND %s ORDER BY di.customer_id, di.date DESC"
+        )
+        return self._execute_query(query, (*customer_ids, start_date, end_date))
+
+    def get_customer_ids_with_records(self, start_date, end_date) -> List[int]:
+        """기간 내 기록이 있는 수급자 ID (이름 복호화 없이)"""
+        rows = self._execute_query(
+            "SELECT DISTINCT customer_id FROM daily_infos WHERE date BETWEEN %s AND %s ORDER BY customer_id",
+            (start_date, end_date),
+        )
+        return [row["customer_id"] for row in rows]
     
     def get_record_by_customer_and_date(self, customer_id: int, date) -> Optional[Dict]:
         """Get a specific daily record for a customer and date."""
@@ -410,37 +663,27 @@ class DailyInfoRepository(BaseRepository):
         query += " ORDER BY c.name"
 
         rows = self._execute_query(query, tuple(params) if params else None)
-        return [_dec_customer_fields(r) for r in rows]
+        return _dec_customer_rows(rows)
     
     def get_all_records_by_date_range(self, start_date, end_date) -> List[Dict]:
         """날짜 범위 내 모든 레코드 조회 (대상자 정보 포함)"""
-        query = """
-            SELECT 
-                c.customer_id, c.name as customer_name, c.birth_date as customer_birth_date,
-                c.grade as customer_grade, c.recognition_no as customer_recognition_no,
-                di.record_id, di.date, di.start_time, di.end_time,
-                di.total_service_time, di.transport_service, di.transport_vehicles,
-                dp.hygiene_care, dp.bath_time, dp.bath_method,
-                dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
-                dp.toilet_care, dp.mobility_care, dp.note as physical_note, dp.writer_name as writer_phy,
-                dc.cog_support, dc.comm_support, dc.note as cognitive_note, dc.writer_name as writer_cog,
-                dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
-                dn.note as nursing_note, dn.writer_name as writer_nur,
-                dr.prog_basic, dr.prog_activity, dr.prog_cognitive, dr.prog_therapy,
-                dr.prog_enhance_detail, dr.note as functional_note, dr.writer_name as writer_func
-            FROM daily_infos di
-            INNER JOIN customers c ON di.customer_id = c.customer_id
-            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-            WHERE di.date BETWEEN %s AND %s
-            ORDER BY c.name, di.date DESC
-        """
+        query = _DATE_RANGE_RECORD_SELECT + " ORDER BY c.name, di.date DESC"
         rows = self._execute_query(query, (start_date, end_date))
-        return [_dec_customer_fields(r, name_key="customer_name",
+        return _dec_customer_rows(rows, name_key="customer_name",
+                                  birth_key="customer_birth_date",
+                                  recog_key="customer_recognition_no")
+
+    def iter_records_by_date_range(self, start_date, end_date,
+                                   batch_size: int = ITER_QUERY_BATCH_SIZE) -> Iterator[List[Dict]]:
+        """get_all_records_by_date_range 와 같은 컬럼을 batch_size 행씩 스트리밍 (날짜, record_id 순).
+
+        내보내기처럼 기간이 길어도 메모리가 배치 크기만큼만 쓰인다. 수급자 PII 는 배치마다 복호화.
+        """
+        query = _DATE_RANGE_RECORD_SELECT + " ORDER BY di.date, di.record_id"
+        for rows in self._iter_query(query, (start_date, end_date), batch_size=batch_size):
+            yield _dec_customer_rows(rows, name_key="customer_name",
                                      birth_key="customer_birth_date",
-                                     recog_key="customer_recognition_no") for r in rows]
+                                     recog_key="customer_recognition_no")
     
     # 트랜잭션 처리를 위한 비공개 헬퍼 메서드들
     def _get_or_create_customer_in_transaction(self, cursor, record: Dict) -> int:
@@ -475,14 +718,6 @@ class DailyInfoRepository(BaseRepository):
             ))
             return cursor.lastrowid
     
-    def _delete_daily_record_in_transaction(self, cursor, record_id: int) -> None:
-        """Delete daily record within an existing transaction."""
-        cursor.execute("DELETE FROM daily_physicals WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_cognitives WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_nursings WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_recoveries WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_infos WHERE record_id=%s", (record_id,))
-    
     def _insert_physicals_in_transaction(self, cursor, record_id: int, record: Dict) -> None:
         """Insert physicals record within an existing transaction."""
         cursor.execute("""
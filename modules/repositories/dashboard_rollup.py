@@ -0,0 +1,130 @@
+"""대시보드 KPI용 일별 집계(rollup) 테이블 유지/재구축.
+
+- rollup_ai_grade_daily : 기록일(daily_infos.date) × 카테고리 × 등급별 AI 평가 건수
+- rollup_emp_eval_daily : 평가일 × 대상 직원 × 카테고리 × 유형별 직원 평가(지적) 건수
+
+원본 행이 저장/삭제될 때 해당 날짜만 원본에서 다시 집계한다 (하루치 DELETE + INSERT ... SELECT).
+같은 트랜잭션(db_transaction 의 튜플 커서) 안에서 실행되므로 원본과 집계가 어긋나지 않는다.
+등급/카테고리 NULL 은 ''로 저장.
+DDL: scripts/dashboard_rollup.sql, 전체 재구축: python scripts/rebuild_dashboard_rollup.py
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from modules.db_connection import db_transaction
+
+AI_GRADE_TABLE = "rollup_ai_grade_daily"
+EMP_EVAL_TABLE = "rollup_emp_eval_daily"
+
+GRADE_SCORES = {"우수": 3, "평균": 2, "개선": 1}
+REBUILD_CHUNK_DAYS = 31
+
+
+def _date_list(dates: Iterable) -> List:
+    """None 제외, 순서 유지 중복 제거."""
+    return list(dict.fromkeys(d for d in dates if d is not None))
+
+
+def refresh_ai_grade_days(cursor, dates: Iterable) -> None:
+    """지정 날짜의 AI 평가 집계를 원본에서 다시 계산."""
+    dates = _date_list(dates)
+    if not dates:
+        return
+    placeholders = ", ".join(["%s"] * len(dates))
+    cursor.execute(f"DELETE FROM {AI_GRADE_TABLE} WHERE date IN ({placeholders})", dates)
+    cursor.execute(
+        f"""
+        INSERT INTO {AI_GRADE_TABLE} (date, category, grade_code, cnt)
+        SELECT di.date, COALESCE(ae.category, ''), COALESCE(ae.grade_code, ''), COUNT(*)
+        FROM ai_evaluations ae
+        JOIN daily_infos di ON ae.record_id = di.record_id
+        WHERE di.date IN ({placeholders})
+        GROUP BY di.date, ae.category, ae.grade_code
+        """,
+        dates,
+    )
+
+
+def refresh_ai_grade_for_records(cursor, record_ids: Iterable[int]) -> None:
+    """기록(record_id)들의 날짜를 찾아 AI 평가 집계 갱신."""
+    record_ids = list(dict.fromkeys(record_ids))
+    if not record_ids:
+        return
+    cursor.execute(
+        f"SELECT DISTINCT date FROM daily_infos WHERE record_id IN ({', '.join(['%s'] * len(record_ids))})",
+        record_ids,
+    )
+    refresh_ai_grade_days(cursor, [row[0] for row in cursor.fetchall()])
+
+
+def refresh_emp_eval_days(cursor, dates: Iterable) -> None:
+    """지정 날짜의 직원 평가 집계를 원본에서 다시 계산."""
+    dates = _date_list(dates)
+    if not dates:
+        return
+    placeholders = ", ".join(["%s"] * len(dates))
+    cursor.execute(f"DELETE FROM {EMP_EVAL_TABLE} WHERE date IN ({placeholders})", dates)
+    cursor.execute(
+        f"""
+        INSERT INTO {EMP_EVAL_TABLE} (date, target_user_id, category, evaluation_type, cnt)
+        SELECT evaluation_date, target_user_id, COALESCE(category, ''),
+               COALESCE(evaluation_type, ''), COUNT(*)
+        FROM employee_evaluations
+        WHERE evaluation_date IN ({placeholders})
+        GROUP BY evaluation_date, target_user_id, category, evaluation_type
+        """,
+        dates,
+    )
+
+
+def emp_eval_dates(cursor, emp_eval_id: int) -> List:
+    """평가 행의 현재 evaluation_date (수정/삭제 전 집계 대상 날짜 확보용)."""
+    cursor.execute(
+        "SELECT evaluation_date FROM employee_evaluations WHERE emp_eval_id = %s FOR UPDATE",
+        (emp_eval_id,),
+    )
+    row = cursor.fetchone()
+    return [row[0]] if row else []
+
+
+def _date_chunks(start: date, end: date, days: int):
+    while start <= end:
+        chunk_end = min(end, start + timedelta(days=days - 1))
+        yield start, chunk_end
+        start = chunk_end + timedelta(days=1)
+
+
+def rebuild_rollups(start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, int]:
+    """집계 테이블 재구축. 기간이 없으면 원본 전체 기간. 반환: 테이블별 처리 일수.
+
+    REBUILD_CHUNK_DAYS 단위 트랜잭션으로 나눠 긴 잠금을 피한다.
+    """
+    with db_transaction() as cursor:
+        cursor.execute(
+            "SELECT MIN(di.date), MAX(di.date) FROM ai_evaluations ae "
+            "JOIN daily_infos di ON ae.record_id = di.record_id"
+        )
+        ai_range = cursor.fetchone()
+        cursor.execute("SELECT MIN(evaluation_date), MAX(evaluation_date) FROM employee_evaluations")
+        emp_range = cursor.fetchone()
+        if start is None and end is None:
+            # 전체 재구축: 원본에 더 이상 없는 날짜까지 비운 뒤 원본 범위로 다시 채움
+            cursor.execute(f"DELETE FROM {AI_GRADE_TABLE}")
+            cursor.execute(f"DELETE FROM {EMP_EVAL_TABLE}")
+
+    counts = {AI_GRADE_TABLE: 0, EMP_EVAL_TABLE: 0}
+    for table, refresh, (lo, hi) in (
+        (AI_GRADE_TABLE, refresh_ai_grade_days, ai_range or (None, None)),
+        (EMP_EVAL_TABLE, refresh_emp_eval_days, emp_range or (None, None)),
+    ):
+        range_start = start or lo
+        range_end = end or hi
+        if range_start is None or range_end is None:
+            continue
+        for chunk_start, chunk_end in _date_chunks(range_start, range_end, REBUILD_CHUNK_DAYS):
+            days = [chunk_start + timedelta(days=i) for i in range((chunk_end - chunk_start).days + 1)]
+            with db_transaction() as cursor:
+                refresh(cursor, days)
+            counts[table] += len(days)
+    return counts
@@ -1,23 +1,21 @@
+from functools import partial
 from typing import Dict, List, Optional
 from datetime import date
 from .base import BaseRepository
-from backend.encryption import EncryptionService
+from .dashboard_rollup import emp_eval_dates, refresh_emp_eval_days
+from modules.db_connection import db_transaction
+from backend.encryption import EncryptionService, get_encryption_service
 
 
 def _get_enc() -> EncryptionService:
-    return EncryptionService()
+    return get_encryption_service()
 
 
 def _decrypt_name(row: Optional[Dict], *cols: str) -> Optional[Dict]:
     """DB 행의 지정 컬럼을 복호화."""
     if row is None:
         return None
-    enc = _get_enc()
-    result = dict(row)
-    for col in cols:
-        if result.get(col) is not None:
-            result[col] = enc.safe_decrypt(str(result[col]))
-    return result
+    return _get_enc().decrypt_columns([row], cols)[0]
 
 
 class EmployeeEvaluationRepository(BaseRepository):
@@ -61,7 +59,8 @@ class EmployeeEvaluationRepository(BaseRepository):
             insert_query, (
                 record_id, target_date, target_user_id, evaluator_user_id,
                 category, evaluation_type, score, comment, evaluation_date
-            )
+            ),
+            after=partial(refresh_emp_eval_days, dates=[evaluation_date]),
         )
     
     def get_evaluation_by_id(self, emp_eval_id: int) -> Optional[Dict]:
@@ -97,7 +96,7 @@ class EmployeeEvaluationRepository(BaseRepository):
             ORDER BY ee.created_at DESC
         """
         rows = self._execute_query(query, (record_id,))
-        return [_decrypt_name(r, "target_user_name", "evaluator_user_name") for r in rows]
+        return _get_enc().decrypt_columns(rows, ("target_user_name", "evaluator_user_name"))
     
     def get_user_id_by_name(self, name: str) -> Optional[int]:
         """Get user ID by name."""
@@ -109,12 +108,16 @@ class EmployeeEvaluationRepository(BaseRepository):
         """Get all users for dropdown selection."""
         query = "SELECT user_id, name FROM users ORDER BY name"
         rows = self._execute_query(query, ())
-        return [_decrypt_name(r, "name") for r in rows]
+        return _get_enc().decrypt_columns(rows, ("name",))
     
     def delete_evaluation(self, emp_eval_id: int) -> int:
-        """Delete an employee evaluation by ID."""
-        query = "DELETE FROM employee_evaluations WHERE emp_eval_id = %s"
-        return self._execute_transaction(query, (emp_eval_id,))
+        """Delete an employee evaluation by ID (대시보드 집계의 해당 날짜도 갱신)."""
+        with db_transaction() as cursor:
+            dates = emp_eval_dates(cursor, emp_eval_id)
+            cursor.execute("DELETE FROM employee_evaluations WHERE emp_eval_id = %s", (emp_eval_id,))
+            affected = cursor.rowcount
+            refresh_emp_eval_days(cursor, dates)
+        return affected
     
     def find_existing_evaluation(
         self,
@@ -144,7 +147,7 @@ class EmployeeEvaluationRepository(BaseRepository):
         score: int = 1,
         comment: str = None
     ) -> int:
-        """Update an existing employee evaluation."""
+        """Update an existing employee evaluation (변경 전/후 날짜의 대시보드 집계 갱신)."""
         update_query = '''
             UPDATE employee_evaluations SET
                 target_date = %s,
@@ -156,15 +159,21 @@ class EmployeeEvaluationRepository(BaseRepository):
                 evaluation_date = %s
             WHERE emp_eval_id = %s
         '''
-        return self._execute_transaction(
-            update_query, (
-                target_date,
-                evaluator_user_id,
-                category,
-                evaluation_type,
-                score,
-                comment,
-                evaluation_date,
-                emp_eval_id,
+        with db_transaction() as cursor:
+            dates = emp_eval_dates(cursor, emp_eval_id)
+            cursor.execute(
+                update_query, (
+                    target_date,
+                    evaluator_user_id,
+                    category,
+                    evaluation_type,
+                    score,
+                    comment,
+                    evaluation_date,
+                    emp_eval_id,
+                )
             )
-        )
+            affected = cursor.rowcount
+            if dates:
+                refresh_emp_eval_days(cursor, dates + [evaluation_date])
+        return affected
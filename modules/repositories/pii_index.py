@@ -0,0 +1,101 @@
+"""암호화 PII 컬럼 검색용 블라인드 인덱스/토큰 저장 헬퍼.
+
+- customers.name_bidx, customers.recognition_no_bidx, users.name_bidx: 동등 조회용 HMAC
+- pii_search_tokens: 키워드(부분 문자열) 검색용 이름 n-gram 토큰 → entity_id
+
+인덱스 값 계산은 backend.encryption (blind_index, search_tokens) 참고.
+백필되지 않은 과거 행(name_bidx IS NULL)은 조회 조건에 함께 포함해 누락을 막는다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.encryption import keyword_token, search_tokens
+
+SEARCH_TOKEN_TABLE = "pii_search_tokens"
+TOKEN_INSERT_ROWS = 1000
+
+ENTITY_CUSTOMER = "customer"
+ENTITY_USER = "user"
+
+# entity → 토큰을 만드는 필드 (users.job_type 은 평문이므로 제외,
+# customers.recognition_no 는 부분 검색 없이 recognition_no_bidx 동등 조회만)
+ENTITY_FIELDS = {
+    ENTITY_CUSTOMER: ("name",),
+    ENTITY_USER: ("name",),
+}
+
+
+def entity_tokens(entity: str, values: Dict[str, Optional[str]]) -> Set[str]:
+    """평문 필드값 → 해당 엔티티의 검색 토큰 집합."""
+    tokens: Set[str] = set()
+    for field in ENTITY_FIELDS[entity]:
+        tokens |= search_tokens(values.get(field), f"{entity}.{field}")
+    return tokens
+
+
+def keyword_tokens(entity: str, keyword: str) -> List[str]:
+    """검색어 → 엔티티 필드별 조회 토큰 목록."""
+    tokens = [keyword_token(keyword, f"{entity}.{field}") for field in ENTITY_FIELDS[entity]]
+    return [t for t in tokens if t]
+
+
+def keyword_condition(
+    entity: str,
+    id_column: str,
+    keyword: str,
+    extra_sql: Optional[str] = None,
+    extra_params: Iterable = (),
+) -> Tuple[str, list]:
+    """키워드 검색 WHERE 조건절과 파라미터.
+
+    토큰 테이블에서 후보 id만 고르고, 백필 전 행(name_bidx IS NULL)은 그대로 포함한다.
+    extra_sql 은 평문 컬럼 조건 등 OR로 함께 묶을 조건.
+    최종 일치 여부는 호출측에서 복호화 값으로 다시 확인한다.
+    """
+    tokens = keyword_tokens(entity, keyword)
+    if not tokens:
+        return "1=1", []
+    placeholders = ", ".join(["%s"] * len(tokens))
+    conditions = [
+        f"{id_column} IN (SELECT entity_id FROM {SEARCH_TOKEN_TABLE} "
+        f"WHERE entity = %s AND token IN ({placeholders}))",
+        "name_bidx IS NULL",
+    ]
+    params = [entity, *tokens]
+    if extra_sql:
+        conditions.append(extra_sql)
+        params.extend(extra_params)
+    return "(" + " OR ".join(conditions) + ")", params
+
+
+def replace_search_tokens(cursor, entity: str, entity_id: int, tokens: Iterable[str]) -> None:
+    """한 엔티티의 검색 토큰 교체 (호출측 트랜잭션 안에서 실행)."""
+    bulk_replace_search_tokens(cursor, entity, {entity_id: tokens})
+
+
+def bulk_replace_search_tokens(cursor, entity: str, tokens_by_id: Dict[int, Iterable[str]]) -> None:
+    """여러 엔티티의 검색 토큰을 DELETE 1회 + 다중 행 INSERT로 교체."""
+    if not tokens_by_id:
+        return
+    ids = list(tokens_by_id)
+    cursor.execute(
+        f"DELETE FROM {SEARCH_TOKEN_TABLE} WHERE entity = %s AND entity_id IN "
+        f"({', '.join(['%s'] * len(ids))})",
+        [entity, *ids],
+    )
+    rows = [(entity, entity_id, token) for entity_id, tokens in tokens_by_id.items() for token in set(tokens)]
+    for i in range(0, len(rows), TOKEN_INSERT_ROWS):
+        chunk = rows[i:i + TOKEN_INSERT_ROWS]
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TOKEN_TABLE} (entity, entity_id, token) VALUES "
+            + ", ".join(["(%s, %s, %s)"] * len(chunk)),
+            [value for row in chunk for value in row],
+        )
+
+
+def delete_search_tokens(cursor, entity: str, entity_id: int) -> None:
+    cursor.execute(
+        f"DELETE FROM {SEARCH_TOKEN_TABLE} WHERE entity = %s AND entity_id = %s",
+        (entity, entity_id),
+    )
+
@@ -1,22 +1,22 @@
 from typing import List, Optional, Dict, Any
 from .base import BaseRepository
-from backend.encryption import EncryptionService
+from .pii_index import ENTITY_USER, entity_tokens, keyword_condition, replace_search_tokens
+from backend.encryption import EncryptionService, blind_index, get_encryption_service
+from modules.db_connection import db_transaction
+
+
+USER_PII_COLUMNS = ("name", "birth_date")
 
 
 def _get_enc() -> EncryptionService:
-    return EncryptionService()
+    return get_encryption_service()
 
 
 def _decrypt_user(row: Optional[Dict]) -> Optional[Dict]:
     """DB 행의 PII 컬럼(name, birth_date)을 복호화."""
     if row is None:
         return None
-    enc = _get_enc()
-    result = dict(row)
-    for col in ("name", "birth_date"):
-        if result.get(col) is not None:
-            result[col] = enc.safe_decrypt(str(result[col]))
-    return result
+    return _get_enc().decrypt_columns([row], USER_PII_COLUMNS)[0]
 
 
 class UserRepository(BaseRepository):
@@ -45,9 +45,18 @@ class UserRepository(BaseRepository):
             query += " AND work_status = %s"
             params.append(work_status)
 
+        if keyword:
+            # name은 검색 토큰으로, job_type(평문)은 LIKE로 후보 조회 → 아래에서 재확인
+            clause, clause_params = keyword_condition(
+                ENTITY_USER, "user_id", keyword,
+                extra_sql="job_type LIKE %s", extra_params=[f"%{keyword}%"],
+            )
+            query += f" AND {clause}"
+            params.extend(clause_params)
+
         query += " ORDER BY user_id"
         rows = self._execute_query(query, tuple(params))
-        decrypted = [_decrypt_user(r) for r in rows]
+        decrypted = _get_enc().decrypt_columns(rows, USER_PII_COLUMNS)
 
         if keyword:
             kw = keyword.lower()
@@ -77,27 +86,32 @@ class UserRepository(BaseRepository):
             INSERT INTO users (
                 username, password, role, name, gender, birth_date,
                 work_status, job_type, hire_date, resignation_date,
-                license_name, license_date
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                license_name, license_date, name_bidx
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         enc = _get_enc()
-        return self._execute_transaction_lastrowid(
-            query,
-            (
-                username,
-                password,
-                role,
-                enc.encrypt(str(name)),
-                gender,
-                enc.encrypt_optional(str(birth_date) if birth_date else None),
-                work_status,
-                job_type,
-                hire_date,
-                resignation_date,
-                license_name,
-                license_date,
-            ),
+        params = (
+            username,
+            password,
+            role,
+            enc.encrypt(str(name)),
+            gender,
+            enc.encrypt_optional(str(birth_date) if birth_date else None),
+            work_status,
+            job_type,
+            hire_date,
+            resignation_date,
+            license_name,
+            license_date,
+            blind_index(str(name), "user.name"),
         )
+        with db_transaction() as cursor:
+            cursor.execute(query, params)
+            user_id = cursor.lastrowid
+            replace_search_tokens(
+                cursor, ENTITY_USER, user_id, entity_tokens(ENTITY_USER, {"name": str(name)})
+            )
+        return user_id
 
     def update_user(
         self,
@@ -123,25 +137,32 @@ class UserRepository(BaseRepository):
                 resignation_date = %s,
                 license_name = %s,
                 license_date = %s,
+                name_bidx = %s,
                 updated_at = CURRENT_TIMESTAMP
             WHERE user_id = %s
         """
         enc = _get_enc()
-        return self._execute_transaction(
-            query,
-            (
-                enc.encrypt(str(name)),
-                gender,
-                enc.encrypt_optional(str(birth_date) if birth_date else None),
-                work_status,
-                job_type,
-                hire_date,
-                resignation_date,
-                license_name,
-                license_date,
-                user_id,
-            ),
+        params = (
+            enc.encrypt(str(name)),
+            gender,
+            enc.encrypt_optional(str(birth_date) if birth_date else None),
+            work_status,
+            job_type,
+            hire_date,
+            resignation_date,
+            license_name,
+            license_date,
+            blind_index(str(name), "user.name"),
+            user_id,
         )
+        with db_transaction() as cursor:
+            cursor.execute(query, params)
+            affected = cursor.rowcount
+            if affected:
+                replace_search_tokens(
+                    cursor, ENTITY_USER, user_id, entity_tokens(ENTITY_USER, {"name": str(name)})
+                )
+        return affected
 
     def soft_delete_user(self, user_id: int) -> int:
         """퇴사 처리 (실제 삭제 대신 상태 변경)."""
@@ -0,0 +1,183 @@
+"""주간 분석(compute_weekly_status) 결과 캐시와 의존 데이터 버전.
+
+- weekly_analysis_cache : (customer_id, start_date, end_date) → 분석 JSON + 계산 당시 데이터 버전
+- daily_record_versions : (customer_id, date) → 해당 날짜 기록이 바뀔 때마다 +1
+
+데이터 버전은 분석 입력 범위(전주 시작 ~ 이번주 끝)의 일별 버전 합과
+AI 참조용 전주 보고서(weekly_status)의 수정 시각으로 만든다.
+기록 쓰기 경로(daily_info)는 같은 트랜잭션에서 bump_* 로 버전을 올리므로,
+캐시 항목의 버전이 현재 버전과 다르면 다시 계산한다 (명시적 삭제 불필요).
+DDL: scripts/weekly_analysis_cache.sql
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from modules.metrics import REGISTRY
+from .base import BaseRepository
+
+ANALYSIS_CACHE_TABLE = "weekly_analysis_cache"
+RECORD_VERSION_TABLE = "daily_record_versions"
+
+ANALYSIS_CACHE_LOOKUPS = REGISTRY.counter(
+    "arisa_weekly_analysis_cache_total",
+    "주간 분석 캐시 조회 결과 (hit / miss: 항목 없음 / stale: 버전 불일치)",
+    ["result"],
+)
+
+
+def bump_record_versions(cursor, keys: Iterable[Tuple[int, object]]) -> None:
+    """(customer_id, date) 기록 버전 +1 (호출측 트랜잭션 안에서 실행)."""
+    keys = list(dict.fromkeys((customer_id, str(d)) for customer_id, d in keys))
+    if not keys:
+        return
+    cursor.execute(
+        f"INSERT INTO {RECORD_VERSION_TABLE} (customer_id, date, version) VALUES "
+        + ", ".join(["(%s, %s, 1)"] * len(keys))
+        + " ON DUPLICATE KEY UPDATE version = version + 1",
+        [value for key in keys for value in key],
+    )
+
+
+def bump_versions_for_records(cursor, record_ids: Iterable[int]) -> None:
+    """record_id 들의 (customer_id, date) 버전 +1. 하위 테이블만 바뀌는 경로용."""
+    record_ids = list(dict.fromkeys(record_ids))
+    if not record_ids:
+        return
+    cursor.execute(
+        f"""
+        INSERT INTO {RECORD_VERSION_TABLE} (customer_id, date, version)
+        SELECT customer_id, date, 1 FROM daily_infos
+        WHERE record_id IN ({', '.join(['%s'] * len(record_ids))})
+        ON DUPLICATE KEY UPDATE version = version + 1
+        """,
+        record_ids,
+    )
+
+
+def _version_sql(customer: str = "%s") -> str:
+    """데이터 버전 식. customer 에 컬럼명(c.customer_id)을 주면 수급자별 상관 서브쿼리가 된다."""
+    return f"""
+        CONCAT(
+            COALESCE((SELECT SUM(version) FROM {RECORD_VERSION_TABLE}
+                      WHERE customer_id = {customer} AND date BETWEEN %s AND %s), 0),
+            ':',
+            COALESCE((SELECT UNIX_TIMESTAMP(updated_at) FROM weekly_status
+                      WHERE customer_id = {customer} AND start_date = %s AND end_date = %s), '')
+        )
+    """
+
+
+def _version_params(customer_id: int, start_date: date, end_date: date) -> list:
+    prev_start = start_date - timedelta(days=7)
+    prev_end = start_date - timedelta(days=1)
+    return [customer_id, prev_start, end_date, customer_id, prev_start, prev_end]
+
+
+def _range_version_params(start_date: date, end_date: date) -> list:
+    """_version_sql(<컬럼>) 용 파라미터 (수급자 자리 없음)."""
+    prev_start = start_date - timedelta(days=7)
+    prev_end = start_date - timedelta(days=1)
+    return [prev_start, end_date, prev_start, prev_end]
+
+
+class WeeklyAnalysisCacheRepository(BaseRepository):
+    """주간 분석 캐시 저장/조회 (버전이 현재 데이터와 같을 때만 적중)."""
+
+    def current_version(self, customer_id: int, start_date: date, end_date: date) -> str:
+        """분석 입력 데이터의 현재 버전. 계산 전에 읽어 두었다가 save() 에 넘긴다."""
+        row = self._execute_query_one(
+            f"SELECT {_version_sql()} AS data_version",
+            _version_params(customer_id, start_date, end_date),
+        )
+        return row["data_version"]
+
+    def load(self, customer_id: int, start_date: date, end_date: date) -> Optional[str]:
+        """현재 버전과 일치하는 캐시 payload. 없거나 오래됐으면 None."""
+        row = self._execute_query_one(
+            f"""
+            SELECT c.payload, c.data_version = v.data_version AS fresh
+            FROM (SELECT {_version_sql()} AS data_version) v
+            LEFT JOIN {ANALYSIS_CACHE_TABLE} c
+                ON c.customer_id = %s AND c.start_date = %s AND c.end_date = %s
+            """,
+            (*_version_params(customer_id, start_date, end_date), customer_id, start_date, end_date),
+        )
+        if not row or row["payload"] is None:
+            ANALYSIS_CACHE_LOOKUPS.inc(result="miss")
+            return None
+        if not row["fresh"]:
+            ANALYSIS_CACHE_LOOKUPS.inc(result="stale")
+            return None
+        ANALYSIS_CACHE_LOOKUPS.inc(result="hit")
+        return row["payload"]
+
+    def load_many(self, customer_ids: List[int], start_date: date,
+                  end_date: date) -> Dict[int, Tuple[Optional[str], str]]:
+        """여러 수급자의 캐시 조회와 현재 버전 읽기를 쿼리 1회로.
+
+        반환: customer_id → (현재 버전과 일치하는 payload 또는 None, 현재 데이터 버전).
+        customers 에 없는 ID 는 결과에서 빠진다.
+        """
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if not customer_ids:
+            return {}
+        rows = self._execute_query(
+            f"""
+            SELECT v.customer_id, v.data_version, c.payload, c.data_version = v.data_version AS fresh
+            FROM (
+                SELECT cu.customer_id, {_version_sql("cu.customer_id")} AS data_version
+                FROM customers cu
+                WHERE cu.customer_id IN ({', '.join(['%s'] * len(customer_ids))})
+            ) v
+            LEFT JOIN {ANALYSIS_CACHE_TABLE} c
+                ON c.customer_id = v.customer_id AND c.start_date = %s AND c.end_date = %s
+            """,
+            (*_range_version_params(start_date, end_date), *customer_ids, start_date, end_date),
+        )
+        result = {}
+        for row in rows:
+            if row["payload"] is None:
+                ANALYSIS_CACHE_LOOKUPS.inc(result="miss")
+                payload = None
+            elif not row["fresh"]:
+                ANALYSIS_CACHE_LOOKUPS.inc(result="stale")
+                payload = None
+            else:
+                ANALYSIS_CACHE_LOOKUPS.inc(result="hit")
+                payload = row["payload"]
+            result[row["customer_id"]] = (payload, row["data_version"])
+        return result
+
+    def save(self, customer_id: int, start_date: date, end_date: date,
+             data_version: str, payload: str) -> None:
+        query = f"""
+            INSERT INTO {ANALYSIS_CACHE_TABLE}
+                (customer_id, start_date, end_date, data_version, payload)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                data_version = VALUES(data_version),
+                payload = VALUES(payload),
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self._execute_transaction(query, (customer_id, start_date, end_date, data_version, payload))
+
+    def save_many(self, start_date: date, end_date: date,
+                  entries: List[Tuple[int, str, str]]) -> None:
+        """(customer_id, data_version, payload) 여러 건을 한 트랜잭션에 저장."""
+        if not entries:
+            return
+        query = f"""
+            INSERT INTO {ANALYSIS_CACHE_TABLE}
+                (customer_id, start_date, end_date, data_version, payload)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                data_version = VALUES(data_version),
+                payload = VALUES(payload),
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self._execute_transaction_many(
+            query,
+            [(customer_id, start_date, end_date, version, payload)
+             for customer_id, version, payload in entries],
+        )
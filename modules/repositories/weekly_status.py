@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from .base import BaseRepository
 
 
@@ -27,6 +27,20 @@ class WeeklyStatusRepository(BaseRepository):
         result = self._execute_query_one(query, (customer_id, start_date, end_date))
         return result['report_text'] if result else None
     
+    def load_weekly_statuses(self, customer_ids: List[int], start_date, end_date) -> Dict[int, str]:
+        """여러 수급자의 같은 기간 보고서를 한 번에 조회 (customer_id → report_text, 없으면 제외)."""
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if not customer_ids:
+            return {}
+        query = f"""
+            SELECT customer_id, report_text
+            FROM weekly_status
+            WHERE customer_id IN ({', '.join(['%s'] * len(customer_ids))})
+              AND start_date=%s AND end_date=%s
+        """
+        rows = self._execute_query(query, (*customer_ids, start_date, end_date))
+        return {row['customer_id']: row['report_text'] for row in rows}
+    
     def get_all_by_customer(self, customer_id: int, limit: int = 10) -> list:
         """Get all weekly status reports for a customer."""
         query = """
@@ -1,17 +1,29 @@
 """AI 평가 서비스 - 일일 기록 평가 비즈니스 로직"""
 
+import asyncio
 import json
 import logging
+import os
 import re
-from typing import Dict, Optional, Any, List
-from modules.clients.daily_prompt import get_special_note_prompt
+from functools import partial
+from typing import Callable, Dict, Optional, Any, List, Tuple
+from modules.clients.daily_prompt import get_special_note_batch_prompt, get_special_note_prompt
+from modules.clients.llm_cache import acached_completion, cached_completion, lookup_cached, store_cached
+from modules.clients.rate_limit import ESTIMATED_OUTPUT_TOKENS, RetryBudget, get_rate_limiter
 from modules.repositories import AiEvaluationRepository
 from modules.repositories.base import BaseRepository
-from modules.clients.ai_client import get_ai_client
+from modules.repositories.dashboard_rollup import refresh_ai_grade_for_records
+from modules.clients.ai_client import async_session, get_ai_client
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+SPECIAL_NOTE_PROVIDER = "gemini"
+SPECIAL_NOTE_MODEL = "gemini-2.5-flash-preview-04-17"
+SPECIAL_NOTE_TEMPERATURE = 0.7
+# 일괄 평가에서 한 요청에 묶는 기록 수 (1이면 기록마다 따로 호출)
+SPECIAL_NOTE_BATCH_SIZE = max(1, int(os.getenv("AI_SPECIAL_NOTE_BATCH_SIZE", "5")))
+
 
 class EvaluationService:
     """AI 평가 서비스 클래스"""
@@ -150,6 +162,7 @@ class EvaluationService:
                     record_id,
                     korean_category,
                 ),
+                after=partial(refresh_ai_grade_for_records, record_ids=[record_id]),
             )
         else:
             # 삽입
@@ -176,6 +189,7 @@ class EvaluationService:
                     suggestion_text,
                     original_text,
                 ),
+                after=partial(refresh_ai_grade_for_records, record_ids=[record_id]),
             )
 
     def get_record_id(self, customer_name: str, date: str) -> Optional[int]:
@@ -221,11 +235,12 @@ class EvaluationService:
         else:
             return {"suggestion": "", "grade": "평가없음"}
 
-    def evaluate_special_note_with_ai(self, record: dict) -> Optional[Dict]:
+    def evaluate_special_note_with_ai(self, record: dict, use_cache: bool = True) -> Optional[Dict]:
         """XML 형식으로 특이사항 평가
 
         Args:
             record: 전체 기록 딕셔너리
+            use_cache: False 면 LLM 응답 캐시를 조회하지 않고 다시 평가 (결과로 캐시 갱신)
 
         Returns:
             평가 결과 딕셔너리 또는 None
@@ -237,61 +252,244 @@ class EvaluationService:
             return None
 
         try:
-            ai_client = get_ai_client(provider="gemini")
+            ai_client = get_ai_client(provider=SPECIAL_NOTE_PROVIDER)
         except Exception as e:
             logger.error("AI 클라이언트 초기화 오류: %s", e)
             return None
 
-        system_prompt, user_prompt = get_special_note_prompt(record)
-
         try:
-            response = ai_client.chat_completion(
-                model="gemini-2.5-flash-preview-04-17",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.7,
+            return cached_completion(
+                ai_client, SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL,
+                self._special_note_messages(record),
+                temperature=SPECIAL_NOTE_TEMPERATURE, purpose="special_note",
+                parse=self._parse_special_note_response, use_cache=use_cache,
             )
+        except Exception as e:
+            logger.error("특이사항 AI 평가 중 오류 발생: %s", e)
+            return None
 
-            # JSON 응답 파싱
-            content = response.choices[0].message.content
-            # 코드 블록 제거
-            if content.startswith("```json"):
-                content = content[7:-3].strip()
-            elif content.startswith("```"):
-                content = content[3:-3].strip()
+    def _special_note_messages(self, record: dict) -> List[Dict[str, str]]:
+        system_prompt, user_prompt = get_special_note_prompt(record)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-            result = json.loads(content)
+    def _special_note_batch_messages(self, records: List[dict]) -> List[Dict[str, str]]:
+        system_prompt, user_prompt = get_special_note_batch_prompt(records)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-            logger.debug(
-                "AI 평가 결과 — 신체: %s, 인지: %s",
-                result.get("original_physical_evaluation", {}),
-                result.get("original_cognitive_evaluation", {}),
-            )
+    @staticmethod
+    def _strip_code_block(content: str) -> str:
+        if content.startswith("```json"):
+            return content[7:-3].strip()
+        if content.startswith("```"):
+            return content[3:-3].strip()
+        return content
 
-            # 3개 후보 중에서 첫 번째 선택 (날짜별 독립 처리)
-            result = {
-                "original_physical": result.get("original_physical_evaluation", {}),
-                "original_cognitive": result.get("original_cognitive_evaluation", {}),
-                "physical": result["physical_candidates"][0],
-                "cognitive": result["cognitive_candidates"][0],
-            }
+    def _parse_special_note_response(self, content: str) -> Dict:
+        """AI 응답(JSON) → 원본/수정안 평가 점수 딕셔너리"""
+        return self._special_note_result(json.loads(self._strip_code_block(content)))
 
-            # O/X 평가 결과를 점수로 변환
-            result["original_physical"] = self._convert_ox_to_score(
-                result["original_physical"]
-            )
-            result["original_cognitive"] = self._convert_ox_to_score(
-                result["original_cognitive"]
-            )
-            result["physical"] = self._convert_ox_to_score(result["physical"])
-            result["cognitive"] = self._convert_ox_to_score(result["cognitive"])
+    def _parse_special_note_batch(self, content: str, count: int) -> List[Optional[Tuple[Dict, str]]]:
+        """배치 응답(JSON) → 기록 순서대로 (평가 결과, 기록 1건 분량의 JSON) 또는 None.
 
-            return result
+        record_id 가 없거나 범위 밖이거나 형식이 맞지 않는 결과는 None 으로 두고 단건 재평가에 맡긴다.
+        쓸 수 있는 결과가 하나도 없으면 ValueError (캐시에 저장하지 않음).
+        """
+        data = json.loads(self._strip_code_block(content))
+        items = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise ValueError("배치 응답에 results 목록이 없습니다.")
+
+        parsed: List[Optional[Tuple[Dict, str]]] = [None] * count
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("record_id")) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < count or parsed[index] is not None:
+                continue
+            item = {key: value for key, value in item.items() if key != "record_id"}
+            content_json = json.dumps(item, ensure_ascii=False)
+            try:
+                parsed[index] = (self._special_note_result(item), content_json)
+            except (KeyError, IndexError, TypeError, AttributeError):
+                continue
+
+        if not any(parsed):
+            raise ValueError("배치 응답에 유효한 기록 결과가 없습니다.")
+        return parsed
+
+    def _special_note_result(self, result: Dict) -> Dict:
+        logger.debug(
+            "AI 평가 결과 — 신체: %s, 인지: %s",
+            result.get("original_physical_evaluation", {}),
+            result.get("original_cognitive_evaluation", {}),
+        )
+
+        # 3개 후보 중에서 첫 번째 선택 (날짜별 독립 처리)
+        result = {
+            "original_physical": result.get("original_physical_evaluation", {}),
+            "original_cognitive": result.get("original_cognitive_evaluation", {}),
+            "physical": result["physical_candidates"][0],
+            "cognitive": result["cognitive_candidates"][0],
+        }
+
+        # O/X 평가 결과를 점수로 변환
+        result["original_physical"] = self._convert_ox_to_score(
+            result["original_physical"]
+        )
+        result["original_cognitive"] = self._convert_ox_to_score(
+            result["original_cognitive"]
+        )
+        result["physical"] = self._convert_ox_to_score(result["physical"])
+        result["cognitive"] = self._convert_ox_to_score(result["cognitive"])
+
+        return result
+
+    def get_records_for_evaluation(self, start_date, end_date,
+                                   customer_ids: Optional[List[int]] = None,
+                                   only_unevaluated: bool = True) -> List[Dict]:
+        """기간 내 특이사항 AI 평가 대상 기록"""
+        return self.ai_eval_repo.get_records_for_evaluation(
+            start_date, end_date, customer_ids, only_unevaluated
+        )
+
+    def evaluate_special_notes_concurrently(
+        self,
+        records: List[dict],
+        on_result: Optional[Callable[[dict, Optional[Dict]], None]] = None,
+        use_cache: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[Dict]]:
+        """여러 기록의 특이사항을 공급자 한도 안에서 동시에 평가.
+
+        호출은 비동기 클라이언트로 보내고 RPM/TPM·동시성·재시도는 rate_limit 모듈이 관리한다.
+        LLM 응답 캐시에 있는 기록은 호출하지 않으므로, 부분 실패 후 재실행하면 바뀐/실패한 기록만 호출한다.
+        캐시에 없는 기록은 batch_size 건씩 한 요청으로 묶어 긴 system 프롬프트를 건마다 보내지 않는다.
+        배치 결과는 use_cache=True 일 때만 기록 1건 프롬프트의 캐시 키로도 저장한다.
+        배치 응답에서 빠졌거나 형식이 맞지 않는 기록, 배치 호출 자체가 실패한 기록은 단건으로 다시 평가한다.
+        on_result(record, result) 는 호출한 스레드에서 완료 순서대로 불린다 (저장/진행률 표시용).
+        on_result 가 예외를 던지면 남은 호출을 취소하고 그 예외를 다시 던진다.
+
+        Args:
+            batch_size: 한 요청에 묶을 기록 수 (기본: AI_SPECIAL_NOTE_BATCH_SIZE, 1이면 기록마다 호출)
+
+        Returns:
+            records 와 같은 순서의 평가 결과 (특이사항이 없거나 실패한 건은 None)
+        """
+        if not records:
+            return []
+        batch_size = max(1, batch_size or SPECIAL_NOTE_BATCH_SIZE)
+        return asyncio.run(self._aevaluate_special_notes(records, on_result, use_cache, batch_size))
+
+    async def _aevaluate_special_notes(self, records, on_result, use_cache, batch_size) -> List[Optional[Dict]]:
+        try:
+            ai_client = get_ai_client(provider=SPECIAL_NOTE_PROVIDER)
         except Exception as e:
-            logger.error("특이사항 AI 평가 중 오류 발생: %s", e)
-            return None
+            logger.error("AI 클라이언트 초기화 오류: %s", e)
+            ai_client = None
+        # SDK 비동기 클라이언트는 이벤트 루프에 묶이므로 asyncio.run 마다 세션을 새로 열고 닫는다
+        async with async_session(ai_client) as session:
+            return await self._aevaluate_with_client(session, records, on_result, use_cache, batch_size)
+
+    async def _aevaluate_with_client(self, ai_client, records, on_result, use_cache,
+                                     batch_size) -> List[Optional[Dict]]:
+        results: List[Optional[Dict]] = [None] * len(records)
+        limiter = get_rate_limiter(SPECIAL_NOTE_PROVIDER)
+        budget = RetryBudget()
+
+        async def evaluate_single(record: dict) -> Optional[Dict]:
+            # 캐시는 아래에서 미리 조회했으므로 다시 보지 않고 결과만 저장
+            try:
+                return await acached_completion(
+                    ai_client, SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL,
+                    self._special_note_messages(record),
+                    temperature=SPECIAL_NOTE_TEMPERATURE, purpose="special_note",
+                    parse=self._parse_special_note_response, use_cache=False,
+                    limiter=limiter, budget=budget,
+                )
+            except Exception as e:
+                logger.error("특이사항 AI 평가 중 오류 발생: %s", e)
+                return None
+
+        async def evaluate(indices: List[int]) -> List[Tuple[int, Optional[Dict]]]:
+            if len(indices) == 1:
+                return [(indices[0], await evaluate_single(records[indices[0]]))]
+            batch = [records[i] for i in indices]
+            try:
+                parsed = await acached_completion(
+                    ai_client, SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL,
+                    self._special_note_batch_messages(batch),
+                    temperature=SPECIAL_NOTE_TEMPERATURE, purpose="special_note_batch",
+                    parse=partial(self._parse_special_note_batch, count=len(batch)), use_cache=use_cache,
+                    limiter=limiter, budget=budget, output_tokens=ESTIMATED_OUTPUT_TOKENS * len(batch),
+                )
+            except Exception as e:
+                logger.warning("특이사항 배치 평가 실패 (%d건 단건 재평가): %s", len(batch), e)
+                parsed = [None] * len(batch)
+
+            done: List[Tuple[int, Optional[Dict]]] = []
+            retry: List[int] = []
+            for index, item in zip(indices, parsed):
+                if item is None:
+                    retry.append(index)
+                    continue
+                result, content = item
+                # 기록 1건 프롬프트의 캐시 키로도 저장 → 다음 실행에서 기록 단위로 적중.
+                # 강제 재평가(use_cache=False)면 저장하지 않는다: 단건 프롬프트가 만든 적 없는 배치 문맥의 응답으로
+                # 기록 단위 캐시를 덮어쓰지 않도록
+                if use_cache:
+                    store_cached(SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL, self._special_note_messages(records[index]),
+                                 content, temperature=SPECIAL_NOTE_TEMPERATURE)
+                done.append((index, result))
+            if retry and len(retry) < len(indices):
+                logger.warning("배치 응답에서 %d/%d건 누락 또는 형식 오류 → 단건 재평가", len(retry), len(indices))
+            singles = await asyncio.gather(*(evaluate_single(records[i]) for i in retry))
+            return done + list(zip(retry, singles))
+
+        ready: List[Tuple[int, Optional[Dict]]] = []
+        pending: List[int] = []
+        for index, record in enumerate(records):
+            if ai_client is None or not (record.get("physical_note") or record.get("cognitive_note")):
+                ready.append((index, None))
+                continue
+            if use_cache:
+                hit, result = lookup_cached(
+                    SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL, self._special_note_messages(record),
+                    temperature=SPECIAL_NOTE_TEMPERATURE, purpose="special_note",
+                    parse=self._parse_special_note_response,
+                )
+                if hit:
+                    ready.append((index, result))
+                    continue
+            pending.append(index)
+
+        tasks = [
+            asyncio.create_task(evaluate(pending[start:start + batch_size]))
+            for start in range(0, len(pending), batch_size)
+        ]
+        try:
+            for index, result in ready:
+                results[index] = result
+                if on_result:
+                    on_result(records[index], result)
+            for future in asyncio.as_completed(tasks):
+                for index, result in await future:
+                    results[index] = result
+                    if on_result:
+                        on_result(records[index], result)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return results
 
     def _extract_programs_from_text(self, text: str) -> List[str]:
         """텍스트에서 프로그램명을 추출"""
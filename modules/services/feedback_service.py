@@ -5,6 +5,7 @@ from typing import Optional, List, Dict
 
 from modules.repositories.feedback_report import FeedbackReportRepository
 from modules.clients.ai_client import get_ai_client
+from modules.clients.llm_cache import cached_completion
 from modules.clients.feedback_prompt import FEEDBACK_SYSTEM_PROMPT, build_user_prompt
 
 
@@ -21,6 +22,7 @@ class FeedbackService:
         target_month: str,
         admin_note: Optional[str],
         evaluations: List[Dict],
+        use_cache: bool = True,
     ) -> Dict:
         """AI 피드백 생성 → upsert → 저장된 레코드 반환.
 
@@ -30,6 +32,7 @@ class FeedbackService:
             target_month: 대상 월 (YYYY-MM)
             admin_note: 관리자 노트 (선택사항)
             evaluations: 평가 이력 리스트
+            use_cache: False 면 LLM 응답 캐시를 조회하지 않고 다시 생성
 
         Returns:
             저장된 피드백 레포트 딕셔너리
@@ -44,13 +47,12 @@ class FeedbackService:
             {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ]
-        response = get_ai_client().chat_completion(
-            model="gpt-4o-mini",
-            messages=messages,
-        )
-        content = response.choices[0].message.content
         try:
-            ai_result = json.loads(content)
+            # 같은 평가 이력/노트로 다시 생성하거나 저장 실패 후 재시도하면 캐시된 응답 재사용
+            ai_result = cached_completion(
+                get_ai_client(), "openai", "gpt-4o-mini", messages,
+                purpose="feedback", parse=json.loads, use_cache=use_cache,
+            )
         except json.JSONDecodeError as e:
             raise ValueError(f"AI 응답 JSON 파싱 오류: {e}") from e
 
@@ -4,19 +4,31 @@ from typing import Dict, Tuple, Any, Optional
 from datetime import date
 from modules.clients.weekly_prompt import WEEKLY_WRITER_SYSTEM_PROMPT, WEEKLY_WRITER_USER_TEMPLATE
 from modules.clients.ai_client import get_ai_client
+from modules.clients.llm_cache import cached_completion
+
+
+class _EmptyResponse(ValueError):
+    """빈 AI 응답 (캐시에 저장하지 않음)"""
+
+
+def _non_empty(content: str) -> str:
+    if not content or not content.strip():
+        raise _EmptyResponse("AI 응답이 비어 있습니다.")
+    return content.strip()
 
 
 class ReportService:
     """주간 보고서 서비스 클래스"""
     
     def generate_weekly_report(self, customer_name: str, date_range: Tuple[date, date], 
-                              analysis_payload: Dict) -> str | Dict[str, str]:
+                              analysis_payload: Dict, use_cache: bool = True) -> str | Dict[str, str]:
         """주간 보고서 생성
         
         Args:
             customer_name: 고객명
             date_range: (시작일, 종료일) 튜플
             analysis_payload: 분석 데이터
+            use_cache: False 면 LLM 응답 캐시를 조회하지 않고 다시 생성
             
         Returns:
             생성된 보고서 텍스트 또는 에러 딕셔너리
@@ -25,17 +37,16 @@ class ReportService:
         
         try:
             ai_client = get_ai_client(provider='openai')
-            response = ai_client.chat_completion(
-                model="gpt-4o-mini",
-                messages=[
+            return cached_completion(
+                ai_client, "openai", "gpt-4o-mini",
+                [
                     {"role": "system", "content": WEEKLY_WRITER_SYSTEM_PROMPT},
                     {"role": "user", "content": input_content},
                 ],
+                purpose="weekly_report", parse=_non_empty, use_cache=use_cache,
             )
-            content = response.choices[0].message.content
-            if not content:
-                return {"error": "AI 응답이 비어 있습니다."}
-            return content.strip()
+        except _EmptyResponse as exc:
+            return {"error": str(exc)}
         except Exception as exc:
             return {"error": f"AI 생성 중 오류 발생: {exc}"}
     
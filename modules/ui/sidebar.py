@@ -14,6 +14,7 @@ import streamlit as st
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from modules.pdf_parser import CareRecordParser
+from modules.parse_cache import get_parse_cache
 from modules.database import save_parsed_data, get_customers_with_records, get_all_records_by_date_range
 from modules.ui.ui_helpers import (
     get_active_doc, get_person_keys_for_doc, iter_person_entries, 
@@ -164,7 +165,7 @@ def render_sidebar():
                         from concurrent.futures import ThreadPoolExecutor, wait
                         import threading
                         
-                        parser = CareRecordParser(f)
+                        parser = CareRecordParser(f, cache=get_parse_cache())
                         parsed = None
                         parsing_done = threading.Event()
                         
@@ -436,9 +437,10 @@ def _batch_generate_weekly_reports(person_entries):
     status_text = st.empty()
     total = len(person_entries)
     
-    for i, entry in enumerate(person_entries):
-        status_text.text(f"{entry['person_name']} 진행중 ({i+1}/{total})")
-        
+    # 1) 인원별 customer_id / 주 시작일 확인
+    from modules.customers import resolve_customer_id
+    targets = []  # (entry, customer_id, week_start)
+    for entry in person_entries:
         # Get person records
         doc = next((d for d in st.session_state.docs if d["id"] == entry["doc_id"]), None)
         if not doc:
@@ -453,7 +455,6 @@ def _batch_generate_weekly_reports(person_entries):
             continue
             
         # Resolve customer_id
-        from modules.customers import resolve_customer_id
         customer_id = (person_records[0].get("customer_id") if person_records else None)
         if customer_id is None:
             try:
@@ -468,21 +469,31 @@ def _batch_generate_weekly_reports(person_entries):
         if customer_id is None:
             continue
         
-        # Compute weekly status
-        from modules.weekly_data_analyzer import compute_weekly_status
         week_dates = sorted([r.get("date") for r in person_records if r.get("date")])
         if not week_dates:
             continue
-            
-        week_start = week_dates[-1]
-        result = compute_weekly_status(entry["person_name"], week_start, customer_id)
+        targets.append((entry, customer_id, str(week_dates[-1])))
+    
+    # 2) 주 시작일별로 묶어 주간 상태 일괄 분석 (기록 조회/분석 1회)
+    from modules.weekly_data_analyzer import compute_weekly_status_bulk
+    status_text.text(f"주간 상태 분석 중 ({len(targets)}명)")
+    results = {}
+    for week_start in dict.fromkeys(week_start for _, _, week_start in targets):
+        customer_ids = [cid for _, cid, ws in targets if ws == week_start]
+        for cid, result in compute_weekly_status_bulk(customer_ids, week_start).items():
+            results[(cid, week_start)] = result
+    
+    # 3) 인원별 AI 보고서 생성
+    from modules.services.weekly_report_service import report_service
+    from modules.database import save_weekly_status
+    for i, (entry, customer_id, week_start) in enumerate(targets):
+        status_text.text(f"{entry['person_name']} 진행중 ({i+1}/{len(targets)})")
+        result = results.get((customer_id, week_start), {})
         
         if result.get("error") or not result.get("scores"):
             continue
             
         # Generate AI report
-        from modules.services.weekly_report_service import report_service
-        from modules.database import save_weekly_status
         prev_range, curr_range = result["ranges"]
         ai_payload = result.get("trend", {}).get("ai_payload")
         
@@ -505,119 +516,18 @@ def _batch_generate_weekly_reports(person_entries):
             except Exception:
                 pass
         
-        progress_bar.progress((i + 1) / total)
+        progress_bar.progress((i + 1) / max(len(targets), 1))
     
+    progress_bar.progress(1.0)
     status_text.text("✅ 모든 인원의 주간 상태변화 기록지 생성이 완료되었습니다.")
     st.toast("✅ 일괄 처리 완료!", icon="✅")
 
 
-def _batch_evaluate_all(person_entries):
-    """전체 인원의 특이사항을 일괄 평가합니다."""
-    if not person_entries:
-        st.warning("처리할 인원이 없습니다.")
-        return
-    
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    total = len(person_entries)
-    
-    for i, entry in enumerate(person_entries):
-        status_text.text(f"{entry['person_name']} 진행중 ({i+1}/{total})")
-        
-        # Get person records from database
-        try:
-            from modules.db_connection import db_query
-            from modules.services.daily_report_service import evaluation_service
-            
-            with db_query() as cursor:
-                # Get customer_id first
-                cursor.execute(
-                    "SELECT customer_id FROM customers WHERE name = %s LIMIT 1",
-                    (entry["person_name"],)
-                )
-                customer_result = cursor.fetchone()
-                
-                if not customer_result:
-                    continue
-                    
-                customer_id = customer_result["customer_id"]
-                
-                # Get records for this customer
-                cursor.execute(
-                    """
-                    SELECT di.record_id, c.name as customer_name, di.date, 
-                           dp.note as physical_note, dc.note as cognitive_note, 
-                           dn.note as nursing_note, dr.note as functional_note,
-                           dp.writer_name as writer_physical, dc.writer_name as writer_cognitive, 
-                           dn.writer_name as writer_nursing, dr.writer_name as writer_recovery
-                    FROM daily_infos di
-                    LEFT JOIN customers c ON di.customer_id = c.customer_id
-                    LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-                    LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-                    LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-                    LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-                    WHERE di.customer_id = %s
-                    ORDER BY di.date DESC
-                    """,
-                    (customer_id,)
-                )
-                
-                records = []
-                for row in cursor.fetchall():
-                    records.append({
-                        "record_id": row["record_id"],
-                        "customer_name": row["customer_name"],
-                        "date": row["date"],
-                        "physical_note": row["physical_note"],
-                        "cognitive_note": row["cognitive_note"],
-                        "nursing_note": row["nursing_note"],
-                        "functional_note": row["functional_note"],
-                        "writer_physical": row["writer_physical"],
-                        "writer_cognitive": row["writer_cognitive"],
-                        "writer_nursing": row["writer_nursing"],
-                        "writer_recovery": row["writer_recovery"]
-                    })
-            
-            # Evaluate all records for this person using process_daily_note_evaluation
-            # 특이사항 평가는 PHYSICAL과 COGNITIVE만 수행
-            for record in records:
-                categories = [
-                    ("PHYSICAL", record.get("physical_note", ""), record.get("writer_physical")),
-                    ("COGNITIVE", record.get("cognitive_note", ""), record.get("writer_cognitive"))
-                ]
-                
-                for category, text, category_writer in categories:
-                    # 빈 텍스트는 건너뛰기
-                    if not text or text.strip() in ['특이사항 없음', '결석', '']:
-                        continue
-                    
-                    note_writer_id = record.get(f"writer_{category.lower()}_id", 1)
-                    
-                    evaluation_service.process_daily_note_evaluation(
-                        record_id=record["record_id"],
-                        category=category,
-                        note_text=text,
-                        note_writer_user_id=note_writer_id,
-                        writer=category_writer or "",
-                        customer_name=record.get("customer_name", ""),
-                        date=record.get("date", "")
-                    )
-            
-        except Exception as e:
-            st.error(f"{entry['person_name']} 평가 중 오류: {e}")
-        
-        progress_bar.progress((i + 1) / total)
-    
-    status_text.text("✅ 모든 인원의 특이사항 평가가 완료되었습니다.")
-    st.toast("✅ 일괄 평가 완료!", icon="✅")
-    st.rerun()
-
-
 def _batch_evaluate_all_optimized(person_entries):
     """성능 최적화된 전체 인원 특이사항 일괄 평가
     
-    탭의 빠른 로직과 동일하게 evaluate_special_note_with_ai를 사용하여
-    1번의 AI 호출로 신체/인지를 동시에 평가합니다.
+    탭의 빠른 로직과 동일하게 기록당 1번의 AI 호출로 신체/인지를 동시에 평가하고,
+    호출은 evaluate_special_notes_concurrently로 공급자 한도 안에서 병렬 처리합니다.
     """
     if not person_entries:
         st.warning("처리할 인원이 없습니다.")
@@ -660,49 +570,30 @@ def _batch_evaluate_all_optimized(person_entries):
     
     total = len(all_records)
     
-    # 병렬 처리를 위한 함수 정의 (탭과 동일한 로직)
-    def process_record(record):
-        date_str = record.get("date", "날짜 없음")
+    completed = 0
+
+    # 완료된 순서대로 저장하고 진행률 갱신 (호출은 공급자 한도 안에서 동시 진행)
+    def on_result(record, result):
+        nonlocal completed
         customer_name = record.get('customer_name', '')
-        physical_note = record.get("physical_note", "").strip()
-        cognitive_note = record.get("cognitive_note", "").strip()
-        
+        date_str = record.get("date", "날짜 없음")
         try:
-            print(f"DEBUG: Processing {customer_name} ({date_str})")
-            
-            # 1번의 AI 호출로 신체/인지 동시 평가
-            result = evaluation_service.evaluate_special_note_with_ai(record)
             if result:
                 record_id = evaluation_service.get_record_id(customer_name, date_str)
                 if record_id:
                     result_with_notes = result.copy()
-                    result_with_notes['physical_note'] = physical_note
-                    result_with_notes['cognitive_note'] = cognitive_note
+                    result_with_notes['physical_note'] = record.get("physical_note", "").strip()
+                    result_with_notes['cognitive_note'] = record.get("cognitive_note", "").strip()
                     evaluation_service.save_special_note_evaluation(record_id, result_with_notes)
-            return True
         except Exception as e:
             print(f"Error processing {customer_name} ({date_str}): {str(e)}")
-            return False
 
-    max_workers = 4
-    completed = 0
-    
-    # UI 업데이트용 컨테이너
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_record = {executor.submit(process_record, rec): rec for rec in all_records}
-        for future in concurrent.futures.as_completed(future_to_record):
-            try:
-                future.result(timeout=40)
-            except concurrent.futures.TimeoutError:
-                print("DEBUG: Task timed out")
-            except Exception as e:
-                print(f"DEBUG: Task error: {e}")
-            
-            completed += 1
-            progress_bar.progress(completed / total)
-            status_text.text(f"⏳ 전체 인원 평가 진행 중... ({completed}/{total})")
-    
+        completed += 1
+        progress_bar.progress(completed / total)
+        status_text.text(f"⏳ 전체 인원 평가 진행 중... ({completed}/{total})")
+
+    evaluation_service.evaluate_special_notes_concurrently(all_records, on_result=on_result)
+
     st.success(f"총 {total}건의 특이사항 평가가 완료되었습니다.")
     st.toast("✅ 일괄 평가 완료!", icon="✅")
     st.rerun()
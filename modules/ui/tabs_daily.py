@@ -12,7 +12,6 @@ from modules.repositories.employee_evaluation import EmployeeEvaluationRepositor
 from modules.utils.enums import CategoryType, CategoryDisplay, RequiredFields, WriterFields, OptionalFields
 from datetime import date
 import time
-import concurrent.futures
 
 
 def render_ai_evaluation_tab():
@@ -374,49 +373,30 @@ def render_ai_evaluation_tab():
         status_text = st.empty()
         total = len(all_records)
         
-        # 병렬 처리를 위한 함수 정의
-        def process_record(record):
-            date_str = record.get("date", "날짜 없음")
+        completed = 0
+
+        # 완료된 순서대로 저장하고 진행률 갱신 (호출은 공급자 한도 안에서 동시 진행)
+        def on_result(record, result):
+            nonlocal completed
             customer_name = record.get('customer_name', '')
-            physical_note = record.get("physical_note", "").strip()
-            cognitive_note = record.get("cognitive_note", "").strip()
-            
+            date_str = record.get("date", "날짜 없음")
             try:
-                # 개별 호출 전 로그
-                print(f"DEBUG: Processing {customer_name} ({date_str})")
-                
-                result = evaluation_service.evaluate_special_note_with_ai(record)
                 if result:
                     record_id = evaluation_service.get_record_id(customer_name, date_str)
                     if record_id:
                         result_with_notes = result.copy()
-                        result_with_notes['physical_note'] = physical_note
-                        result_with_notes['cognitive_note'] = cognitive_note
+                        result_with_notes['physical_note'] = record.get("physical_note", "").strip()
+                        result_with_notes['cognitive_note'] = record.get("cognitive_note", "").strip()
                         evaluation_service.save_special_note_evaluation(record_id, result_with_notes)
-                return True
             except Exception as e:
                 print(f"Error processing {customer_name} ({date_str}): {str(e)}")
-                return False
 
-        max_workers = 4
-        completed = 0
-        
-        # UI 업데이트용 컨테이너
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_record = {executor.submit(process_record, rec): rec for rec in all_records}
-            for future in concurrent.futures.as_completed(future_to_record):
-                try:
-                    # 각 작업의 결과를 기다림 (타임아웃 설정 가능)
-                    future.result(timeout=40) 
-                except concurrent.futures.TimeoutError:
-                    print("DEBUG: Task timed out")
-                except Exception as e:
-                    print(f"DEBUG: Task error: {e}")
-                
-                completed += 1
-                progress_bar.progress(completed / total)
-                status_text.text(f"⏳ 특이사항 평가 진행 중... ({completed}/{total})")
-        
+            completed += 1
+            progress_bar.progress(completed / total)
+            status_text.text(f"⏳ 특이사항 평가 진행 중... ({completed}/{total})")
+
+        evaluation_service.evaluate_special_notes_concurrently(all_records, on_result=on_result)
+
         st.success(f"총 {total}건의 특이사항 평가가 완료되었습니다.")
         time.sleep(1) # 결과 확인을 위한 잠시 대기
         st.rerun()
@@ -14,12 +14,13 @@
 """
 
 import gc
+import os
 from typing import TypeVar, Iterator, List, Callable, Any
 from contextlib import contextmanager
 
 T = TypeVar('T')
 
-DB_POOL_SIZE = 5
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))  # 워커 프로세스당 MySQL 연결 수 상한
 THREAD_MAX_WORKERS = 4
 CACHE_MAX_ENTRIES = 20
 CACHE_TTL = 600  # 10분
@@ -0,0 +1,63 @@
+"""로컬 SQLite 저장소 공용 유틸리티
+
+여러 uvicorn 워커/Streamlit 프로세스가 같은 호스트에서 공유하는
+로컬 캐시·저장소(파싱 캐시, 업로드 결과 저장소 등)를 위한 헬퍼.
+
+- WAL 모드 + busy timeout으로 다중 프로세스 동시 접근 허용
+- autocommit 연결 (명시적 트랜잭션은 BEGIN IMMEDIATE 사용)
+- 연결은 블록 종료 시 항상 닫힘
+
+사용법:
+    from modules.utils.sqlite_utils import sqlite_connect, local_store_path
+
+    path = local_store_path("parse_cache.sqlite3", env_dir="PARSE_CACHE_DIR")
+    with sqlite_connect(path) as conn:
+        conn.execute("SELECT 1")
+"""
+
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+SQLITE_BUSY_TIMEOUT = 30  # 초
+
+
+def local_store_path(filename: str, env_dir: Optional[str] = None, default_subdir: str = "arisa_store") -> Path:
+    """로컬 저장소 파일 경로. env_dir 환경변수가 있으면 그 디렉토리를 사용."""
+    base = os.environ.get(env_dir) if env_dir else None
+    directory = Path(base) if base else Path(tempfile.gettempdir()) / default_subdir
+    return directory / filename
+
+
+def init_sqlite(path: Path, schema: str) -> None:
+    """디렉토리 생성 후 스키마(CREATE ... IF NOT EXISTS) 적용."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite_connect(path) as conn:
+        conn.executescript(schema)
+
+
+@contextmanager
+def sqlite_connect(path: Path) -> Iterator[sqlite3.Connection]:
+    """WAL 모드 autocommit 연결 컨텍스트 매니저."""
+    conn = sqlite3.connect(str(path), timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def sqlite_transaction(path: Path) -> Iterator[sqlite3.Connection]:
+    """쓰기 잠금을 즉시 잡는 트랜잭션. 성공 시 커밋, 예외 시 롤백."""
+    with sqlite_connect(path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
@@ -5,13 +5,14 @@ import re
 from collections import defaultdict
 from datetime import date, datetime, timedelta
 from statistics import mean
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
 
 import json
 from modules.repositories import WeeklyStatusRepository, DailyInfoRepository
+from modules.repositories.weekly_analysis_cache import WeeklyAnalysisCacheRepository
 
 
 def _optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -72,6 +73,26 @@ def _score_text(text: Optional[str]) -> int:
     return max(0, min(100, score))
 
 
+def _to_analysis_row(record: Dict) -> Dict:
+    """DB 기록(get_customer_records 행) → 분석 입력 행"""
+    return {
+        'date': record['date'],
+        'total_service_time': record['total_service_time'],
+        'physical_note': record['physical_note'],
+        'cognitive_note': record['cognitive_note'],
+        'nursing_note': record['nursing_note'],
+        'functional_note': record['functional_note'],
+        'meal_breakfast': record.get('meal_breakfast'),
+        'meal_lunch': record.get('meal_lunch'),
+        'meal_dinner': record.get('meal_dinner'),
+        'toilet_care': record.get('toilet_care'),
+        'bath_time': record.get('bath_time'),
+        'bp_temp': record.get('bp_temp'),
+        'prog_therapy': record.get('prog_therapy'),
+        'prog_enhance_detail': record.get('prog_enhance_detail'),
+    }
+
+
 def _fetch_two_week_records(
     name: str, start_date: date
 ) -> Tuple[List[Dict,], Tuple[date, date], Tuple[date, date]]:
@@ -98,24 +119,7 @@ def _fetch_two_week_records(
     )
     
     # 예상 형식과 일치하도록 레코드 변환
-    transformed_records = []
-    for record in records:
-        transformed_records.append({
-            'date': record['date'],
-            'total_service_time': record['total_service_time'],
-            'physical_note': record['physical_note'],
-            'cognitive_note': record['cognitive_note'],
-            'nursing_note': record['nursing_note'],
-            'functional_note': record['functional_note'],
-            'meal_breakfast': record.get('meal_breakfast'),
-            'meal_lunch': record.get('meal_lunch'),
-            'meal_dinner': record.get('meal_dinner'),
-            'toilet_care': record.get('toilet_care'),
-            'bath_time': record.get('bath_time'),
-            'bp_temp': record.get('bp_temp'),
-            'prog_therapy': record.get('prog_therapy'),
-            'prog_enhance_detail': record.get('prog_enhance_detail'),
-        })
+    transformed_records = [_to_analysis_row(record) for record in records]
     
     return transformed_records, (prev_start, prev_end), (start_date, curr_end)
 
@@ -124,11 +128,14 @@ def compute_weekly_status(customer_name: str, week_start_str: str, customer_id:
                           use_cache: bool = True) -> Dict:
     """주간 상태 분석 (DB 캐싱 지원)
     
+    캐시(weekly_analysis_cache)는 입력 기록/전주 보고서의 버전이 같을 때만 사용되므로
+    기록이 다시 저장되거나 삭제되면 자동으로 재계산된다.
+    
     Args:
         customer_name: 고객명
         week_start_str: 주 시작일 (YYYY-MM-DD) - 필터의 시작일이 이번주 시작일이 됨
         customer_id: 고객 ID
-        use_cache: 캐시 사용 여부 (기본값: True)
+        use_cache: 캐시 사용 여부 (기본값: True, False여도 결과는 캐시에 저장)
     """
     try:
         week_start = datetime.strptime(week_start_str, "%Y-%m-%d").date()
@@ -140,10 +147,14 @@ def compute_weekly_status(customer_name: str, week_start_str: str, customer_id:
     curr_end = curr_start + timedelta(days=6)
     
     # 캐시 확인 (use_cache=True일 때)
-    if use_cache and customer_id:
-        cached = _load_cached_weekly_status(customer_id, curr_start, curr_end)
-        if cached:
-            return cached
+    data_version = None
+    if customer_id:
+        if use_cache:
+            cached = _load_cached_weekly_status(customer_id, curr_start, curr_end)
+            if cached:
+                return cached
+        # 조회 전에 읽은 버전으로 저장 → 계산 중 기록이 바뀌면 다음 조회에서 재계산
+        data_version = _analysis_data_version(customer_id, curr_start, curr_end)
 
     try:
         rows, prev_range, curr_range = _fetch_two_week_records(customer_name, curr_start)
@@ -153,6 +164,107 @@ def compute_weekly_status(customer_name: str, week_start_str: str, customer_id:
     if not rows:
         return {"data": [], "ranges": (prev_range, curr_range), "scores": {}}
 
+    scores = _category_scores(rows, curr_start)
+    trend = analyze_weekly_trend(rows, prev_range, curr_range, customer_id)
+
+    result = {
+        "ranges": (prev_range, curr_range),
+        "scores": scores,
+        "raw": rows,
+        "trend": trend,
+    }
+    
+    # 결과 캐싱 (customer_id가 있을 때만)
+    if customer_id and data_version is not None:
+        _save_weekly_status_cache(customer_id, curr_start, curr_end, result, data_version)
+    
+    return result
+
+
+def compute_weekly_status_bulk(customer_ids: Optional[Iterable[int]], week_start: Union[date, str],
+                               use_cache: bool = True) -> Dict[int, Dict]:
+    """여러 수급자의 주간 상태 분석을 한 번에 (수급자별 결과는 compute_weekly_status 와 같은 형식)
+
+    - 캐시 조회 + 데이터 버전 읽기: 쿼리 1회
+    - 캐시에 없는 수급자의 2주치 기록 / 전주 보고서: 각각 범위 쿼리 1회 (이름 조회 없음)
+    - 추이 분석: 전체 기록의 특징을 한 번에 추출해 (수급자, 주 구간)으로 나눠 집계
+    - 새로 계산한 결과는 한 트랜잭션으로 캐시에 저장
+
+    Args:
+        customer_ids: 수급자 ID 목록. None 이면 2주 구간에 기록이 있는 모든 수급자
+        week_start: 이번주 시작일 (date 또는 YYYY-MM-DD)
+        use_cache: 캐시 사용 여부 (False여도 결과는 캐시에 저장)
+
+    Returns:
+        customer_id → 분석 결과 (입력 순서 유지)
+    """
+    customer_ids = list(dict.fromkeys(customer_ids)) if customer_ids is not None else None
+    try:
+        curr_start = (week_start if isinstance(week_start, date)
+                      else datetime.strptime(week_start, "%Y-%m-%d").date())
+    except Exception:
+        return {cid: {"error": "날짜 형식이 올바르지 않습니다."} for cid in customer_ids or []}
+
+    prev_range = (curr_start - timedelta(days=7), curr_start - timedelta(days=1))
+    curr_range = (curr_start, curr_start + timedelta(days=6))
+    daily_info_repo = DailyInfoRepository()
+    if customer_ids is None:
+        try:
+            customer_ids = daily_info_repo.get_customer_ids_with_records(prev_range[0], curr_range[1])
+        except Exception:
+            return {}
+
+    # 캐시 확인 + 조회 전 데이터 버전 (compute_weekly_status 와 같은 규칙)
+    try:
+        cached = WeeklyAnalysisCacheRepository().load_many(customer_ids, *curr_range)
+    except Exception:
+        cached = {}
+    results: Dict[int, Dict] = {}
+    for cid, (payload, _) in cached.items():
+        if use_cache and payload:
+            try:
+                results[cid] = _decode_cached_status(payload)
+            except Exception:
+                pass
+    pending = [cid for cid in customer_ids if cid not in results]
+
+    if pending:
+        try:
+            records = daily_info_repo.get_records_for_customers(pending, prev_range[0], curr_range[1])
+            previous_reports = WeeklyStatusRepository().load_weekly_statuses(pending, *prev_range)
+        except Exception as e:
+            results.update({cid: {"error": str(e)} for cid in pending})
+            return {cid: results[cid] for cid in customer_ids}
+
+        rows_by_customer: Dict[int, List[Dict]] = defaultdict(list)
+        for record in records:
+            rows_by_customer[record["customer_id"]].append(_to_analysis_row(record))
+        trends = _analyze_weekly_trends(rows_by_customer, prev_range, curr_range, previous_reports)
+
+        to_save = []
+        for cid in pending:
+            rows = rows_by_customer.get(cid)
+            if not rows:
+                results[cid] = {"data": [], "ranges": (prev_range, curr_range), "scores": {}}
+                continue
+            results[cid] = {
+                "ranges": (prev_range, curr_range),
+                "scores": _category_scores(rows, curr_start),
+                "raw": rows,
+                "trend": trends[cid],
+            }
+            if cid in cached:
+                to_save.append((cid, cached[cid][1], _encode_cached_status(results[cid])))
+        try:
+            WeeklyAnalysisCacheRepository().save_many(*curr_range, to_save)
+        except Exception:
+            pass  # 캐시 저장 실패는 무시
+
+    return {cid: results[cid] for cid in customer_ids}
+
+
+def _category_scores(rows: List[Dict], curr_start: date) -> Dict[str, Dict]:
+    """카테고리별 지난주/이번주 메모 점수 평균과 추세"""
     buckets: Dict[str, Dict[str, List[int]]] = {
         "prev": defaultdict(list),
         "curr": defaultdict(list),
@@ -190,69 +302,72 @@ def compute_weekly_status(customer_name: str, week_start_str: str, customer_id:
             "diff": diff,
             "trend": trend,
         }
-
-    trend = analyze_weekly_trend(rows, prev_range, curr_range, customer_id)
-
-    result = {
-        "ranges": (prev_range, curr_range),
-        "scores": scores,
-        "raw": rows,
-        "trend": trend,
-    }
-    
-    # 결과 캐싱 (customer_id가 있을 때만)
-    if customer_id:
-        _save_weekly_status_cache(customer_id, curr_start, curr_end, result)
-    
-    return result
+    return scores
+
+
+def _decode_cached_status(cached_text: str) -> Dict:
+    """캐시 JSON → 분석 결과 (ranges / raw 의 날짜 문자열을 date 로 복원)"""
+    cached = json.loads(cached_text)
+    # ranges를 date 객체로 복원
+    if 'ranges' in cached:
+        prev_range, curr_range = cached['ranges']
+        cached['ranges'] = (
+            (datetime.strptime(prev_range[0], '%Y-%m-%d').date(),
+             datetime.strptime(prev_range[1], '%Y-%m-%d').date()),
+            (datetime.strptime(curr_range[0], '%Y-%m-%d').date(),
+             datetime.strptime(curr_range[1], '%Y-%m-%d').date())
+        )
+    # raw의 date도 복원
+    if 'raw' in cached:
+        for row in cached['raw']:
+            if 'date' in row and isinstance(row['date'], str):
+                row['date'] = datetime.strptime(row['date'], '%Y-%m-%d').date()
+    return cached
+
+
+def _encode_cached_status(result: Dict) -> str:
+    """분석 결과 → 캐시 JSON (date 객체는 ISO 문자열로)"""
+    cache_data = result.copy()
+    if 'ranges' in cache_data:
+        prev_range, curr_range = cache_data['ranges']
+        cache_data['ranges'] = (
+            (prev_range[0].isoformat(), prev_range[1].isoformat()),
+            (curr_range[0].isoformat(), curr_range[1].isoformat())
+        )
+    if 'raw' in cache_data:
+        cache_data['raw'] = [
+            {**row, 'date': row['date'].isoformat() if hasattr(row.get('date'), 'isoformat') else row.get('date')}
+            for row in cache_data['raw']
+        ]
+    return json.dumps(cache_data, ensure_ascii=False)
 
 
 def _load_cached_weekly_status(customer_id: int, start_date: date, end_date: date) -> Optional[Dict]:
-    """캐시된 주간 분석 결과 로드"""
+    """캐시된 주간 분석 결과 로드 (데이터 버전이 현재와 같을 때만)"""
     try:
-        repo = WeeklyStatusRepository()
-        cached_text = repo.load_weekly_status(customer_id, start_date, end_date)
+        repo = WeeklyAnalysisCacheRepository()
+        cached_text = repo.load(customer_id, start_date, end_date)
         if cached_text:
-            cached = json.loads(cached_text)
-            # ranges를 date 객체로 복원
-            if 'ranges' in cached:
-                prev_range, curr_range = cached['ranges']
-                cached['ranges'] = (
-                    (datetime.strptime(prev_range[0], '%Y-%m-%d').date(),
-                     datetime.strptime(prev_range[1], '%Y-%m-%d').date()),
-                    (datetime.strptime(curr_range[0], '%Y-%m-%d').date(),
-                     datetime.strptime(curr_range[1], '%Y-%m-%d').date())
-                )
-            # raw의 date도 복원
-            if 'raw' in cached:
-                for row in cached['raw']:
-                    if 'date' in row and isinstance(row['date'], str):
-                        row['date'] = datetime.strptime(row['date'], '%Y-%m-%d').date()
-            return cached
+            return _decode_cached_status(cached_text)
     except Exception:
         pass
     return None
 
 
-def _save_weekly_status_cache(customer_id: int, start_date: date, end_date: date, result: Dict):
+def _analysis_data_version(customer_id: int, start_date: date, end_date: date) -> Optional[str]:
+    """분석 입력 데이터의 현재 버전 (조회 실패 시 None → 캐시 저장 생략)"""
+    try:
+        return WeeklyAnalysisCacheRepository().current_version(customer_id, start_date, end_date)
+    except Exception:
+        return None
+
+
+def _save_weekly_status_cache(customer_id: int, start_date: date, end_date: date, result: Dict,
+                              data_version: str):
     """주간 분석 결과 캐싱"""
     try:
-        # JSON 직렬화를 위해 date 객체 변환
-        cache_data = result.copy()
-        if 'ranges' in cache_data:
-            prev_range, curr_range = cache_data['ranges']
-            cache_data['ranges'] = (
-                (prev_range[0].isoformat(), prev_range[1].isoformat()),
-                (curr_range[0].isoformat(), curr_range[1].isoformat())
-            )
-        if 'raw' in cache_data:
-            cache_data['raw'] = [
-                {**row, 'date': row['date'].isoformat() if hasattr(row.get('date'), 'isoformat') else row.get('date')}
-                for row in cache_data['raw']
-            ]
-        
-        repo = WeeklyStatusRepository()
-        repo.save_weekly_status(customer_id, start_date, end_date, json.dumps(cache_data, ensure_ascii=False))
+        repo = WeeklyAnalysisCacheRepository()
+        repo.save(customer_id, start_date, end_date, data_version, _encode_cached_status(result))
     except Exception:
         pass  # 캐시 저장 실패는 무시
 
@@ -313,400 +428,288 @@ def _parse_toilet_breakdown(text: Optional[str]) -> Dict[str, float]:
     return detail
 
 
-def _summarize_meal_details(df: pd.DataFrame) -> str:
-    """itertuples() 사용으로 성능 최적화"""
-    if df.empty:
-        return "-"
-    details = []
-    sorted_df = df.sort_values("date")
-    for row in sorted_df.itertuples(index=False):
-        detail = getattr(row, 'meal_detail', None)
-        if detail:
-            details.append(detail)
-    return " / ".join(details) if details else "-"
+# ─── 주간 추이 분석 (벡터화) ─────────────────────────────────────────────
+# 행마다 Series 를 만드는 apply/iterrows 대신, 텍스트 컬럼에서 특징 컬럼을 한 번에 뽑고
+# 주 구간(prev/curr)으로 groupby 한 뒤 NumPy 합계로 집계한다.
+# 특징 추출은 행 단위로 독립이므로 여러 수급자의 기록을 한 프레임으로 처리할 수 있다.
 
+MEAL_FIELDS = ("meal_breakfast", "meal_lunch", "meal_dinner")
+TOILET_KEYS = ("stool", "urine", "diaper")
+# 유형별 키워드 → 배설 구분. 한 번의 정규식 스캔으로 세 유형을 모두 찾는다.
+TOILET_KEYWORDS = {
+    "대변": "stool", "배변": "stool",
+    "소변": "urine", "배뇨": "urine",
+    "기저귀": "diaper", "교환": "diaper",
+}
+TOILET_PATTERN = r"(" + "|".join(TOILET_KEYWORDS) + r")\s*(\d+)\s*회"
+MEAL_TYPE_KEYWORDS = {
+    "일반식": ["일반식"],
+    "죽식": ["죽식"],
+    "다진식": ["다진식", "다짐식"],
+}
+MEAL_PORTION_MAP = {
+    "1/2이상": 0.75,
+    "1/2 이상": 0.75,
+    "1/2이하": 0.25,
+    "1/2 이하": 0.25,
+    "정량": 1.0,
+    "전량": 1.0,
+    "완식": 1.0,
+}
+NOTE_LABELS = {"physical": "신체", "cognitive": "인지", "nursing": "간호", "functional": "기능"}
+TREND_TEXT_COLUMNS = [field for field, _ in CATEGORIES.values()] + list(MEAL_FIELDS) + [
+    "toilet_care", "total_service_time", "prog_enhance_detail",
+]
+WEEK_PREV, WEEK_CURR = "prev", "curr"
 
-def _summarize_toilet_summary(df: pd.DataFrame) -> str:
-    if df.empty:
-        return "-"
-    total = {"stool": 0.0, "urine": 0.0, "diaper": 0.0}
-    for detail_map in df["toilet_detail"]:
-        if isinstance(detail_map, dict):
-            for key in total:
-                total[key] += detail_map.get(key, 0.0)
-    if not any(total.values()):
-        return "-"
-    return (
-        f"대변{int(total['stool'])}회/소변{int(total['urine'])}회 "
-        f"(기저귀교환{int(total['diaper'])}회)"
+
+def _contains_any(series: pd.Series, keywords: List[str]) -> np.ndarray:
+    return series.str.contains("|".join(re.escape(k) for k in keywords), regex=True).to_numpy()
+
+
+def _join_nonempty(parts: List[np.ndarray], sep: str) -> np.ndarray:
+    """행별로 빈 문자열이 아닌 값만 sep 로 연결 (object 배열)"""
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.where((result != "") & (part != ""), result + sep + part, result + part)
+    return result
+
+
+def _meal_features(meals: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """끼니 텍스트 (n, 3) → 행별 식사 상세 문자열과 식사유형별 섭취량 합
+
+    상세는 _detect_meal_type / _meal_amount_label 과 같은 규칙으로 '유형 (섭취량)' 을 잇고,
+    섭취량은 구분자(/ ,)로 나눈 조각마다 MEAL_PORTION_MAP 비율(기본 0.5)을 유형별로 더한다.
+    """
+    n = len(meals)
+    flat = pd.Series(meals.to_numpy(dtype=object).ravel())  # 행 우선: 0행 조·중·석, 1행 ...
+    meal_type = np.select(
+        [flat.str.contains(t, regex=False).to_numpy() for t in MEAL_TYPES],
+        MEAL_TYPES, default="미확인",
+    ).astype(object)
+    label = np.select(
+        [_contains_any(flat, keywords) for keywords, _ in MEAL_AMOUNT_RULES],
+        [label for _, (_, label) in MEAL_AMOUNT_RULES], default="정보없음",
+    ).astype(object)
+    texts = flat.to_numpy(dtype=object)
+    parts = np.where(texts != "", meal_type + " (" + label + ")", "").reshape(n, len(MEAL_FIELDS))
+    features = {"meal_detail": _join_nonempty(list(parts.T), " / ")}
+
+    segments = flat.str.split(r"[\/,]", regex=True).explode().str.strip()
+    segments = segments[segments != ""]
+    rows = segments.index.to_numpy(dtype=np.intp) // len(MEAL_FIELDS)
+    ratio = np.select(
+        [segments.str.contains(k, regex=False).to_numpy() for k in MEAL_PORTION_MAP],
+        list(MEAL_PORTION_MAP.values()), default=0.5,
     )
+    for meal_label, keywords in MEAL_TYPE_KEYWORDS.items():
+        features[meal_label] = np.bincount(
+            rows, weights=ratio * _contains_any(segments, keywords), minlength=n
+        )
+    return features
 
 
-def _merge_notes(df: pd.DataFrame, highlight: bool = False) -> List[str]:
-    """itertuples() 사용으로 성능 최적화"""
-    notes = []
-    # itertuples()는 iterrows()보다 10배 이상 빠름
-    for row in df.itertuples(index=False):
-        parts = []
-        physical_note = getattr(row, 'physical_note', None)
-        cognitive_note = getattr(row, 'cognitive_note', None)
-        nursing_note = getattr(row, 'nursing_note', None)
-        functional_note = getattr(row, 'functional_note', None)
-        row_date = getattr(row, 'date', None)
-        
-        if physical_note:
-            parts.append(f"신체: {physical_note}")
-        if cognitive_note:
-            parts.append(f"인지: {cognitive_note}")
-        if nursing_note:
-            parts.append(f"간호: {nursing_note}")
-        if functional_note:
-            parts.append(f"기능: {functional_note}")
-        if not parts:
-            continue
-        line = f"[{row_date.strftime('%m-%d')}] " + " / ".join(parts)
-        if highlight:
-            for kw in HIGHLIGHT_KEYWORDS:
-                if kw in line:
-                    line = line.replace(
-                        kw, f"<span style='background-color:#fff3cd;'>{kw}</span>"
-                    )
-        notes.append(line)
-    return notes
+def _toilet_features(toilet: pd.Series) -> Dict[str, np.ndarray]:
+    """배설 텍스트 → 유형별 'N회' 합 (_parse_toilet_breakdown 과 동일)"""
+    found = toilet.str.extractall(TOILET_PATTERN)
+    rows = found.index.get_level_values(0).to_numpy(dtype=np.intp)
+    kinds = found[0].map(TOILET_KEYWORDS).to_numpy()
+    counts = found[1].astype(float).to_numpy()
+    return {
+        key: np.bincount(rows[kinds == key], weights=counts[kinds == key], minlength=len(toilet))
+        for key in TOILET_KEYS
+    }
 
 
-def analyze_weekly_trend(
-    rows: List[Dict], prev_range: Tuple[date, date], curr_range: Tuple[date, date], customer_id: int
-) -> Dict:
-    """DataFrame 최적화 버전 - 메모리 효율화"""
-    if not rows:
-        return {}
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return {}
-    df["date"] = pd.to_datetime(df["date"]).dt.date
-    
-    # 메모리 최적화: category 타입 적용
-    df = _optimize_dataframe(df)
-
-    def _derive(row):
-        meals = [row.get("meal_breakfast"), row.get("meal_lunch"), row.get("meal_dinner")]
-        meal_types = [t for t in (_detect_meal_type(m) for m in meals) if t]
-        meal_type = meal_types[0] if meal_types else "미확인"
-        meal_scores = [_score_meal_amount(m or "") for m in meals if m is not None]
-        meal_amount_score = round(sum(meal_scores) / len(meal_scores), 2) if meal_scores else 0.0
-        meal_detail = []
-        for meal_text in meals:
-            if not meal_text:
-                continue
-            meal_detail.append(f"{_detect_meal_type(meal_text) or '미확인'} ({_meal_amount_label(meal_text)})")
-        toilet_count = _extract_toilet_count(row.get("toilet_care"))
-        toilet_detail = _parse_toilet_breakdown(row.get("toilet_care"))
-        return pd.Series(
-            {
-                "meal_type": meal_type,
-                "meal_amount_score": meal_amount_score,
-                "toilet_count": toilet_count,
-                "note_phy": row.get("physical_note"),
-                "note_nur": row.get("nursing_note"),
-                "meal_detail": " / ".join(meal_detail),
-                "toilet_detail": toilet_detail,
-            }
+def _weekly_trend_features(df: pd.DataFrame) -> pd.DataFrame:
+    """기록 프레임 → 행별 특징 컬럼 (메모/카테고리 항목, 식사·배설 수치, 출석, 프로그램)
+
+    행마다 독립적으로 계산하므로 여러 주·여러 수급자의 기록을 한 번에 넘겨도 된다.
+    반환 프레임은 0..n-1 위치 인덱스를 쓴다.
+    """
+    df = df.reset_index(drop=True)
+    texts = df.reindex(columns=TREND_TEXT_COLUMNS).astype(object)
+    texts = texts.where(texts.notna(), "").astype(str)
+    dates = pd.to_datetime(df["date"])
+    mmdd = dates.dt.strftime("%m-%d").to_numpy(dtype=object)
+    features: Dict[str, object] = {"date": dates.to_numpy(), "mmdd": mmdd}
+
+    # 메모: "[MM-DD] 신체: ... / 인지: ..." 와 카테고리별 "[MM-DD] 원문"
+    note_parts = []
+    for key, (field, _) in CATEGORIES.items():
+        text = texts[field].to_numpy(dtype=object)
+        features[f"entry_{key}"] = np.where(text != "", "[" + mmdd + "] " + text, "")
+        note_parts.append(np.where(text != "", f"{NOTE_LABELS[key]}: " + text, ""))
+    note = _join_nonempty(note_parts, " / ")
+    note = np.where(note != "", "[" + mmdd + "] " + note, "")
+    highlighted = pd.Series(note)
+    for kw in HIGHLIGHT_KEYWORDS:
+        highlighted = highlighted.str.replace(
+            kw, f"<span style='background-color:#fff3cd;'>{kw}</span>", regex=False
         )
+    features["note"] = note
+    features["note_highlight"] = highlighted.to_numpy()
+
+    features.update(_meal_features(texts[list(MEAL_FIELDS)]))
+    features.update(_toilet_features(texts["toilet_care"]))
+
+    service = texts["total_service_time"]
+    features["attended"] = ((service != "") & ~service.str.strip().isin(ABSENCE_STATUSES)).to_numpy()
+    features["prog"] = texts["prog_enhance_detail"].str.strip().to_numpy()
+    return pd.DataFrame(features)
+
+
+def _week_buckets(dates: pd.Series, prev_range: Tuple[date, date],
+                  curr_range: Tuple[date, date]) -> np.ndarray:
+    """날짜 → 'prev' / 'curr' / '' (두 주 밖)"""
+    return np.select(
+        [
+            dates.between(pd.Timestamp(prev_range[0]), pd.Timestamp(prev_range[1])).to_numpy(),
+            dates.between(pd.Timestamp(curr_range[0]), pd.Timestamp(curr_range[1])).to_numpy(),
+        ],
+        [WEEK_PREV, WEEK_CURR],
+        default="",
+    )
 
-    derived = df.apply(_derive, axis=1)
-    df = pd.concat([df, derived], axis=1)
 
-    prev_start, prev_end = prev_range
-    curr_start, curr_end = curr_range
-    last_week_df = df[
-        (df["date"] >= prev_start)
-        & (df["date"] <= prev_end)
-    ]
-    this_week_df = df[
-        (df["date"] >= curr_start)
-        & (df["date"] <= curr_end)
-    ]
+def _summarize_week(features: pd.DataFrame, positions: np.ndarray, highlight: bool = False) -> Dict:
+    """한 주 구간(특징 프레임의 행 위치들) → 메모 목록, 식사/배설 요약, 출석·합계"""
 
-    def _mode(series: pd.Series) -> str:
-        if series.empty:
-            return "-"
-        mode = series.mode()
-        return mode.iloc[0] if not mode.empty else "-"
+    def column(name: str) -> np.ndarray:
+        return features[name].to_numpy()[positions]
 
-    last_type = _mode(last_week_df["meal_type"])
-    this_type = _mode(this_week_df["meal_type"])
+    def nonempty(name: str) -> List[str]:
+        values = column(name)
+        return values[values != ""].tolist()
 
-    notes = {
-        "last": _merge_notes(last_week_df),
-        "this": _merge_notes(this_week_df, highlight=True),
-    }
+    notes = column("note_highlight" if highlight else "note")
+    notes = notes[column("note") != ""]
 
-    meal_detail_summary = {
-        "last": _summarize_meal_details(last_week_df),
-        "this": _summarize_meal_details(this_week_df),
-    }
-    toilet_detail_summary = {
-        "last": _summarize_toilet_summary(last_week_df),
-        "this": _summarize_toilet_summary(this_week_df),
+    by_date = positions[np.argsort(features["date"].to_numpy()[positions], kind="stable")]
+    meal_details = features["meal_detail"].to_numpy()[by_date]
+    meal_details = meal_details[meal_details != ""]
+
+    toilet = {key: float(column(key).sum()) for key in TOILET_KEYS}
+    if any(toilet.values()):
+        toilet_summary = (
+            f"대변{int(toilet['stool'])}회/소변{int(toilet['urine'])}회 "
+            f"(기저귀교환{int(toilet['diaper'])}회)"
+        )
+    else:
+        toilet_summary = "-"
+
+    prog = column("prog")
+    return {
+        "notes": notes.tolist(),
+        "meal_detail": " / ".join(meal_details) if len(meal_details) else "-",
+        "toilet_detail": toilet_summary,
+        "entries": {key: nonempty(f"entry_{key}") for key in CATEGORIES},
+        "attendance": int(column("attended").sum()),
+        "meals": {label: float(column(label).sum()) for label in MEAL_TYPE_KEYWORDS},
+        "toilet": toilet,
+        "prog_entries": [
+            {"date": d, "detail": detail}
+            for d, detail in zip(column("mmdd")[prog != ""], prog[prog != ""])
+        ],
     }
 
-    def _collect_category_entries(source_df: pd.DataFrame) -> Dict[str, List[str]]:
-        result: Dict[str, List[str]] = {}
-        for key, (field, label) in CATEGORIES.items():
-            result[key] = [
-                f"[{row['date'].strftime('%m-%d')}] {row[field]}"
-                for _, row in source_df.iterrows()
-                if row.get(field)
-            ]
-        return result
-
-    last_category_entries = _collect_category_entries(last_week_df)
-    this_category_entries = _collect_category_entries(this_week_df)
-
-    category_notes = {}
-    for key, (field, label) in CATEGORIES.items():
-        category_notes[key] = {"label": label, "entries": this_category_entries.get(key, [])}
-
-    def _format_entry_list(entries: List[str]) -> str:
-        return "\n".join(entries) if entries else "없음"
-
-    def _build_week_summary(
-        entries: Dict[str, List[str]],
-        attendance: int,
-        meal_values: Dict[str, float],
-        toilet_values: Dict[str, float],
-    ) -> Dict[str, object]:
-        return {
-            "physical": _format_entry_list(entries.get("physical", [])),
-            "cognitive": _format_entry_list(entries.get("cognitive", [])),
-            "nursing": _format_entry_list(entries.get("nursing", [])),
-            "functional": _format_entry_list(entries.get("functional", [])),
-            "attendance": attendance,
-            "meals": {
-                "일반식": meal_values["일반식"],
-                "죽식": meal_values["죽식"],
-                "다진식": meal_values["다진식"],
-            },
-            "toilet": {
-                "소변": toilet_values["urine"],
-                "대변": toilet_values["stool"],
-                "기저귀교환": toilet_values["diaper"],
-            },
-        }
 
-    def _latest_text_value(source_df: pd.DataFrame, column: str) -> str:
-        if source_df.empty or column not in source_df:
-            return "-"
-        values = [
-            str(value).strip()
-            for value in source_df[column]
-            if value is not None and str(value).strip()
-        ]
-        return values[-1] if values else "-"
+_NO_ROWS = np.array([], dtype=np.intp)
 
-    MEAL_TYPE_KEYWORDS = {
-        "일반식": ["일반식"],
-        "죽식": ["죽식"],
-        "다진식": ["다진식", "다짐식"],
-    }
 
-    MEAL_PORTION_MAP = {
-        "1/2이상": 0.75,
-        "1/2 이상": 0.75,
-        "1/2이하": 0.25,
-        "1/2 이하": 0.25,
-        "정량": 1.0,
-        "전량": 1.0,
-        "완식": 1.0,
-    }
+def _trend_from_features(features: pd.DataFrame, weeks: Dict[str, np.ndarray],
+                         previous_weekly_report: Optional[str]) -> Dict:
+    """특징 프레임 + 주 구간별 행 위치 ({'prev': ..., 'curr': ...}) → 추이 분석 결과"""
+    last = _summarize_week(features, weeks.get(WEEK_PREV, _NO_ROWS))
+    this = _summarize_week(features, weeks.get(WEEK_CURR, _NO_ROWS), highlight=True)
+    return _build_trend_result(last, this, previous_weekly_report)
 
-    def _extract_meal_type_amounts(text: Optional[str]) -> Dict[str, float]:
-        totals = {key: 0.0 for key in MEAL_TYPE_KEYWORDS}
-        if not text:
-            return totals
-        segments = [seg.strip() for seg in re.split(r"[\/,]", text) if seg.strip()]
-        for segment in segments:
-            ratio = 0.5
-            for keyword, value in MEAL_PORTION_MAP.items():
-                if keyword in segment:
-                    ratio = value
-                    break
-            matched = False
-            for type_label, keywords in MEAL_TYPE_KEYWORDS.items():
-                if any(keyword in segment for keyword in keywords):
-                    totals[type_label] += ratio
-                    matched = True
-            if not matched and "일반식" in segment:
-                totals["일반식"] += ratio
-        return totals
-
-    def _average_toilet_breakdown(source_df: pd.DataFrame) -> Optional[Dict[str, float]]:
-        if source_df.empty:
-            return None
-        total = {"stool": 0.0, "urine": 0.0, "diaper": 0.0}
-        count = 0
-        for detail in source_df.get("toilet_detail", []):
-            if not isinstance(detail, dict):
-                continue
-            count += 1
-            for key in total:
-                total[key] += detail.get(key, 0.0)
-        if count == 0:
-            return None
-        return {key: round(total[key] / count, 1) for key in total}
-
-    def _format_toilet_value(detail: Optional[Dict[str, float]], key: str) -> str:
-        if not detail:
-            return "-"
-        value = detail.get(key)
-        if value is None:
-            return "-"
-        if float(value).is_integer():
-            formatted = f"{int(value)}"
-        else:
-            formatted = f"{value:.1f}"
-        return f"{formatted}회"
-
-    def _sum_toilet_counts(source_df: pd.DataFrame) -> Dict[str, float]:
-        total = {"stool": 0.0, "urine": 0.0, "diaper": 0.0}
-        for detail in source_df.get("toilet_detail", []):
-            if not isinstance(detail, dict):
-                continue
-            for key in total:
-                total[key] += detail.get(key, 0.0)
-        return total
-
-    def _format_total(value: float) -> str:
-        if value is None:
-            return "-"
-        if float(value).is_integer():
-            return f"{int(value)}"
-        return f"{value:.1f}"
-
-    def _sum_meals(source_df: pd.DataFrame) -> Dict[str, float]:
-        totals = {key: 0.0 for key in MEAL_TYPE_KEYWORDS}
-        meal_fields = ["meal_breakfast", "meal_lunch", "meal_dinner"]
-        for _, row in source_df.iterrows():
-            for field in meal_fields:
-                parsed = _extract_meal_type_amounts(row.get(field))
-                for meal_type, value in parsed.items():
-                    totals[meal_type] += value
-        return totals
-
-    def _is_attended(total_service_time: Optional[str]) -> bool:
-        if not total_service_time:
-            return False
-        normalized = str(total_service_time).strip()
-        return normalized not in ABSENCE_STATUSES
-
-    def _count_attendance(source_df: pd.DataFrame) -> int:
-        if source_df.empty or "total_service_time" not in source_df:
-            return 0
-        return sum(
-            1
-            for value in source_df["total_service_time"]
-            if _is_attended(value)
-        )
 
-    last_toilet_totals = _sum_toilet_counts(last_week_df)
-    this_toilet_totals = _sum_toilet_counts(this_week_df)
-    last_meals = _sum_meals(last_week_df)
-    this_meals = _sum_meals(this_week_df)
-    attendance_prev = _count_attendance(last_week_df)
-    attendance_curr = _count_attendance(this_week_df)
+def _format_total(value: float) -> str:
+    if value is None:
+        return "-"
+    if float(value).is_integer():
+        return f"{int(value)}"
+    return f"{value:.1f}"
 
-    def _sum_totals(values: Dict[str, float]) -> float:
-        return sum(values.values())
 
-    last_meal_total = _sum_totals(last_meals)
-    this_meal_total = _sum_totals(this_meals)
-    last_toilet_total = _sum_totals(last_toilet_totals)
-    this_toilet_total = _sum_totals(this_toilet_totals)
+def _ratio(total: float, count: int) -> Optional[float]:
+    if count <= 0:
+        return None
+    return total / count
 
-    def _ratio(total: float, count: int) -> Optional[float]:
-        if count <= 0:
-            return None
-        return total / count
 
-    meal_ratio_prev = _ratio(last_meal_total, attendance_prev)
-    meal_ratio_curr = _ratio(this_meal_total, attendance_curr)
-    toilet_ratio_prev = _ratio(last_toilet_total, attendance_prev)
-    toilet_ratio_curr = _ratio(this_toilet_total, attendance_curr)
+def _percent_change(prev: Optional[float], curr: Optional[float]) -> Optional[float]:
+    if prev is None or prev == 0 or curr is None:
+        return None
+    return round((curr - prev) / prev * 100, 1)
 
-    def _percent_change(prev: Optional[float], curr: Optional[float]) -> Optional[float]:
-        if prev is None or prev == 0 or curr is None:
-            return None
-        return round((curr - prev) / prev * 100, 1)
 
-    meal_percent_change = _percent_change(meal_ratio_prev, meal_ratio_curr)
-    toilet_percent_change = _percent_change(toilet_ratio_prev, toilet_ratio_curr)
+def _change_label(percent: Optional[float]) -> str:
+    if percent is None:
+        return "데이터 부족"
+    if percent > 0:
+        return f"{percent:.1f}% 상승"
+    if percent < 0:
+        return f"{abs(percent):.1f}% 하락"
+    return "변화 없음"
 
-    def _change_label(percent: Optional[float]) -> str:
-        if percent is None:
-            return "데이터 부족"
-        if percent > 0:
-            return f"{percent:.1f}% 상승"
-        if percent < 0:
-            return f"{abs(percent):.1f}% 하락"
-        return "변화 없음"
-
-    def _format_attendance_summary(
-        entries: Dict[str, List[str]],
-        attendance: int,
-        meal_values: Dict[str, float],
-        toilet_values: Dict[str, float],
-    ) -> Dict[str, object]:
-        def _format_entries(key: str) -> str:
-            items = entries.get(key, [])
-            return "\n".join(items) if items else "없음"
-
-        return {
-            "physical": _format_entries("physical"),
-            "cognitive": _format_entries("cognitive"),
-            "nursing": _format_entries("nursing"),
-            "functional": _format_entries("functional"),
-            "attendance": attendance,
-            "meals": {
-                "일반식": meal_values["일반식"],
-                "죽식": meal_values["죽식"],
-                "다진식": meal_values["다진식"],
-            },
-            "toilet": {
-                "소변": toilet_values["urine"],
-                "대변": toilet_values["stool"],
-                "기저귀교환": toilet_values["diaper"],
-            },
-        }
 
-    def _calc_total_meal(values: Dict[str, float]) -> float:
-        return sum(values.values())
+def _format_attendance_summary(week: Dict) -> Dict[str, object]:
+    entries, meals, toilet = week["entries"], week["meals"], week["toilet"]
+    return {
+        **{key: "\n".join(entries[key]) if entries[key] else "없음" for key in CATEGORIES},
+        "attendance": week["attendance"],
+        "meals": {label: meals[label] for label in MEAL_TYPE_KEYWORDS},
+        "toilet": {
+            "소변": toilet["urine"],
+            "대변": toilet["stool"],
+            "기저귀교환": toilet["diaper"],
+        },
+    }
+
+
+def _weekly_table_row(label: str, week: Dict) -> Dict[str, object]:
+    meals, toilet = week["meals"], week["toilet"]
+    return {
+        "주간": label,
+        "출석일": week["attendance"],
+        "식사량(일반식)": _format_total(meals["일반식"]),
+        "식사량(죽식)": _format_total(meals["죽식"]),
+        "식사량(다진식)": _format_total(meals["다진식"]),
+        "소변": f"{_format_total(toilet['urine'])}회",
+        "대변": f"{_format_total(toilet['stool'])}회",
+        "기저귀교환": f"{_format_total(toilet['diaper'])}회",
+    }
+
+
+def _build_trend_result(last: Dict, this: Dict, previous_weekly_report: Optional[str]) -> Dict:
+    """주간 요약 두 개 → 화면/AI 용 결과 (header, weekly_table, ai_payload 등)"""
+    last_meal_total = sum(last["meals"].values())
+    this_meal_total = sum(this["meals"].values())
+    last_toilet_total = sum(last["toilet"].values())
+    this_toilet_total = sum(this["toilet"].values())
+
+    meal_ratio_prev = _ratio(last_meal_total, last["attendance"])
+    meal_ratio_curr = _ratio(this_meal_total, this["attendance"])
+    toilet_ratio_prev = _ratio(last_toilet_total, last["attendance"])
+    toilet_ratio_curr = _ratio(this_toilet_total, this["attendance"])
+    meal_percent_change = _percent_change(meal_ratio_prev, meal_ratio_curr)
+    toilet_percent_change = _percent_change(toilet_ratio_prev, toilet_ratio_curr)
 
     change_payload = {
-        "meal": _format_total(this_meal_total - last_meal_total) if last_meal_total is not None else "-",
-        "toilet": _format_total(this_toilet_total - last_toilet_total) if last_toilet_total is not None else "-",
+        "meal": _format_total(this_meal_total - last_meal_total),
+        "toilet": _format_total(this_toilet_total - last_toilet_total),
         "toilet_breakdown": {
-            "소변": _format_total(this_toilet_totals["urine"] - last_toilet_totals["urine"]),
-            "대변": _format_total(this_toilet_totals["stool"] - last_toilet_totals["stool"]),
-            "기저귀교환": _format_total(this_toilet_totals["diaper"] - last_toilet_totals["diaper"]),
+            "소변": _format_total(this["toilet"]["urine"] - last["toilet"]["urine"]),
+            "대변": _format_total(this["toilet"]["stool"] - last["toilet"]["stool"]),
+            "기저귀교환": _format_total(this["toilet"]["diaper"] - last["toilet"]["diaper"]),
         },
     }
 
-    # AI 참조용 이전 주간 보고서 로드 (리포지토리 사용)
-    weekly_status_repo = WeeklyStatusRepository()
-    previous_weekly_report = weekly_status_repo.load_weekly_status(
-        customer_id=customer_id,
-        start_date=prev_range[0],
-        end_date=prev_range[1],
-    )
-
     ai_payload = {
-        "current_week": _format_attendance_summary(
-            this_category_entries, attendance_curr, this_meals, this_toilet_totals
-        ),
-        "previous_week": _format_attendance_summary(
-            last_category_entries, attendance_prev, last_meals, last_toilet_totals
-        ),
+        "current_week": _format_attendance_summary(this),
+        "previous_week": _format_attendance_summary(last),
         "per_attendance": {
             "meal_avg_prev": meal_ratio_prev,
             "meal_avg_curr": meal_ratio_curr,
@@ -721,29 +724,6 @@ def analyze_weekly_trend(
         "previous_weekly_report": previous_weekly_report or "없음",
     }
 
-    weekly_table = [
-        {
-            "주간": "지난주",
-            "출석일": attendance_prev,
-            "식사량(일반식)": _format_total(last_meals["일반식"]),
-            "식사량(죽식)": _format_total(last_meals["죽식"]),
-            "식사량(다진식)": _format_total(last_meals["다진식"]),
-            "소변": f"{_format_total(last_toilet_totals['urine'])}회",
-            "대변": f"{_format_total(last_toilet_totals['stool'])}회",
-            "기저귀교환": f"{_format_total(last_toilet_totals['diaper'])}회",
-        },
-        {
-            "주간": "이번주",
-            "출석일": attendance_curr,
-            "식사량(일반식)": _format_total(this_meals["일반식"]),
-            "식사량(죽식)": _format_total(this_meals["죽식"]),
-            "식사량(다진식)": _format_total(this_meals["다진식"]),
-            "소변": f"{_format_total(this_toilet_totals['urine'])}회",
-            "대변": f"{_format_total(this_toilet_totals['stool'])}회",
-            "기저귀교환": f"{_format_total(this_toilet_totals['diaper'])}회",
-        },
-    ]
-
     header = {
         "meal_amount": {
             "label": "식사량",
@@ -761,27 +741,59 @@ def analyze_weekly_trend(
         },
     }
 
-    def _get_prog_entries(source_df: pd.DataFrame) -> List[Dict]:
-        entries = []
-        if source_df.empty or "prog_enhance_detail" not in source_df.columns:
-            return entries
-        for _, row in source_df.iterrows():
-            detail = row.get("prog_enhance_detail")
-            if detail and str(detail).strip():
-                entries.append({
-                    "date": row["date"].strftime("%m-%d"),
-                    "detail": str(detail).strip(),
-                })
-        return entries
-
     return {
         "header": header,
-        "notes": notes,
-        "meal_detail": meal_detail_summary,
-        "toilet_detail": toilet_detail_summary,
-        "weekly_table": weekly_table,
-        "category_notes": category_notes,
+        "notes": {"last": last["notes"], "this": this["notes"]},
+        "meal_detail": {"last": last["meal_detail"], "this": this["meal_detail"]},
+        "toilet_detail": {"last": last["toilet_detail"], "this": this["toilet_detail"]},
+        "weekly_table": [_weekly_table_row("지난주", last), _weekly_table_row("이번주", this)],
+        "category_notes": {
+            key: {"label": label, "entries": this["entries"][key]}
+            for key, (_, label) in CATEGORIES.items()
+        },
         "ai_payload": ai_payload,
-        "prev_prog_entries": _get_prog_entries(last_week_df),
-        "curr_prog_entries": _get_prog_entries(this_week_df),
+        "prev_prog_entries": last["prog_entries"],
+        "curr_prog_entries": this["prog_entries"],
+    }
+
+
+def _analyze_weekly_trends(rows_by_customer: Dict[int, List[Dict]], prev_range: Tuple[date, date],
+                           curr_range: Tuple[date, date],
+                           previous_reports: Dict[int, Optional[str]]) -> Dict[int, Dict]:
+    """여러 수급자의 추이 분석 (특징 추출 1회 → (수급자, 주 구간) groupby). 기록 없는 수급자는 제외"""
+    rows_by_customer = {cid: rows for cid, rows in rows_by_customer.items() if rows}
+    if not rows_by_customer:
+        return {}
+    customer_keys = np.repeat(list(rows_by_customer), [len(rows) for rows in rows_by_customer.values()])
+    features = _weekly_trend_features(
+        pd.DataFrame([row for rows in rows_by_customer.values() for row in rows])
+    )
+    buckets = _week_buckets(features["date"], prev_range, curr_range)
+    groups = features.groupby([customer_keys, buckets]).indices
+    return {
+        cid: _trend_from_features(
+            features,
+            {week: groups[(cid, week)] for week in (WEEK_PREV, WEEK_CURR) if (cid, week) in groups},
+            previous_reports.get(cid),
+        )
+        for cid in rows_by_customer
     }
+
+
+def analyze_weekly_trend(
+    rows: List[Dict], prev_range: Tuple[date, date], curr_range: Tuple[date, date], customer_id: int
+) -> Dict:
+    """지난주/이번주 추이 분석 (특징 컬럼 일괄 추출 → 주 구간 groupby 집계)"""
+    if not rows:
+        return {}
+
+    # AI 참조용 이전 주간 보고서 로드 (리포지토리 사용)
+    weekly_status_repo = WeeklyStatusRepository()
+    previous_weekly_report = weekly_status_repo.load_weekly_status(
+        customer_id=customer_id,
+        start_date=prev_range[0],
+        end_date=prev_range[1],
+    )
+    return _analyze_weekly_trends(
+        {customer_id: rows}, prev_range, curr_range, {customer_id: previous_weekly_report}
+    )[customer_id]
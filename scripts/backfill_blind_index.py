@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+암호화된 customers/users 행에 블라인드 인덱스(name_bidx 등)와 검색 토큰을 백필하는 스크립트.
+
+blind_index.sql 로 컬럼/테이블을 만든 뒤 한 번 실행한다. 이미 인덱스가 있는 행도
+다시 계산해 덮어쓰므로 BLIND_INDEX_KEY 를 바꾼 뒤 재실행하면 전체가 재색인된다.
+
+사용법:
+  python scripts/backfill_blind_index.py --dry-run           # 미리보기 (변경 없음)
+  python scripts/backfill_blind_index.py --table customers   # customers만
+  python scripts/backfill_blind_index.py --only-missing      # name_bidx 가 비어 있는 행만
+  python scripts/backfill_blind_index.py                     # 전체 (DDL + customers + users)
+
+환경변수:
+  ENCRYPTION_KEY   — Fernet 키 (필수, 복호화용)
+  BLIND_INDEX_KEY  — HMAC 키 (선택, 미설정 시 ENCRYPTION_KEY 에서 파생)
+  DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트의 .env 자동 로드
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+import mysql.connector
+
+from backend.encryption import EncryptionService, blind_index
+from modules.repositories.customer import customer_index_values
+from modules.repositories.pii_index import ENTITY_USER, bulk_replace_search_tokens, entity_tokens
+
+BATCH_SIZE = 200
+
+TABLES = {
+    "customers": {
+        "entity": "customer",
+        "select": "SELECT customer_id AS id, name, recognition_no FROM customers",
+        "id_column": "customer_id",
+    },
+    "users": {
+        "entity": ENTITY_USER,
+        "select": "SELECT user_id AS id, name FROM users",
+        "id_column": "user_id",
+    },
+}
+
+
+def _require_env(name: str) -> str:
+    val = os.getenv(name)
+    if not val:
+        print(f"[ERROR] 환경변수 {name} 가 설정되지 않았습니다.", file=sys.stderr)
+        sys.exit(1)
+    return val
+
+
+def _get_db_conn():
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("DB_PASSWORD", ""),
+        database=os.getenv("DB_NAME", "arisa"),
+        port=int(os.getenv("DB_PORT", "3306")),
+        charset="utf8mb4",
+    )
+
+
+def _index_row(table: str, enc: EncryptionService, row: dict):
+    """행 → (UPDATE SET 값 dict, 검색 토큰 집합). 평문 행도 safe_decrypt 로 그대로 처리."""
+    name = enc.safe_decrypt(str(row["name"])) if row.get("name") is not None else None
+    if table == "customers":
+        recognition_no = row.get("recognition_no")
+        if recognition_no is not None:
+            recognition_no = enc.safe_decrypt(str(recognition_no))
+        index = customer_index_values(name, recognition_no)
+        return (
+            {"name_bidx": index["name_bidx"], "recognition_no_bidx": index["recognition_no_bidx"]},
+            index["tokens"],
+        )
+    return (
+        {"name_bidx": blind_index(name, "user.name")},
+        entity_tokens(ENTITY_USER, {"name": name}),
+    )
+
+
+def _flush(conn, table: str, pending: list):
+    """배치 단위로 인덱스 컬럼 UPDATE + 토큰 교체를 한 트랜잭션에서 실행."""
+    spec = TABLES[table]
+    cursor = conn.cursor()
+    try:
+        for row_id, values, _ in pending:
+            set_clause = ", ".join(f"{c}=%s" for c in values)
+            cursor.execute(
+                f"UPDATE {table} SET {set_clause} WHERE {spec['id_column']}=%s",
+                (*values.values(), row_id),
+            )
+        bulk_replace_search_tokens(
+            cursor, spec["entity"], {row_id: tokens for row_id, _, tokens in pending}
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _backfill(conn, table: str, enc: EncryptionService, dry_run: bool, only_missing: bool):
+    spec = TABLES[table]
+    query = spec["select"]
+    if only_missing:
+        query += " WHERE name_bidx IS NULL"
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(query)
+    rows = cursor.fetchall()
+    cursor.close()
+
+    total = len(rows)
+    updated = 0
+    errors = 0
+    pending = []
+
+    for i, row in enumerate(rows, 1):
+        try:
+            values, tokens = _index_row(table, enc, row)
+            if dry_run:
+                print(f"  [DRY-RUN] {table} id={row['id']} 색인 예정: 토큰 {len(tokens)}개")
+            else:
+                pending.append((row["id"], values, tokens))
+            updated += 1
+        except Exception as e:
+            print(f"  [WARN] {table} id={row['id']} 오류 — {e}")
+            errors += 1
+
+        if pending and (len(pending) >= BATCH_SIZE or i == total):
+            try:
+                _flush(conn, table, pending)
+            except mysql.connector.Error as e:
+                print(f"  [WARN] {table} 배치 저장 실패 ({len(pending)}건) — {e}")
+                updated -= len(pending)
+                errors += len(pending)
+            pending = []
+
+        if i % 500 == 0 or i == total:
+            print(f"  {table} 진행: {i}/{total} (색인={updated}, 오류={errors})")
+
+    return updated, errors
+
+
+def _run_ddl(conn):
+    ddl_path = os.path.join(os.path.dirname(__file__), "blind_index.sql")
+    with open(ddl_path, encoding="utf-8") as f:
+        sql = f.read()
+
+    cursor = conn.cursor()
+    for statement in sql.split(";"):
+        # 주석 줄 제거 후 실행
+        stmt = "\n".join(
+            line for line in statement.splitlines() if not line.strip().startswith("--")
+        ).strip()
+        if stmt:
+            try:
+                cursor.execute(stmt)
+                conn.commit()
+            except mysql.connector.Error as e:
+                # 이미 추가된 컬럼/인덱스 등 무시 가능한 오류
+                print(f"  [DDL WARN] {e}")
+    cursor.close()
+    print("[INFO] DDL 실행 완료.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PII 블라인드 인덱스 백필")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 미리보기")
+    parser.add_argument(
+        "--table",
+        choices=["customers", "users", "all"],
+        default="all",
+        help="백필 대상 테이블 (기본: all)",
+    )
+    parser.add_argument("--only-missing", action="store_true", help="name_bidx 가 없는 행만 처리")
+    parser.add_argument("--skip-ddl", action="store_true", help="blind_index.sql DDL 실행 건너뜀")
+    args = parser.parse_args()
+
+    _require_env("ENCRYPTION_KEY")
+    enc = EncryptionService()
+
+    print(f"[INFO] 대상: {args.table} | dry-run: {args.dry_run} | only-missing: {args.only_missing}")
+
+    conn = _get_db_conn()
+    print("[INFO] DB 연결 성공.")
+
+    if not args.dry_run and not args.skip_ddl:
+        print("[INFO] DDL 실행 중 (블라인드 인덱스 컬럼 + pii_search_tokens 테이블)...")
+        _run_ddl(conn)
+
+    results = {}
+    for table in ("customers", "users"):
+        if args.table in (table, "all"):
+            print(f"\n[INFO] {table} 백필 시작...")
+            results[table] = _backfill(conn, table, enc, args.dry_run, args.only_missing)
+
+    conn.close()
+
+    print("\n── 최종 보고 ─────────────────────────────────────────────")
+    for table, (updated, errors) in results.items():
+        mode = "예정" if args.dry_run else "완료"
+        print(f"  {table}: 색인 {mode} {updated}건 / 오류 {errors}건")
+    print("──────────────────────────────────────────────────────────")
+
+
+if __name__ == "__main__":
+    main()
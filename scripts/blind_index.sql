@@ -0,0 +1,21 @@
+-- 암호화 PII 검색용 블라인드 인덱스 (HMAC-SHA256 앞 32자)
+-- 적용 후 python scripts/backfill_blind_index.py 로 기존 행 백필
+
+ALTER TABLE customers
+  ADD COLUMN name_bidx           CHAR(32) NULL,
+  ADD COLUMN recognition_no_bidx CHAR(32) NULL,
+  ADD INDEX idx_customers_name_bidx (name_bidx),
+  ADD INDEX idx_customers_recognition_no_bidx (recognition_no_bidx);
+
+ALTER TABLE users
+  ADD COLUMN name_bidx CHAR(32) NULL,
+  ADD INDEX idx_users_name_bidx (name_bidx);
+
+-- 키워드(부분 문자열) 검색 토큰: entity = 'customer' | 'user'
+CREATE TABLE IF NOT EXISTS pii_search_tokens (
+  entity    VARCHAR(16) NOT NULL,
+  entity_id INT         NOT NULL,
+  token     CHAR(32)    NOT NULL,
+  PRIMARY KEY (entity, token, entity_id),
+  INDEX idx_pii_tokens_entity (entity, entity_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
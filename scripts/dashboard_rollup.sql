@@ -0,0 +1,21 @@
+-- 대시보드 KPI용 일별 집계 테이블 (modules/repositories/dashboard_rollup.py 가 유지)
+-- 적용 후 python scripts/rebuild_dashboard_rollup.py 로 기존 데이터 집계
+-- 등급/카테고리/유형 NULL 은 '' 로 저장
+
+CREATE TABLE IF NOT EXISTS rollup_ai_grade_daily (
+  date       DATE        NOT NULL,
+  category   VARCHAR(20) NOT NULL DEFAULT '',
+  grade_code VARCHAR(10) NOT NULL DEFAULT '',
+  cnt        INT         NOT NULL,
+  PRIMARY KEY (date, category, grade_code)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS rollup_emp_eval_daily (
+  date            DATE        NOT NULL,
+  target_user_id  INT         NOT NULL,
+  category        VARCHAR(50) NOT NULL DEFAULT '',
+  evaluation_type VARCHAR(20) NOT NULL DEFAULT '',
+  cnt             INT         NOT NULL,
+  PRIMARY KEY (date, target_user_id, category, evaluation_type),
+  INDEX idx_rollup_emp_eval_user (target_user_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+LLM 응답 캐시 조회/정리 스크립트.
+
+사용법:
+  python scripts/llm_cache.py stats                      # 항목 수/용량, 용도별 호출·적중·비용·지연
+  python scripts/llm_cache.py stats --days 7             # 최근 7일 호출만 집계
+  python scripts/llm_cache.py purge --all                # 응답/호출 기록 전체 삭제
+  python scripts/llm_cache.py purge --older-than-days 7  # 7일 이상 미사용 응답 삭제
+
+환경변수:
+  LLM_CACHE_DIR       — 캐시 디렉토리 (기본: <tmp>/arisa_store)
+  LLM_CACHE_MAX_MB    — 최대 용량 MB (기본: 64, 0이면 비활성)
+  LLM_CACHE_TTL_DAYS  — 응답 보관 기간 (기본: 30)
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트의 .env 자동 로드
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from modules.clients.llm_cache import LLMCache
+
+
+def _fmt_size(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f} MB"
+
+
+def _cmd_stats(cache: LLMCache, args) -> None:
+    stats = cache.stats(since_seconds=args.days * 86400 if args.days else None)
+    print(f"[INFO] 경로: {stats['path']}")
+    print(f"  응답: {stats['entries']}건 / {_fmt_size(stats['size_bytes'])} (상한 {_fmt_size(stats['max_bytes'])})")
+    print(f"  {'용도':<14} {'호출':>6} {'적중':>6} {'비용($)':>10} {'절감($)':>10} {'평균지연(ms)':>12}")
+    for purpose, v in sorted(stats["by_purpose"].items()):
+        latency = f"{v['avg_latency_ms']:.0f}" if v["avg_latency_ms"] is not None else "-"
+        print(
+            f"  {purpose:<14} {v['calls']:>6} {v['cached']:>6} "
+            f"{v['cost_usd']:>10.4f} {v['saved_usd']:>10.4f} {latency:>12}"
+        )
+
+
+def _cmd_purge(cache: LLMCache, args) -> None:
+    if args.all:
+        removed = cache.purge()
+    elif args.older_than_days is not None:
+        removed = cache.purge(older_than_seconds=args.older_than_days * 86400)
+    else:
+        print("[ERROR] --all, --older-than-days 중 하나를 지정하세요.", file=sys.stderr)
+        sys.exit(1)
+    print(f"[INFO] {removed}건 삭제 완료.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 응답 캐시 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_stats = sub.add_parser("stats", help="캐시/호출 요약")
+    p_stats.add_argument("--days", type=float, help="최근 N일 호출만 집계")
+
+    p_purge = sub.add_parser("purge", help="캐시 삭제")
+    p_purge.add_argument("--all", action="store_true", help="응답/호출 기록 전체 삭제")
+    p_purge.add_argument("--older-than-days", type=float, help="N일 이상 미사용 응답 삭제")
+
+    args = parser.parse_args()
+    cache = LLMCache()
+
+    {"stats": _cmd_stats, "purge": _cmd_purge}[args.command](cache, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+PDF 파싱 결과 캐시 조회/정리 스크립트.
+
+사용법:
+  python scripts/parse_cache.py stats                      # 항목 수/용량 요약
+  python scripts/parse_cache.py list --limit 20            # 최근 접근 항목 목록
+  python scripts/parse_cache.py purge --all                # 전체 삭제
+  python scripts/parse_cache.py purge --older-than-days 7  # 7일 이상 미사용 항목 삭제
+  python scripts/parse_cache.py purge --stale-versions     # 현재 파서 버전이 아닌 항목 삭제
+
+환경변수:
+  PARSE_CACHE_DIR     — 캐시 디렉토리 (기본: <tmp>/arisa_parse_cache)
+  PARSE_CACHE_MAX_MB  — 최대 용량 MB (기본: 256, 0이면 비활성)
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트의 .env 자동 로드
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from modules.parse_cache import ParseCache
+from modules.pdf_parser import PARSER_VERSION
+
+
+def _fmt_size(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f} MB"
+
+
+def _fmt_time(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _cmd_stats(cache: ParseCache, args) -> None:
+    stats = cache.stats()
+    print(f"[INFO] 경로: {stats['path']}")
+    print(f"[INFO] 파서 버전: {PARSER_VERSION}")
+    print(f"  전체: {stats['entries']}건 / {_fmt_size(stats['size_bytes'])} (상한 {_fmt_size(stats['max_bytes'])})")
+    for kind, v in sorted(stats["by_kind"].items()):
+        print(f"  {kind}: {v['entries']}건 / {_fmt_size(v['size_bytes'])} / 적중 {v['hits']}회")
+
+
+def _cmd_list(cache: ParseCache, args) -> None:
+    for entry in cache.list_entries(limit=args.limit):
+        print(
+            f"  {entry['cache_key'][:40]}…  {entry['size_bytes']:>10,} B  "
+            f"적중 {entry['hits']:>4}  최근 {_fmt_time(entry['accessed_at'])}"
+        )
+
+
+def _cmd_purge(cache: ParseCache, args) -> None:
+    if args.all:
+        removed = cache.purge()
+    elif args.older_than_days is not None:
+        removed = cache.purge(older_than_seconds=args.older_than_days * 86400)
+    elif args.stale_versions:
+        removed = cache.purge(exclude_version=PARSER_VERSION)
+    else:
+        print("[ERROR] --all, --older-than-days, --stale-versions 중 하나를 지정하세요.", file=sys.stderr)
+        sys.exit(1)
+    print(f"[INFO] {removed}건 삭제 완료.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 파싱 결과 캐시 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="캐시 요약")
+
+    p_list = sub.add_parser("list", help="최근 접근 항목 목록")
+    p_list.add_argument("--limit", type=int, default=50, help="출력 항목 수 (기본: 50)")
+
+    p_purge = sub.add_parser("purge", help="캐시 삭제")
+    p_purge.add_argument("--all", action="store_true", help="전체 삭제")
+    p_purge.add_argument("--older-than-days", type=float, help="N일 이상 미사용 항목 삭제")
+    p_purge.add_argument("--stale-versions", action="store_true", help="현재 파서 버전이 아닌 항목 삭제")
+
+    args = parser.parse_args()
+    cache = ParseCache()
+
+    {"stats": _cmd_stats, "list": _cmd_list, "purge": _cmd_purge}[args.command](cache, args)
+
+
+if __name__ == "__main__":
+    main()
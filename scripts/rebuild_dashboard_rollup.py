@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+대시보드 일별 집계 테이블(rollup_ai_grade_daily, rollup_emp_eval_daily)을 원본에서 재구축하는 스크립트.
+
+dashboard_rollup.sql 로 테이블을 만든 직후 한 번 실행한다. 평소에는 저장/삭제 시 같은
+트랜잭션에서 해당 날짜만 갱신되므로 필요 없고, 원본을 직접 수정했거나 집계가 어긋났을 때 다시 실행한다.
+
+사용법:
+  python scripts/rebuild_dashboard_rollup.py                                  # 전체 (DDL + 전체 기간)
+  python scripts/rebuild_dashboard_rollup.py --start 2025-11-01 --end 2025-11-30  # 기간만
+  python scripts/rebuild_dashboard_rollup.py --skip-ddl
+
+환경변수:
+  DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+
+# 프로젝트 루트의 .env 자동 로드
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+except ImportError:
+    pass
+
+# 프로젝트 루트를 sys.path에 추가
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from modules.db_connection import db_transaction
+from modules.repositories.dashboard_rollup import rebuild_rollups
+
+
+def _run_ddl():
+    ddl_path = os.path.join(os.path.dirname(__file__), "dashboard_rollup.sql")
+    with open(ddl_path, encoding="utf-8") as f:
+        sql = f.read()
+
+    with db_transaction() as cursor:
+        for statement in sql.split(";"):
+            # 주석 줄 제거 후 실행
+            stmt = "\n".join(
+                line for line in statement.splitlines() if not line.strip().startswith("--")
+            ).strip()
+            if stmt:
+                cursor.execute(stmt)
+    print("[INFO] DDL 실행 완료.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 집계 테이블 재구축")
+    parser.add_argument("--start", type=date.fromisoformat, help="시작일 (YYYY-MM-DD, 기본: 원본 최소일)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료일 (YYYY-MM-DD, 기본: 원본 최대일)")
+    parser.add_argument("--skip-ddl", action="store_true", help="dashboard_rollup.sql DDL 실행 건너뜀")
+    args = parser.parse_args()
+
+    if args.start and args.end and args.start > args.end:
+        print("[ERROR] --start 가 --end 보다 늦습니다.", file=sys.stderr)
+        sys.exit(1)
+
+    if not args.skip_ddl:
+        print("[INFO] DDL 실행 중 (집계 테이블)...")
+        _run_ddl()
+
+    period = f"{args.start or '처음'} ~ {args.end or '끝'}"
+    print(f"[INFO] 재구축 시작: {period}")
+    counts = rebuild_rollups(args.start, args.end)
+
+    print("\n── 최종 보고 ─────────────────────────────────────────────")
+    for table, days in counts.items():
+        print(f"  {table}: {days}일 재집계")
+    print("──────────────────────────────────────────────────────────")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+-- 주간 분석 캐시 (modules/repositories/weekly_analysis_cache.py)
+-- 기존에는 분석 JSON 을 weekly_status(AI 보고서 테이블)에 함께 저장했으므로 적용 후 정리한다.
+
+CREATE TABLE IF NOT EXISTS daily_record_versions (
+  customer_id INT    NOT NULL,
+  date        DATE   NOT NULL,
+  version     BIGINT NOT NULL DEFAULT 1,
+  PRIMARY KEY (customer_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS weekly_analysis_cache (
+  customer_id  INT         NOT NULL,
+  start_date   DATE        NOT NULL,
+  end_date     DATE        NOT NULL,
+  data_version VARCHAR(64) NOT NULL,
+  payload      LONGTEXT    NOT NULL,
+  updated_at   TIMESTAMP   NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (customer_id, start_date, end_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- weekly_status 에 남아 있는 예전 분석 캐시(JSON) 행 제거 (AI 보고서 본문은 평문 텍스트)
+DELETE FROM weekly_status WHERE report_text LIKE '{"ranges": %';
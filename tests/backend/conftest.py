@@ -41,6 +41,43 @@ def client(app):
     app.dependency_overrides.pop(get_current_user, None)
 
 
+@pytest.fixture(autouse=True)
+def parsed_store(app, tmp_path):
+    """업로드 파싱 결과 저장소를 테스트별 임시 SQLite 파일로 격리."""
+    from backend.dependencies import get_parsed_store
+    from backend.parsed_store import SqliteParsedStore
+
+    store = SqliteParsedStore(tmp_path / "parsed_results.sqlite3")
+    app.dependency_overrides[get_parsed_store] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_parsed_store, None)
+
+
+@pytest.fixture(autouse=True)
+def job_manager(app, tmp_path):
+    """백그라운드 작업 관리자를 테스트별 임시 SQLite 파일로 격리."""
+    from backend.dependencies import get_jobs
+    from backend.jobs import JobManager
+
+    manager = JobManager(tmp_path / "jobs.sqlite3", max_workers=2)
+    app.dependency_overrides[get_jobs] = lambda: manager
+    yield manager
+    app.dependency_overrides.pop(get_jobs, None)
+    manager.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def response_cache(app, tmp_path):
+    """응답 캐시를 테스트별 임시 SQLite 파일로 격리 (테스트 간 캐시 공유 방지)."""
+    from backend.dependencies import get_response_cache
+    from backend.response_cache import SqliteResponseCache
+
+    cache = SqliteResponseCache(tmp_path / "response_cache.sqlite3")
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_response_cache, None)
+
+
 @pytest.fixture
 def viewer_client(app):
     """VIEWER 역할 TestClient (RBAC 테스트용)."""
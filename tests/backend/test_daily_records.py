@@ -1,5 +1,7 @@
 """일일 기록 API 테스트."""
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 from contextlib import contextmanager
@@ -167,3 +169,54 @@ class TestDailyRecordsValidation:
         """end_date에 날짜 형식이 아닌 값 → 422."""
         resp = client.get("/api/daily-records?customer_id=1&end_date=not-a-date")
         assert resp.status_code == 422
+
+
+class TestExportDailyRecords:
+    ROWS = [
+        {"customer_name": "홍길동", "record_id": 1, "date": date(2024, 1, 2), "physical_note": "보행, 보조", "bath_time": None},
+        {"customer_name": "김철수", "record_id": 2, "date": date(2024, 1, 3), "physical_note": "식사", "bath_time": "10:00"},
+    ]
+
+    def test_CSV_스트리밍(self, client, mock_repo):
+        mock_repo.iter_records_by_date_range.return_value = iter([self.ROWS[:1], self.ROWS[1:]])
+
+        resp = client.get("/api/daily-records/export?start_date=2024-01-01&end_date=2024-12-31")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="daily_records_2024-01-01_2024-12-31.csv"' in resp.headers["content-disposition"]
+        lines = resp.content.decode("utf-8-sig").splitlines()
+        assert lines == [
+            "customer_name,record_id,date,physical_note,bath_time",
+            '홍길동,1,2024-01-02,"보행, 보조",',
+            "김철수,2,2024-01-03,식사,10:00",
+        ]
+        mock_repo.iter_records_by_date_range.assert_called_once_with(date(2024, 1, 1), date(2024, 12, 31))
+
+    def test_NDJSON_스트리밍(self, client, mock_repo):
+        mock_repo.iter_records_by_date_range.return_value = iter([self.ROWS])
+
+        resp = client.get("/api/daily-records/export?start_date=2024-01-01&end_date=2024-12-31&format=ndjson")
+
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [row["customer_name"] for row in rows] == ["홍길동", "김철수"]
+        assert rows[0]["date"] == "2024-01-02"
+
+    def test_기록_없으면_빈_본문(self, client, mock_repo):
+        mock_repo.iter_records_by_date_range.return_value = iter([])
+        resp = client.get("/api/daily-records/export?start_date=2024-01-01&end_date=2024-01-31")
+        assert resp.status_code == 200
+        assert resp.content == b""
+
+    def test_기간_역전_400(self, client, mock_repo):
+        resp = client.get("/api/daily-records/export?start_date=2024-02-01&end_date=2024-01-01")
+        assert resp.status_code == 400
+
+    def test_지원하지_않는_형식_422(self, client, mock_repo):
+        resp = client.get("/api/daily-records/export?start_date=2024-01-01&end_date=2024-01-31&format=xlsx")
+        assert resp.status_code == 422
+
+    def test_ADMIN_전용(self, viewer_client, app):
+        resp = viewer_client.get("/api/daily-records/export?start_date=2024-01-01&end_date=2024-01-31")
+        assert resp.status_code == 403
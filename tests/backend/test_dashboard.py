@@ -132,17 +132,18 @@ class TestEvaluationTrend:
 
 class TestEmployeeRankings:
     def test_랭킹_반환(self, client):
-        # 새 구현: 1차 fetchall(유저 목록) + 유저별 fetchone(레코드 통계)
+        # 1차 fetchall(유저 목록) + 2차 fetchall(작성자별 통계, GROUP BY 1회)
         cursor = MagicMock()
-        cursor.fetchall.return_value = [
-            {"user_id": 1, "name": "김요양"}
+        cursor.fetchall.side_effect = [
+            [{"user_id": 1, "name": "김요양"}],
+            [{
+                "writer_name": "김요양",
+                "total_records": 10,
+                "excellent_count": 8,
+                "average_count": 1,
+                "improvement_count": 1,
+            }],
         ]
-        cursor.fetchone.return_value = {
-            "total_records": 10,
-            "excellent_count": 8,
-            "average_count": 1,
-            "improvement_count": 1,
-        }
 
         @contextmanager
         def _mock_db():
@@ -161,15 +162,7 @@ class TestEmployeeRankings:
 
     def test_평가없는_직원_score_0(self, client):
         cursor = MagicMock()
-        cursor.fetchall.return_value = [
-            {"user_id": 2, "name": "박간호"}
-        ]
-        cursor.fetchone.return_value = {
-            "total_records": 0,
-            "excellent_count": 0,
-            "average_count": 0,
-            "improvement_count": 0,
-        }
+        cursor.fetchall.side_effect = [[{"user_id": 2, "name": "박간호"}], []]
 
         @contextmanager
         def _mock_db():
@@ -180,6 +173,39 @@ class TestEmployeeRankings:
 
         assert resp.json()[0]["score"] == 0.0
 
+    def test_직원수와_무관하게_집계쿼리_1회(self, client):
+        users = [{"user_id": i, "name": f"직원{i}"} for i in range(1, 201)]
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [
+            users,
+            [
+                {"writer_name": "직원1", "total_records": 3, "excellent_count": 1,
+                 "average_count": 0, "improvement_count": 0},
+                {"writer_name": "직원2", "total_records": 5, "excellent_count": 2,
+                 "average_count": 1, "improvement_count": 0},
+            ],
+        ]
+
+        @contextmanager
+        def _mock_db():
+            yield cursor
+
+        with patch("modules.db_connection.db_query", _mock_db):
+            resp = client.get(
+                "/api/dashboard/employee-rankings",
+                params={"start_date": "2026-01-01", "end_date": "2026-01-31"},
+            )
+
+        data = resp.json()
+        assert cursor.execute.call_count == 2
+        assert len(data) == 200
+        # 정렬: 우수 건수 내림차순 → 기록 수 내림차순, 동점은 조회 순서 유지
+        assert [d["user_id"] for d in data[:3]] == [2, 1, 3]
+        assert data[0]["score"] == round((2 * 3 + 1 * 2) / 3, 2)
+        params = cursor.execute.call_args_list[1][0][1]
+        assert len(params) == 200 * 2 + 2
+        assert params[-2:] == [date(2026, 1, 1), date(2026, 1, 31)]
+
 
 class TestAiGradeDist:
     def test_등급_분포(self, client):
@@ -420,18 +446,19 @@ class TestEmployeeRankingsMasking:
 
     def test_viewer_이름_마스킹(self, viewer_client):
         mock_enc = MagicMock()
-        mock_enc.return_value.safe_decrypt.return_value = "김요양"
+        mock_enc.return_value.decrypt_many.side_effect = lambda values: ["김요양" for _ in values]
 
         cursor = MagicMock()
-        cursor.fetchall.return_value = [
-            {"user_id": 1, "name": "encrypted_name"}
+        cursor.fetchall.side_effect = [
+            [{"user_id": 1, "name": "encrypted_name"}],
+            [{
+                "writer_name": "김요양",
+                "total_records": 5,
+                "excellent_count": 3,
+                "average_count": 1,
+                "improvement_count": 1,
+            }],
         ]
-        cursor.fetchone.return_value = {
-            "total_records": 5,
-            "excellent_count": 3,
-            "average_count": 1,
-            "improvement_count": 1,
-        }
 
         @contextmanager
         def _mock_db():
@@ -439,7 +466,7 @@ class TestEmployeeRankingsMasking:
 
         with (
             patch("modules.db_connection.db_query", _mock_db),
-            patch("backend.routers.dashboard.EncryptionService", mock_enc),
+            patch("backend.routers.dashboard.get_encryption_service", mock_enc),
         ):
             resp = viewer_client.get("/api/dashboard/employee-rankings")
 
@@ -449,18 +476,19 @@ class TestEmployeeRankingsMasking:
 
     def test_admin_이름_원본(self, client):
         mock_enc = MagicMock()
-        mock_enc.return_value.safe_decrypt.return_value = "김요양"
+        mock_enc.return_value.decrypt_many.side_effect = lambda values: ["김요양" for _ in values]
 
         cursor = MagicMock()
-        cursor.fetchall.return_value = [
-            {"user_id": 1, "name": "encrypted_name"}
+        cursor.fetchall.side_effect = [
+            [{"user_id": 1, "name": "encrypted_name"}],
+            [{
+                "writer_name": "김요양",
+                "total_records": 5,
+                "excellent_count": 3,
+                "average_count": 1,
+                "improvement_count": 1,
+            }],
         ]
-        cursor.fetchone.return_value = {
-            "total_records": 5,
-            "excellent_count": 3,
-            "average_count": 1,
-            "improvement_count": 1,
-        }
 
         @contextmanager
         def _mock_db():
@@ -468,7 +496,7 @@ class TestEmployeeRankingsMasking:
 
         with (
             patch("modules.db_connection.db_query", _mock_db),
-            patch("backend.routers.dashboard.EncryptionService", mock_enc),
+            patch("backend.routers.dashboard.get_encryption_service", mock_enc),
         ):
             resp = client.get("/api/dashboard/employee-rankings")
 
@@ -482,7 +510,7 @@ class TestEmpEvalRankingsMasking:
 
     def test_viewer_이름_마스킹(self, viewer_client):
         mock_enc = MagicMock()
-        mock_enc.return_value.safe_decrypt.return_value = "김요양"
+        mock_enc.return_value.decrypt_many.side_effect = lambda values: ["김요양" for _ in values]
 
         cursor = MagicMock()
         cursor.fetchall.return_value = [
@@ -504,7 +532,7 @@ class TestEmpEvalRankingsMasking:
 
         with (
             patch("modules.db_connection.db_query", _mock_db),
-            patch("backend.routers.dashboard.EncryptionService", mock_enc),
+            patch("backend.routers.dashboard.get_encryption_service", mock_enc),
         ):
             resp = viewer_client.get("/api/dashboard/emp-eval-rankings")
 
@@ -514,7 +542,7 @@ class TestEmpEvalRankingsMasking:
 
     def test_admin_이름_원본(self, client):
         mock_enc = MagicMock()
-        mock_enc.return_value.safe_decrypt.return_value = "김요양"
+        mock_enc.return_value.decrypt_many.side_effect = lambda values: ["김요양" for _ in values]
 
         cursor = MagicMock()
         cursor.fetchall.return_value = [
@@ -536,7 +564,7 @@ class TestEmpEvalRankingsMasking:
 
         with (
             patch("modules.db_connection.db_query", _mock_db),
-            patch("backend.routers.dashboard.EncryptionService", mock_enc),
+            patch("backend.routers.dashboard.get_encryption_service", mock_enc),
         ):
             resp = client.get("/api/dashboard/emp-eval-rankings")
 
@@ -608,16 +636,13 @@ class TestPeriodComparison:
 class TestKpiSummary:
     def test_KPI_delta_포함_반환(self, client):
         cursor = MagicMock()
-        # 순서: total_employees → curr_total → curr_high_risk → curr_emp_cnt
-        #                        → prev_total → prev_high_risk → prev_emp_cnt
+        # 순서: total_employees → 현재/이전 기간 집계 (집계 테이블 1회 조회)
         cursor.fetchone.side_effect = [
             {"cnt": 14},    # total_employees
-            {"total": 45},  # curr total
-            {"cnt": 3},     # curr high_risk
-            {"emp_cnt": 10},  # curr distinct employees
-            {"total": 30},  # prev total
-            {"cnt": 2},     # prev high_risk
-            {"emp_cnt": 8},   # prev distinct employees
+            {
+                "curr_total": 45, "curr_emp_cnt": 10, "curr_high_risk": 3,
+                "prev_total": 30, "prev_emp_cnt": 8, "prev_high_risk": 2,
+            },
         ]
 
         @contextmanager
@@ -637,17 +662,21 @@ class TestKpiSummary:
         assert data["high_risk_count"] == 3
         assert data["total_employees"] == 14
         assert data["avg_per_employee"] == 4.5
+        assert data["avg_per_employee_prev"] == 3.8
+        # 원본 테이블이 아니라 집계 테이블을 한 번만 조회
+        kpi_query, kpi_params = cursor.execute.call_args_list[1][0]
+        assert "rollup_emp_eval_daily" in kpi_query
+        assert "employee_evaluations" not in kpi_query
+        assert kpi_params[2:4] == [date(2023, 12, 29), date(2024, 1, 14)]
 
     def test_이전기간_0건_delta_null(self, client):
         cursor = MagicMock()
         cursor.fetchone.side_effect = [
             {"cnt": 10},    # total_employees
-            {"total": 5},   # curr total
-            {"cnt": 0},     # curr high_risk
-            {"emp_cnt": 3},   # curr distinct employees
-            {"total": 0},   # prev total
-            {"cnt": 0},     # prev high_risk
-            {"emp_cnt": 0},   # prev distinct employees
+            {
+                "curr_total": 5, "curr_emp_cnt": 3, "curr_high_risk": 0,
+                "prev_total": 0, "prev_emp_cnt": 0, "prev_high_risk": 0,
+            },
         ]
 
         @contextmanager
@@ -667,9 +696,10 @@ class TestKpiSummary:
         cursor = MagicMock()
         cursor.fetchone.side_effect = [
             {"cnt": 10},    # total_employees
-            {"total": 20},  # curr total (전체)
-            {"cnt": 1},     # curr high_risk
-            {"emp_cnt": 5},   # curr distinct employees
+            {
+                "curr_total": 20, "curr_emp_cnt": 5, "curr_high_risk": 1,  # 전체 기간
+                "prev_total": 0, "prev_emp_cnt": 0, "prev_high_risk": 0,
+            },
         ]
 
         @contextmanager
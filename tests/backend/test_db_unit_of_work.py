@@ -0,0 +1,162 @@
+"""요청 범위 DB 작업 단위(backend.dependencies.db_unit_of_work) 테스트"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from backend.dependencies import db_unit_of_work
+from modules.db_connection import db_query, db_transaction, set_connection_factory
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    checkouts = []
+
+    def factory():
+        checkouts.append(1)
+        return conn
+
+    conn.checkouts = checkouts
+    set_connection_factory(factory)
+    yield conn
+    set_connection_factory(None)
+
+
+@pytest.fixture
+def uow_client():
+    app = FastAPI(dependencies=[Depends(db_unit_of_work)])
+
+    def lookup() -> None:
+        with db_query() as cursor:
+            cursor.execute("SELECT 1")
+
+    @app.post("/items")
+    def create(_: None = Depends(lookup)):
+        with db_query() as cursor:
+            cursor.execute("SELECT 2")
+        with db_transaction() as cursor:
+            cursor.execute("INSERT INTO t VALUES (1)")
+        return {"ok": True}
+
+    @app.post("/fail")
+    def fail():
+        with db_transaction() as cursor:
+            cursor.execute("INSERT INTO t VALUES (1)")
+        raise HTTPException(status_code=409, detail="충돌")
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_요청_1건은_연결_1개로_한번_커밋(conn, uow_client):
+    assert uow_client.post("/items").status_code == 200
+
+    assert len(conn.checkouts) == 1
+    conn.commit.assert_called_once()
+    conn.rollback.assert_not_called()
+    conn.close.assert_called_once()
+
+
+def test_예외로_끝난_요청은_롤백(conn, uow_client):
+    assert uow_client.post("/fail").status_code == 409
+
+    conn.rollback.assert_called_once()
+    conn.commit.assert_not_called()
+    conn.close.assert_called_once()
+
+
+def test_DB_안쓰는_요청은_체크아웃_없음(conn, uow_client):
+    assert uow_client.get("/health").status_code == 200
+    assert conn.checkouts == []
+
+
+def test_요청마다_별도_작업_단위(conn, uow_client):
+    uow_client.post("/items")
+    uow_client.post("/items")
+
+    assert len(conn.checkouts) == 2
+    assert conn.commit.call_count == 2
+
+
+def test_캐시_무효화는_커밋_후(conn):
+    """엔드포인트 안의 무효화는 커밋 뒤에 적용 → 그 사이 GET 이 커밋 전 데이터를 새 세대로 캐시하지 않음"""
+    from backend.response_cache import InMemoryResponseCache
+
+    cache = InMemoryResponseCache()
+    app = FastAPI(dependencies=[Depends(db_unit_of_work)])
+    window = {}
+
+    @app.post("/items")
+    def create():
+        with db_transaction() as cursor:
+            cursor.execute("INSERT INTO t VALUES (1)")
+        cache.invalidate("t")
+        # 엔드포인트 반환 ~ 커밋 사이에 다른 요청의 GET 이 커밋 전 데이터를 읽어 캐시
+        window["read"] = cache.get_or_compute("/list", ["t"], lambda: "커밋 전")
+        window["committed"] = conn.commit.called
+        return {"ok": True}
+
+    @app.post("/fail")
+    def fail():
+        cache.invalidate("t")
+        raise HTTPException(status_code=409, detail="충돌")
+
+    client = TestClient(app)
+    cache.get_or_compute("/list", ["t"], lambda: "커밋 전")
+
+    assert client.post("/items").status_code == 200
+    assert window == {"read": "커밋 전", "committed": False}
+    assert cache.get_or_compute("/list", ["t"], lambda: "커밋 후") == "커밋 후"
+
+    # 롤백된 요청은 무효화하지 않음
+    assert client.post("/fail").status_code == 409
+    assert cache.get_or_compute("/list", ["t"], lambda: "다시 계산") == "커밋 후"
+
+
+def test_without_unit_of_work_는_쿼리마다_연결_반납(conn):
+    """외부 호출/대량 저장 라우트는 요청 내내 연결·트랜잭션을 쥐지 않음"""
+    from backend.dependencies import without_unit_of_work
+    from modules.db_connection import current_unit_of_work
+
+    app = FastAPI(dependencies=[Depends(db_unit_of_work)])
+    seen = {}
+
+    @app.post("/slow")
+    @without_unit_of_work
+    def slow():
+        with db_query() as cursor:
+            cursor.execute("SELECT 1")
+        # 여기서 LLM 호출 등 오래 걸리는 작업을 해도 연결을 쥐고 있지 않음
+        seen["closed_before_save"] = conn.close.call_count
+        seen["uow"] = current_unit_of_work()
+        with db_transaction() as cursor:
+            cursor.execute("INSERT INTO t VALUES (1)")
+        return {"ok": True}
+
+    assert TestClient(app).post("/slow").status_code == 200
+
+    assert seen == {"closed_before_save": 1, "uow": None}
+    assert len(conn.checkouts) == 2
+    conn.commit.assert_called_once()
+
+
+def test_LLM_대량저장_라우트는_작업_단위_제외():
+    from backend.main import app
+
+    exempt = {
+        route.path for route in app.routes
+        if getattr(getattr(route, "endpoint", None), "__db_unit_of_work__", True) is False
+    }
+    assert exempt == {
+        "/api/ai-evaluations/evaluate",
+        "/api/ai-evaluations/evaluate-record/{record_id}",
+        "/api/dashboard/employee/{user_id}/feedback-report",
+        "/api/weekly-reports/generate",
+        "/api/upload/{file_id}/save",
+    }
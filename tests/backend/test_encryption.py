@@ -4,6 +4,7 @@ import os
 from datetime import date
 
 import pytest
+from unittest.mock import patch
 
 # ENCRYPTION_KEY가 설정되어 있어야 EncryptionService를 import할 수 있음
 # conftest.py의 set_test_encryption_key autouse fixture가 처리
@@ -12,15 +13,119 @@ import pytest
 from backend.encryption import (
     EncryptionService,
     apply_customer_mask,
+    blind_index,
+    get_encryption_service,
+    keyword_token,
     apply_employee_mask,
     is_admin,
     mask_birth_date,
     mask_facility,
     mask_name,
     mask_recognition_no,
+    reset_encryption_service,
+    search_tokens,
 )
 
 
+# ── 공용 인스턴스 / 복호화 캐시 ──────────────────────────────────────
+
+
+class TestDecryptCache:
+    def test_공용_인스턴스_재사용(self):
+        assert get_encryption_service() is get_encryption_service()
+
+    def test_키_교체시_새_인스턴스(self, monkeypatch):
+        from cryptography.fernet import Fernet
+
+        before = get_encryption_service()
+        token = before.encrypt("홍길동")
+        before.safe_decrypt(token)
+        monkeypatch.setenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
+        after = get_encryption_service()
+        assert after is not before
+        # 이전 키로 만든 토큰은 캐시에서 나오지 않고 복호화 실패(원본 반환)
+        assert after.safe_decrypt(token) == token
+
+    def test_reset_후_새_인스턴스(self):
+        before = get_encryption_service()
+        reset_encryption_service()
+        assert get_encryption_service() is not before
+
+    def test_캐시_적중시_Fernet_미호출(self):
+        enc = EncryptionService(cache_size=10)
+        token = enc.encrypt("홍길동")
+        enc.safe_decrypt(token)
+        with patch.object(enc, "_fernet") as fernet:
+            assert enc.safe_decrypt(token) == "홍길동"
+            assert enc.decrypt(token) == "홍길동"
+            fernet.decrypt.assert_not_called()
+
+    def test_LRU_용량_제한(self):
+        enc = EncryptionService(cache_size=2)
+        tokens = [enc.encrypt(name) for name in ("가", "나", "다")]
+        for token in tokens:
+            enc.safe_decrypt(token)
+        assert list(enc._cache) == tokens[1:]
+
+    def test_decrypt_many_중복_1회_복호화(self):
+        enc = EncryptionService()
+        token = enc.encrypt("홍길동")
+        with patch.object(enc, "safe_decrypt", wraps=enc.safe_decrypt) as spy:
+            result = enc.decrypt_many([token, None, token, "평문"])
+        assert result == ["홍길동", None, "홍길동", "평문"]
+        assert spy.call_count == 2
+
+    def test_decrypt_columns_복사본(self):
+        enc = EncryptionService()
+        rows = [{"id": 1, "name": enc.encrypt("홍길동"), "memo": None}, None]
+        result = enc.decrypt_columns(rows, ("name", "memo"))
+        assert result == [{"id": 1, "name": "홍길동", "memo": None}, None]
+        assert rows[0]["name"] != "홍길동"
+
+
+# ── 블라인드 인덱스 ──────────────────────────────────────────────────
+
+
+class TestBlindIndex:
+    def test_결정적_값(self):
+        assert blind_index("홍길동", "customer.name") == blind_index("홍길동", "customer.name")
+        assert len(blind_index("홍길동", "customer.name")) == 32
+
+    def test_평문_미포함(self):
+        assert "홍길동" not in blind_index("홍길동", "customer.name")
+
+    def test_정규화_공백_대소문자(self):
+        assert blind_index(" L12 34 ", "customer.recognition_no") == blind_index(
+            "l1234", "customer.recognition_no"
+        )
+
+    def test_필드별_분리(self):
+        assert blind_index("홍길동", "customer.name") != blind_index("홍길동", "user.name")
+
+    def test_빈값_None(self):
+        assert blind_index(None, "customer.name") is None
+        assert blind_index("  ", "customer.name") is None
+
+    def test_키_변경시_값_변경(self, monkeypatch):
+        before = blind_index("홍길동", "customer.name")
+        monkeypatch.setenv("BLIND_INDEX_KEY", "c2VwYXJhdGUtYmxpbmQtaW5kZXgta2V5LTMyYnl0ZXM=")
+        assert blind_index("홍길동", "customer.name") != before
+
+    def test_부분문자열_토큰(self):
+        tokens = search_tokens("홍길동", "customer.name")
+        assert len(tokens) == 2  # 홍길, 길동
+        for keyword in ("홍길", "길동", "홍길동", "길동 "):
+            assert keyword_token(keyword, "customer.name") in tokens
+        assert keyword_token("동홍", "customer.name") not in tokens
+
+    def test_토큰수는_값_길이에_비례(self):
+        assert len(search_tokens("가나다라마바사아자차카타파하" * 3, "customer.name")) <= 14 * 3
+
+    def test_짧은_값과_검색어는_토큰없음(self):
+        assert search_tokens("홍", "customer.name") == set()
+        assert keyword_token("길", "customer.name") is None
+
+
 # ── EncryptionService ────────────────────────────────────────────────
 
 
@@ -32,6 +137,13 @@ class TestEncryptionService:
         assert token != plaintext
         assert enc.decrypt(token) == plaintext
 
+    def test_바이트_왕복(self):
+        enc = EncryptionService()
+        data = "홍길동".encode("utf-8")
+        token = enc.encrypt_bytes(data)
+        assert data not in token
+        assert enc.decrypt_bytes(token) == data
+
     def test_한국어_왕복(self):
         enc = EncryptionService()
         text = "홍길동"
@@ -50,7 +50,7 @@ class TestCreateFeedbackReport:
             ],
         )
         with patch("backend.routers.feedback_reports.db_query", mock_db):
-            with patch("backend.routers.feedback_reports.EncryptionService") as MockEnc:
+            with patch("backend.routers.feedback_reports.get_encryption_service") as MockEnc:
                 MockEnc.return_value.safe_decrypt.return_value = "홍길동"
                 resp = client.post(
                     "/api/dashboard/employee/1/feedback-report", json=self.PAYLOAD
@@ -77,7 +77,7 @@ class TestCreateFeedbackReport:
         )
         mock_db = _mock_db_with_user({"user_id": 1, "name": "enc_name"})
         with patch("backend.routers.feedback_reports.db_query", mock_db):
-            with patch("backend.routers.feedback_reports.EncryptionService") as MockEnc:
+            with patch("backend.routers.feedback_reports.get_encryption_service") as MockEnc:
                 MockEnc.return_value.safe_decrypt.return_value = "홍길동"
                 resp = client.post(
                     "/api/dashboard/employee/1/feedback-report", json=self.PAYLOAD
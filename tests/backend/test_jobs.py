@@ -0,0 +1,308 @@
+"""백그라운드 작업 큐(backend/jobs.py) 및 작업 API 테스트."""
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.jobs import (
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_SUCCEEDED,
+    JobLimitExceeded,
+    JobManager,
+)
+
+from .conftest import make_mock_daily_info_repo
+
+
+def wait_for(manager, job_id, timeout=5.0):
+    """작업이 종료 상태가 될 때까지 대기 후 반환."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업이 끝나지 않음: {manager.get(job_id)}")
+
+
+def _mock_evaluation_service(evaluate):
+    """evaluate(record) 결과를 on_result 로 차례로 넘기는 동시 평가 대역."""
+    service = MagicMock()
+
+    def run(records, on_result=None, use_cache=True):
+        results = [evaluate(record) for record in records]
+        for record, result in zip(records, results):
+            on_result(record, result)
+        return results
+
+    service.evaluate_special_notes_concurrently.side_effect = run
+    return service
+
+
+@pytest.fixture
+def manager(tmp_path):
+    m = JobManager(tmp_path / "jobs.sqlite3", max_workers=2, max_per_user=2)
+    yield m
+    m.shutdown()
+
+
+class TestJobManager:
+    def test_성공_결과_저장(self, manager):
+        job_id = manager.submit("parse", "1", lambda ctx, x: {"value": x * 2}, 21)
+        job = wait_for(manager, job_id)
+        assert job["status"] == STATUS_SUCCEEDED
+        assert job["result"] == {"value": 42}
+
+    def test_진행률_기록(self, manager):
+        def work(ctx):
+            for i in range(1, 4):
+                ctx.progress(i, 3, f"{i}/3")
+            return None
+
+        job = wait_for(manager, manager.submit("save", "1", work))
+        assert (job["progress_current"], job["progress_total"], job["message"]) == (3, 3, "3/3")
+
+    def test_예외시_실패_처리(self, manager):
+        def work(ctx):
+            raise ValueError("파싱 오류")
+
+        job = wait_for(manager, manager.submit("parse", "1", work))
+        assert job["status"] == STATUS_FAILED
+        assert "파싱 오류" in job["error"]
+
+    def test_실행중_취소(self, manager):
+        started = threading.Event()
+
+        def work(ctx):
+            started.set()
+            while True:
+                ctx.progress(0)
+                time.sleep(0.01)
+
+        job_id = manager.submit("ai_evaluation", "1", work)
+        assert started.wait(2)
+        manager.cancel(job_id)
+        assert wait_for(manager, job_id)["status"] == STATUS_CANCELLED
+
+    def test_대기중_취소시_실행안됨(self, tmp_path):
+        single = JobManager(tmp_path / "single.sqlite3", max_workers=1, max_per_user=5)
+        gate = threading.Event()
+        ran = []
+        blocker = single.submit("parse", "1", lambda ctx: gate.wait(2))
+        queued = single.submit("parse", "1", lambda ctx: ran.append(True))
+        assert single.cancel(queued)["status"] == STATUS_CANCELLED
+        gate.set()
+        wait_for(single, blocker)
+        single.shutdown()
+        assert ran == []
+
+    def test_사용자별_동시작업_제한(self, manager):
+        gate = threading.Event()
+        ids = [manager.submit("parse", "1", lambda ctx: gate.wait(2)) for _ in range(2)]
+        with pytest.raises(JobLimitExceeded):
+            manager.submit("parse", "1", lambda ctx: None)
+        # 다른 사용자는 영향 없음
+        other = manager.submit("parse", "2", lambda ctx: None)
+        gate.set()
+        for job_id in [*ids, other]:
+            wait_for(manager, job_id)
+        manager.submit("parse", "1", lambda ctx: None)
+
+    def test_결과_평문_미저장(self, manager):
+        import sqlite3
+
+        wait_for(manager, manager.submit("parse", "1", lambda ctx: {"customer_names": ["홍길동"]}))
+        conn = sqlite3.connect(manager.path)
+        blob = conn.execute("SELECT result FROM jobs").fetchone()[0]
+        conn.close()
+        assert "홍길동".encode("utf-8") not in blob
+
+    def test_다른_프로세스의_중단된_작업_실패처리(self, manager, tmp_path):
+        import sqlite3
+
+        conn = sqlite3.connect(manager.path)
+        conn.execute(
+            """
+            INSERT INTO jobs (job_id, kind, owner, status, runner, pid, created_at, updated_at)
+            VALUES ('dead', 'parse', '1', 'running', 'old-runner', 999999999, 0, 0)
+            """
+        )
+        conn.commit()
+        conn.close()
+        fresh = JobManager(manager.path)
+        assert fresh.get("dead")["status"] == STATUS_FAILED
+        fresh.shutdown()
+
+    def test_목록은_결과_제외(self, manager):
+        wait_for(manager, manager.submit("parse", "1", lambda ctx: {"a": 1}))
+        jobs = manager.list_jobs(owner="1")
+        assert len(jobs) == 1
+        assert jobs[0]["result"] is None
+
+
+# ─── API ────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def mock_repo(app):
+    repo = make_mock_daily_info_repo()
+    from backend.dependencies import get_daily_info_repo
+    app.dependency_overrides[get_daily_info_repo] = lambda: repo
+    yield repo
+    app.dependency_overrides.pop(get_daily_info_repo, None)
+
+
+@pytest.fixture(autouse=True)
+def patch_chunk_dir(tmp_path):
+    import backend.routers.upload as upload_mod
+    original = upload_mod.CHUNK_DIR
+    upload_mod.CHUNK_DIR = tmp_path / "arisa_chunks"
+    yield
+    upload_mod.CHUNK_DIR = original
+
+
+class TestJobApi:
+    def test_업로드_파싱_작업(self, client, job_manager, parsed_store):
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = iter(
+                [[{"customer_name": "홍길동"}], [{"customer_name": "김철수"}]]
+            )
+            resp = client.post(
+                "/api/upload/jobs",
+                files={"file": ("test.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+            assert resp.status_code == 202
+            job_id = resp.json()["job_id"]
+            wait_for(job_manager, job_id)
+
+        job = client.get(f"/api/jobs/{job_id}").json()
+        assert job["status"] == STATUS_SUCCEEDED
+        assert job["progress_current"] == 2
+        assert job["result"]["customer_names"] == ["홍길동", "김철수"]
+        assert parsed_store.get(job["result"]["file_id"]) is not None
+
+    def test_업로드_작업_PDF아님_400(self, client):
+        resp = client.post(
+            "/api/upload/jobs", files={"file": ("a.txt", b"x", "text/plain")}
+        )
+        assert resp.status_code == 400
+
+    def test_저장_작업_진행률(self, client, job_manager, parsed_store, mock_repo):
+        records = [{"customer_name": "홍길동", "date": f"2025-11-{d:02d}"} for d in range(1, 6)]
+        parsed_store.put("f1", records)
+
+        def fake_save(recs, progress=None):
+            progress(len(recs), len(recs))
+            return len(recs)
+
+        mock_repo.save_parsed_data.side_effect = fake_save
+        resp = client.post("/api/upload/f1/save/job")
+        assert resp.status_code == 202
+        job = wait_for(job_manager, resp.json()["job_id"])
+        assert job["result"]["saved_count"] == 5
+        assert job["progress_total"] == 5
+        assert parsed_store.get("f1") is None
+
+    def test_저장_작업_데이터없음_404(self, client, mock_repo):
+        assert client.post("/api/upload/missing/save/job").status_code == 404
+
+    def test_AI_일괄평가_작업(self, client, job_manager, app):
+        from backend.dependencies import get_evaluation_service
+
+        service = _mock_evaluation_service(lambda r: {"grade_code": "우수"} if r["record_id"] == 1 else None)
+        app.dependency_overrides[get_evaluation_service] = lambda: service
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [{"record_id": 1}, None]
+
+        @contextmanager
+        def _mock_db_query():
+            yield cursor
+
+        try:
+            with patch("modules.db_connection.db_query", _mock_db_query):
+                resp = client.post(
+                    "/api/ai-evaluations/evaluate-records/job", json={"record_ids": [1, 2, 1]}
+                )
+                job = wait_for(job_manager, resp.json()["job_id"])
+        finally:
+            app.dependency_overrides.pop(get_evaluation_service, None)
+
+        assert job["result"] == {"evaluated": [1], "failed": [2]}
+        assert job["progress_total"] == 2
+        service.save_special_note_evaluation.assert_called_once_with(1, {"grade_code": "우수"})
+        # 조회된 기록만 동시 평가 경로로 전달
+        assert [r["record_id"] for r in service.evaluate_special_notes_concurrently.call_args[0][0]] == [1]
+
+    def test_AI_기간평가_작업(self, client, job_manager, app):
+        from backend.dependencies import get_evaluation_service
+
+        service = _mock_evaluation_service(lambda r: None if r["record_id"] == 12 else {"grade_code": "평균"})
+        service.get_records_for_evaluation.return_value = [{"record_id": 11}, {"record_id": 12}, {"record_id": 13}]
+        app.dependency_overrides[get_evaluation_service] = lambda: service
+        try:
+            resp = client.post(
+                "/api/ai-evaluations/evaluate-range/job",
+                json={"start_date": "2024-01-01", "end_date": "2024-01-31", "customer_ids": [5],
+                      "use_cache": False},
+            )
+            assert resp.status_code == 202
+            job = wait_for(job_manager, resp.json()["job_id"])
+        finally:
+            app.dependency_overrides.pop(get_evaluation_service, None)
+
+        assert job["result"] == {"evaluated": [11, 13], "failed": [12]}
+        assert (job["progress_current"], job["progress_total"]) == (3, 3)
+        args, kwargs = service.get_records_for_evaluation.call_args
+        assert [str(a) for a in args] == ["2024-01-01", "2024-01-31", "[5]"]
+        assert kwargs == {"only_unevaluated": True}
+        assert service.evaluate_special_notes_concurrently.call_args.kwargs["use_cache"] is False
+
+    def test_AI_기간평가_기간역전_400(self, client, job_manager):
+        resp = client.post(
+            "/api/ai-evaluations/evaluate-range/job",
+            json={"start_date": "2024-02-01", "end_date": "2024-01-31"},
+        )
+        assert resp.status_code == 400
+
+    def test_동시작업_초과_429(self, client, job_manager):
+        gate = threading.Event()
+        for _ in range(job_manager.max_per_user):
+            job_manager.submit("parse", "1", lambda ctx: gate.wait(2))
+        try:
+            resp = client.post(
+                "/api/upload/jobs",
+                files={"file": ("test.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+            assert resp.status_code == 429
+        finally:
+            gate.set()
+
+    def test_다른_사용자_작업_404(self, viewer_client, job_manager):
+        job_id = job_manager.submit("parse", "1", lambda ctx: None)
+        assert viewer_client.get(f"/api/jobs/{job_id}").status_code == 404
+
+    def test_작업_취소_API(self, client, job_manager):
+        started = threading.Event()
+
+        def work(ctx):
+            started.set()
+            while True:
+                ctx.progress(0)
+                time.sleep(0.01)
+
+        job_id = job_manager.submit("parse", "1", work)
+        assert started.wait(2)
+        resp = client.post(f"/api/jobs/{job_id}/cancel")
+        assert resp.status_code == 200
+        assert resp.json()["cancel_requested"] is True
+        assert wait_for(job_manager, job_id)["status"] == STATUS_CANCELLED
+
+    def test_내_작업_목록(self, client, job_manager):
+        wait_for(job_manager, job_manager.submit("parse", "1", lambda ctx: None))
+        wait_for(job_manager, job_manager.submit("parse", "2", lambda ctx: None))
+        resp = client.get("/api/jobs")
+        assert [j["owner"] for j in resp.json()] == ["1"]
@@ -0,0 +1,111 @@
+"""운영 지표 라우터 테스트"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from modules.db_pool import PoolTimeout
+
+
+@pytest.fixture
+def metrics_admin(app):
+    """/api/metrics 용 ADMIN 로그인 (쿠키 대신 get_optional_user 오버라이드)."""
+    from backend.dependencies import get_optional_user
+
+    app.dependency_overrides[get_optional_user] = lambda: {"user_id": 1, "role": "ADMIN"}
+    yield
+    app.dependency_overrides.pop(get_optional_user, None)
+
+
+def test_DB_풀_통계(client):
+    stats = {"size": 5, "in_use": 2, "waiters": 0}
+    with patch("backend.routers.metrics.get_pool_stats", return_value=stats):
+        resp = client.get("/api/metrics/db-pool")
+
+    assert resp.status_code == 200
+    assert resp.json()["pool"] == stats
+    assert isinstance(resp.json()["pid"], int)
+
+
+def test_DB_풀_통계는_ADMIN_전용(viewer_client):
+    assert viewer_client.get("/api/metrics/db-pool").status_code == 403
+
+
+def test_풀_대기_시간_초과는_503(app, client):
+    from backend.dependencies import get_customer_repo
+
+    def exhausted():
+        raise PoolTimeout("가득 참")
+
+    app.dependency_overrides[get_customer_repo] = exhausted
+    try:
+        resp = client.get("/api/customers")
+    finally:
+        app.dependency_overrides.pop(get_customer_repo, None)
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+
+
+def test_prometheus_지표(client, metrics_admin):
+    client.get("/api/health")
+    client.get("/api/daily-records/123456789/없는경로")
+    resp = client.get("/api/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    assert '# TYPE arisa_http_request_duration_seconds histogram' in text
+    assert 'arisa_http_request_duration_seconds_count{method="GET",route="/api/health",status="200"}' in text
+    assert 'route="unmatched",status="404"' in text
+
+
+def test_경로_파라미터는_템플릿으로_묶음(client, metrics_admin):
+    client.get("/api/jobs/none-1")
+    client.get("/api/jobs/none-2")
+
+    text = client.get("/api/metrics").text
+    assert 'route="/api/jobs/{job_id}",status="404"' in text
+    assert "none-1" not in text
+
+
+def test_주간_분석_캐시_조회_지표(client, metrics_admin):
+    from modules.repositories.weekly_analysis_cache import WeeklyAnalysisCacheRepository
+
+    row = {"payload": "{}", "fresh": 0}
+    with patch.object(WeeklyAnalysisCacheRepository, "_execute_query_one", return_value=row):
+        WeeklyAnalysisCacheRepository().load(1, date(2024, 1, 8), date(2024, 1, 14))
+
+    text = client.get("/api/metrics").text
+    assert "# TYPE arisa_weekly_analysis_cache_total counter" in text
+    assert 'arisa_weekly_analysis_cache_total{result="stale"}' in text
+
+
+def test_prometheus_토큰_인증(client, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/api/metrics").status_code == 401
+
+
+def test_prometheus_ADMIN_전용(viewer_client, app):
+    from backend.dependencies import get_optional_user
+
+    app.dependency_overrides[get_optional_user] = lambda: {"user_id": 99, "role": "VIEWER"}
+    try:
+        assert viewer_client.get("/api/metrics").status_code == 403
+    finally:
+        app.dependency_overrides.pop(get_optional_user, None)
+
+
+def test_SQL_지문별_통계(client):
+    stats = [{"fingerprint": "abc", "query": "SELECT ?", "calls": 3}]
+    with patch("backend.routers.metrics.get_statement_stats", return_value=stats) as mock:
+        resp = client.get("/api/metrics/db-queries?limit=5&order_by=calls")
+
+    assert resp.status_code == 200
+    assert resp.json()["statements"] == stats
+    mock.assert_called_once_with(5, "calls")
+    assert client.get("/api/metrics/db-queries?order_by=bogus").status_code == 422
@@ -0,0 +1,128 @@
+"""backend/parsed_store.py 단위 테스트."""
+
+import sqlite3
+import time
+
+import pytest
+
+from backend.parsed_store import (
+    InMemoryParsedStore,
+    SqliteParsedStore,
+    decode_batch,
+    encode_batch,
+)
+
+RECORDS = [
+    {"customer_name": "홍길동", "date": f"2025-11-{d:02d}", "hygiene_care": "완료", "writer_phy": None}
+    for d in range(1, 21)
+]
+
+
+class TestBatchCodec:
+    def test_왕복_동일(self):
+        assert decode_batch(encode_batch(RECORDS)) == RECORDS
+
+    def test_일부_키_누락_보존(self):
+        records = [{"customer_name": "홍길동"}, {"customer_name": "김철수", "date": "2025-11-01"}]
+        assert decode_batch(encode_batch(records)) == records
+
+    def test_빈_목록(self):
+        assert decode_batch(encode_batch([])) == []
+
+    def test_반복값_사전_인코딩으로_크기_감소(self):
+        import json
+        import zlib
+
+        row_wise = zlib.compress(json.dumps(RECORDS * 20, ensure_ascii=False).encode("utf-8"), 6)
+        assert len(encode_batch(RECORDS * 20)) < len(row_wise)
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteParsedStore(tmp_path / "store.sqlite3")
+    return InMemoryParsedStore()
+
+
+class TestParsedResultStore:
+    def test_저장_조회(self, store):
+        store.put("f1", RECORDS)
+        assert store.get("f1") == RECORDS
+
+    def test_없는_file_id_None(self, store):
+        assert store.get("missing") is None
+
+    def test_삭제(self, store):
+        store.put("f1", RECORDS)
+        store.delete("f1")
+        assert store.get("f1") is None
+
+    def test_배치_분할_순서_유지(self, store, monkeypatch):
+        import backend.parsed_store as mod
+
+        monkeypatch.setattr(mod, "BATCH_RECORDS", 3)
+        store.put("f1", RECORDS)
+        assert store.get("f1") == RECORDS
+
+    def test_TTL_만료(self, store):
+        store.ttl_seconds = 0
+        store.put("f1", RECORDS)
+        time.sleep(0.01)
+        assert store.get("f1") is None
+
+    def test_추가_저장은_finish_후_조회(self, store):
+        store.append("f1", RECORDS[:5])
+        store.append("f1", RECORDS[5:])
+        assert store.get("f1") is None
+
+        assert store.finish("f1", len(RECORDS))
+        assert store.get("f1") == RECORDS
+
+    def test_추가_저장_중_밀려나면_finish_실패(self, store):
+        store.append("f1", RECORDS[:5])
+        store.delete("f1")  # 작성 중 만료/용량 초과로 제거된 상황
+        store.append("f1", RECORDS[5:])
+
+        assert not store.finish("f1", len(RECORDS))
+        assert store.get("f1") is None
+
+    def test_완료된_업로드에_추가하면_새로_작성(self, store):
+        store.put("f1", RECORDS)
+        store.append("f1", RECORDS[:2])
+        assert store.finish("f1", 2)
+        assert store.get("f1") == RECORDS[:2]
+
+    def test_용량_초과시_오래된_업로드_제거(self, store):
+        store.put("old", RECORDS)
+        size = store.stats()["size_bytes"]
+        store.max_bytes = size + size // 2
+        store.put("new", RECORDS)
+        assert store.get("old") is None
+        assert store.get("new") == RECORDS
+
+
+class TestSqliteParsedStore:
+    def test_워커간_공유(self, tmp_path):
+        """같은 파일을 여는 별도 인스턴스(다른 워커)에서 조회/삭제 가능."""
+        worker_a = SqliteParsedStore(tmp_path / "shared.sqlite3")
+        worker_b = SqliteParsedStore(tmp_path / "shared.sqlite3")
+        worker_a.put("f1", RECORDS)
+        assert worker_b.get("f1") == RECORDS
+        worker_b.delete("f1")
+        assert worker_a.get("f1") is None
+
+    def test_평문_미저장(self, tmp_path):
+        store = SqliteParsedStore(tmp_path / "store.sqlite3")
+        store.put("f1", RECORDS)
+        conn = sqlite3.connect(tmp_path / "store.sqlite3")
+        blobs = [row[0] for row in conn.execute("SELECT payload FROM parsed_batches")]
+        conn.close()
+        assert blobs
+        assert all("홍길동".encode("utf-8") not in blob for blob in blobs)
+
+    def test_재저장시_기존_배치_교체(self, tmp_path):
+        store = SqliteParsedStore(tmp_path / "store.sqlite3")
+        store.put("f1", RECORDS)
+        store.put("f1", RECORDS[:2])
+        assert store.get("f1") == RECORDS[:2]
+        assert store.stats()["uploads"] == 1
@@ -0,0 +1,184 @@
+"""GET 응답 캐시(backend/response_cache.py) 및 라우터 연동 테스트."""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.response_cache import (
+    TAG_AI_EVALUATIONS,
+    TAG_EMPLOYEE_EVALUATIONS,
+    InMemoryResponseCache,
+    SqliteResponseCache,
+    cache_key,
+)
+
+from .conftest import make_mock_employee_evaluation_repo
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryResponseCache()
+    return SqliteResponseCache(tmp_path / "cache.sqlite3")
+
+
+class TestResponseCache:
+    def test_두번째_조회는_캐시(self, cache):
+        compute = MagicMock(return_value={"total": 1})
+        assert cache.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"total": 1}
+        assert cache.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"total": 1}
+        assert compute.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_태그_무효화시_재계산(self, cache):
+        compute = MagicMock(side_effect=[{"v": 1}, {"v": 2}])
+        cache.get_or_compute("k", [TAG_AI_EVALUATIONS], compute)
+        # 다른 태그 무효화는 영향 없음
+        cache.invalidate(TAG_EMPLOYEE_EVALUATIONS)
+        assert cache.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"v": 1}
+        cache.invalidate(TAG_AI_EVALUATIONS)
+        assert cache.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"v": 2}
+
+    def test_TTL_만료(self, cache):
+        cache.ttl_seconds = -1
+        compute = MagicMock(return_value=[1])
+        cache.get_or_compute("k", [], compute)
+        cache.get_or_compute("k", [], compute)
+        assert compute.call_count == 2
+
+    def test_역할별_키_분리(self):
+        params = [("end_date", "2024-01-31"), ("start_date", "2024-01-01")]
+        admin = cache_key("/api/dashboard/summary", params, "admin")
+        assert admin == cache_key("/api/dashboard/summary", list(reversed(params)), "ADMIN")
+        assert admin != cache_key("/api/dashboard/summary", params, "VIEWER")
+
+    def test_동시_요청은_한번만_계산(self, cache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"v": 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", [], compute)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert results == [{"v": 1}] * 5
+
+    def test_계산_예외는_저장안함(self, cache):
+        with pytest.raises(ValueError):
+            cache.get_or_compute("k", [], MagicMock(side_effect=ValueError("DB 오류")))
+        assert cache.get_or_compute("k", [], lambda: "ok") == "ok"
+
+
+class TestSqliteSharing:
+    def test_워커간_캐시_공유(self, tmp_path):
+        path = tmp_path / "shared.sqlite3"
+        worker_a, worker_b = SqliteResponseCache(path), SqliteResponseCache(path)
+        worker_a.get_or_compute("k", [TAG_AI_EVALUATIONS], lambda: {"v": 1})
+        compute = MagicMock(return_value={"v": 2})
+        assert worker_b.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"v": 1}
+        compute.assert_not_called()
+
+        worker_a.invalidate(TAG_AI_EVALUATIONS)
+        assert worker_b.get_or_compute("k", [TAG_AI_EVALUATIONS], compute) == {"v": 2}
+
+    def test_다른_워커_계산중이면_결과_대기(self, tmp_path):
+        path = tmp_path / "shared.sqlite3"
+        worker_a, worker_b = SqliteResponseCache(path), SqliteResponseCache(path)
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(2)
+            return {"v": "a"}
+
+        thread = threading.Thread(target=lambda: worker_a.get_or_compute("k", [], slow))
+        thread.start()
+        assert started.wait(2)
+        threading.Timer(0.1, release.set).start()
+        compute = MagicMock(return_value={"v": "b"})
+        assert worker_b.get_or_compute("k", [], compute) == {"v": "a"}
+        thread.join()
+        compute.assert_not_called()
+
+    def test_만료된_임대는_무시(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "c.sqlite3", lease_seconds=-1)
+        # 죽은 워커가 남긴 임대
+        assert cache._acquire_lease("k")
+        assert cache.get_or_compute("k", [], lambda: 1) == 1
+
+    def test_응답_평문_미저장(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "c.sqlite3")
+        cache.get_or_compute("k", [], lambda: {"name": "홍길동"})
+        conn = sqlite3.connect(cache.path)
+        blob = conn.execute("SELECT payload FROM response_cache").fetchone()[0]
+        conn.close()
+        assert "홍길동".encode("utf-8") not in blob
+
+
+# ─── 라우터 연동 ────────────────────────────────────────────────────────
+
+
+@contextmanager
+def counting_db_query():
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"cnt": 3, "avg_score": 2.0}
+    opened = []
+
+    @contextmanager
+    def _db_query():
+        opened.append(1)
+        yield cursor
+
+    with patch("modules.db_connection.db_query", _db_query):
+        yield opened
+
+
+class TestDashboardCaching:
+    def test_같은_요청은_DB_재조회_안함(self, client):
+        with counting_db_query() as opened:
+            first = client.get("/api/dashboard/summary?start_date=2024-01-01&end_date=2024-01-31")
+            second = client.get("/api/dashboard/summary?end_date=2024-01-31&start_date=2024-01-01")
+        assert first.json() == second.json()
+        assert len(opened) == 1
+
+    def test_파라미터가_다르면_별도_캐시(self, client):
+        with counting_db_query() as opened:
+            client.get("/api/dashboard/summary?start_date=2024-01-01&end_date=2024-01-31")
+            client.get("/api/dashboard/summary?start_date=2024-02-01&end_date=2024-02-29")
+        assert len(opened) == 2
+
+    def test_역할별_별도_캐시(self, client, app):
+        from backend.dependencies import get_current_user
+
+        with counting_db_query() as opened:
+            client.get("/api/dashboard/summary")
+            app.dependency_overrides[get_current_user] = lambda: {"user_id": 99, "role": "VIEWER"}
+            client.get("/api/dashboard/summary")
+            client.get("/api/dashboard/summary")
+        assert len(opened) == 2
+
+    def test_직원평가_쓰기후_무효화(self, client, app):
+        from backend.dependencies import get_employee_evaluation_repo
+
+        app.dependency_overrides[get_employee_evaluation_repo] = make_mock_employee_evaluation_repo
+        try:
+            with counting_db_query() as opened:
+                client.get("/api/dashboard/summary")
+                assert client.delete("/api/employee-evaluations/1").status_code == 204
+                client.get("/api/dashboard/summary")
+        finally:
+            app.dependency_overrides.pop(get_employee_evaluation_repo, None)
+        assert len(opened) == 2
@@ -84,6 +84,111 @@ class TestUploadPdf:
         uuid.UUID(file_id)  # 예외 없으면 통과
 
 
+class TestUploadPdfStream:
+    @staticmethod
+    def _lines(resp):
+        import json
+
+        return [json.loads(line) for line in resp.text.splitlines() if line]
+
+    def test_PDF_아닌_파일_400(self, client, mock_repo):
+        resp = client.post(
+            "/api/upload/stream",
+            files={"file": ("test.txt", io.BytesIO(b"x"), "text/plain")},
+        )
+        assert resp.status_code == 400
+
+    def test_수급자별_라인_후_done(self, client, mock_repo):
+        groups = [
+            [{"customer_name": "홍길동", "date": "2024-01-15"}],
+            [{"customer_name": "김철수", "date": "2024-01-15"}, {"customer_name": "김철수", "date": "2024-01-16"}],
+        ]
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = iter(groups)
+            resp = client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = self._lines(resp)
+        assert [l["type"] for l in lines] == ["group", "group", "done"]
+        assert lines[1]["customer_name"] == "김철수"
+        assert len(lines[1]["records"]) == 2
+        assert lines[2]["total_records"] == 3
+        assert lines[2]["customer_names"] == ["홍길동", "김철수"]
+
+    def test_스트림_완료_후_save_가능(self, client, mock_repo):
+        mock_repo.save_parsed_data.return_value = 1
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = iter([[{"customer_name": "홍길동"}]])
+            resp = client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        file_id = self._lines(resp)[-1]["file_id"]
+        save_resp = client.post(f"/api/upload/{file_id}/save")
+        assert save_resp.status_code == 200
+
+    def test_파싱_실패시_error_라인(self, client, mock_repo):
+        def failing():
+            yield [{"customer_name": "홍길동"}]
+            raise Exception("파싱 오류")
+
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = failing()
+            resp = client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        lines = self._lines(resp)
+        assert [l["type"] for l in lines] == ["group", "error"]
+        assert "파싱 실패" in lines[-1]["detail"]
+
+    def test_그룹마다_저장소에_추가(self, client, mock_repo, parsed_store):
+        seen = []
+
+        def groups():
+            yield [{"customer_name": "홍길동", "date": "2024-01-15"}]
+            # 다음 그룹 파싱 시점에 앞 그룹이 이미 저장소에 기록되어 있음 (아직 비공개)
+            seen.append(parsed_store.stats()["size_bytes"])
+            yield [{"customer_name": "김철수", "date": "2024-01-15"}]
+
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser, \
+                patch.object(parsed_store, "put", side_effect=AssertionError("일괄 저장 금지")):
+            MockParser.return_value.iter_parse.return_value = groups()
+            resp = client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        lines = self._lines(resp)
+        assert seen and seen[0] > 0
+        assert parsed_store.get(lines[-1]["file_id"]) == [r for l in lines[:-1] for r in l["records"]]
+
+    def test_파싱_실패시_작성중_결과_삭제(self, client, mock_repo, parsed_store):
+        def failing():
+            yield [{"customer_name": "홍길동"}]
+            raise Exception("파싱 오류")
+
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = failing()
+            client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        assert parsed_store.stats()["uploads"] == 0
+
+    def test_파싱_결과_없을때_error_라인(self, client, mock_repo):
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = iter([])
+            resp = client.post(
+                "/api/upload/stream",
+                files={"file": ("test.pdf", io.BytesIO(b"%PDF fake"), "application/pdf")},
+            )
+        lines = self._lines(resp)
+        assert lines == [{"type": "error", "detail": "파싱된 데이터가 없습니다."}]
+
+
 class TestSaveParsedData:
     def _upload_and_get_file_id(self, client, mock_repo):
         """업로드 후 file_id 반환."""
@@ -33,10 +33,15 @@ class TestChunkedUpload:
 
     # ── 헬퍼 ─────────────────────────────────────────────────────────────────
 
-    def _init(self, client, filename="test.pdf", chunks=2):
+    def _init(self, client, filename="test.pdf", chunks=2, chunk_size=4):
         resp = client.post(
             "/api/upload/chunk/init",
-            params={"filename": filename, "total_size": 1024, "total_chunks": chunks},
+            params={
+                "filename": filename,
+                "total_size": chunks * chunk_size,
+                "total_chunks": chunks,
+                "chunk_size": chunk_size,
+            },
         )
         return resp.json()["upload_id"]
 
@@ -79,7 +84,28 @@ class TestChunkedUpload:
         assert meta_path.exists()
         meta = json.loads(meta_path.read_text())
         assert meta["filename"] == "a.pdf"
-        assert meta["done_chunks"] == []
+        assert meta["chunk_size"] == 512
+
+    def test_init_세션파일_사전할당(self, client, mock_repo):
+        import backend.routers.upload as upload_mod
+        upload_id = self._init(client, chunks=3, chunk_size=4)
+        session_dir = upload_mod.CHUNK_DIR / upload_id
+        assert (session_dir / upload_mod.SESSION_FILE).stat().st_size == 12
+        assert (session_dir / upload_mod.CHUNK_MAP_FILE).read_bytes() == bytes(3)
+
+    def test_init_chunk_size_미지정시_균등분할(self, client, mock_repo):
+        resp = client.post(
+            "/api/upload/chunk/init",
+            params={"filename": "a.pdf", "total_size": 10, "total_chunks": 3},
+        )
+        assert resp.json()["chunk_size"] == 4
+
+    def test_init_청크수_불일치_400(self, client, mock_repo):
+        resp = client.post(
+            "/api/upload/chunk/init",
+            params={"filename": "a.pdf", "total_size": 100, "total_chunks": 2, "chunk_size": 10},
+        )
+        assert resp.status_code == 400
 
     # ── upload_chunk ──────────────────────────────────────────────────────────
 
@@ -89,13 +115,31 @@ class TestChunkedUpload:
         assert resp.status_code == 200
         assert 0 in resp.json()["done_chunks"]
 
-    def test_청크_파일_저장됨(self, client, mock_repo):
+    def test_청크_오프셋에_기록(self, client, mock_repo):
         import backend.routers.upload as upload_mod
-        upload_id = self._init(client)
-        self._put_chunk(client, upload_id, 0, b"hello")
-        chunk_path = upload_mod.CHUNK_DIR / upload_id / "chunk_000000.bin"
-        assert chunk_path.exists()
-        assert chunk_path.read_bytes() == b"hello"
+        upload_id = self._init(client, chunks=3)
+        self._put_chunk(client, upload_id, 2, b"cccc")
+        self._put_chunk(client, upload_id, 0, b"aaaa")
+        session_file = upload_mod.CHUNK_DIR / upload_id / upload_mod.SESSION_FILE
+        assert session_file.read_bytes() == b"aaaa" + bytes(4) + b"cccc"
+
+    def test_마지막_청크는_짧을_수_있음(self, client, mock_repo):
+        resp = client.post(
+            "/api/upload/chunk/init",
+            params={"filename": "a.pdf", "total_size": 6, "total_chunks": 2, "chunk_size": 4},
+        )
+        upload_id = resp.json()["upload_id"]
+        assert self._put_chunk(client, upload_id, 1, b"zz").status_code == 200
+        assert self._put_chunk(client, upload_id, 0, b"zz").status_code == 400
+
+    def test_청크_재전송_덮어쓰기(self, client, mock_repo):
+        import backend.routers.upload as upload_mod
+        upload_id = self._init(client, chunks=1)
+        self._put_chunk(client, upload_id, 0, b"old!")
+        resp = self._put_chunk(client, upload_id, 0, b"new!")
+        assert resp.json()["done_chunks"] == [0]
+        session_file = upload_mod.CHUNK_DIR / upload_id / upload_mod.SESSION_FILE
+        assert session_file.read_bytes() == b"new!"
 
     def test_잘못된_청크_인덱스_400(self, client, mock_repo):
         upload_id = self._init(client, chunks=2)
@@ -127,12 +171,14 @@ class TestChunkedUpload:
     def test_complete_파싱_성공(self, client, mock_repo):
         fake_records = [{"customer_name": "홍길동", "date": "2024-01-15"}]
         upload_id = self._init(client, chunks=2)
-        self._put_chunk(client, upload_id, 0, b"part0")
-        self._put_chunk(client, upload_id, 1, b"part1")
+        self._put_chunk(client, upload_id, 0, b"prt0")
+        self._put_chunk(client, upload_id, 1, b"prt1")
         with patch("modules.pdf_parser.CareRecordParser") as MockParser:
             MockParser.return_value.parse.return_value = fake_records
             resp = client.post(f"/api/upload/chunk/{upload_id}/complete")
+            parsed_source = MockParser.call_args.args[0]
         assert resp.status_code == 200
+        assert isinstance(parsed_source, str)  # BytesIO 복사 없이 경로로 파싱
         result = resp.json()
         assert result["file_id"] == upload_id
         assert result["total_records"] == 1
@@ -173,3 +219,22 @@ class TestChunkedUpload:
         resp = client.post(f"/api/upload/{upload_id}/save")
         assert resp.status_code == 200
         assert resp.json()["saved_count"] == 1
+
+    def test_complete_stream_수급자별_라인(self, client, mock_repo):
+        import backend.routers.upload as upload_mod
+        upload_id = self._init(client, chunks=1)
+        self._put_chunk(client, upload_id, 0)
+        with patch("modules.pdf_parser.CareRecordParser") as MockParser:
+            MockParser.return_value.iter_parse.return_value = iter([[{"customer_name": "홍길동"}]])
+            resp = client.post(f"/api/upload/chunk/{upload_id}/complete/stream")
+        assert resp.status_code == 200
+        lines = [json.loads(line) for line in resp.text.splitlines() if line]
+        assert [l["type"] for l in lines] == ["group", "done"]
+        assert lines[-1]["file_id"] == upload_id
+        assert not (upload_mod.CHUNK_DIR / upload_id).exists()
+
+    def test_complete_stream_청크_누락시_400(self, client, mock_repo):
+        upload_id = self._init(client, chunks=2)
+        self._put_chunk(client, upload_id, 0)
+        resp = client.post(f"/api/upload/chunk/{upload_id}/complete/stream")
+        assert resp.status_code == 400
@@ -491,3 +491,48 @@ class TestWeeklyReportValidation:
             },
         )
         assert resp.status_code == 422
+
+
+class TestGetWeeklyAnalysisBulk:
+    BASE = "/api/weekly-reports/analysis/bulk"
+
+    def test_start_date_필수(self, client):
+        assert client.get(f"{self.BASE}?customer_ids=1").status_code == 422
+
+    def test_수급자별_분석_목록(self, client):
+        with patch("backend.routers.weekly_reports.compute_weekly_status_bulk") as mock_bulk:
+            mock_bulk.return_value = {
+                2: {
+                    "ranges": (
+                        (date(2024, 1, 1), date(2024, 1, 7)),
+                        (date(2024, 1, 8), date(2024, 1, 14)),
+                    ),
+                    "scores": {"physical": {"label": "신체활동", "prev": 55.0, "curr": 60.0}},
+                    "trend": {
+                        "weekly_table": [{"주간": "지난주"}, {"주간": "이번주"}],
+                        "curr_prog_entries": [{"date": "01-08", "detail": "활동"}],
+                    },
+                },
+                5: {"error": "DB 오류"},
+            }
+            resp = client.get(f"{self.BASE}?start_date=2024-01-08&customer_ids=2&customer_ids=5")
+
+        assert resp.status_code == 200
+        mock_bulk.assert_called_once_with([2, 5], date(2024, 1, 8), use_cache=True)
+        data = resp.json()
+        assert data["start_date"] == "2024-01-08"
+        first, second = data["items"]
+        assert first["customer_id"] == 2
+        assert first["curr_range"] == ["2024-01-08", "2024-01-14"]
+        assert len(first["weekly_table"]) == 2
+        assert first["curr_prog_entries"][0]["detail"] == "활동"
+        assert second == {**second, "customer_id": 5, "error": "DB 오류", "weekly_table": []}
+
+    def test_customer_ids_생략시_전원(self, client):
+        with patch("backend.routers.weekly_reports.compute_weekly_status_bulk",
+                   return_value={}) as mock_bulk:
+            resp = client.get(f"{self.BASE}?start_date=2024-01-08")
+
+        assert resp.status_code == 200
+        assert resp.json()["items"] == []
+        assert mock_bulk.call_args[0][0] is None
@@ -4,17 +4,26 @@ OpenAI/Gemini 클라이언트 래퍼, 의존성 주입, API 키 조회 로직 
 향후 백엔드 분리 시 AI 클라이언트 계층의 독립성을 보장합니다.
 """
 
+import asyncio
 import os
 import sys
+import httpx
+import openai
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
+from google.api_core import exceptions as google_exceptions
 from modules.clients.ai_client import (
     BaseAIClient,
     OpenAIClient,
     GeminiClient,
+    async_session,
     get_ai_client,
     set_ai_client,
     get_api_key,
+    is_rate_limit_error,
+    is_retryable_error,
+    response_total_tokens,
+    retry_after_seconds,
 )
 
 
@@ -92,7 +101,8 @@ class TestGeminiClient:
     @pytest.fixture
     def mock_genai(self):
         """google.generativeai 모듈 mock"""
-        with patch('modules.clients.ai_client.genai') as mock:
+        with patch('modules.clients.ai_client.genai') as mock, \
+             patch('modules.clients.ai_client.genai_client'):
             mock.configure = MagicMock()
             yield mock
 
@@ -176,6 +186,132 @@ class TestGeminiClient:
         assert response.choices[0].message.content == '{"result": "테스트 응답"}'
 
 
+    def test_achat_completion_uses_async_api(self, client, mock_genai):
+        """achat_completion은 generate_content_async를 사용하고 사용 토큰을 노출한다"""
+        mock_model = MagicMock()
+        mock_response = MagicMock(text='{"ok": 1}')
+        mock_response.usage_metadata.total_token_count = 42
+        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        response = asyncio.run(client.achat_completion(
+            model='gemini-flash', messages=[{'role': 'user', 'content': '테스트'}]
+        ))
+
+        mock_model.generate_content.assert_not_called()
+        assert response.choices[0].message.content == '{"ok": 1}'
+        assert response_total_tokens(response) == 42
+
+
+class TestAsyncClients:
+    """비동기 호출 경로 테스트"""
+
+    def test_base_achat_completion_runs_sync_call(self):
+        """기본 achat_completion은 동기 chat_completion 결과를 돌려준다"""
+        class SyncOnly(BaseAIClient):
+            def chat_completion(self, model, messages, **kwargs):
+                return (model, kwargs)
+
+        assert asyncio.run(SyncOnly().achat_completion('m', [], temperature=0.1)) == ('m', {'temperature': 0.1})
+
+    def test_openai_achat_completion_uses_async_client(self):
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value='응답')
+        client = OpenAIClient(client=MagicMock(), async_client=async_client)
+
+        result = asyncio.run(client.achat_completion(model='gpt-4o-mini', messages=[], temperature=0.2))
+
+        assert result == '응답'
+        async_client.chat.completions.create.assert_awaited_once_with(
+            model='gpt-4o-mini', messages=[], temperature=0.2
+        )
+
+    def test_openai_async_client_disables_sdk_retries(self):
+        """SDK 자체 재시도를 끄고 동기 클라이언트 설정을 따른다"""
+        client = OpenAIClient(client=openai.OpenAI(api_key='sk-test'))
+
+        async_client = client._new_async_client()
+
+        assert async_client.max_retries == 0
+        assert async_client.api_key == 'sk-test'
+
+    def test_openai_session_per_event_loop(self):
+        """asyncio.run 마다 새 AsyncOpenAI 를 쓰고 끝나면 닫는다 (다른 루프의 연결 재사용 금지)"""
+        client = OpenAIClient(client=openai.OpenAI(api_key='sk-test'))
+
+        async def open_session():
+            async with client.async_session() as session:
+                return session._async_client
+
+        first, second = asyncio.run(open_session()), asyncio.run(open_session())
+
+        assert first is not second
+        assert first.is_closed() and second.is_closed()
+        assert client._async_client is None
+
+    def test_gemini_session_uses_loop_local_client(self):
+        """Gemini 세션은 공용 클라이언트 대신 세션 전용 grpc.aio 클라이언트를 모델에 넘긴다"""
+        with patch('modules.clients.ai_client.genai') as mock_genai, \
+             patch('modules.clients.ai_client.genai_client') as mock_genai_client:
+            mock_model = MagicMock()
+            mock_model.generate_content_async = AsyncMock(return_value=MagicMock(text='{}'))
+            mock_genai.GenerativeModel.return_value = mock_model
+            made = []
+            mock_genai_client._client_manager.make_client.side_effect = (
+                lambda name: made.append(MagicMock(name=name)) or made[-1]
+            )
+            client = GeminiClient(api_key='test-key')
+
+            async def call():
+                async with client.async_session() as session:
+                    await session.achat_completion(model='gemini-flash', messages=[])
+                    return mock_model._async_client
+
+            used = [asyncio.run(call()), asyncio.run(call())]
+
+        assert used == made and used[0] is not used[1]
+        assert all(c.__aexit__.await_count == 1 for c in made)
+
+    def test_async_session_passes_through_test_doubles(self):
+        double = MagicMock()
+
+        async def open_session():
+            async with async_session(double) as session:
+                return session
+
+        assert asyncio.run(open_session()) is double
+
+
+class TestErrorClassification:
+    """공급자 오류 분류 테스트"""
+
+    @staticmethod
+    def _openai_error(cls, status, headers=None):
+        request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+        response = httpx.Response(status, headers=headers or {}, request=request)
+        return cls('error', response=response, body=None)
+
+    def test_openai_429(self):
+        error = self._openai_error(openai.RateLimitError, 429, {'retry-after': '7'})
+        assert is_rate_limit_error(error)
+        assert retry_after_seconds(error) == 7.0
+
+    def test_gemini_resource_exhausted(self):
+        error = google_exceptions.ResourceExhausted('quota')
+        assert is_rate_limit_error(error)
+        assert retry_after_seconds(error) is None
+
+    def test_server_error_retryable_but_not_rate_limit(self):
+        error = self._openai_error(openai.InternalServerError, 500)
+        assert not is_rate_limit_error(error)
+        assert is_retryable_error(error)
+        assert is_retryable_error(google_exceptions.ServiceUnavailable('busy'))
+
+    def test_client_error_not_retryable(self):
+        assert not is_retryable_error(self._openai_error(openai.BadRequestError, 400))
+        assert not is_retryable_error(ValueError('JSON'))
+
+
 class TestSetAiClient:
     """set_ai_client / get_ai_client 의존성 주입 테스트"""
 
@@ -0,0 +1,215 @@
+"""LLM 응답 캐시(modules/clients/llm_cache.py) 테스트"""
+
+import asyncio
+import json
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules.clients import llm_cache
+from modules.clients.llm_cache import (
+    LLMCache,
+    acached_completion,
+    cached_completion,
+    estimate_cost,
+    llm_cache_key,
+    lookup_cached,
+    store_cached,
+)
+from modules.clients.rate_limit import ProviderLimiter
+
+MESSAGES = [
+    {"role": "system", "content": "평가 지침"},
+    {"role": "user", "content": "홍길동 보행 보조"},
+]
+
+
+def _response(content, prompt_tokens=1000, completion_tokens=500):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm.sqlite3")
+    with patch.object(llm_cache, "get_llm_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.chat_completion.side_effect = [_response('{"v": 1}'), _response('{"v": 2}')]
+    return client
+
+
+class TestCacheKey:
+    def test_같은_프롬프트는_같은_키(self):
+        assert llm_cache_key("openai", "gpt-4o-mini", 0.7, MESSAGES) == llm_cache_key(
+            "openai", "gpt-4o-mini", 0.7, [dict(m) for m in MESSAGES]
+        )
+
+    @pytest.mark.parametrize("provider, model, temperature, messages", [
+        ("gemini", "gpt-4o-mini", 0.7, MESSAGES),
+        ("openai", "gpt-4o", 0.7, MESSAGES),
+        ("openai", "gpt-4o-mini", None, MESSAGES),
+        ("openai", "gpt-4o-mini", 0.7, [MESSAGES[0], {"role": "user", "content": "홍길동 보행"}]),
+        ("openai", "gpt-4o-mini", 0.7, [{"role": "system", "content": "다른 지침"}, MESSAGES[1]]),
+    ])
+    def test_구성요소가_다르면_다른_키(self, provider, model, temperature, messages):
+        assert llm_cache_key("openai", "gpt-4o-mini", 0.7, MESSAGES) != llm_cache_key(
+            provider, model, temperature, messages
+        )
+
+
+class TestCachedCompletion:
+    def test_두번째_호출은_캐시_적중(self, cache, client):
+        first = cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, purpose="feedback", parse=json.loads)
+        second = cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, purpose="feedback", parse=json.loads)
+
+        assert first == second == {"v": 1}
+        assert client.chat_completion.call_count == 1
+        stats = cache.stats()["by_purpose"]["feedback"]
+        assert (stats["calls"], stats["cached"]) == (2, 1)
+        # gpt-4o-mini: 1000 × 0.15 + 500 × 0.60 (100만 토큰당)
+        assert stats["cost_usd"] == pytest.approx(0.00045)
+        assert stats["saved_usd"] == pytest.approx(0.00045)
+
+    def test_AI_호출_시간_지표(self, cache, client):
+        labels = dict(provider="openai", model="gpt-4o-mini", purpose="metrics_test")
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, purpose="metrics_test")
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, purpose="metrics_test")
+
+        assert llm_cache.LLM_CALL_SECONDS.count(**labels, outcome="ok") == 1
+        assert llm_cache.LLM_CACHE_HITS.value(purpose="metrics_test") == 1
+
+        client.chat_completion.side_effect = RuntimeError("API 오류")
+        with pytest.raises(RuntimeError):
+            cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, purpose="metrics_test", use_cache=False)
+        assert llm_cache.LLM_CALL_SECONDS.count(**labels, outcome="error") == 1
+
+    def test_temperature_전달(self, cache, client):
+        cached_completion(client, "gemini", "gemini-2.5-flash", MESSAGES, temperature=0.7)
+        assert client.chat_completion.call_args.kwargs["temperature"] == 0.7
+
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES)
+        assert "temperature" not in client.chat_completion.call_args.kwargs
+
+    def test_파싱_실패는_저장안함(self, cache):
+        client = MagicMock()
+        client.chat_completion.side_effect = [_response("깨진 응답"), _response('{"v": 2}')]
+
+        with pytest.raises(json.JSONDecodeError):
+            cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, parse=json.loads)
+        assert cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, parse=json.loads) == {"v": 2}
+        assert cache.stats()["entries"] == 1
+
+    def test_캐시_우회시_재호출_후_갱신(self, cache, client):
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, parse=json.loads)
+        assert cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, parse=json.loads,
+                                 use_cache=False) == {"v": 2}
+        assert client.chat_completion.call_count == 2
+        client.chat_completion.side_effect = None
+        assert cached_completion(client, "openai", "gpt-4o-mini", MESSAGES, parse=json.loads) == {"v": 2}
+        assert client.chat_completion.call_count == 2
+
+    def test_캐시_비활성이면_매번_호출(self, client):
+        assert llm_cache.get_llm_cache() is None
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES)
+        cached_completion(client, "openai", "gpt-4o-mini", MESSAGES)
+        assert client.chat_completion.call_count == 2
+
+    def test_비동기_적중은_한도_대기_없음(self, cache):
+        client = MagicMock()
+
+        async def achat(model, messages, **kwargs):
+            return _response("응답")
+
+        client.achat_completion = MagicMock(side_effect=achat)
+        limiter = ProviderLimiter(rpm=0, tpm=0)
+
+        async def run():
+            return [
+                await acached_completion(client, "gemini", "gemini-2.5-flash", MESSAGES,
+                                         purpose="special_note", limiter=limiter)
+                for _ in range(3)
+            ]
+
+        assert asyncio.run(run()) == ["응답"] * 3
+        assert client.achat_completion.call_count == 1
+        assert limiter.stats()["calls"] == 1
+
+
+    def test_다른_응답을_기록_키로_저장후_조회(self, cache):
+        assert lookup_cached("gemini", "gemini-2.5-flash", MESSAGES, temperature=0.7) == (False, None)
+        store_cached("gemini", "gemini-2.5-flash", MESSAGES, '{"v": 3}', temperature=0.7)
+
+        assert lookup_cached("gemini", "gemini-2.5-flash", MESSAGES, temperature=0.7,
+                             purpose="special_note", parse=json.loads) == (True, {"v": 3})
+        assert lookup_cached("gemini", "gemini-2.5-flash", MESSAGES) == (False, None)
+        assert cache.stats()["by_purpose"]["special_note"]["cached"] == 1
+
+    def test_출력_토큰_추정치로_TPM_예약(self, cache):
+        client = MagicMock()
+
+        async def achat(model, messages, **kwargs):
+            return _response("응답")
+
+        client.achat_completion = achat
+        limiter = MagicMock()
+
+        async def call(func, estimated_tokens, budget):
+            limiter.estimated = estimated_tokens
+            return await func()
+
+        limiter.call = call
+        asyncio.run(acached_completion(client, "gemini", "gemini-2.5-flash", MESSAGES,
+                                       limiter=limiter, output_tokens=6000))
+        assert limiter.estimated == 6000 + 7
+
+
+class TestLLMCacheStore:
+    def test_TTL_만료(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.sqlite3", ttl_seconds=-1)
+        cache.put("k", "openai", "gpt-4o-mini", "응답")
+        assert cache.get("k") is None
+
+    def test_용량_초과시_LRU_제거(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.sqlite3")
+        cache.put("a", "openai", "gpt-4o-mini", "가" * 200)
+        size = cache.stats()["size_bytes"]
+        cache.max_bytes = size * 2
+        cache.put("b", "openai", "gpt-4o-mini", "나" * 200)
+        cache.get("a")
+        cache.put("c", "openai", "gpt-4o-mini", "다" * 200)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_응답_평문_미저장(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.sqlite3")
+        cache.put("k", "openai", "gpt-4o-mini", "홍길동 보행 보조")
+        conn = sqlite3.connect(cache.path)
+        blob = conn.execute("SELECT payload FROM llm_cache").fetchone()[0]
+        conn.close()
+        assert "홍길동".encode("utf-8") not in blob
+        assert cache.get("k") == ("홍길동 보행 보조", None)
+
+    def test_전체_삭제(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.sqlite3")
+        cache.put("k", "openai", "gpt-4o-mini", "응답")
+        cache.record_call("feedback", "openai", "gpt-4o-mini", False, 120.0)
+        assert cache.purge() == 1
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["by_purpose"] == {}
+
+
+def test_비용_추정():
+    assert estimate_cost("gemini-2.5-flash-preview-04-17", 1_000_000, 0) == pytest.approx(0.30)
+    assert estimate_cost("unknown-model", 10, 10) is None
+    assert estimate_cost("gpt-4o-mini", None, 10) is None
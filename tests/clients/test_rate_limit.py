@@ -0,0 +1,208 @@
+"""AI 호출 한도 관리(modules/clients/rate_limit.py) 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from modules.clients import rate_limit
+from modules.clients.rate_limit import (
+    AdaptiveConcurrency,
+    ProviderLimiter,
+    RetryBudget,
+    TokenBucket,
+    estimate_tokens,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch.object(rate_limit, "_backoff", return_value=0.0):
+        yield
+
+
+class TestTokenBucket:
+    def test_용량까지는_즉시_이후는_예약순_대기(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)  # 초당 1개
+        assert [bucket.reserve(1) for _ in range(60)] == [0.0] * 60
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+
+        clock.now = 10.0
+        assert bucket.reserve(1) == pytest.approx(0.0)
+
+    def test_실사용량으로_보정(self):
+        clock = FakeClock()
+        bucket = TokenBucket(600, clock)
+        bucket.reserve(600)
+        assert bucket.reserve(100) == pytest.approx(10.0)
+        # 예약 700 중 실제 300만 사용 → 400 반환
+        bucket.adjust(400)
+        assert bucket.reserve(100) == pytest.approx(0.0)
+
+    def test_한도보다_큰_요청은_용량으로_제한(self):
+        bucket = TokenBucket(100, FakeClock())
+        assert bucket.reserve(1000) == 0.0
+
+    def test_한도_0이면_제한없음(self):
+        bucket = TokenBucket(0, FakeClock())
+        assert all(bucket.reserve(10**6) == 0.0 for _ in range(5))
+
+
+class TestAdaptiveConcurrency:
+    def test_성공시_증가_최대값_제한(self):
+        gate = AdaptiveConcurrency(max_limit=6, initial=2, clock=FakeClock())
+        for _ in range(50):
+            assert gate.try_acquire() is None
+            gate.release(success=True)
+        assert gate.limit == 6
+
+    def test_429면_절반_쿨다운내_연속은_한번만(self):
+        clock = FakeClock()
+        gate = AdaptiveConcurrency(max_limit=16, initial=16, clock=clock)
+        gate.throttle(2.0)
+        gate.throttle(2.0)
+        assert gate.limit == 8
+
+        # 일시정지 동안은 자리가 나도 대기
+        assert gate.try_acquire() == pytest.approx(2.0)
+        clock.now = 2.5
+        gate.throttle(0.0)
+        assert gate.limit == 4
+        assert gate.try_acquire() is None
+
+    def test_한도만큼만_동시_진행(self):
+        gate = AdaptiveConcurrency(max_limit=4, initial=2, clock=FakeClock())
+        assert gate.try_acquire() is None
+        assert gate.try_acquire() is None
+        assert gate.try_acquire() is not None
+        gate.release()
+        assert gate.try_acquire() is None
+        assert gate.in_flight == 2
+
+
+class TestRetryBudget:
+    def test_기본값_더하기_호출수_비율(self):
+        budget = RetryBudget(ratio=0.5, minimum=1)
+        for _ in range(4):
+            budget.record_request()
+        assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+def _response(tokens=None):
+    return SimpleNamespace(usage=SimpleNamespace(total_tokens=tokens))
+
+
+class TestProviderLimiter:
+    def test_429_재시도후_성공_동시성_감소(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0, max_concurrency=8)
+        limiter.concurrency._limit = 8.0
+        outcomes = [google_exceptions.ResourceExhausted("quota"), _response()]
+
+        async def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert asyncio.run(limiter.call(call, 100)) is not None
+        stats = limiter.stats()
+        assert (stats["calls"], stats["throttled"], stats["retries"], stats["failures"]) == (2, 1, 1, 0)
+        assert stats["in_flight"] == 0
+        assert limiter.concurrency.limit == 4
+
+    def test_재시도_불가_오류는_즉시_실패(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0)
+
+        async def call():
+            raise ValueError("잘못된 요청")
+
+        with pytest.raises(ValueError):
+            asyncio.run(limiter.call(call, 100))
+        assert limiter.stats()["calls"] == 1
+
+    def test_최대_시도_횟수(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0, max_attempts=3)
+
+        async def call():
+            raise google_exceptions.ServiceUnavailable("busy")
+
+        with pytest.raises(google_exceptions.ServiceUnavailable):
+            asyncio.run(limiter.call(call, 100))
+        assert limiter.stats()["calls"] == 3
+
+    def test_재시도_예산_소진시_중단(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0, max_attempts=10)
+        budget = RetryBudget(ratio=0, minimum=1)
+
+        async def call():
+            raise google_exceptions.ServiceUnavailable("busy")
+
+        with pytest.raises(google_exceptions.ServiceUnavailable):
+            asyncio.run(limiter.call(call, 100, budget))
+        assert limiter.stats()["calls"] == 2
+        assert budget.retries == 1
+
+    def test_실제_토큰으로_TPM_보정(self):
+        clock = FakeClock()
+        limiter = ProviderLimiter(rpm=0, tpm=6000, clock=clock)
+
+        async def call():
+            return _response(tokens=1000)
+
+        asyncio.run(limiter.call(call, 6000))
+        # 6000 예약, 1000 사용 → 5000 반환
+        assert limiter.tokens.reserve(5000) == 0.0
+
+    def test_동시_호출수_제한(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0, max_concurrency=2)
+        limiter.concurrency._limit = 2.0
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            peak = max(peak, limiter.concurrency.in_flight)
+            await asyncio.sleep(0.01)
+            return _response()
+
+        async def main():
+            await asyncio.gather(*(limiter.call(call, 1) for _ in range(6)))
+
+        asyncio.run(main())
+        assert peak == 2
+
+    def test_취소되면_자리_반환(self):
+        limiter = ProviderLimiter(rpm=0, tpm=0, max_concurrency=4)
+        limiter.concurrency._limit = 4.0
+
+        async def hang():
+            await asyncio.sleep(60)
+
+        async def main():
+            tasks = [asyncio.create_task(limiter.call(hang, 1)) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            assert limiter.concurrency.in_flight == 4
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # 자리가 돌아와야 다음 호출이 기다리지 않는다
+            return await asyncio.wait_for(limiter.call(lambda: asyncio.sleep(0, _response()), 1), 1)
+
+        assert asyncio.run(main()) is not None
+        assert limiter.stats()["in_flight"] == 0
+
+
+def test_토큰_추정():
+    messages = [{"role": "system", "content": "가" * 100}, {"role": "user", "content": None}]
+    assert estimate_tokens(messages, output_tokens=10) == 60
@@ -15,6 +15,14 @@ def set_test_encryption_key(monkeypatch):
     monkeypatch.setenv("ENCRYPTION_KEY", _TEST_ENCRYPTION_KEY)
 
 
+@pytest.fixture(autouse=True)
+def disable_llm_cache(monkeypatch):
+    """LLM 응답 캐시 비활성 (공용 캐시 파일이 테스트 간 응답을 재사용하지 않도록)."""
+    from modules.clients import llm_cache
+
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_MAX_BYTES", 0)
+
+
 class MockCursor:
     """Mock database cursor for testing."""
     
@@ -100,6 +108,10 @@ class MockAIClient:
         mock_response.choices[0].message.content = self._response or '{}'
         return mock_response
 
+    async def achat_completion(self, model: str, messages: list, **kwargs) -> MagicMock:
+        """Mock async chat completion."""
+        return self.chat_completion(model, messages, **kwargs)
+
 
 @pytest.fixture
 def mock_cursor():
@@ -207,3 +207,29 @@ class TestAiEvaluationRepository:
         call_args = mock_execute_query.call_args[0][1]
         assert '2024-01-01' in call_args
         assert '2024-01-31' in call_args
+
+
+class TestGetRecordsForEvaluation:
+    """get_records_for_evaluation 테스트"""
+
+    def test_기간_수급자_미평가_필터(self):
+        rows = [{"record_id": 1, "customer_name": "홍길동", "physical_note": "보행"}]
+        with patch.object(AiEvaluationRepository, '_execute_query', return_value=rows) as mock:
+            result = AiEvaluationRepository().get_records_for_evaluation("2024-01-01", "2024-01-31", [3, 4])
+
+        sql, params = mock.call_args[0]
+        assert params == ("2024-01-01", "2024-01-31", 3, 4)
+        assert "di.customer_id IN (%s, %s)" in sql
+        assert "COUNT(DISTINCT ae.category)" in sql
+        assert result[0]["customer_name"] == "홍길동"
+
+    def test_전체_수급자_재평가(self):
+        with patch.object(AiEvaluationRepository, '_execute_query', return_value=[]) as mock:
+            AiEvaluationRepository().get_records_for_evaluation(
+                "2024-01-01", "2024-01-31", only_unevaluated=False
+            )
+
+        sql, params = mock.call_args[0]
+        assert params == ("2024-01-01", "2024-01-31")
+        assert "customer_id IN" not in sql
+        assert "ai_evaluations" not in sql
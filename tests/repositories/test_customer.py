@@ -1,6 +1,7 @@
 """CustomerRepository 테스트"""
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import patch, MagicMock
 from modules.repositories.customer import CustomerRepository
 
@@ -26,16 +27,16 @@ class TestCustomerRepository:
             yield mock
     
     @pytest.fixture
-    def mock_execute_transaction(self):
-        """_execute_transaction 메서드 mock"""
-        with patch.object(CustomerRepository, '_execute_transaction') as mock:
-            yield mock
-    
-    @pytest.fixture
-    def mock_execute_transaction_lastrowid(self):
-        """_execute_transaction_lastrowid 메서드 mock"""
-        with patch.object(CustomerRepository, '_execute_transaction_lastrowid') as mock:
-            yield mock
+    def mock_tx_cursor(self):
+        """db_transaction mock — 쓰기(고객 행 + 검색 토큰)는 한 트랜잭션의 커서로 실행"""
+        cursor = MagicMock()
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+
+        with patch('modules.repositories.customer.db_transaction', _mock_tx):
+            yield cursor
 
     # ========== list_customers 테스트 ==========
     
@@ -50,15 +51,41 @@ class TestCustomerRepository:
         mock_execute_query.assert_called_once()
     
     def test_list_customers_with_keyword(self, repo, mock_execute_query, sample_customer_data):
-        """키워드로 고객 검색 (전체 조회 후 Python 필터링)."""
+        """키워드로 고객 검색 (검색 토큰으로 후보 조회 후 Python 재확인)."""
         mock_execute_query.return_value = [sample_customer_data]
 
-        result = repo.list_customers(keyword='홍')
+        result = repo.list_customers(keyword='길동')
 
         assert len(result) == 1
-        # 암호화 이후 SQL LIKE 대신 Python 필터링을 사용하므로
-        # _execute_query는 파라미터 없이 한 번만 호출됨
         mock_execute_query.assert_called_once()
+        query, params = mock_execute_query.call_args[0]
+        assert "pii_search_tokens" in query
+        # 평문 키워드는 쿼리 파라미터로 전달되지 않음
+        assert '길동' not in params
+
+    def test_list_customers_keyword_recognition_no_exact(self, repo, mock_execute_query, sample_customer_data):
+        """인정번호는 부분 문자열 토큰 없이 recognition_no_bidx 동등 조회로 후보에 포함."""
+        from backend.encryption import blind_index
+
+        mock_execute_query.return_value = [sample_customer_data]
+
+        result = repo.list_customers(keyword='L1234567890')
+
+        assert len(result) == 1
+        query, params = mock_execute_query.call_args[0]
+        assert "recognition_no_bidx = %s" in query
+        assert blind_index('L1234567890', 'customer.recognition_no') in params
+
+    def test_list_customers_single_char_keyword(self, repo, mock_execute_query, sample_customer_data):
+        """1글자 검색어는 토큰 없이 전체 후보를 복호화해 재확인."""
+        mock_execute_query.return_value = [sample_customer_data]
+
+        result = repo.list_customers(keyword='홍')
+
+        assert len(result) == 1
+        query, params = mock_execute_query.call_args[0]
+        assert "pii_search_tokens" not in query
+        assert '홍' not in params
 
     def test_list_customers_with_keyword_no_match(self, repo, mock_execute_query, sample_customer_data):
         """매칭 없는 키워드 검색 시 빈 목록 반환."""
@@ -98,9 +125,9 @@ class TestCustomerRepository:
 
     # ========== create_customer 테스트 ==========
     
-    def test_create_customer_success(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_customer_success(self, repo, mock_tx_cursor):
         """고객 생성 성공"""
-        mock_execute_transaction_lastrowid.return_value = 1
+        mock_tx_cursor.lastrowid = 1
         
         result = repo.create_customer(
             name='김철수',
@@ -111,13 +138,15 @@ class TestCustomerRepository:
         )
         
         assert result == 1
-        mock_execute_transaction_lastrowid.assert_called_once()
+        insert_params = mock_tx_cursor.execute.call_args_list[0][0][1]
+        assert '김철수' not in insert_params
+        assert insert_params[-2] is not None  # name_bidx
 
     # ========== update_customer 테스트 ==========
     
-    def test_update_customer_success(self, repo, mock_execute_transaction):
+    def test_update_customer_success(self, repo, mock_tx_cursor):
         """고객 정보 수정 성공"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
         
         result = repo.update_customer(
             customer_id=1,
@@ -129,9 +158,9 @@ class TestCustomerRepository:
         
         assert result == 1
     
-    def test_update_customer_not_found(self, repo, mock_execute_transaction):
+    def test_update_customer_not_found(self, repo, mock_tx_cursor):
         """존재하지 않는 고객 수정"""
-        mock_execute_transaction.return_value = 0
+        mock_tx_cursor.rowcount = 0
         
         result = repo.update_customer(
             customer_id=999,
@@ -143,25 +172,25 @@ class TestCustomerRepository:
 
     # ========== delete_customer 테스트 ==========
     
-    def test_delete_customer_success(self, repo, mock_execute_transaction):
+    def test_delete_customer_success(self, repo, mock_tx_cursor):
         """고객 삭제 성공"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
         
         result = repo.delete_customer(1)
         
         assert result == 1
     
-    def test_delete_customer_not_found(self, repo, mock_execute_transaction):
+    def test_delete_customer_not_found(self, repo, mock_tx_cursor):
         """존재하지 않는 고객 삭제"""
-        mock_execute_transaction.return_value = 0
+        mock_tx_cursor.rowcount = 0
         
         result = repo.delete_customer(999)
         
         assert result == 0
 
     # ========== find_by_name 테스트 ==========
-    # 암호화 이후 find_by_name/find_by_recognition_no는
-    # _execute_query(전체 조회) + Python 필터링으로 동작
+    # find_by_name/find_by_recognition_no는 블라인드 인덱스 동등 조회
+    # (+ 백필 전 행) 후 복호화 값으로 재확인
 
     def test_find_by_name_exists(self, repo, mock_execute_query, sample_customer_data):
         """이름으로 고객 검색 - 존재"""
@@ -191,26 +220,51 @@ class TestCustomerRepository:
         assert result is not None
         assert result['recognition_no'] == 'L1234567890'
 
+    def test_find_by_name_uses_blind_index(self, repo, mock_execute_query):
+        """전체 스캔 대신 name_bidx 조건으로 조회"""
+        from backend.encryption import blind_index
+
+        mock_execute_query.return_value = []
+
+        repo.find_by_name('홍길동')
+
+        query, params = mock_execute_query.call_args[0]
+        assert "WHERE name_bidx = %s" in query
+        assert params == (blind_index('홍길동', 'customer.name'),)
+
+    def test_find_by_name_bidx_collision_rechecked(self, repo, mock_execute_query, sample_customer_data):
+        """인덱스가 일치해도 복호화한 이름이 다르면 제외"""
+        mock_execute_query.return_value = [dict(sample_customer_data, name='홍길순')]
+
+        assert repo.find_by_name('홍길동') is None
+
+    def test_find_by_name_and_birth(self, repo, mock_execute_query, sample_customer_data):
+        """이름 + 생년월일 일치 확인"""
+        mock_execute_query.return_value = [sample_customer_data]
+
+        birth = sample_customer_data['birth_date']
+        assert repo.find_by_name_and_birth('홍길동', birth) is not None
+        assert repo.find_by_name_and_birth('홍길동', '1900-01-01') is None
+
     # ========== get_or_create 테스트 ==========
 
     def test_get_or_create_existing_customer(
-        self, repo, mock_execute_query, mock_execute_transaction,
-        mock_execute_transaction_lastrowid, sample_customer_data
+        self, repo, mock_execute_query, mock_tx_cursor, sample_customer_data
     ):
         """기존 고객이 있으면 업데이트 후 ID 반환"""
         mock_execute_query.return_value = [sample_customer_data]
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
 
         result = repo.get_or_create(name='홍길동', birth_date='1950-01-01')
 
         assert result == 1
 
     def test_get_or_create_new_customer(
-        self, repo, mock_execute_query, mock_execute_transaction_lastrowid
+        self, repo, mock_execute_query, mock_tx_cursor
     ):
         """새 고객이면 생성 후 ID 반환"""
         mock_execute_query.return_value = []
-        mock_execute_transaction_lastrowid.return_value = 2
+        mock_tx_cursor.lastrowid = 2
 
         result = repo.get_or_create(name='새고객', birth_date='1970-01-01')
 
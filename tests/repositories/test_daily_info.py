@@ -129,6 +129,22 @@ class TestDailyInfoRepository:
         assert any('daily_recoveries' in q for q in executed_queries)
         assert any('daily_infos' in q for q in executed_queries)
 
+    def test_delete_daily_record_bumps_weekly_analysis_version(self, repo):
+        """삭제된 기록의 (customer_id, date) 버전을 올려 주간 분석 캐시를 무효화"""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (date(2024, 1, 15), 7)
+
+        @contextmanager
+        def _mock_transaction(dictionary=False):
+            yield mock_cursor
+
+        with patch('modules.repositories.daily_info.db_transaction', _mock_transaction):
+            repo.delete_daily_record(record_id=100)
+
+        bumps = [c[0] for c in mock_cursor.execute.call_args_list if 'daily_record_versions' in c[0][0]]
+        assert len(bumps) == 1
+        assert bumps[0][1] == [7, '2024-01-15']
+
     def test_delete_daily_record_none_record_id_skips(self, repo):
         """record_id가 None이면 아무것도 실행하지 않는다"""
         with patch('modules.repositories.daily_info.db_transaction') as mock_t:
@@ -156,11 +172,12 @@ class TestDailyInfoRepository:
         with patch('modules.repositories.daily_info.db_transaction', _mock_transaction):
             repo.delete_daily_record(record_id=100)
 
-        # daily_infos는 마지막에 삭제되어야 함
+        # daily_infos는 마지막에 삭제되어야 함 (이후 대시보드 집계 갱신 쿼리는 제외)
+        deletes = [q for q in executed_queries if q.startswith('DELETE FROM daily_')]
         daily_infos_idx = next(
-            (i for i, q in enumerate(executed_queries) if 'daily_infos' in q), -1
+            (i for i, q in enumerate(deletes) if 'daily_infos' in q), -1
         )
-        assert daily_infos_idx == len(executed_queries) - 1
+        assert daily_infos_idx == len(deletes) - 1
 
     # ========== insert_daily_info 테스트 ==========
 
@@ -218,6 +235,21 @@ class TestDailyInfoRepository:
         assert date(2024, 1, 1) in params
         assert date(2024, 1, 31) in params
 
+    def test_get_records_for_customers_범위_쿼리_1회(self, repo, mock_execute_query):
+        """여러 수급자의 기간 기록을 IN + BETWEEN 쿼리 1회로 조회"""
+        mock_execute_query.return_value = []
+
+        repo.get_records_for_customers([3, 1, 3], date(2024, 1, 1), date(2024, 1, 14))
+
+        query, params = mock_execute_query.call_args[0]
+        assert 'customer_id IN (%s, %s)' in query
+        assert 'ORDER BY di.customer_id, di.date DESC' in query
+        assert params == (3, 1, date(2024, 1, 1), date(2024, 1, 14))
+
+    def test_get_records_for_customers_빈_목록(self, repo, mock_execute_query):
+        assert repo.get_records_for_customers([], date(2024, 1, 1), date(2024, 1, 14)) == []
+        mock_execute_query.assert_not_called()
+
     def test_get_customer_records_returns_empty(self, repo, mock_execute_query):
         """레코드가 없을 때 빈 리스트 반환"""
         mock_execute_query.return_value = []
@@ -314,6 +346,23 @@ class TestDailyInfoRepository:
         assert date(2024, 2, 1) in params
         assert date(2024, 2, 29) in params
 
+    def test_iter_records_by_date_range_배치별_복호화(self, repo):
+        from backend.encryption import get_encryption_service
+
+        enc = get_encryption_service()
+        batches = [
+            [{'customer_name': enc.encrypt('홍길동'), 'record_id': 1}, {'customer_name': enc.encrypt('김철수'), 'record_id': 2}],
+            [{'customer_name': enc.encrypt('이영희'), 'record_id': 3}],
+        ]
+        with patch.object(DailyInfoRepository, '_iter_query', return_value=iter(batches)) as mock:
+            result = list(repo.iter_records_by_date_range(date(2024, 1, 1), date(2024, 12, 31), batch_size=2))
+
+        assert [[row['customer_name'] for row in rows] for rows in result] == [['홍길동', '김철수'], ['이영희']]
+        query, params = mock.call_args[0]
+        assert params == (date(2024, 1, 1), date(2024, 12, 31))
+        assert 'ORDER BY di.date, di.record_id' in query
+        assert mock.call_args.kwargs['batch_size'] == 2
+
     # ========== save_parsed_data 테스트 ==========
 
     def test_save_parsed_data_empty_returns_zero(self, repo):
@@ -471,6 +520,53 @@ class TestDailyInfoRepositoryHelpers:
         executed = [call[0][0] for call in mock_cursor.execute.call_args_list]
         assert any("INSERT" in q.upper() for q in executed)
 
+    def test_bulk_get_or_create_customers_uses_blind_index(self, repo):
+        """기존 고객은 name_bidx 로 조회하고 신규 고객 이름은 암호화해 저장"""
+        from backend.encryption import EncryptionService, blind_index
+
+        enc = EncryptionService()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(1, enc.encrypt("홍길동"))]
+        mock_cursor.lastrowid = 7
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield mock_cursor
+
+        records = [{"customer_name": "홍길동"}, {"customer_name": "김철수"}]
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            result = repo._bulk_get_or_create_customers(records, ["홍길동", "김철수"])
+
+        assert result == {"홍길동": 1, "김철수": 7}
+        select_query, select_params = mock_cursor.execute.call_args_list[0][0]
+        assert "name_bidx IN" in select_query
+        assert blind_index("홍길동", "customer.name") in select_params
+        insert_params = mock_cursor.execute.call_args_list[1][0][1]
+        assert "김철수" not in insert_params
+        assert enc.decrypt(insert_params[0]) == "김철수"
+
+    def test_bulk_get_or_create_customers_matches_encrypted_unindexed(self, repo):
+        """name_bidx 백필 전 암호화 행도 복호화 값으로 찾아 중복 생성하지 않음"""
+        from backend.encryption import EncryptionService
+
+        enc = EncryptionService()
+        mock_cursor = MagicMock()
+        # name_bidx IS NULL 로 함께 조회된 행: 이름은 이미 암호문
+        mock_cursor.fetchall.return_value = [(5, enc.encrypt("이영희")), (3, enc.encrypt("다른사람"))]
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield mock_cursor
+
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            result = repo._bulk_get_or_create_customers([{"customer_name": "이영희"}], ["이영희"])
+
+        assert result == {"이영희": 5}
+        select_query, select_params = mock_cursor.execute.call_args_list[0][0]
+        assert "OR name_bidx IS NULL" in select_query
+        assert "이영희" not in select_params  # 평문 이름 비교에 기대지 않음
+        assert not any("INSERT" in c[0][0].upper() for c in mock_cursor.execute.call_args_list)
+
     # ========== _bulk_find_existing_records (DB 호출) ==========
 
     def test_bulk_find_existing_records_with_existing(self, repo):
@@ -629,22 +725,6 @@ class TestDailyInfoRepositoryHelpers:
         executed = [call[0][0] for call in cursor.execute.call_args_list]
         assert any("INSERT" in q.upper() for q in executed)
 
-    # ========== _delete_daily_record_in_transaction ==========
-
-    def test_delete_daily_record_in_transaction_executes_all_deletes(self, repo):
-        """트랜잭션 내 삭제 시 모든 하위 테이블 삭제 쿼리 실행"""
-        cursor = MagicMock()
-        queries = []
-        cursor.execute.side_effect = lambda q, p: queries.append(q)
-
-        repo._delete_daily_record_in_transaction(cursor, 100)
-
-        assert any("daily_physicals" in q for q in queries)
-        assert any("daily_cognitives" in q for q in queries)
-        assert any("daily_nursings" in q for q in queries)
-        assert any("daily_recoveries" in q for q in queries)
-        assert any("daily_infos" in q for q in queries)
-
     # ========== _insert_*_in_transaction 헬퍼 메서드 ==========
 
     def test_insert_physicals_in_transaction(self, repo):
@@ -686,3 +766,189 @@ class TestDailyInfoRepositoryHelpers:
         query = cursor.execute.call_args[0][0]
         assert "INSERT" in query.upper()
         assert "daily_recoveries" in query
+
+
+class TestDailyInfoBulkUpsert:
+    """집합 단위 저장 경로 (_process_batch / 배치 분할) 테스트"""
+
+    @pytest.fixture
+    def repo(self):
+        return DailyInfoRepository()
+
+    def _run_batch(self, repo, batch, customer_map, existing, fetched=()):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = list(fetched)
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            count = repo._process_batch(batch, customer_map, existing)
+        return count, [(c[0][0], c[0][1]) for c in cursor.execute.call_args_list]
+
+    def _records(self, n, name="홍길동"):
+        return [
+            {"customer_name": name, "date": date(2024, 1, d + 1), "start_time": "09:00",
+             "hygiene_care": "완료", "physical_note": f"메모{d}", "writer_phy": "담당"}
+            for d in range(n)
+        ]
+
+    def test_배치당_쿼리수_고정(self, repo):
+        """레코드 수와 무관하게 upsert 1 + 버전 갱신 1 + 하위 테이블별 DELETE/INSERT 1회씩"""
+        records = self._records(10)
+        existing = {(1, f"2024-01-{d + 1:02d}"): 100 + d for d in range(10)}
+        count, executed = self._run_batch(repo, records, {"홍길동": 1}, existing)
+
+        assert count == 10
+        assert len(executed) == 1 + 1 + 4 + 4
+        upsert_sql, upsert_params = executed[0]
+        assert "ON DUPLICATE KEY UPDATE" in upsert_sql
+        assert len(upsert_params) == 10 * 7
+        # 주간 분석 캐시 무효화용 (customer_id, date) 버전 갱신
+        version_sql, version_params = executed[1]
+        assert "daily_record_versions" in version_sql
+        assert version_params[:2] == [1, "2024-01-01"]
+        deletes = [(q, p) for q, p in executed if q.startswith("DELETE")]
+        assert len(deletes) == 4
+        assert deletes[0][1] == [100 + d for d in range(10)]
+
+    def test_신규_레코드는_ID_일괄조회후_하위삽입(self, repo):
+        records = self._records(2)
+        fetched = [(501, 1, date(2024, 1, 1)), (502, 1, date(2024, 1, 2))]
+        existing = {}
+        count, executed = self._run_batch(repo, records, {"홍길동": 1}, existing, fetched)
+
+        assert count == 2
+        assert not any(q.startswith("DELETE") for q, _ in executed)
+        insert_sql, params = next(
+            (q, p) for q, p in executed if q.startswith("INSERT INTO daily_physicals")
+        )
+        assert params[0] == 501 and params[11] == 502
+        assert params.count("메모1") == 1
+        assert existing == {(1, "2024-01-01"): 501, (1, "2024-01-02"): 502}
+
+    def test_같은_날짜_중복은_마지막_값(self, repo):
+        first, second = self._records(1), self._records(1)
+        second[0]["start_time"] = "10:00"
+        count, executed = self._run_batch(
+            repo, first + second, {"홍길동": 1}, {(1, "2024-01-01"): 7}
+        )
+        assert count == 1
+        assert executed[0][1][2] == "10:00"
+
+    def test_패킷_크기에_맞춰_분할(self):
+        from modules.repositories.daily_info import _estimate_record_bytes, _iter_packet_batches
+
+        records = self._records(30)
+        per_record = max(_estimate_record_bytes(r) for r in records)
+        batches = list(_iter_packet_batches(records, max_bytes=per_record * 10))
+        assert sum(len(b) for b in batches) == 30
+        assert all(sum(_estimate_record_bytes(r) for r in b) <= per_record * 10 for b in batches)
+        assert len(batches) >= 3
+
+    def test_행수_상한(self):
+        from modules.repositories.daily_info import _iter_packet_batches
+
+        batches = list(_iter_packet_batches(self._records(25), max_bytes=10 ** 9, max_rows=10))
+        assert [len(b) for b in batches] == [10, 10, 5]
+
+    def test_batch_size_미지정시_패킷기준_분할(self, repo):
+        records = self._records(5)
+        with patch('modules.repositories.daily_info._get_max_allowed_packet', return_value=10 ** 9), \
+             patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+             patch.object(repo, '_bulk_find_existing_records', return_value={}), \
+             patch.object(repo, '_process_batch', return_value=5) as mock_batch:
+            progress = MagicMock()
+            assert repo.save_parsed_data(records, progress=progress) == 5
+        mock_batch.assert_called_once()
+        progress.assert_called_once_with(5, 5)
+
+
+class TestRecordIdLookup:
+    """기존 레코드 조회 전략 (lookup_record_ids) 테스트"""
+
+    def _cursor(self, rows=()):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = list(rows)
+        return cursor
+
+    def _sqls(self, cursor):
+        return [c[0][0] for c in cursor.execute.call_args_list]
+
+    def test_범위조회_한번에_요청키만_반환(self):
+        from modules.repositories.daily_info import lookup_record_ids
+
+        cursor = self._cursor([
+            {"record_id": 1, "customer_id": 1, "date": date(2024, 1, 1)},
+            {"record_id": 2, "customer_id": 1, "date": date(2024, 1, 2)},  # 범위 내 미요청
+            {"record_id": 3, "customer_id": 2, "date": date(2024, 1, 3)},
+        ])
+        keys = [(1, "2024-01-01"), (2, "2024-01-03")]
+        result = lookup_record_ids(cursor, keys, strategy="range")
+
+        assert result == {(1, "2024-01-01"): 1, (2, "2024-01-03"): 3}
+        sqls = self._sqls(cursor)
+        assert len(sqls) == 1
+        assert "BETWEEN" in sqls[0] and " OR " not in sqls[0]
+        assert cursor.execute.call_args[0][1] == [1, 2, "2024-01-01", "2024-01-03"]
+
+    def test_범위조회_수급자_묶음_단위(self):
+        import modules.repositories.daily_info as mod
+
+        cursor = self._cursor()
+        keys = [(cid, "2024-01-01") for cid in range(5)]
+        with patch.object(mod, "_RANGE_LOOKUP_CUSTOMERS", 2):
+            mod.lookup_record_ids(cursor, keys, strategy="range")
+        assert cursor.execute.call_count == 3
+
+    def test_임시테이블_조인후_삭제(self):
+        from modules.repositories.daily_info import lookup_record_ids
+
+        cursor = self._cursor([(7, 1, date(2024, 1, 1))])
+        result = lookup_record_ids(cursor, [(1, "2024-01-01"), (1, "2024-01-01")], strategy="temp_table")
+
+        assert result == {(1, "2024-01-01"): 7}
+        sqls = self._sqls(cursor)
+        assert sqls[0].startswith("CREATE TEMPORARY TABLE")
+        assert any(q.startswith("INSERT IGNORE") for q in sqls)
+        assert any("JOIN tmp_record_lookup" in q for q in sqls)
+        assert sqls[-1].startswith("DROP TEMPORARY TABLE")
+
+    def test_임시테이블_실패시_범위조회_대체(self):
+        from modules.repositories.daily_info import lookup_record_ids
+
+        cursor = self._cursor()
+
+        def _execute(sql, *args):
+            if sql.startswith("CREATE TEMPORARY"):
+                raise Exception("권한 없음")
+
+        cursor.execute.side_effect = _execute
+        lookup_record_ids(cursor, [(1, "2024-01-01")], strategy="temp_table")
+        assert "BETWEEN" in self._sqls(cursor)[-1]
+
+    def test_건수에_따라_전략_자동선택(self):
+        import modules.repositories.daily_info as mod
+
+        with patch.object(mod, "EXISTING_LOOKUP_TEMP_TABLE_MIN", 3), \
+             patch.object(mod, "_lookup_record_ids_by_temp_table", return_value={}) as temp, \
+             patch.object(mod, "_lookup_record_ids_by_range", return_value={}) as rng:
+            mod.lookup_record_ids(MagicMock(), [(1, "2024-01-01")] * 2)
+            mod.lookup_record_ids(MagicMock(), [(1, f"2024-01-0{d}") for d in range(1, 4)])
+        assert rng.call_count == 1 and temp.call_count == 1
+
+    def test_기존레코드_조회는_연결_하나(self):
+        repo = DailyInfoRepository()
+        opened = []
+
+        @contextmanager
+        def _mock_query(dictionary=True):
+            opened.append(True)
+            yield self._cursor()
+
+        records = [{"customer_name": f"고객{i}", "date": date(2024, 1, 1)} for i in range(300)]
+        customer_map = {f"고객{i}": i for i in range(300)}
+        with patch("modules.repositories.daily_info.db_query", _mock_query):
+            repo._bulk_find_existing_records(customer_map, records)
+        assert len(opened) == 1
@@ -0,0 +1,96 @@
+"""dashboard_rollup (대시보드 일별 집계 유지) 테스트"""
+
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules.repositories import dashboard_rollup
+from modules.repositories.dashboard_rollup import (
+    AI_GRADE_TABLE,
+    EMP_EVAL_TABLE,
+    emp_eval_dates,
+    rebuild_rollups,
+    refresh_ai_grade_days,
+    refresh_ai_grade_for_records,
+    refresh_emp_eval_days,
+)
+
+
+class TestRefresh:
+    def test_AI_집계_날짜별_삭제후_재집계(self):
+        cursor = MagicMock()
+        refresh_ai_grade_days(cursor, [date(2024, 1, 1), None, date(2024, 1, 1), date(2024, 1, 2)])
+
+        (delete_sql, delete_params), (insert_sql, insert_params) = [
+            c[0] for c in cursor.execute.call_args_list
+        ]
+        assert delete_sql.startswith(f"DELETE FROM {AI_GRADE_TABLE}")
+        assert f"INSERT INTO {AI_GRADE_TABLE}" in insert_sql
+        assert "GROUP BY" in insert_sql
+        # None 제외, 중복 제거
+        assert delete_params == insert_params == [date(2024, 1, 1), date(2024, 1, 2)]
+
+    def test_직원평가_집계_날짜별_삭제후_재집계(self):
+        cursor = MagicMock()
+        refresh_emp_eval_days(cursor, [date(2024, 1, 3)])
+
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        assert queries[0].startswith(f"DELETE FROM {EMP_EVAL_TABLE}")
+        assert "FROM employee_evaluations" in queries[1]
+
+    @pytest.mark.parametrize("refresh", [refresh_ai_grade_days, refresh_emp_eval_days])
+    def test_빈_날짜는_쿼리없음(self, refresh):
+        cursor = MagicMock()
+        refresh(cursor, [None])
+        cursor.execute.assert_not_called()
+
+    def test_기록_id로_날짜_조회후_갱신(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(date(2024, 1, 5),)]
+        refresh_ai_grade_for_records(cursor, [7, 7])
+
+        calls = cursor.execute.call_args_list
+        assert calls[0][0][1] == [7]
+        assert calls[1][0][1] == [date(2024, 1, 5)]
+
+    def test_평가_행_없으면_빈_목록(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        assert emp_eval_dates(cursor, 1) == []
+
+
+class TestRebuild:
+    @pytest.fixture
+    def cursor(self):
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [
+            (date(2024, 1, 1), date(2024, 2, 15)),  # AI 평가 기간
+            (None, None),                            # 직원 평가 없음
+        ]
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+
+        with patch.object(dashboard_rollup, "db_transaction", _mock_tx):
+            yield cursor
+
+    def test_전체_재구축은_비우고_청크단위_재집계(self, cursor):
+        counts = rebuild_rollups()
+
+        assert counts == {AI_GRADE_TABLE: 46, EMP_EVAL_TABLE: 0}
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        assert f"DELETE FROM {AI_GRADE_TABLE}" in queries
+        assert f"DELETE FROM {EMP_EVAL_TABLE}" in queries
+        # 31일 + 15일 두 청크
+        inserts = [q for q in queries if "INSERT INTO" in q]
+        assert len(inserts) == 2
+
+    def test_기간_재구축은_전체삭제_안함(self, cursor):
+        counts = rebuild_rollups(date(2024, 1, 10), date(2024, 1, 12))
+
+        assert counts == {AI_GRADE_TABLE: 3, EMP_EVAL_TABLE: 3}
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        assert f"DELETE FROM {AI_GRADE_TABLE}" not in queries
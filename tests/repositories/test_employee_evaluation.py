@@ -1,7 +1,8 @@
 """EmployeeEvaluationRepository 테스트"""
 
 import pytest
-from unittest.mock import patch
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 from datetime import date
 from modules.repositories.employee_evaluation import EmployeeEvaluationRepository
 
@@ -32,6 +33,19 @@ class TestEmployeeEvaluationRepository:
         with patch.object(EmployeeEvaluationRepository, '_execute_transaction') as mock:
             yield mock
     
+    @pytest.fixture
+    def mock_tx_cursor(self):
+        """수정/삭제는 평가 행 변경 + 대시보드 집계 갱신을 한 트랜잭션에서 실행"""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (date(2024, 1, 15),)
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+
+        with patch('modules.repositories.employee_evaluation.db_transaction', _mock_tx):
+            yield cursor
+
     @pytest.fixture
     def mock_execute_transaction_lastrowid(self):
         """_execute_transaction_lastrowid 메서드 mock"""
@@ -127,17 +141,18 @@ class TestEmployeeEvaluationRepository:
 
     # ========== delete_evaluation 테스트 ==========
     
-    def test_delete_evaluation_success(self, repo, mock_execute_transaction):
+    def test_delete_evaluation_success(self, repo, mock_tx_cursor):
         """평가 삭제 성공"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
         
         result = repo.delete_evaluation(emp_eval_id=1)
         
         assert result == 1
     
-    def test_delete_evaluation_not_found(self, repo, mock_execute_transaction):
+    def test_delete_evaluation_not_found(self, repo, mock_tx_cursor):
         """존재하지 않는 평가 삭제"""
-        mock_execute_transaction.return_value = 0
+        mock_tx_cursor.rowcount = 0
+        mock_tx_cursor.fetchone.return_value = None
         
         result = repo.delete_evaluation(emp_eval_id=999)
         
@@ -173,9 +188,9 @@ class TestEmployeeEvaluationRepository:
 
     # ========== update_evaluation 테스트 ==========
     
-    def test_update_evaluation_success(self, repo, mock_execute_transaction):
+    def test_update_evaluation_success(self, repo, mock_tx_cursor):
         """평가 수정 성공"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
         
         result = repo.update_evaluation(
             emp_eval_id=1,
@@ -186,10 +201,17 @@ class TestEmployeeEvaluationRepository:
         )
         
         assert result == 1
+        # 변경 전(1/15)·후(1/20) 날짜 모두 집계 재계산
+        rollup_delete = [
+            c for c in mock_tx_cursor.execute.call_args_list
+            if c[0][0].startswith("DELETE FROM rollup_emp_eval_daily")
+        ]
+        assert rollup_delete[0][0][1] == [date(2024, 1, 15), date(2024, 1, 20)]
     
-    def test_update_evaluation_not_found(self, repo, mock_execute_transaction):
+    def test_update_evaluation_not_found(self, repo, mock_tx_cursor):
         """존재하지 않는 평가 수정"""
-        mock_execute_transaction.return_value = 0
+        mock_tx_cursor.rowcount = 0
+        mock_tx_cursor.fetchone.return_value = None
         
         result = repo.update_evaluation(
             emp_eval_id=999,
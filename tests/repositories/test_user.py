@@ -5,7 +5,8 @@
 """
 
 import pytest
-from unittest.mock import patch
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 from datetime import date
 from modules.repositories.user import UserRepository
 
@@ -33,9 +34,16 @@ class TestUserRepository:
             yield mock
 
     @pytest.fixture
-    def mock_execute_transaction_lastrowid(self):
-        with patch.object(UserRepository, '_execute_transaction_lastrowid') as mock:
-            yield mock
+    def mock_tx_cursor(self):
+        """생성/수정은 users 행 + 이름 검색 토큰을 한 트랜잭션에서 기록"""
+        cursor = MagicMock()
+
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+
+        with patch('modules.repositories.user.db_transaction', _mock_tx):
+            yield cursor
 
     @pytest.fixture
     def sample_user(self):
@@ -132,9 +140,9 @@ class TestUserRepository:
 
     # ========== create_user 테스트 ==========
 
-    def test_create_user_success(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_user_success(self, repo, mock_tx_cursor):
         """직원 생성 성공 - 새 user_id 반환"""
-        mock_execute_transaction_lastrowid.return_value = 5
+        mock_tx_cursor.lastrowid = 5
 
         result = repo.create_user(
             username='hong123',
@@ -148,11 +156,15 @@ class TestUserRepository:
         )
 
         assert result == 5
-        mock_execute_transaction_lastrowid.assert_called_once()
+        params = mock_tx_cursor.execute.call_args_list[0][0][1]
+        assert '홍길동' not in params
+        assert params[-1] is not None  # name_bidx
+        token_insert = mock_tx_cursor.execute.call_args_list[-1][0][0]
+        assert 'pii_search_tokens' in token_insert
 
-    def test_create_user_minimal_fields(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_user_minimal_fields(self, repo, mock_tx_cursor):
         """최소 필드만으로 직원 생성"""
-        mock_execute_transaction_lastrowid.return_value = 3
+        mock_tx_cursor.lastrowid = 3
 
         result = repo.create_user(
             username='min_user',
@@ -162,9 +174,9 @@ class TestUserRepository:
 
         assert result == 3
 
-    def test_create_user_with_role(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_user_with_role(self, repo, mock_tx_cursor):
         """관리자 역할로 직원 생성"""
-        mock_execute_transaction_lastrowid.return_value = 1
+        mock_tx_cursor.lastrowid = 1
 
         result = repo.create_user(
             username='admin',
@@ -174,33 +186,33 @@ class TestUserRepository:
         )
 
         assert result == 1
-        call_args = mock_execute_transaction_lastrowid.call_args[0][1]
+        call_args = mock_tx_cursor.execute.call_args_list[0][0][1]
         assert 'ADMIN' in call_args
 
-    def test_create_user_default_role_is_employee(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_user_default_role_is_employee(self, repo, mock_tx_cursor):
         """기본 역할이 EMPLOYEE인지 확인"""
-        mock_execute_transaction_lastrowid.return_value = 2
+        mock_tx_cursor.lastrowid = 2
 
         repo.create_user(username='emp', password='pass', name='직원')
 
-        call_args = mock_execute_transaction_lastrowid.call_args[0][1]
+        call_args = mock_tx_cursor.execute.call_args_list[0][0][1]
         assert 'EMPLOYEE' in call_args
 
-    def test_create_user_query_contains_insert(self, repo, mock_execute_transaction_lastrowid):
+    def test_create_user_query_contains_insert(self, repo, mock_tx_cursor):
         """INSERT 쿼리가 실행되는지 확인"""
-        mock_execute_transaction_lastrowid.return_value = 1
+        mock_tx_cursor.lastrowid = 1
 
         repo.create_user(username='u', password='p', name='테스트')
 
-        query = mock_execute_transaction_lastrowid.call_args[0][0]
+        query = mock_tx_cursor.execute.call_args_list[0][0][0]
         assert 'INSERT' in query.upper()
         assert 'users' in query.lower()
 
     # ========== update_user 테스트 ==========
 
-    def test_update_user_success(self, repo, mock_execute_transaction):
+    def test_update_user_success(self, repo, mock_tx_cursor):
         """직원 정보 수정 성공"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
 
         result = repo.update_user(
             user_id=1,
@@ -211,11 +223,10 @@ class TestUserRepository:
         )
 
         assert result == 1
-        mock_execute_transaction.assert_called_once()
 
-    def test_update_user_not_found(self, repo, mock_execute_transaction):
+    def test_update_user_not_found(self, repo, mock_tx_cursor):
         """존재하지 않는 직원 수정 시 0 반환"""
-        mock_execute_transaction.return_value = 0
+        mock_tx_cursor.rowcount = 0
 
         result = repo.update_user(
             user_id=999,
@@ -224,23 +235,23 @@ class TestUserRepository:
 
         assert result == 0
 
-    def test_update_user_query_contains_update(self, repo, mock_execute_transaction):
+    def test_update_user_query_contains_update(self, repo, mock_tx_cursor):
         """UPDATE 쿼리가 실행되는지 확인"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
 
         repo.update_user(user_id=1, name='홍길동')
 
-        query = mock_execute_transaction.call_args[0][0]
+        query = mock_tx_cursor.execute.call_args_list[0][0][0]
         assert 'UPDATE' in query.upper()
         assert 'users' in query.lower()
 
-    def test_update_user_includes_user_id_in_params(self, repo, mock_execute_transaction):
+    def test_update_user_includes_user_id_in_params(self, repo, mock_tx_cursor):
         """UPDATE 쿼리 파라미터에 user_id가 포함되는지 확인"""
-        mock_execute_transaction.return_value = 1
+        mock_tx_cursor.rowcount = 1
 
         repo.update_user(user_id=7, name='홍길동')
 
-        params = mock_execute_transaction.call_args[0][1]
+        params = mock_tx_cursor.execute.call_args_list[0][0][1]
         assert 7 in params
 
     # ========== soft_delete_user 테스트 ==========
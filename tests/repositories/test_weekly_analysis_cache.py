@@ -0,0 +1,114 @@
+"""WeeklyAnalysisCacheRepository / 기록 버전 갱신 테스트"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from modules.repositories import weekly_analysis_cache
+from modules.repositories.weekly_analysis_cache import (
+    ANALYSIS_CACHE_LOOKUPS,
+    WeeklyAnalysisCacheRepository,
+    bump_record_versions,
+    bump_versions_for_records,
+)
+
+_RESULTS = ("hit", "miss", "stale")
+
+
+@pytest.fixture
+def lookups():
+    """테스트 중 늘어난 조회 결과 수 (카운터는 프로세스 누적이라 시작 값을 뺀다)."""
+    before = {r: ANALYSIS_CACHE_LOOKUPS.value(result=r) for r in _RESULTS}
+    return lambda: {r: ANALYSIS_CACHE_LOOKUPS.value(result=r) - before[r] for r in _RESULTS}
+
+
+class TestBumpVersions:
+    def test_날짜별_버전_증가_중복제거(self):
+        cursor = MagicMock()
+        bump_record_versions(cursor, [(1, date(2024, 1, 8)), (1, "2024-01-08"), (2, date(2024, 1, 9))])
+
+        sql, params = cursor.execute.call_args[0]
+        assert "ON DUPLICATE KEY UPDATE version = version + 1" in sql
+        assert params == [1, "2024-01-08", 2, "2024-01-09"]
+
+    def test_record_id로_버전_증가(self):
+        cursor = MagicMock()
+        bump_versions_for_records(cursor, [5, 5, 6])
+
+        sql, params = cursor.execute.call_args[0]
+        assert "FROM daily_infos" in sql
+        assert params == [5, 6]
+
+    @pytest.mark.parametrize("bump", [bump_record_versions, bump_versions_for_records])
+    def test_빈_입력은_쿼리없음(self, bump):
+        cursor = MagicMock()
+        bump(cursor, [])
+        cursor.execute.assert_not_called()
+
+
+class TestWeeklyAnalysisCacheRepository:
+    @pytest.fixture
+    def repo(self):
+        return WeeklyAnalysisCacheRepository()
+
+    @pytest.fixture
+    def mock_query_one(self):
+        with patch.object(WeeklyAnalysisCacheRepository, "_execute_query_one") as mock:
+            yield mock
+
+    def test_버전_일치시_적중(self, repo, mock_query_one, lookups):
+        mock_query_one.return_value = {"payload": '{"scores": {}}', "fresh": 1}
+        assert repo.load(1, date(2024, 1, 8), date(2024, 1, 14)) == '{"scores": {}}'
+        assert lookups() == {"hit": 1, "miss": 0, "stale": 0}
+
+        # 의존 범위: 전주 시작 ~ 이번주 끝, 전주 보고서
+        params = mock_query_one.call_args[0][1]
+        assert params[:3] == (1, date(2024, 1, 1), date(2024, 1, 14))
+        assert params[4:6] == (date(2024, 1, 1), date(2024, 1, 7))
+
+    def test_버전_불일치시_stale(self, repo, mock_query_one, lookups):
+        mock_query_one.return_value = {"payload": '{"scores": {}}', "fresh": 0}
+        assert repo.load(1, date(2024, 1, 8), date(2024, 1, 14)) is None
+        assert lookups()["stale"] == 1
+
+    def test_항목없으면_miss(self, repo, mock_query_one, lookups):
+        mock_query_one.return_value = {"payload": None, "fresh": None}
+        assert repo.load(1, date(2024, 1, 8), date(2024, 1, 14)) is None
+        assert lookups()["miss"] == 1
+
+    def test_저장시_버전_포함(self, repo):
+        with patch.object(WeeklyAnalysisCacheRepository, "_execute_transaction") as mock_tx:
+            repo.save(1, date(2024, 1, 8), date(2024, 1, 14), "12:1700000000", "{}")
+
+        sql, params = mock_tx.call_args[0]
+        assert weekly_analysis_cache.ANALYSIS_CACHE_TABLE in sql
+        assert params == (1, date(2024, 1, 8), date(2024, 1, 14), "12:1700000000", "{}")
+
+    def test_일괄_조회는_쿼리1회로_버전과_캐시(self, repo, lookups):
+        rows = [
+            {"customer_id": 1, "data_version": "3:", "payload": "{}", "fresh": 1},
+            {"customer_id": 2, "data_version": "5:", "payload": "{}", "fresh": 0},
+            {"customer_id": 3, "data_version": "0:", "payload": None, "fresh": None},
+        ]
+        with patch.object(WeeklyAnalysisCacheRepository, "_execute_query", return_value=rows) as mock_query:
+            result = repo.load_many([1, 2, 3, 1], date(2024, 1, 8), date(2024, 1, 14))
+
+        assert result == {1: ("{}", "3:"), 2: (None, "5:"), 3: (None, "0:")}
+        assert lookups() == {"hit": 1, "miss": 1, "stale": 1}
+        mock_query.assert_called_once()
+        sql, params = mock_query.call_args[0]
+        # 단건 조회와 같은 버전 식을 수급자 컬럼으로 상관 서브쿼리화
+        assert "customer_id = cu.customer_id" in sql
+        assert params == (date(2024, 1, 1), date(2024, 1, 14), date(2024, 1, 1), date(2024, 1, 7),
+                          1, 2, 3, date(2024, 1, 8), date(2024, 1, 14))
+
+    def test_일괄_저장은_트랜잭션1회(self, repo):
+        with patch.object(WeeklyAnalysisCacheRepository, "_execute_transaction_many") as mock_many:
+            repo.save_many(date(2024, 1, 8), date(2024, 1, 14), [(1, "3:", "{}"), (2, "5:", "[]")])
+            repo.save_many(date(2024, 1, 8), date(2024, 1, 14), [])
+
+        mock_many.assert_called_once()
+        assert mock_many.call_args[0][1] == [
+            (1, date(2024, 1, 8), date(2024, 1, 14), "3:", "{}"),
+            (2, date(2024, 1, 8), date(2024, 1, 14), "5:", "[]"),
+        ]
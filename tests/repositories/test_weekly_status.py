@@ -234,3 +234,22 @@ class TestWeeklyStatusRepository:
         assert 3 in params
         assert date(2024, 3, 4) in params
         assert date(2024, 3, 10) in params
+
+    # ========== load_weekly_statuses 테스트 ==========
+
+    def test_load_weekly_statuses_한번에_조회(self, repo, mock_execute_query):
+        """여러 수급자의 같은 기간 보고서를 쿼리 1회로 조회"""
+        mock_execute_query.return_value = [
+            {'customer_id': 1, 'report_text': '보고서1'},
+            {'customer_id': 3, 'report_text': '보고서3'},
+        ]
+
+        result = repo.load_weekly_statuses([1, 2, 3, 1], date(2024, 1, 1), date(2024, 1, 7))
+
+        assert result == {1: '보고서1', 3: '보고서3'}
+        params = mock_execute_query.call_args[0][1]
+        assert params == (1, 2, 3, date(2024, 1, 1), date(2024, 1, 7))
+
+    def test_load_weekly_statuses_빈_목록(self, repo, mock_execute_query):
+        assert repo.load_weekly_statuses([], date(2024, 1, 1), date(2024, 1, 7)) == {}
+        mock_execute_query.assert_not_called()
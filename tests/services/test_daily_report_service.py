@@ -1,8 +1,19 @@
 """EvaluationService 테스트"""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
-from modules.services.daily_report_service import EvaluationService
+from modules.clients.llm_cache import LLMCache, lookup_cached
+from modules.clients.daily_prompt import SYSTEM_PROMPT, get_special_note_batch_prompt
+from modules.clients.rate_limit import ProviderLimiter
+from modules.services.daily_report_service import (
+    SPECIAL_NOTE_MODEL,
+    SPECIAL_NOTE_PROVIDER,
+    SPECIAL_NOTE_TEMPERATURE,
+    EvaluationService,
+)
 
 
 class TestEvaluationService:
@@ -674,3 +685,212 @@ class TestEvaluationServiceAdditional:
 
         # fallback으로 첫 번째 후보 반환 또는 정상 처리
         assert result in candidates
+
+
+class TestEvaluateSpecialNotesConcurrently:
+    """evaluate_special_notes_concurrently 동시 평가 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        with patch('modules.services.daily_report_service.AiEvaluationRepository'), \
+             patch('modules.services.daily_report_service.BaseRepository'), \
+             patch('modules.services.daily_report_service.get_special_note_prompt',
+                   side_effect=lambda record: ('system', record['physical_note'] or '')), \
+             patch('modules.services.daily_report_service.get_rate_limiter',
+                   return_value=ProviderLimiter(rpm=0, tpm=0)), \
+             patch('modules.services.daily_report_service.SPECIAL_NOTE_BATCH_SIZE', 1):
+            yield EvaluationService()
+
+    @staticmethod
+    def _client(sample_ai_response, peak=None):
+        client = MagicMock()
+        state = {'in_flight': 0}
+
+        async def achat(model, messages, **kwargs):
+            state['in_flight'] += 1
+            if peak is not None:
+                peak.append(state['in_flight'])
+            await asyncio.sleep(0.01)
+            state['in_flight'] -= 1
+            if messages[1]['content'] == '실패':
+                raise ValueError('잘못된 응답')
+            response = MagicMock()
+            response.choices[0].message.content = sample_ai_response
+            return response
+
+        client.achat_completion = achat
+        return client
+
+    def test_입력순서_결과_빈특이사항과_실패는_None(self, service, sample_ai_response):
+        records = [
+            {'record_id': 1, 'physical_note': '보행 보조', 'cognitive_note': ''},
+            {'record_id': 2, 'physical_note': '', 'cognitive_note': ''},
+            {'record_id': 3, 'physical_note': '실패', 'cognitive_note': ''},
+        ]
+        seen = []
+        with patch('modules.services.daily_report_service.get_ai_client',
+                   return_value=self._client(sample_ai_response)):
+            results = service.evaluate_special_notes_concurrently(
+                records, on_result=lambda record, result: seen.append((record['record_id'], result is not None))
+            )
+
+        assert results[0]['original_physical']['grade'] == '우수'
+        assert results[1:] == [None, None]
+        assert sorted(seen) == [(1, True), (2, False), (3, False)]
+
+    def test_동시에_호출(self, service, sample_ai_response):
+        peak = []
+        records = [{'record_id': i, 'physical_note': f'기록{i}'} for i in range(8)]
+        with patch('modules.services.daily_report_service.get_ai_client',
+                   return_value=self._client(sample_ai_response, peak)):
+            results = service.evaluate_special_notes_concurrently(records)
+
+        assert all(results)
+        assert max(peak) > 1
+
+    def test_콜백_예외시_중단(self, service, sample_ai_response):
+        records = [{'record_id': i, 'physical_note': f'기록{i}'} for i in range(3)]
+
+        def on_result(record, result):
+            raise RuntimeError('취소')
+
+        with patch('modules.services.daily_report_service.get_ai_client',
+                   return_value=self._client(sample_ai_response)):
+            with pytest.raises(RuntimeError):
+                service.evaluate_special_notes_concurrently(records, on_result=on_result)
+
+    def test_재실행시_실패하거나_바뀐_기록만_호출(self, service, sample_ai_response, tmp_path):
+        client = self._client(sample_ai_response)
+        calls = []
+        achat = client.achat_completion
+
+        async def counting(model, messages, **kwargs):
+            calls.append(messages[1]['content'])
+            return await achat(model, messages, **kwargs)
+
+        client.achat_completion = counting
+        records = [{'record_id': i, 'physical_note': f'기록{i}'} for i in range(3)]
+        records.append({'record_id': 3, 'physical_note': '실패'})
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client), \
+             patch('modules.clients.llm_cache.get_llm_cache', return_value=LLMCache(tmp_path / 'llm.sqlite3')):
+            first = service.evaluate_special_notes_concurrently(records)
+            calls.clear()
+            records[1] = {'record_id': 1, 'physical_note': '기록1 수정'}
+            second = service.evaluate_special_notes_concurrently(records)
+
+        assert first[3] is None and second[3] is None
+        assert sorted(calls) == ['기록1 수정', '실패']
+        assert second[0] == first[0]
+
+    def test_클라이언트_초기화_실패시_전부_None(self, service):
+        with patch('modules.services.daily_report_service.get_ai_client', side_effect=Exception('키 없음')):
+            assert service.evaluate_special_notes_concurrently([{'physical_note': 'a'}]) == [None]
+        assert service.evaluate_special_notes_concurrently([]) == []
+
+
+class TestEvaluateSpecialNotesBatched:
+    """여러 기록을 한 요청으로 묶는 배치 평가 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        with patch('modules.services.daily_report_service.AiEvaluationRepository'), \
+             patch('modules.services.daily_report_service.BaseRepository'), \
+             patch('modules.services.daily_report_service.get_rate_limiter',
+                   return_value=ProviderLimiter(rpm=0, tpm=0)):
+            yield EvaluationService()
+
+    @staticmethod
+    def _client(sample_ai_response, batch_ids=None):
+        """요청마다 묶인 기록 수를 client.sizes 에 남기는 클라이언트.
+
+        batch_ids(기록 수) 로 배치 응답에 담을 record_id 목록을 정한다 (기본: 전부).
+        """
+        client = MagicMock()
+        client.sizes = []
+        item = json.loads(sample_ai_response)
+
+        async def achat(model, messages, **kwargs):
+            size = messages[1]['content'].count('<physical_note>')
+            client.sizes.append(size)
+            response = MagicMock()
+            if '<daily_activity_records>' not in messages[1]['content']:
+                response.choices[0].message.content = sample_ai_response
+            else:
+                ids = batch_ids(size) if batch_ids else [str(i) for i in range(1, size + 1)]
+                response.choices[0].message.content = json.dumps(
+                    {'results': [{'record_id': record_id, **item} for record_id in ids]}
+                )
+            return response
+
+        client.achat_completion = achat
+        return client
+
+    @staticmethod
+    def _records(count):
+        return [{'record_id': i, 'physical_note': f'기록{i}', 'cognitive_note': ''} for i in range(count)]
+
+    def test_batch_size_건씩_묶어_호출(self, service, sample_ai_response):
+        client = self._client(sample_ai_response)
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client):
+            results = service.evaluate_special_notes_concurrently(self._records(7), batch_size=3)
+
+        assert sorted(client.sizes) == [1, 3, 3]
+        assert all(result['original_physical']['grade'] == '우수' for result in results)
+
+    def test_누락_기록만_단건_재평가(self, service, sample_ai_response):
+        # 2번 누락, 범위 밖 id 와 중복 id 는 무시
+        client = self._client(sample_ai_response, batch_ids=lambda size: ['1', '3', '3', '9'])
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client):
+            results = service.evaluate_special_notes_concurrently(self._records(3), batch_size=3)
+
+        assert client.sizes == [3, 1]
+        assert all(results)
+
+    def test_배치_응답_검증_실패시_전부_단건(self, service, sample_ai_response):
+        client = self._client(sample_ai_response, batch_ids=lambda size: [])
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client):
+            results = service.evaluate_special_notes_concurrently(self._records(3), batch_size=3)
+
+        assert sorted(client.sizes) == [1, 1, 1, 3]
+        assert all(results)
+
+    def test_배치_결과를_기록_단위로_캐시(self, service, sample_ai_response, tmp_path):
+        client = self._client(sample_ai_response)
+        records = self._records(4)
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client), \
+             patch('modules.clients.llm_cache.get_llm_cache', return_value=LLMCache(tmp_path / 'llm.sqlite3')):
+            first = service.evaluate_special_notes_concurrently(records, batch_size=4)
+            client.sizes.clear()
+            records[2] = {'record_id': 2, 'physical_note': '기록2 수정'}
+            second = service.evaluate_special_notes_concurrently(records, batch_size=4)
+
+        assert client.sizes == [1]
+        assert second == first
+
+    def test_강제_재평가_배치결과는_기록_단위_캐시에_안씀(self, service, sample_ai_response, tmp_path):
+        client = self._client(sample_ai_response)
+        records = self._records(3)
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=client), \
+             patch('modules.clients.llm_cache.get_llm_cache', return_value=LLMCache(tmp_path / 'llm.sqlite3')):
+            service.evaluate_special_notes_concurrently(records, batch_size=3, use_cache=False)
+            hits = [
+                lookup_cached(
+                    SPECIAL_NOTE_PROVIDER, SPECIAL_NOTE_MODEL, service._special_note_messages(record),
+                    temperature=SPECIAL_NOTE_TEMPERATURE, purpose='special_note',
+                )[0]
+                for record in records
+            ]
+
+        assert client.sizes == [3]
+        assert hits == [False, False, False]
+
+    def test_배치_프롬프트(self):
+        system_a, user_a = get_special_note_batch_prompt(self._records(2))
+        system_b, user_b = get_special_note_batch_prompt(self._records(3))
+
+        # system 프롬프트는 배치 내용과 무관하게 같아야 공급자 프롬프트 캐시에 걸린다
+        assert system_a == system_b
+        assert system_a.startswith(SYSTEM_PROMPT)
+        assert '<daily_activity_record record_id="2">' in user_a
+        assert '<daily_activity_record record_id="3">' in user_b
@@ -16,6 +16,7 @@ from unittest.mock import MagicMock, patch, call
 from contextlib import contextmanager
 
 import modules.db_connection as db_module
+from modules.db_pool import PoolTimeout
 from modules.db_connection import (
     set_connection_factory,
     get_db_config,
@@ -157,6 +158,47 @@ class TestConnectionFactory:
         assert db_module._connection_factory is None
 
 
+# backend 테스트의 세션 픽스처가 _get_connection_pool 을 패치하므로 실제 함수를 잡아 둔다
+_real_get_connection_pool = db_module._get_connection_pool
+
+
+class TestConnectionPool:
+    """
+    비즈니스 규칙:
+      - 설정은 풀을 만들 때 한 번만 읽음 (대여마다 secrets.toml 재조회 없음)
+      - 풀이 가득 차면 직접 연결로 우회하지 않고 PoolTimeout
+    """
+
+    @pytest.fixture(autouse=True)
+    def real_pool(self):
+        with patch.object(db_module, "_get_connection_pool", _real_get_connection_pool):
+            yield
+
+    def test_설정은_한번만_읽음(self):
+        with patch.object(db_module, "get_db_config", return_value={"host": "h"}) as config, \
+             patch.object(db_module.mysql.connector, "connect", return_value=MagicMock()) as connect:
+            get_db_connection().close()
+            get_db_connection().close()
+
+        config.assert_called_once()
+        connect.assert_called_once_with(host="h")
+        assert db_module.get_pool_stats()["checkouts"] == 2
+
+    def test_풀_소진시_직접연결_우회_없음(self):
+        with patch.object(db_module, "get_db_config", return_value={"host": "h"}), \
+             patch.object(db_module, "DB_POOL_TIMEOUT", 0.01), \
+             patch("modules.utils.memory_utils.DB_POOL_SIZE", 1), \
+             patch.object(db_module.mysql.connector, "connect", return_value=MagicMock()) as connect:
+            get_db_connection()
+            with pytest.raises(PoolTimeout):
+                get_db_connection()
+
+        connect.assert_called_once()
+
+    def test_풀_없으면_통계_None(self):
+        assert db_module.get_pool_stats() is None
+
+
 # ───────────────────────────────────────────────────────────────
 # 3. db_transaction — 커밋/롤백 동작
 # ───────────────────────────────────────────────────────────────
@@ -250,7 +292,11 @@ class TestDbTransaction:
         set_connection_factory(lambda: conn)
 
         with db_transaction() as c:
-            assert c is cursor
+            c.execute("INSERT INTO t VALUES (%s)", (1,))
+            assert c.lastrowid is cursor.lastrowid
+
+        # 계측 래퍼가 원래 커서에 위임
+        cursor.execute.assert_called_once_with("INSERT INTO t VALUES (%s)", (1,))
 
 
 # ───────────────────────────────────────────────────────────────
@@ -308,7 +354,10 @@ class TestDbQuery:
         set_connection_factory(lambda: conn)
 
         with db_query() as c:
-            assert c is cursor
+            c.execute("SELECT 1")
+            assert c.fetchall() is cursor.fetchall.return_value
+
+        cursor.execute.assert_called_once_with("SELECT 1")
 
     def test_cursor_closed_even_on_exception(self):
         conn, cursor = make_mock_conn()
@@ -345,6 +394,86 @@ class TestDbQuery:
         conn.close.assert_called_once()
 
 
+# ───────────────────────────────────────────────────────────────
+# 4-1. iter_query — 배치 스트리밍
+# ───────────────────────────────────────────────────────────────
+
+class TestIterQuery:
+    """
+    비즈니스 규칙:
+      - unbuffered 커서에서 batch_size 행씩 내보냄
+      - row_type 을 주면 튜플 커서 + row_type(*row), 필드와 컬럼이 다르면 ValueError
+      - 중간에 멈추면 남은 행을 나눠 읽어 버리고 연결 반납
+      - 작업 단위 안에서도 별도 연결 사용
+    """
+
+    def test_배치_단위로_내보냄(self):
+        conn, cursor = make_mock_conn()
+        cursor.fetchmany.side_effect = [[{"a": 1}, {"a": 2}], [{"a": 3}], []]
+        set_connection_factory(lambda: conn)
+
+        batches = list(db_module.iter_query("SELECT a FROM t WHERE d > %s", (1,), batch_size=2))
+
+        assert batches == [[{"a": 1}, {"a": 2}], [{"a": 3}]]
+        conn.cursor.assert_called_once_with(dictionary=True, buffered=False)
+        cursor.execute.assert_called_once_with("SELECT a FROM t WHERE d > %s", (1,))
+        cursor.fetchmany.assert_called_with(2)
+        cursor.fetchall.assert_not_called()
+        conn.close.assert_called_once()
+
+    def test_row_type_튜플(self):
+        from typing import NamedTuple
+
+        class Row(NamedTuple):
+            a: int
+            b: str
+
+        conn, cursor = make_mock_conn()
+        cursor.column_names = ("a", "b")
+        cursor.fetchmany.side_effect = [[(1, "x")], []]
+        set_connection_factory(lambda: conn)
+
+        (rows,) = db_module.iter_query("SELECT a, b FROM t", row_type=Row)
+
+        assert rows == [Row(1, "x")] and rows[0].b == "x"
+        conn.cursor.assert_called_once_with(dictionary=False, buffered=False)
+
+        cursor.column_names = ("a", "c")
+        with pytest.raises(ValueError):
+            list(db_module.iter_query("SELECT a, c FROM t", row_type=Row))
+
+    def test_중간에_멈추면_남은_행_정리후_반납(self):
+        conn, cursor = make_mock_conn()
+        cursor.fetchmany.side_effect = [[{"a": 1}], [{"a": 2}], [{"a": 3}], []]
+        set_connection_factory(lambda: conn)
+
+        batches = db_module.iter_query("SELECT a FROM t", batch_size=1)
+        assert next(batches) == [{"a": 1}]
+        batches.close()
+
+        assert cursor.fetchmany.call_count == 4
+        cursor.close.assert_called_once()
+        conn.close.assert_called_once()
+
+    def test_작업_단위_안에서도_별도_연결(self):
+        conns = []
+
+        def factory():
+            conn, cursor = make_mock_conn()
+            cursor.fetchmany.return_value = []
+            conns.append(conn)
+            return conn
+
+        set_connection_factory(factory)
+        with db_module.unit_of_work():
+            with db_query() as c:
+                c.execute("SELECT 1")
+            list(db_module.iter_query("SELECT a FROM t"))
+
+        assert len(conns) == 2
+        conns[1].close.assert_called_once()
+
+
 # ───────────────────────────────────────────────────────────────
 # 5. release_pool — 풀 해제
 # ───────────────────────────────────────────────────────────────
@@ -366,3 +495,119 @@ class TestReleasePool:
         db_module._connection_pool = None
         db_module._pool_config = None
         release_pool()  # 에러 없어야 함
+
+
+# ───────────────────────────────────────────────────────────────
+# 6. unit_of_work — 연결 1개/트랜잭션 1개 공유
+# ───────────────────────────────────────────────────────────────
+
+class TestUnitOfWork:
+    """
+    비즈니스 규칙:
+      - 작업 단위 안의 db_query/db_transaction 은 연결 1개를 공유하고 끝에서 한 번 커밋
+      - 안쪽 db_transaction 은 SAVEPOINT 로 감싸고 예외 시 그 블록만 되돌림
+      - 작업 단위 밖으로 예외가 나가면 롤백
+      - 쿼리가 없으면 연결을 빌리지 않음
+    """
+
+    @pytest.fixture
+    def conn(self):
+        conn, _ = make_mock_conn()
+        self.checkouts = 0
+
+        def factory():
+            self.checkouts += 1
+            return conn
+
+        set_connection_factory(factory)
+        return conn
+
+    @staticmethod
+    def _statements(conn):
+        return [c.args[0] for c in conn.cursor.return_value.execute.call_args_list]
+
+    def test_연결_1개_공유_끝에서_한번_커밋(self, conn):
+        with db_module.unit_of_work():
+            with db_query() as c:
+                c.execute("SELECT 1")
+            with db_transaction() as c:
+                c.execute("UPDATE t SET v = 1")
+            with db_query(dictionary=False) as c:
+                c.execute("SELECT 2")
+
+        assert self.checkouts == 1
+        conn.commit.assert_called_once()
+        conn.close.assert_called_once()
+        conn.cursor.assert_any_call(dictionary=False, buffered=True)
+        assert self._statements(conn) == [
+            "SELECT 1", "SAVEPOINT uow_sp_1", "UPDATE t SET v = 1", "RELEASE SAVEPOINT uow_sp_1", "SELECT 2",
+        ]
+
+    def test_안쪽_예외는_SAVEPOINT_까지만_되돌림(self, conn):
+        with db_module.unit_of_work():
+            with pytest.raises(ValueError):
+                with db_transaction() as c:
+                    c.execute("UPDATE t SET v = 1")
+                    raise ValueError("의도된 에러")
+
+        assert "ROLLBACK TO SAVEPOINT uow_sp_1" in self._statements(conn)
+        conn.rollback.assert_not_called()
+        conn.commit.assert_called_once()
+
+    def test_밖으로_나간_예외는_전체_롤백(self, conn):
+        with pytest.raises(RuntimeError):
+            with db_module.unit_of_work():
+                with db_transaction() as c:
+                    c.execute("UPDATE t SET v = 1")
+                raise RuntimeError("의도된 에러")
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        conn.close.assert_called_once()
+        assert db_module.current_unit_of_work() is None
+
+    def test_중첩은_SAVEPOINT(self, conn):
+        with db_module.unit_of_work() as outer:
+            with db_module.unit_of_work() as inner:
+                with db_query() as c:
+                    c.execute("SELECT 1")
+
+        assert inner is outer
+        assert self.checkouts == 1
+        assert self._statements(conn) == ["SAVEPOINT uow_sp_1", "SELECT 1", "RELEASE SAVEPOINT uow_sp_1"]
+
+    def test_after_commit_은_커밋_후_실행_롤백시_버림(self, conn):
+        order = []
+        conn.commit.side_effect = lambda: order.append("commit")
+        with db_module.unit_of_work() as uow:
+            with db_transaction() as c:
+                c.execute("UPDATE t SET v = 1")
+            uow.after_commit(lambda: order.append("hook"))
+            uow.after_commit(lambda: 1 / 0)  # 실패해도 다음 작업/요청에 영향 없음
+            uow.after_commit(lambda: order.append("hook2"))
+        assert order == ["commit", "hook", "hook2"]
+
+        with pytest.raises(RuntimeError):
+            with db_module.unit_of_work() as uow:
+                uow.after_commit(lambda: order.append("rolled back"))
+                raise RuntimeError("의도된 에러")
+        assert "rolled back" not in order
+
+    def test_쿼리_없으면_연결_안빌림(self, conn):
+        with db_module.unit_of_work():
+            pass
+
+        assert self.checkouts == 0
+
+    def test_닫힌_작업_단위는_무시(self, conn):
+        uow = db_module.UnitOfWork()
+        db_module.bind_unit_of_work(uow)
+        try:
+            uow.close()
+            with db_query() as c:
+                c.execute("SELECT 1")
+            with db_query() as c:
+                c.execute("SELECT 2")
+            assert self.checkouts == 2
+        finally:
+            db_module._unit_of_work.set(None)
@@ -0,0 +1,114 @@
+"""SQL 문장 계측(modules/db_metrics.py) 테스트"""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules import db_metrics
+from modules.db_metrics import TimedCursor, fingerprint, get_statement_stats
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    db_metrics.STATEMENTS.reset()
+    yield
+    db_metrics.STATEMENTS.reset()
+
+
+class TestFingerprint:
+    def test_리터럴과_파라미터는_같은_지문(self):
+        a = fingerprint("SELECT * FROM t WHERE id = %s AND name = 'x'")
+        b = fingerprint("select * from t\n  WHERE id = 42 AND name = 'y' -- 주석")
+        assert a[1] == "SELECT * FROM t WHERE id = ? AND name = ?"
+        assert a[0] != b[0]  # 대소문자는 그대로 둠
+        assert fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'y'")[0] == a[0]
+
+    def test_IN_목록과_여러행_VALUES_접기(self):
+        assert fingerprint("SELECT a FROM t WHERE id IN (%s, %s, %s)")[1] == "SELECT a FROM t WHERE id IN (...)"
+        assert fingerprint("SELECT a FROM t WHERE id IN (%s)")[0] == fingerprint("SELECT a FROM t WHERE id IN (1,2)")[0]
+        assert fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)")[1] == "INSERT INTO t (a, b) VALUES (?, ?), ..."
+
+    def test_식별자_속_숫자는_유지(self):
+        assert fingerprint("SELECT t1.a FROM t1")[1] == "SELECT t1.a FROM t1"
+
+
+class TestTimedCursor:
+    def test_fetch_행_수_기록(self):
+        raw = MagicMock()
+        raw.fetchall.return_value = [{"a": 1}, {"a": 2}]
+        cursor = TimedCursor(raw)
+
+        cursor.execute("SELECT a FROM t WHERE id = %s", (1,))
+        assert cursor.fetchall() == [{"a": 1}, {"a": 2}]
+        cursor.execute("UPDATE t SET a = %s", (3,))
+        raw.rowcount = 5
+        cursor.finish()
+
+        raw.execute.assert_any_call("SELECT a FROM t WHERE id = %s", (1,))
+        stats = {s["query"]: s for s in get_statement_stats()}
+        assert stats["SELECT a FROM t WHERE id = ?"]["rows"] == 2
+        assert stats["UPDATE t SET a = ?"]["rows"] == 5
+        assert stats["UPDATE t SET a = ?"]["calls"] == 1
+
+    def test_execute_실패도_기록(self):
+        raw = MagicMock()
+        raw.execute.side_effect = RuntimeError("DB 오류")
+        cursor = TimedCursor(raw)
+        with pytest.raises(RuntimeError):
+            cursor.execute("DELETE FROM t")
+        cursor.finish()
+        assert get_statement_stats()[0]["calls"] == 1
+
+    def test_느린_쿼리_로그(self, caplog):
+        cursor = TimedCursor(MagicMock())
+        with patch.object(db_metrics, "DB_SLOW_QUERY_MS", 0.000001), caplog.at_level(logging.WARNING, "modules.db_metrics"):
+            cursor.execute("SELECT * FROM daily_infos WHERE date = '2024-01-01'")
+            cursor.finish()
+        assert "느린 쿼리" in caplog.text
+        assert "2024-01-01" not in caplog.text  # 값 대신 지문만 남김
+
+    def test_느린_쿼리_로그_끔(self, caplog):
+        cursor = TimedCursor(MagicMock())
+        with patch.object(db_metrics, "DB_SLOW_QUERY_MS", 0), caplog.at_level(logging.WARNING, "modules.db_metrics"):
+            cursor.execute("SELECT 1")
+            cursor.finish()
+        assert "느린 쿼리" not in caplog.text
+
+    def test_지문_표_상한(self):
+        with patch.object(db_metrics, "MAX_STATEMENTS", 2):
+            for table in ("a", "b", "c", "d"):
+                cursor = TimedCursor(MagicMock())
+                cursor.execute(f"SELECT * FROM {table}")
+                cursor.finish()
+        stats = {s["fingerprint"]: s for s in get_statement_stats()}
+        assert len(stats) == 3
+        assert stats["other"]["calls"] == 2
+
+    def test_prometheus_출력(self):
+        from modules.metrics import REGISTRY
+
+        cursor = TimedCursor(MagicMock())
+        cursor.execute("SELECT 1")
+        cursor.finish()
+        fid = fingerprint("SELECT 1")[0]
+        text = REGISTRY.render()
+        assert f'arisa_db_statement_calls_total{{fingerprint="{fid}"}} 1' in text
+        assert 'arisa_db_query_duration_seconds_count{statement="SELECT"}' in text
+
+
+def test_db_query_커서_계측():
+    from modules.db_connection import db_query, set_connection_factory
+
+    conn = MagicMock()
+    conn.cursor.return_value.fetchall.side_effect = [[{"a": 1}], []]
+    set_connection_factory(lambda: conn)
+    try:
+        with db_query() as cursor:
+            cursor.execute("SELECT a FROM t")
+            cursor.fetchall()
+    finally:
+        set_connection_factory(None)
+
+    (stats,) = get_statement_stats()
+    assert (stats["query"], stats["calls"], stats["rows"]) == ("SELECT a FROM t", 1, 1)
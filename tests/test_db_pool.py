@@ -0,0 +1,149 @@
+"""DB 연결 풀(modules/db_pool.py) 테스트"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(size=2, **kwargs):
+    created = []
+
+    def connect():
+        conn = MagicMock()
+        conn.in_transaction = False
+        created.append(conn)
+        return conn
+
+    pool = ConnectionPool(connect, size=size, **kwargs)
+    return pool, created
+
+
+class TestCheckout:
+    def test_반납한_연결_재사용(self):
+        pool, created = make_pool()
+        pool.get_connection().close()
+        pool.get_connection().close()
+
+        assert len(created) == 1
+        created[0].close.assert_not_called()
+        stats = pool.stats()
+        assert (stats["checkouts"], stats["created"], stats["idle"], stats["in_use"]) == (2, 1, 1, 0)
+
+    def test_크기_초과시_반납까지_대기(self):
+        pool, created = make_pool(size=1)
+        held = pool.get_connection()
+        got = []
+
+        def worker():
+            got.append(pool.get_connection(timeout=5))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while pool.stats()["waiters"] == 0:
+            time.sleep(0.005)
+        held.close()
+        thread.join(5)
+
+        assert len(got) == 1 and len(created) == 1
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["wait_seconds_max"] > 0
+
+    def test_대기_시간_초과(self):
+        pool, _ = make_pool(size=1)
+        pool.get_connection()
+
+        with pytest.raises(PoolTimeout):
+            pool.get_connection(timeout=0.01)
+        assert pool.stats()["timeouts"] == 1
+
+    def test_연결_생성_실패시_자리_반환(self):
+        pool = ConnectionPool(MagicMock(side_effect=OSError("접속 불가")), size=1)
+
+        with pytest.raises(OSError):
+            pool.get_connection()
+        assert pool.stats()["open"] == 0
+
+    def test_위임과_반납후_사용_금지(self):
+        pool, created = make_pool()
+        conn = pool.get_connection()
+        conn.cursor(dictionary=True)
+        created[0].cursor.assert_called_once_with(dictionary=True)
+
+        conn.close()
+        conn.close()  # 두 번 반납해도 한 번만 처리
+        assert pool.stats()["idle"] == 1
+        with pytest.raises(RuntimeError):
+            conn.cursor()
+
+
+class TestHealth:
+    def test_오래_쉰_연결은_ping_실패시_교체(self):
+        clock = FakeClock()
+        pool, created = make_pool(clock=clock, ping_after=30)
+        pool.get_connection().close()
+        created[0].ping.side_effect = Exception("MySQL server has gone away")
+
+        clock.now = 10
+        pool.get_connection().close()
+        created[0].ping.assert_not_called()
+
+        clock.now = 100
+        pool.get_connection()
+        assert len(created) == 2
+        created[0].close.assert_called_once()
+        assert pool.stats()["discarded"] == 1
+
+    def test_최대_수명_지난_연결은_반납시_닫음(self):
+        clock = FakeClock()
+        pool, created = make_pool(clock=clock, max_lifetime=60)
+        conn = pool.get_connection()
+        clock.now = 61
+        conn.close()
+
+        created[0].close.assert_called_once()
+        assert pool.stats()["open"] == 0
+
+    def test_열린_트랜잭션은_반납시_롤백(self):
+        pool, created = make_pool()
+        conn = pool.get_connection()
+        created[0].in_transaction = True
+        conn.close()
+
+        created[0].rollback.assert_called_once()
+        assert pool.stats()["idle"] == 1
+
+    def test_풀_종료후_반납된_연결은_닫음(self):
+        pool, created = make_pool()
+        idle = pool.get_connection()
+        in_use = pool.get_connection()
+        idle.close()
+
+        assert pool.close() == 1
+        created[0].close.assert_called_once()
+        in_use.close()
+        created[1].close.assert_called_once()
+        assert pool.stats()["open"] == 0
+
+
+def test_최근_1분_초당_대여수():
+    clock = FakeClock()
+    pool, _ = make_pool(clock=clock)
+    for _ in range(30):
+        pool.get_connection().close()
+    assert pool.stats()["checkouts_per_second"] == pytest.approx(0.5)
+
+    clock.now = 61
+    assert pool.stats()["checkouts_per_second"] == 0
@@ -0,0 +1,98 @@
+"""프로세스 내 지표 수집(modules/metrics.py) 테스트"""
+
+import json
+import os
+
+import pytest
+
+from modules import metrics
+from modules.metrics import Registry, merge_snapshots, render_snapshot
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+class TestCounterHistogram:
+    def test_카운터_레이블별_누적(self, registry):
+        counter = registry.counter("c_total", "설명", ["kind"])
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind="b")
+        assert counter.value(kind="a") == 3
+        assert registry.counter("c_total", "설명", ["kind"]) is counter
+
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+    def test_같은_이름_다른_타입은_오류(self, registry):
+        registry.counter("m", "설명")
+        with pytest.raises(ValueError):
+            registry.histogram("m", "설명")
+
+    def test_히스토그램_누적_구간_출력(self, registry):
+        hist = registry.histogram("h_seconds", "설명", ["route"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            hist.observe(value, route="/a")
+
+        text = registry.render()
+        assert '# TYPE h_seconds histogram' in text
+        assert 'h_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'h_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'h_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'h_seconds_sum{route="/a"} 5.55' in text
+        assert 'h_seconds_count{route="/a"} 3' in text
+
+    def test_time_예외면_outcome_error(self, registry):
+        hist = registry.histogram("t_seconds", "설명", ["outcome"])
+        with hist.time():
+            pass
+        with pytest.raises(RuntimeError):
+            with hist.time():
+                raise RuntimeError
+        assert hist.count(outcome="ok") == 1
+        assert hist.count(outcome="error") == 1
+
+    def test_레이블_값_이스케이프(self, registry):
+        registry.counter("e_total", "설명", ["q"]).inc(q='a"b\\c')
+        assert 'e_total{q="a\\"b\\\\c"} 1' in registry.render()
+
+
+class TestCollector:
+    def test_수집기_값_출력_실패는_건너뜀(self, registry):
+        registry.add_collector(lambda: [("pool_in_use", "gauge", "사용 중", [({}, 2)])])
+
+        def broken():
+            raise RuntimeError("고장")
+
+        registry.add_collector(broken)
+        text = registry.render()
+        assert "# TYPE pool_in_use gauge" in text
+        assert "pool_in_use 2" in text
+
+
+class TestWorkerMerge:
+    def test_스냅샷_합산(self, registry):
+        hist = registry.histogram("h", "설명", ["r"], buckets=(1.0,))
+        hist.observe(0.5, r="/a")
+        registry.counter("c", "설명").inc(2)
+        merged = merge_snapshots([registry.snapshot(), registry.snapshot()])
+
+        text = render_snapshot(merged)
+        assert 'h_bucket{r="/a",le="1"} 2' in text
+        assert 'h_count{r="/a"} 2' in text
+        assert "c 4" in text
+
+    def test_METRICS_DIR_살아있는_워커만_합산(self, registry, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics, "METRICS_DIR", str(tmp_path))
+        registry.counter("c", "설명").inc()
+
+        other = registry.snapshot()
+        (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(other))
+        dead = tmp_path / "999999999.json"
+        dead.write_text(json.dumps(other))
+
+        assert "c 2" in registry.render()
+        assert not dead.exists()
+        assert (tmp_path / f"{os.getpid()}.json").exists()
@@ -0,0 +1,163 @@
+"""
+ParseCache / CareRecordParser 캐시 연동 단위 테스트
+====================================================
+modules/parse_cache.py 의 디스크 캐시와 파서의 문서/그룹 단위 재사용을 검증합니다.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from modules.parse_cache import KIND_DOCUMENT, KIND_GROUP, ParseCache
+from modules.pdf_parser import PARSER_VERSION, CareRecordParser
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(tmp_path / "cache.sqlite3", max_bytes=10 * 1024 * 1024)
+
+
+class TestParseCache:
+    def test_put_get_왕복(self, cache):
+        records = [{"customer_name": "홍길동", "date": "2025-11-03"}]
+        cache.put(KIND_DOCUMENT, "abc", "v1", records)
+        assert cache.get(KIND_DOCUMENT, "abc", "v1") == records
+
+    def test_버전이_다르면_miss(self, cache):
+        cache.put(KIND_DOCUMENT, "abc", "v1", [1])
+        assert cache.get(KIND_DOCUMENT, "abc", "v2") is None
+
+    def test_payload_평문_미저장(self, cache):
+        cache.put(KIND_DOCUMENT, "abc", "v1", [{"customer_name": "홍길동"}])
+        conn = sqlite3.connect(cache.path)
+        payload = conn.execute("SELECT payload FROM parse_cache").fetchone()[0]
+        conn.close()
+        assert "홍길동".encode("utf-8") not in payload
+
+    def test_키_교체시_miss_및_삭제(self, cache, monkeypatch):
+        cache.put(KIND_DOCUMENT, "abc", "v1", [1])
+        monkeypatch.setenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
+        fresh = ParseCache(cache.path, max_bytes=cache.max_bytes)
+        assert fresh.get(KIND_DOCUMENT, "abc", "v1") is None
+        assert fresh.stats()["entries"] == 0
+
+    def test_용량_초과시_LRU_제거(self, tmp_path):
+        import os
+
+        small = ParseCache(tmp_path / "small.sqlite3", max_bytes=10 * 1024 * 1024)
+        blob = os.urandom(600).hex()
+        small.put(KIND_GROUP, "a", "v1", blob)
+        entry_size = small.stats()["size_bytes"]
+        small.max_bytes = entry_size * 2 + entry_size // 2  # 2개까지만 보관
+        small.put(KIND_GROUP, "b", "v1", blob)
+        small.get(KIND_GROUP, "a", "v1")  # a를 최근 사용으로 갱신
+        small.put(KIND_GROUP, "c", "v1", blob)
+        assert small.get(KIND_GROUP, "b", "v1") is None
+        assert small.get(KIND_GROUP, "a", "v1") == blob
+        assert small.get(KIND_GROUP, "c", "v1") == blob
+
+    def test_purge_버전_조건(self, cache):
+        cache.put(KIND_GROUP, "a", "old", [1])
+        cache.put(KIND_GROUP, "b", "new", [2])
+        assert cache.purge(exclude_version="new") == 1
+        assert cache.get(KIND_GROUP, "b", "new") == [2]
+
+    def test_purge_전체(self, cache):
+        cache.put(KIND_GROUP, "a", "v1", [1])
+        cache.put(KIND_DOCUMENT, "b", "v1", [2])
+        assert cache.purge() == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_stats_종류별_집계(self, cache):
+        cache.put(KIND_GROUP, "a", "v1", [1])
+        cache.put(KIND_DOCUMENT, "b", "v1", [2])
+        cache.get(KIND_GROUP, "a", "v1")
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["by_kind"][KIND_GROUP]["hits"] == 1
+
+
+# ───────────────────────────────────────────────────────────────
+# 파서 연동
+# ───────────────────────────────────────────────────────────────
+
+
+def _make_record_page(name, dates, header="장기요양급여제공기록지"):
+    page = MagicMock()
+    page.extract_text.return_value = f"{header} 수급자명 {name} 2025년 {' '.join(dates)}"
+    page.search.return_value = []
+    page.rects = []
+    page.lines = []
+    page.width = 595.0
+    page.height = 842.0
+    table = MagicMock()
+    table.bbox = (0, 100, 500, 700)
+    table.extract.return_value = [["년월/일", *dates], ["특이사항", *["메모" for _ in dates]]]
+    page.find_tables.return_value = [table]
+    return page
+
+
+def _parse(pages, cache, pdf_bytes=b"%PDF-1"):
+    import io
+
+    with patch("pdfplumber.open") as mock_open:
+        mock_pdf = MagicMock()
+        mock_pdf.pages = pages
+        mock_open.return_value.__enter__.return_value = mock_pdf
+        records = CareRecordParser(io.BytesIO(pdf_bytes), cache=cache).parse()
+    return records, mock_open
+
+
+class TestParserCache:
+    def test_동일_PDF_재업로드는_문서_캐시_적중(self, cache):
+        pages = [_make_record_page("홍길동", ["11/03"]), _make_record_page("김철수", ["11/03"])]
+        first, _ = _parse(pages, cache)
+        second, mock_open = _parse(pages, cache)
+        assert second == first
+        mock_open.assert_not_called()
+
+    def test_경로_입력도_문서_해시로_캐시_적중(self, cache, tmp_path):
+        pdf_path = tmp_path / "upload.pdf"
+        pdf_path.write_bytes(b"%PDF-path" * 1000)
+        pages = [_make_record_page("홍길동", ["11/03"])]
+        with patch("pdfplumber.open") as mock_open:
+            mock_pdf = MagicMock()
+            mock_pdf.pages = pages
+            mock_open.return_value.__enter__.return_value = mock_pdf
+            first = CareRecordParser(str(pdf_path), cache=cache).parse()
+            mock_open.reset_mock()
+            second = CareRecordParser(str(pdf_path), cache=cache).parse()
+        assert second == first
+        mock_open.assert_not_called()
+
+    def test_바뀐_그룹만_다시_파싱(self, cache):
+        pages = [_make_record_page("홍길동", ["11/03"]), _make_record_page("김철수", ["11/03"])]
+        _parse(pages, cache, b"%PDF-1")
+
+        changed = [_make_record_page("홍길동", ["11/03"]), _make_record_page("김철수", ["11/03", "11/04"])]
+        records, _ = _parse(changed, cache, b"%PDF-2")
+
+        assert [r["customer_name"] for r in records] == ["홍길동", "김철수", "김철수"]
+        changed[0].find_tables.assert_not_called()
+        changed[1].find_tables.assert_called_once()
+
+    def test_캐시_결과는_캐시_없는_파싱과_동일(self, cache):
+        pages = [_make_record_page("홍길동", ["11/03", "11/04"])]
+        uncached, _ = _parse(pages, None)
+        _parse(pages, cache, b"%PDF-a")
+        from_groups, _ = _parse(pages, cache, b"%PDF-b")
+        assert from_groups == uncached
+
+    def test_캐시_오류시_파싱_계속(self):
+        broken = MagicMock()
+        broken.get.side_effect = Exception("디스크 오류")
+        broken.put.side_effect = Exception("디스크 오류")
+        records, _ = _parse([_make_record_page("홍길동", ["11/03"])], broken)
+        assert len(records) == 1
+
+    def test_파서_버전_키_사용(self, cache):
+        _parse([_make_record_page("홍길동", ["11/03"])], cache)
+        versions = {e["version"] for e in cache.list_entries()}
+        assert versions == {PARSER_VERSION}
@@ -15,7 +15,7 @@ CareRecordParser 단위 테스트
 
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
-from modules.pdf_parser import CareRecordParser
+from modules.pdf_parser import CareRecordParser, PageAnalysisCache
 
 
 # ───────────────────────────────────────────────────────────────
@@ -33,6 +33,7 @@ def make_parser(year=None):
     parser._basic_info = {}
     parser._personal_info = {}
     parser._year = year
+    parser._page_cache = PageAnalysisCache()
     return parser
 
 
@@ -1043,6 +1044,79 @@ class TestSplitPageGroups:
         assert isinstance(result, list)
 
 
+# ───────────────────────────────────────────────────────────────
+# 16-1. 페이지 분석 캐시 (PageAnalysisCache)
+# ───────────────────────────────────────────────────────────────
+
+class TestPageAnalysisCache:
+    """
+    성능 규칙:
+      - 한 문서 안에서 페이지 텍스트/테이블 추출은 페이지당 한 번만 수행
+      - 추출 실패도 캐시되어 호출부에서 동일한 예외로 처리됨
+    """
+
+    def test_text_extracted_once(self):
+        cache = PageAnalysisCache()
+        page = make_mock_page("본문")
+        assert cache.text(page) == "본문"
+        assert cache.text(page) == "본문"
+        page.extract_text.assert_called_once()
+
+    def test_none_text_becomes_empty(self):
+        cache = PageAnalysisCache()
+        page = make_mock_page(None)
+        assert cache.text(page) == ""
+
+    def test_error_cached_and_reraised(self):
+        cache = PageAnalysisCache()
+        page = MagicMock()
+        page.extract_text.side_effect = Exception("오류")
+        for _ in range(2):
+            with pytest.raises(Exception):
+                cache.text(page)
+        page.extract_text.assert_called_once()
+
+    def test_search_cached_per_pattern(self):
+        cache = PageAnalysisCache()
+        page = make_mock_page()
+        cache.search(page, "신체활동")
+        cache.search(page, "신체활동")
+        cache.search(page, "간호관리")
+        assert page.search.call_count == 2
+
+    def test_find_tables_cached_per_settings(self):
+        cache = PageAnalysisCache()
+        page = make_mock_page()
+        cache.find_tables(page, {"snap_tolerance": 4})
+        cache.find_tables(page, {"snap_tolerance": 4})
+        cache.find_tables(page, {"snap_tolerance": 3})
+        assert page.find_tables.call_count == 2
+
+    def test_evict_drops_page_entries(self):
+        cache = PageAnalysisCache()
+        page = make_mock_page("본문")
+        cache.text(page)
+        cache.evict([page])
+        assert len(cache) == 0
+        cache.text(page)
+        assert page.extract_text.call_count == 2
+
+    def test_group_stages_share_page_text(self):
+        """그룹 분리 → 개인정보 → 기본정보 → 연도 추출이 같은 텍스트를 재사용."""
+        parser = make_parser()
+        pages = [
+            make_mock_page("장기요양급여제공기록지 수급자명 홍길동 2025년 신체활동지원"),
+            make_mock_page("수급자명 홍길동 본문"),
+            make_mock_page("수급자명 홍길동 본문2"),
+        ]
+        groups = parser._split_page_groups(pages)
+        parser._parse_personal_info(groups[0])
+        parser._parse_basic_info_block(groups[0])
+        parser._extract_year(groups[0])
+        for page in pages:
+            page.extract_text.assert_called_once()
+
+
 # ───────────────────────────────────────────────────────────────
 # 17. 통합 시나리오 테스트 (mock pdfplumber 사용)
 # ───────────────────────────────────────────────────────────────
@@ -1132,6 +1206,105 @@ class TestCareRecordParserIntegration:
 
         assert isinstance(result, list)
 
+    def test_parse_records_stage_timings(self):
+        """parse() 는 단계별 소요 시간을 지표로 남김."""
+        from modules.pdf_parser import PARSE_STAGE_SECONDS
+
+        before = {stage: PARSE_STAGE_SECONDS.count(stage=stage) for stage in ("split", "group", "merge", "document")}
+        mock_page = make_mock_page("장기요양급여제공기록지 수급자명 홍길동 생년월일 1950.01.01")
+
+        with patch("pdfplumber.open") as mock_open:
+            mock_pdf = MagicMock()
+            mock_pdf.pages = [mock_page]
+            mock_open.return_value.__enter__.return_value = mock_pdf
+            CareRecordParser("test.pdf").parse()
+
+        for stage, count in before.items():
+            assert PARSE_STAGE_SECONDS.count(stage=stage) == count + 1
+
+    def test_parallel_parse_matches_serial(self):
+        """workers > 1 병렬 파싱 결과가 단일 프로세스 결과와 순서까지 동일해야 함."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def make_record_page(header, name, dates):
+            page = make_mock_page(f"{header} 수급자명 {name} 2025년")
+            table = MagicMock()
+            table.bbox = (0, 100, 500, 700)
+            table.extract.return_value = [
+                ["년월/일", *dates],
+                ["특이사항", *[f"{name} {d} 메모" for d in dates]],
+            ]
+            page.find_tables.return_value = [table]
+            return page
+
+        pages = [
+            make_record_page("장기요양급여제공기록지", "홍길동", ["11/03", "11/04"]),
+            make_record_page("", "홍길동", ["11/05"]),
+            make_record_page("장기요양급여제공기록지", "김철수", ["11/03"]),
+            make_record_page("장기요양급여제공기록지", "이영희", ["11/07"]),
+        ]
+
+        def run(workers):
+            with patch("pdfplumber.open") as mock_open:
+                mock_pdf = MagicMock()
+                mock_pdf.pages = pages
+                mock_open.return_value = mock_pdf
+                mock_open.return_value.__enter__.return_value = mock_pdf
+                # 프로세스 간 mock 전달이 불가능하므로 스레드 풀로 대체
+                with patch("modules.pdf_parser.ProcessPoolExecutor", ThreadPoolExecutor):
+                    parser = CareRecordParser(b"%PDF", workers=workers)
+                    parser.pdf_file = MagicMock(getvalue=MagicMock(return_value=b"%PDF"))
+                    return parser.parse()
+
+        serial = run(1)
+        parallel = run(3)
+        assert [r["customer_name"] for r in serial] == ["홍길동", "홍길동", "홍길동", "김철수", "이영희"]
+        assert parallel == serial
+
+    def test_iter_parse_yields_per_customer_and_matches_parse(self):
+        """iter_parse()는 수급자 단위로 레코드를 내보내며 합치면 parse()와 동일."""
+
+        def make_record_page(header, name, dates, note="메모"):
+            page = make_mock_page(f"{header} 수급자명 {name} 2025년")
+            table = MagicMock()
+            table.bbox = (0, 100, 500, 700)
+            table.extract.return_value = [
+                ["년월/일", *dates],
+                ["특이사항", *[note for _ in dates]],
+            ]
+            page.find_tables.return_value = [table]
+            return page
+
+        appendix_page = make_mock_page("수급자명 홍길동 날짜 내용 2025.11.03")
+        appendix_table = MagicMock()
+        appendix_table.bbox = (0, 100, 500, 700)
+        appendix_table.extract.return_value = [["2025.11.03", "별지 신체 내용"]]
+        appendix_page.find_tables.return_value = [appendix_table]
+        appendix_page.search.side_effect = lambda label: [{"top": 10}] if label == "신체활동지원" else []
+
+        pages = [
+            make_record_page("장기요양급여제공기록지", "홍길동", ["11/03"], note="별지참조"),
+            make_record_page("장기요양급여제공기록지", "홍길동", ["11/04"]),
+            appendix_page,
+            make_record_page("장기요양급여제공기록지", "김철수", ["11/03"]),
+        ]
+
+        with patch("pdfplumber.open") as mock_open:
+            mock_pdf = MagicMock()
+            mock_pdf.pages = pages
+            mock_open.return_value.__enter__.return_value = mock_pdf
+            groups = list(CareRecordParser("test.pdf").iter_parse())
+            full = CareRecordParser("test.pdf").parse()
+
+        assert [[r["customer_name"] for r in g] for g in groups] == [["홍길동", "홍길동"], ["김철수"]]
+        assert groups[0][0]["physical_note"] == "별지 신체 내용"
+        assert [r for g in groups for r in g] == full
+
+    def test_workers_default_is_single_process(self):
+        parser = CareRecordParser("test.pdf")
+        assert parser.workers == 1
+        assert CareRecordParser("test.pdf", workers=0).workers == 1
+
     def test_check_symbols_all_recognized(self):
         """모든 체크 기호가 동일하게 '완료'로 인식되어야 함."""
         symbols = ["■", "Π", "V", "O", "☑"]
@@ -0,0 +1,56 @@
+"""
+합성 기록지 PDF 종단 파싱 테스트
+==================================
+benchmarks/synthetic.py 로 만든 PDF 를 실제 pdfplumber 경로로 파싱해
+생성에 쓴 기록과 같은지 확인한다 (표 판별, 주간 페이지 이어 붙이기, 별지 병합).
+"""
+
+import io
+import re
+
+import pytest
+
+from benchmarks.synthetic import PLACEHOLDER, make_records, render_care_record_pdf
+from modules.pdf_parser import CareRecordParser
+
+
+def _normalize(value):
+    # 셀 줄바꿈 위치에 따라 공백이 달라질 수 있어 공백은 비교하지 않는다
+    return re.sub(r"\s+", "", "" if value is None else str(value))
+
+
+def _parse(records):
+    return CareRecordParser(io.BytesIO(render_care_record_pdf(records)), workers=1).parse()
+
+
+def _assert_same(parsed, records):
+    assert len(parsed) == len(records)
+    by_key = {(r["customer_name"], r["date"]): r for r in parsed}
+    for expected in records:
+        actual = by_key[(expected["customer_name"], expected["date"])]
+        for key, value in expected.items():
+            if key.startswith("_"):
+                continue
+            assert _normalize(actual.get(key)) == _normalize(value), (expected["date"], key)
+
+
+def test_round_trip_weekly_pages_and_absences():
+    records = make_records(2, 9, seed=3, absence_ratio=0.2)
+    assert any(r["total_service_time"] == "결석" for r in records)
+
+    _assert_same(_parse(records), records)
+
+
+def test_appendix_notes_replace_placeholders_across_pages():
+    # 모든 특이사항을 별지로 보내 별지가 여러 페이지에 걸치게 한다
+    records = make_records(1, 30, seed=1, appendix_ratio=1.0, absence_ratio=0.0)
+
+    parsed = _parse(records)
+
+    _assert_same(parsed, records)
+    assert not any(PLACEHOLDER in (r.get("physical_note") or "") for r in parsed)
+
+
+def test_make_records_rejects_out_of_range_days():
+    with pytest.raises(ValueError):
+        make_records(1, 0)
@@ -4,6 +4,7 @@ DB 의존성 없이 순수 Python 로직만 테스트합니다.
 향후 백엔드 분리 시 분석 엔진으로 독립 배포 가능합니다.
 """
 
+import pandas as pd
 import pytest
 from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
@@ -383,6 +384,25 @@ class TestComputeWeeklyStatus:
         mock_fetch.assert_not_called()
         assert result == cached
 
+    def test_cache_saved_with_version_read_before_fetch(self):
+        """조회 전에 읽은 데이터 버전으로 저장 (계산 중 기록이 바뀌면 다음에 재계산)"""
+        sample_rows = [{'date': date(2024, 1, 8), 'physical_note': '정상'}]
+        prev_range = (date(2024, 1, 1), date(2024, 1, 7))
+        curr_range = (date(2024, 1, 8), date(2024, 1, 14))
+        order = []
+
+        with patch('modules.weekly_data_analyzer._load_cached_weekly_status', return_value=None), \
+                patch('modules.weekly_data_analyzer._analysis_data_version',
+                      side_effect=lambda *a: order.append('version') or '3:'), \
+                patch('modules.weekly_data_analyzer._fetch_two_week_records',
+                      side_effect=lambda *a: order.append('fetch') or (sample_rows, prev_range, curr_range)), \
+                patch('modules.weekly_data_analyzer.analyze_weekly_trend', return_value={}), \
+                patch('modules.weekly_data_analyzer._save_weekly_status_cache') as mock_save:
+            analyzer.compute_weekly_status('홍길동', '2024-01-08', 1)
+
+        assert order == ['version', 'fetch']
+        assert mock_save.call_args[0][4] == '3:'
+
     def test_no_cache_when_use_cache_false(self):
         """use_cache=False이면 캐시를 사용하지 않는다"""
         with patch('modules.weekly_data_analyzer._load_cached_weekly_status') as mock_cache:
@@ -399,6 +419,90 @@ class TestComputeWeeklyStatus:
         mock_cache.assert_not_called()
 
 
+class TestComputeWeeklyStatusBulk:
+    """compute_weekly_status_bulk: 캐시/기록/전주 보고서를 수급자 묶음으로 한 번에 조회"""
+
+    PREV = (date(2024, 1, 1), date(2024, 1, 7))
+    CURR = (date(2024, 1, 8), date(2024, 1, 14))
+
+    def _record(self, customer_id, day, note):
+        return {
+            'customer_id': customer_id, 'date': day, 'total_service_time': '9시간',
+            'physical_note': note, 'cognitive_note': None, 'nursing_note': None,
+            'functional_note': None, 'meal_lunch': '일반식 전량', 'toilet_care': '소변 2회',
+        }
+
+    @pytest.fixture
+    def repos(self):
+        with patch('modules.weekly_data_analyzer.DailyInfoRepository') as daily, \
+                patch('modules.weekly_data_analyzer.WeeklyStatusRepository') as weekly, \
+                patch('modules.weekly_data_analyzer.WeeklyAnalysisCacheRepository') as cache:
+            weekly.return_value.load_weekly_statuses.return_value = {2: '지난 보고서'}
+            weekly.return_value.load_weekly_status.side_effect = (
+                lambda customer_id, **_: {2: '지난 보고서'}.get(customer_id)
+            )
+            cache.return_value.load_many.return_value = {1: (None, '4:'), 2: (None, '7:')}
+            daily.return_value.get_records_for_customers.return_value = [
+                self._record(1, date(2024, 1, 9), '통증 호소'),
+                self._record(1, date(2024, 1, 3), '양호'),
+                self._record(2, date(2024, 1, 10), '안정'),
+            ]
+            yield daily.return_value, weekly.return_value, cache.return_value
+
+    def test_수급자별_결과는_개별_분석과_동일(self, repos):
+        daily, _, cache = repos
+        results = analyzer.compute_weekly_status_bulk([2, 1, 3], '2024-01-08')
+
+        assert list(results) == [2, 1, 3]
+        daily.get_records_for_customers.assert_called_once_with([2, 1, 3], *(self.PREV[0], self.CURR[1]))
+        for cid in (1, 2):
+            rows = [analyzer._to_analysis_row(r)
+                    for r in daily.get_records_for_customers.return_value if r['customer_id'] == cid]
+            assert results[cid]['scores'] == analyzer._category_scores(rows, self.CURR[0])
+            assert results[cid]['trend'] == analyzer.analyze_weekly_trend(rows, self.PREV, self.CURR, cid)
+        assert results[2]['trend']['ai_payload']['previous_weekly_report'] == '지난 보고서'
+        assert results[3] == {'data': [], 'ranges': (self.PREV, self.CURR), 'scores': {}}
+
+        # 조회 전에 읽은 버전으로 한 번에 저장 (기록 없는 수급자는 저장 안 함)
+        start, end, entries = cache.save_many.call_args[0]
+        assert (start, end) == self.CURR
+        assert [(cid, version) for cid, version, _ in entries] == [(2, '7:'), (1, '4:')]
+        assert analyzer._decode_cached_status(entries[1][2])['raw'] == results[1]['raw']
+
+    def test_캐시_적중_수급자는_조회에서_제외(self, repos):
+        daily, _, cache = repos
+        cached = {'scores': {}, 'ranges': (self.PREV, self.CURR), 'raw': [], 'trend': {}}
+        cache.load_many.return_value = {
+            1: (analyzer._encode_cached_status(cached), '4:'), 2: (None, '7:'),
+        }
+
+        results = analyzer.compute_weekly_status_bulk([1, 2], date(2024, 1, 8))
+
+        assert results[1] == cached
+        assert daily.get_records_for_customers.call_args[0][0] == [2]
+
+    def test_customer_ids_없으면_기록_있는_전원(self, repos):
+        daily, _, _ = repos
+        daily.get_customer_ids_with_records.return_value = [1, 2]
+
+        results = analyzer.compute_weekly_status_bulk(None, '2024-01-08')
+
+        daily.get_customer_ids_with_records.assert_called_once_with(self.PREV[0], self.CURR[1])
+        assert list(results) == [1, 2]
+
+    def test_잘못된_날짜는_수급자별_error(self, repos):
+        results = analyzer.compute_weekly_status_bulk([1, 2], 'invalid-date')
+        assert all('error' in r for r in results.values())
+
+    def test_기록_조회_실패는_미계산_수급자별_error(self, repos):
+        daily, _, _ = repos
+        daily.get_records_for_customers.side_effect = RuntimeError('DB 오류')
+
+        results = analyzer.compute_weekly_status_bulk([1, 2], '2024-01-08')
+
+        assert results == {1: {'error': 'DB 오류'}, 2: {'error': 'DB 오류'}}
+
+
 class TestAnalyzeWeeklyTrend:
     """analyze_weekly_trend 함수 테스트 (순수 DataFrame 로직)"""
 
@@ -705,6 +809,97 @@ class TestAnalyzeWeeklyTrend:
         assert result['curr_prog_entries'] == []
         assert result['prev_prog_entries'] == []
 
+    def test_식사량_배설_집계와_강조(self, date_ranges):
+        """식사유형별 섭취량/배설 횟수 합계, 이번주 메모 강조"""
+        prev_range, curr_range = date_ranges
+        rows = [
+            self._make_row(
+                date(2024, 1, 8),
+                physical_note='통증 호소',
+                meal_breakfast='다짐식 정량, 일반식 완식',
+                meal_lunch='죽식 절반',
+                toilet_care='소변 3회 대변 1회 기저귀 교환 2회',
+            ),
+            self._make_row(date(2024, 1, 9), meal_lunch='일반식 전량', toilet_care='배뇨 2회'),
+        ]
+
+        with patch('modules.weekly_data_analyzer.WeeklyStatusRepository') as MockRepo:
+            MockRepo.return_value.load_weekly_status.return_value = None
+            result = analyzer.analyze_weekly_trend(
+                rows=rows, prev_range=prev_range, curr_range=curr_range, customer_id=1
+            )
+
+        this_week = result['ai_payload']['current_week']
+        assert this_week['meals'] == {'일반식': 2.0, '죽식': 0.5, '다진식': 1.0}
+        assert this_week['toilet'] == {'소변': 5.0, '대변': 1.0, '기저귀교환': 2.0}
+        assert result['toilet_detail']['this'] == '대변1회/소변5회 (기저귀교환2회)'
+        assert result['meal_detail']['this'] == (
+            '일반식 (전량) / 죽식 (1/2이하) / 일반식 (전량)'
+        )
+        assert result['notes']['this'] == [
+            "[01-08] 신체: <span style='background-color:#fff3cd;'>통증</span> 호소"
+        ]
+
+
+class TestWeeklyTrendFeatures:
+    """벡터화 특징 추출이 행 단위 헬퍼와 같은 값을 내는지"""
+
+    MEALS = [None, '', '일반식 전량', '죽식 1/2이상', '다짐식 1/2 이하, 일반식 완식',
+             '경관식', '거부', '연식 반', '식사 못함 0%', '특식']
+    TOILETS = [None, '', '소변 3회 대변 1회', '기저귀 교환 2회', '배변 1회/배뇨 4회', '3회']
+
+    def _rows(self):
+        return [
+            {
+                'date': date(2024, 1, 1) + timedelta(days=i),
+                'meal_breakfast': meal,
+                'meal_lunch': self.MEALS[(i + 3) % len(self.MEALS)],
+                'meal_dinner': None,
+                'toilet_care': self.TOILETS[i % len(self.TOILETS)],
+                'total_service_time': ['9시간', '결석', ' ', None, ' 미이용 '][i % 5],
+            }
+            for i, meal in enumerate(self.MEALS)
+        ]
+
+    def test_식사_상세는_행_단위_헬퍼와_동일(self):
+        rows = self._rows()
+        features = analyzer._weekly_trend_features(pd.DataFrame(rows))
+
+        expected = [
+            " / ".join(
+                f"{analyzer._detect_meal_type(m) or '미확인'} ({analyzer._meal_amount_label(m)})"
+                for m in (row['meal_breakfast'], row['meal_lunch'], row['meal_dinner']) if m
+            )
+            for row in rows
+        ]
+        assert features['meal_detail'].tolist() == expected
+
+    def test_배설_횟수는_행_단위_헬퍼와_동일(self):
+        rows = self._rows()
+        features = analyzer._weekly_trend_features(pd.DataFrame(rows))
+
+        for i, row in enumerate(rows):
+            expected = analyzer._parse_toilet_breakdown(row['toilet_care'])
+            for key in analyzer.TOILET_KEYS:
+                assert features[key][i] == expected.get(key, 0.0)
+
+    def test_출석_판정(self):
+        features = analyzer._weekly_trend_features(pd.DataFrame(self._rows()))
+        assert features['attended'].tolist()[:5] == [True, False, True, False, False]
+
+    def test_여러_수급자_일괄_집계는_개별_분석과_동일(self):
+        prev_range = (date(2024, 1, 1), date(2024, 1, 7))
+        curr_range = (date(2024, 1, 8), date(2024, 1, 14))
+        by_customer = {
+            1: self._rows(),
+            2: [dict(row, date=row['date'] + timedelta(days=4)) for row in self._rows()],
+        }
+        with patch('modules.weekly_data_analyzer.WeeklyStatusRepository') as MockRepo:
+            MockRepo.return_value.load_weekly_status.return_value = None
+            batched = analyzer._analyze_weekly_trends(by_customer, prev_range, curr_range, {})
+            for cid, rows in by_customer.items():
+                assert batched[cid] == analyzer.analyze_weekly_trend(rows, prev_range, curr_range, cid)
+
 
 class TestFetchTwoWeekRecords:
     """_fetch_two_week_records 필드 포함 검증"""